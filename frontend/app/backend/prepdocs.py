@@ -11,6 +11,7 @@ from openai import AsyncOpenAI
 from rich.logging import RichHandler
 
 from load_azd_env import load_azd_env
+from prepdocslib.embeddings import OpenAIEmbeddings
 from prepdocslib.filestrategy import FileStrategy
 from prepdocslib.integratedvectorizerstrategy import (
     IntegratedVectorizerStrategy,
@@ -255,6 +256,12 @@ if __name__ == "__main__":  # pragma: no cover
     emb_model_dimensions = 1536
     if os.getenv("AZURE_OPENAI_EMB_DIMENSIONS"):
         emb_model_dimensions = int(os.environ["AZURE_OPENAI_EMB_DIMENSIONS"])
+    emb_max_concurrency = OpenAIEmbeddings.DEFAULT_MAX_CONCURRENCY
+    if os.getenv("AZURE_OPENAI_EMB_MAX_CONCURRENCY"):
+        emb_max_concurrency = int(os.environ["AZURE_OPENAI_EMB_MAX_CONCURRENCY"])
+    emb_tokens_per_minute = None
+    if os.getenv("AZURE_OPENAI_EMB_TOKENS_PER_MINUTE"):
+        emb_tokens_per_minute = int(os.environ["AZURE_OPENAI_EMB_TOKENS_PER_MINUTE"])
 
     openai_client, azure_openai_endpoint = setup_openai_client(
         openai_host=OPENAI_HOST,
@@ -275,6 +282,8 @@ if __name__ == "__main__":  # pragma: no cover
             azure_openai_deployment=os.getenv("AZURE_OPENAI_EMB_DEPLOYMENT"),
             azure_openai_endpoint=azure_openai_endpoint,
             disable_batch=args.disablebatchvectors,
+            max_concurrency=emb_max_concurrency,
+            tokens_per_minute=emb_tokens_per_minute,
         )
 
     ingestion_strategy: Strategy
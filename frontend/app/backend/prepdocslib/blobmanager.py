@@ -7,7 +7,7 @@ from typing import IO, Any, Optional, TypedDict
 from urllib.parse import unquote
 
 from azure.core.credentials_async import AsyncTokenCredential
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.storage.blob.aio import BlobServiceClient
 from azure.storage.filedatalake.aio import (
     DataLakeDirectoryClient,
@@ -577,7 +577,10 @@ class BlobManager(BaseBlobManager):
     async def upload_blob(self, file: File) -> str:
         container_client = self.blob_service_client.get_container_client(self.container)
         if not await container_client.exists():
-            await container_client.create_container()
+            try:
+                await container_client.create_container()
+            except ResourceExistsError:  # created by a concurrent upload
+                pass
 
         # Re-open and upload the original file
         # URL may be a path to a local file or already set to a blob URL
@@ -611,7 +614,10 @@ class BlobManager(BaseBlobManager):
             )
         container_client = self.blob_service_client.get_container_client(self.image_container)
         if not await container_client.exists():
-            await container_client.create_container()
+            try:
+                await container_client.create_container()
+            except ResourceExistsError:  # created by a concurrent upload
+                pass
         image_bytes = self.add_image_citation(image_bytes, document_filename, image_filename, image_page_num)
         blob_name = f"{self.blob_name_from_file_name(document_filename)}/page{image_page_num}/{image_filename}"
         logger.info("Uploading blob for document image '%s'", blob_name)
@@ -1,6 +1,9 @@
+import asyncio
 import logging
+import time
 from abc import ABC
 from collections.abc import Awaitable, Callable
+from typing import TypeVar
 from urllib.parse import urljoin
 
 import aiohttp
@@ -16,6 +19,8 @@ from typing_extensions import TypedDict
 
 logger = logging.getLogger("scripts")
 
+_T = TypeVar("_T")
+
 
 class EmbeddingBatch:
     """Represents a batch of text that is going to be embedded."""
@@ -25,12 +30,54 @@ class EmbeddingBatch:
         self.token_length = token_length
 
 
+class TokenBudget:
+    """Tokens-per-minute budget shared by concurrent embedding requests.
+
+    A token bucket that refills continuously at ``tokens_per_minute / 60`` per second.
+    Waiters are served in arrival order; a request larger than the whole budget
+    waits for a full bucket rather than forever.
+    """
+
+    def __init__(self, tokens_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        if tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+        self.capacity = tokens_per_minute
+        self.available = float(tokens_per_minute)
+        self._refill_per_second = tokens_per_minute / 60
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.available = min(self.capacity, self.available + (now - self._updated) * self._refill_per_second)
+        self._updated = now
+
+    async def acquire(self, tokens: int):
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.available < tokens:
+                await asyncio.sleep((tokens - self.available) / self._refill_per_second)
+                self._refill()
+            self.available -= tokens
+
+
 class ExtraArgs(TypedDict, total=False):
     dimensions: int
 
 
 class OpenAIEmbeddings(ABC):
-    """Client wrapper that handles batching, retries, and token accounting."""
+    """Client wrapper that handles batching, retries, and token accounting.
+
+    Requests (batches, or single texts when batching is disabled) are dispatched
+    concurrently, at most ``max_concurrency`` in flight, and results are reassembled
+    in input order. A request backing off after a rate limit does not hold a slot,
+    so the other requests keep going. With ``tokens_per_minute`` set, every request
+    first draws its token count from a shared :class:`TokenBudget`.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 4
 
     SUPPORTED_BATCH_MODEL = {
         "text-embedding-ada-002": {"token_limit": 8100, "max_batch_size": 16},
@@ -52,6 +99,8 @@ class OpenAIEmbeddings(ABC):
         disable_batch: bool = False,
         azure_deployment_name: str | None = None,
         azure_endpoint: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        tokens_per_minute: int | None = None,
     ):
         self.open_ai_client = open_ai_client
         self.open_ai_model_name = open_ai_model_name
@@ -59,6 +108,9 @@ class OpenAIEmbeddings(ABC):
         self.disable_batch = disable_batch
         self.azure_deployment_name = azure_deployment_name
         self.azure_endpoint = azure_endpoint.rstrip("/") if azure_endpoint else None
+        self.max_concurrency = max(1, max_concurrency)
+        self._request_slots = asyncio.Semaphore(self.max_concurrency)
+        self.token_budget = TokenBudget(tokens_per_minute) if tokens_per_minute else None
 
     @property
     def _api_model(self) -> str:
@@ -102,30 +154,8 @@ class OpenAIEmbeddings(ABC):
 
         return batches
 
-    async def create_embedding_batch(self, texts: list[str], dimensions_args: ExtraArgs) -> list[list[float]]:
-        batches = self.split_text_into_batches(texts)
-        embeddings = []
-        for batch in batches:
-            async for attempt in AsyncRetrying(
-                retry=retry_if_exception_type(RateLimitError),
-                wait=wait_random_exponential(min=15, max=60),
-                stop=stop_after_attempt(15),
-                before_sleep=self.before_retry_sleep,
-            ):
-                with attempt:
-                    emb_response = await self.open_ai_client.embeddings.create(
-                        model=self._api_model, input=batch.texts, **dimensions_args
-                    )
-                    embeddings.extend([data.embedding for data in emb_response.data])
-                    logger.info(
-                        "Computed embeddings in batch. Batch size: %d, Token count: %d",
-                        len(batch.texts),
-                        batch.token_length,
-                    )
-
-        return embeddings
-
-    async def create_embedding_single(self, text: str, dimensions_args: ExtraArgs) -> list[float]:
+    async def _create(self, input: str | list[str], token_length: int, dimensions_args: ExtraArgs):
+        """One embeddings request with rate-limit retries; backoff sleeps happen outside the request slot."""
         async for attempt in AsyncRetrying(
             retry=retry_if_exception_type(RateLimitError),
             wait=wait_random_exponential(min=15, max=60),
@@ -133,11 +163,32 @@ class OpenAIEmbeddings(ABC):
             before_sleep=self.before_retry_sleep,
         ):
             with attempt:
-                emb_response = await self.open_ai_client.embeddings.create(
-                    model=self._api_model, input=text, **dimensions_args
-                )
-                logger.info("Computed embedding for text section. Character count: %d", len(text))
+                if self.token_budget:
+                    await self.token_budget.acquire(token_length)
+                async with self._request_slots:
+                    emb_response = await self.open_ai_client.embeddings.create(
+                        model=self._api_model, input=input, **dimensions_args
+                    )
+        return emb_response
+
+    async def _embed_batch(self, batch: EmbeddingBatch, dimensions_args: ExtraArgs) -> list[list[float]]:
+        emb_response = await self._create(batch.texts, batch.token_length, dimensions_args)
+        logger.info(
+            "Computed embeddings in batch. Batch size: %d, Token count: %d",
+            len(batch.texts),
+            batch.token_length,
+        )
+        return [data.embedding for data in emb_response.data]
 
+    async def create_embedding_batch(self, texts: list[str], dimensions_args: ExtraArgs) -> list[list[float]]:
+        batches = self.split_text_into_batches(texts)
+        results = await _gather_in_order([self._embed_batch(batch, dimensions_args) for batch in batches])
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    async def create_embedding_single(self, text: str, dimensions_args: ExtraArgs) -> list[float]:
+        token_length = self.calculate_token_length(text) if self.token_budget else 0
+        emb_response = await self._create(text, token_length, dimensions_args)
+        logger.info("Computed embedding for text section. Character count: %d", len(text))
         return emb_response.data[0].embedding
 
     async def create_embeddings(self, texts: list[str]) -> list[list[float]]:
@@ -151,7 +202,22 @@ class OpenAIEmbeddings(ABC):
         if not self.disable_batch and self.open_ai_model_name in OpenAIEmbeddings.SUPPORTED_BATCH_MODEL:
             return await self.create_embedding_batch(texts, dimensions_args)
 
-        return [await self.create_embedding_single(text, dimensions_args) for text in texts]
+        return await _gather_in_order([self.create_embedding_single(text, dimensions_args) for text in texts])
+
+
+async def _gather_in_order(coros: list[Awaitable[_T]]) -> list[_T]:
+    """Run coroutines concurrently and return their results in input order.
+
+    If one fails, the others are cancelled before the error propagates.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 class ImageEmbeddings:
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from typing import Optional
 
 from .blobmanager import AdlsBlobManager, BaseBlobManager, BlobManager
@@ -11,45 +14,139 @@ from .figureprocessor import (
 from .fileprocessor import FileProcessor
 from .listfilestrategy import File, ListFileStrategy
 from .mediadescriber import ContentUnderstandingDescriber
+from .page import Page
 from .searchmanager import SearchManager, Section
 from .strategy import DocumentAction, SearchInfo, Strategy
 from .textprocessor import process_text
 
 logger = logging.getLogger("scripts")
 
+DEFAULT_FIGURE_CONCURRENCY = 4
 
-async def parse_file(
-    file: File,
-    file_processors: dict[str, FileProcessor],
-    category: Optional[str] = None,
-    blob_manager: Optional[BaseBlobManager] = None,
-    image_embeddings_client: Optional[ImageEmbeddings] = None,
-    figure_processor: Optional[FigureProcessor] = None,
-    user_oid: Optional[str] = None,
-) -> list[Section]:
 
+async def parse_pages(
+    file: File, file_processors: dict[str, FileProcessor]
+) -> Optional[tuple[FileProcessor, list[Page]]]:
+    """Parse a file into pages with its registered processor, or return None if no parser handles it."""
     key = file.file_extension().lower()
     processor = file_processors.get(key)
     if processor is None:
         logger.info("Skipping '%s', no parser found.", file.filename())
-        return []
+        return None
     logger.info("Ingesting '%s'", file.filename())
     pages = [page async for page in processor.parser.parse(content=file.content)]
-    for page in pages:
-        for image in page.images:
+    return processor, pages
+
+
+async def process_figures(
+    pages: list[Page],
+    document_filename: str,
+    blob_manager: Optional[BaseBlobManager] = None,
+    image_embeddings_client: Optional[ImageEmbeddings] = None,
+    figure_processor: Optional[FigureProcessor] = None,
+    user_oid: Optional[str] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+) -> int:
+    """Describe, upload and embed every figure of a document concurrently.
+
+    At most ``limit`` figures are in flight (DEFAULT_FIGURE_CONCURRENCY when not given);
+    pass a shared semaphore to bound figure work across several documents.
+    Returns the number of figures processed.
+    """
+    limit = limit or asyncio.Semaphore(DEFAULT_FIGURE_CONCURRENCY)
+
+    async def process(page: Page, image) -> None:
+        async with limit:
             logger.info("Processing image '%s' on page %d", image.filename, page.page_num)
             await process_page_image(
                 image=image,
-                document_filename=file.filename(),
+                document_filename=document_filename,
                 blob_manager=blob_manager,
                 image_embeddings_client=image_embeddings_client,
                 figure_processor=figure_processor,
                 user_oid=user_oid,
             )
+
+    figures = [process(page, image) for page in pages for image in page.images]
+    await asyncio.gather(*figures)
+    return len(figures)
+
+
+async def parse_file(
+    file: File,
+    file_processors: dict[str, FileProcessor],
+    category: Optional[str] = None,
+    blob_manager: Optional[BaseBlobManager] = None,
+    image_embeddings_client: Optional[ImageEmbeddings] = None,
+    figure_processor: Optional[FigureProcessor] = None,
+    user_oid: Optional[str] = None,
+) -> list[Section]:
+
+    parsed = await parse_pages(file, file_processors)
+    if parsed is None:
+        return []
+    processor, pages = parsed
+    await process_figures(
+        pages,
+        file.filename(),
+        blob_manager=blob_manager,
+        image_embeddings_client=image_embeddings_client,
+        figure_processor=figure_processor,
+        user_oid=user_oid,
+    )
     sections = process_text(pages, file, processor.splitter, category)
     return sections
 
 
+@dataclass
+class IngestionConcurrency:
+    """Worker counts for each stage of the FileStrategy pipeline.
+
+    Stages are connected by queues holding at most ``queue_size`` files, so a slow
+    stage applies backpressure upstream instead of buffering the whole file list.
+    ``figures`` bounds figure (image) processing across all documents in flight.
+    """
+
+    upload: int = 4
+    parse: int = 4
+    figure_workers: int = 2
+    figures: int = 8
+    index: int = 2
+    queue_size: int = 8
+
+
+@dataclass
+class IngestionProgress:
+    """Running counters for a FileStrategy ingestion run."""
+
+    listed: int = 0
+    uploaded: int = 0
+    parsed: int = 0
+    figures: int = 0
+    indexed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    failed_files: list[str] = field(default_factory=list)
+
+    @property
+    def finished(self) -> int:
+        return self.indexed + self.skipped + self.failed
+
+    def summary(self) -> str:
+        return (
+            f"{self.finished}/{self.listed} files done: {self.indexed} indexed, {self.skipped} skipped, "
+            f"{self.failed} failed ({self.uploaded} uploaded, {self.parsed} parsed, {self.figures} figures)"
+        )
+
+
+@dataclass
+class _FileJob:
+    file: File
+    blob_url: Optional[str] = None
+    processor: Optional[FileProcessor] = None
+    pages: list[Page] = field(default_factory=list)
+
+
 class FileStrategy(Strategy):
     """
     Strategy for ingesting documents into a search service from files stored either locally or in a data lake storage account
@@ -72,6 +169,7 @@ class FileStrategy(Strategy):
         enforce_access_control: bool = False,
         use_web_source: bool = False,
         use_sharepoint_source: bool = False,
+        concurrency: Optional[IngestionConcurrency] = None,
     ):
         self.list_file_strategy = list_file_strategy
         self.blob_manager = blob_manager
@@ -88,6 +186,8 @@ class FileStrategy(Strategy):
         self.enforce_access_control = enforce_access_control
         self.use_web_source = use_web_source
         self.use_sharepoint_source = use_sharepoint_source
+        self.concurrency = concurrency or IngestionConcurrency()
+        self.progress = IngestionProgress()
 
     def setup_search_manager(self):
         self.search_manager = SearchManager(
@@ -119,23 +219,7 @@ class FileStrategy(Strategy):
     async def run(self):
         self.setup_search_manager()
         if self.document_action == DocumentAction.Add:
-            files = self.list_file_strategy.list()
-            async for file in files:
-                try:
-                    blob_url = await self.blob_manager.upload_blob(file)
-                    sections = await parse_file(
-                        file,
-                        self.file_processors,
-                        self.category,
-                        self.blob_manager,
-                        self.image_embeddings,
-                        figure_processor=self.figure_processor,
-                    )
-                    if sections:
-                        await self.search_manager.update_content(sections, url=blob_url)
-                finally:
-                    if file:
-                        file.close()
+            await self.ingest_files()
         elif self.document_action == DocumentAction.Remove:
             paths = self.list_file_strategy.list_paths()
             async for path in paths:
@@ -145,6 +229,117 @@ class FileStrategy(Strategy):
             await self.blob_manager.remove_blob()
             await self.search_manager.remove_content()
 
+    async def ingest_files(self):
+        """Upload, parse, process figures and index every listed file as a staged pipeline.
+
+        Each stage has its own worker pool; a file moves to the next stage's queue as soon
+        as it is done, so uploads, parsing, figure descriptions and index updates for
+        different files overlap. A failure in any stage is logged and counted against that
+        file only; once every file has been processed, a RuntimeError reports the failed files.
+        """
+        limits = self.concurrency
+        self.progress = IngestionProgress()
+        figure_limit = asyncio.Semaphore(limits.figures)
+
+        async def upload(job: _FileJob) -> Optional[_FileJob]:
+            job.blob_url = await self.blob_manager.upload_blob(job.file)
+            self.progress.uploaded += 1
+            return job
+
+        async def parse(job: _FileJob) -> Optional[_FileJob]:
+            parsed = await parse_pages(job.file, self.file_processors)
+            if parsed is None:
+                self.progress.skipped += 1
+                self._finish(job)
+                return None
+            job.processor, job.pages = parsed
+            self.progress.parsed += 1
+            return job
+
+        async def figures(job: _FileJob) -> Optional[_FileJob]:
+            processed = await process_figures(
+                job.pages,
+                job.file.filename(),
+                blob_manager=self.blob_manager,
+                image_embeddings_client=self.image_embeddings,
+                figure_processor=self.figure_processor,
+                limit=figure_limit,
+            )
+            # add after the await so concurrent workers don't overwrite each other's count
+            self.progress.figures += processed
+            return job
+
+        async def index(job: _FileJob) -> Optional[_FileJob]:
+            assert job.processor is not None
+            sections = process_text(job.pages, job.file, job.processor.splitter, self.category)
+            if sections:
+                await self.search_manager.update_content(sections, url=job.blob_url)
+            self.progress.indexed += 1
+            self._finish(job)
+            return None
+
+        stages: list[tuple[str, int, Callable[[_FileJob], Awaitable[Optional[_FileJob]]]]] = [
+            ("upload", max(1, limits.upload), upload),
+            ("parse", max(1, limits.parse), parse),
+            ("figures", max(1, limits.figure_workers), figures),
+            ("index", max(1, limits.index), index),
+        ]
+        # queues[i] feeds stage i; None tells one worker to stop
+        queues: list[asyncio.Queue[Optional[_FileJob]]] = [
+            asyncio.Queue(maxsize=max(1, limits.queue_size)) for _ in stages
+        ]
+
+        async def produce():
+            try:
+                async for file in self.list_file_strategy.list():
+                    self.progress.listed += 1
+                    await queues[0].put(_FileJob(file=file))
+            finally:
+                for _ in range(stages[0][1]):
+                    await queues[0].put(None)
+
+        async def run_stage(position: int):
+            name, workers, handler = stages[position]
+            inbox = queues[position]
+            outbox = queues[position + 1] if position + 1 < len(stages) else None
+
+            async def worker():
+                while (job := await inbox.get()) is not None:
+                    try:
+                        result = await handler(job)
+                    except Exception:
+                        logger.exception("Ingestion of '%s' failed in %s stage", job.file.filename(), name)
+                        self.progress.failed += 1
+                        self.progress.failed_files.append(job.file.filename())
+                        self._finish(job)
+                        continue
+                    if result is not None and outbox is not None:
+                        await outbox.put(result)
+
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            if outbox is not None:
+                for _ in range(stages[position + 1][1]):
+                    await outbox.put(None)
+
+        tasks = [asyncio.ensure_future(produce())] + [asyncio.ensure_future(run_stage(i)) for i in range(len(stages))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        logger.info("Ingestion finished: %s", self.progress.summary())
+        if self.progress.failed:
+            raise RuntimeError(
+                f"{self.progress.failed} of {self.progress.listed} files failed to ingest: "
+                + ", ".join(self.progress.failed_files)
+            )
+
+    def _finish(self, job: _FileJob):
+        job.file.close()
+        logger.info("Ingestion progress: %s", self.progress.summary())
+
 
 class UploadUserFileStrategy:
     """
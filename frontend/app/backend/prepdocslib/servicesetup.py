@@ -162,6 +162,8 @@ def setup_embeddings_service(
     azure_openai_deployment: Optional[str] = None,
     azure_openai_endpoint: Optional[str] = None,
     disable_batch: bool = False,
+    max_concurrency: int = OpenAIEmbeddings.DEFAULT_MAX_CONCURRENCY,
+    tokens_per_minute: Optional[int] = None,
 ) -> OpenAIEmbeddings:
     if openai_host in [OpenAIHost.AZURE, OpenAIHost.AZURE_CUSTOM]:
         if azure_openai_endpoint is None:
@@ -176,6 +178,8 @@ def setup_embeddings_service(
         disable_batch=disable_batch,
         azure_deployment_name=azure_openai_deployment,
         azure_endpoint=azure_openai_endpoint,
+        max_concurrency=max_concurrency,
+        tokens_per_minute=tokens_per_minute,
     )
 
 
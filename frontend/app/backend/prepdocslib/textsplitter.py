@@ -1,3 +1,4 @@
+import bisect
 import logging
 import re
 from abc import ABC
@@ -84,6 +85,11 @@ bpe = tiktoken.encoding_for_model(ENCODING_MODEL)
 DEFAULT_OVERLAP_PERCENT = 10  # See semantic search article for 10% overlap performance
 DEFAULT_SECTION_LENGTH = 1000  # Roughly 400-500 tokens for English
 
+# Token counts read off a parent text's offset map can differ from encoding the
+# substring itself, but only around the cut points (BPE merges are local).
+# Decisions within this many tokens per cut of a limit are confirmed with a real encode.
+TOKEN_ESTIMATE_SLACK = 8
+
 
 def _safe_concat(a: str, b: str) -> str:
     """Concatenate two non-empty segments, inserting a space only when both sides
@@ -129,6 +135,41 @@ def _normalize_chunk(text: str, max_chars: int) -> str:
     return trimmed
 
 
+class _TokenOffsets:
+    """Single encoding of a text with a char-to-token offset map.
+
+    Lets callers size sub-ranges of the text (split halves, trimmed fragments)
+    by binary search over token start offsets instead of re-encoding each one.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        tokens = bpe.encode(text)
+        self.total = len(tokens)
+        _, self.starts = bpe.decode_with_offsets(tokens)
+
+    def count(self, start: int, end: int) -> int:
+        """Tokens of the full encoding that start within text[start:end]."""
+        return bisect.bisect_left(self.starts, end) - bisect.bisect_left(self.starts, start)
+
+    def fits(self, start: int, end: int, max_tokens: int) -> bool:
+        """Whether text[start:end] encodes to at most max_tokens tokens."""
+        cuts = (start > 0) + (end < len(self.text))
+        if not cuts:
+            return self.total <= max_tokens
+        return _fits_token_limit(self.count(start, end), max_tokens, self.text[start:end], cuts)
+
+
+def _fits_token_limit(estimate: int, max_tokens: int, text: str, cuts: int) -> bool:
+    """Decide a token limit from an offset-map estimate, encoding only near the limit."""
+    slack = TOKEN_ESTIMATE_SLACK * cuts
+    if estimate + slack <= max_tokens:
+        return True
+    if estimate - slack > max_tokens:
+        return False
+    return len(bpe.encode(text)) <= max_tokens
+
+
 @dataclass
 class _ChunkBuilder:
     """Accumulates sentence-like spans for a single page until size limits are reached.
@@ -149,24 +190,25 @@ class _ChunkBuilder:
     max_tokens: int
     parts: list[str] = field(default_factory=list)
     token_len: int = 0
+    char_len: int = 0
 
     def can_fit(self, text: str, token_count: int) -> bool:
         if not self.parts:  # always allow first span
             return token_count <= self.max_tokens and len(text) <= self.max_chars
         # Character + token constraints
-        return (len("".join(self.parts)) + len(text) <= self.max_chars) and (
-            self.token_len + token_count <= self.max_tokens
-        )
+        return (self.char_len + len(text) <= self.max_chars) and (self.token_len + token_count <= self.max_tokens)
 
     def add(self, text: str, token_count: int) -> bool:
         if not self.can_fit(text, token_count):
             return False
         self.parts.append(text)
         self.token_len += token_count
+        self.char_len += len(text)
         return True
 
     def force_append(self, text: str):
         self.parts.append(text)
+        self.char_len += len(text)
 
     def flush_into(self, out: list[Chunk]):
         if self.parts:
@@ -175,6 +217,7 @@ class _ChunkBuilder:
                 out.append(Chunk(page_num=self.page_num, text=chunk))
         self.parts.clear()
         self.token_len = 0
+        self.char_len = 0
 
     # Convenience helpers for readability at call sites
     def has_content(self) -> bool:
@@ -202,6 +245,9 @@ class SentenceTextSplitter(TextSplitter):
         # - Between chunks on the same page.
         # - Across page boundary ONLY if semantic continuation heuristics pass.
         self.semantic_overlap_percent = 10
+        # Sentence-like spans: text up to and including each sentence ending, plus any tail
+        endings = re.escape("".join(self.sentence_endings))
+        self.span_regex = re.compile(f"[^{endings}]*[{endings}]|[^{endings}]+")
 
     def _find_split_pos(self, text: str) -> tuple[int, bool]:
         """Find a good split position near midpoint.
@@ -251,24 +297,61 @@ class SentenceTextSplitter(TextSplitter):
         1. Sentence-ending punctuation near midpoint.
         2. Word-break character near midpoint (space/punctuation) to avoid mid-word cuts.
         3. Midpoint split with symmetric overlap (DEFAULT_OVERLAP_PERCENT).
+
+        The text is encoded once; halves are sized from its token offset map.
         """
-        tokens = bpe.encode(text)
-        if len(tokens) <= self.max_tokens_per_section:
+        yield from self._split_range_by_max_tokens(page_num, _TokenOffsets(text), 0, len(text))
+
+    def _split_range_by_max_tokens(
+        self, page_num: int, offsets: _TokenOffsets, start: int, end: int
+    ) -> Generator[Chunk, None, None]:
+        text = offsets.text[start:end]
+        if offsets.fits(start, end, self.max_tokens_per_section):
             yield Chunk(page_num=page_num, text=text)
             return
 
+        length = len(text)
         split_pos, use_overlap = self._find_split_pos(text)
         if not use_overlap and split_pos > 0:
-            first_half = text[: split_pos + 1]
-            second_half = text[split_pos + 1 :]
+            first_half = (start, start + split_pos + 1)
+            second_half = (start + split_pos + 1, end)
         else:
-            middle = len(text) // 2
-            overlap = int(len(text) * (DEFAULT_OVERLAP_PERCENT / 100))
-            first_half = text[: middle + overlap]
-            second_half = text[middle - overlap :]
-
-        yield from self.split_page_by_max_tokens(page_num, first_half)
-        yield from self.split_page_by_max_tokens(page_num, second_half)
+            middle = length // 2
+            overlap = int(length * (DEFAULT_OVERLAP_PERCENT / 100))
+            # Same bounds as text[: middle + overlap] and text[middle - overlap :]
+            first_end = slice(None, middle + overlap).indices(length)[1]
+            second_start = slice(middle - overlap, None).indices(length)[0]
+            first_half = (start, start + first_end)
+            second_half = (start + second_start, end)
+
+        yield from self._split_range_by_max_tokens(page_num, offsets, *first_half)
+        yield from self._split_range_by_max_tokens(page_num, offsets, *second_half)
+
+    def _trim_fragment_to_token_limit(self, fragment: str, suffix: str) -> str:
+        """Longest prefix of fragment, shortened 50 chars at a time (then 1 char at a time
+        below 50), such that prefix + suffix fits the token limit; "" if none does.
+
+        The candidates are sized from one encoding of fragment + suffix; only those
+        whose estimate is close to the limit are encoded to confirm.
+        """
+        lengths: list[int] = []
+        n = len(fragment)
+        while n:
+            lengths.append(n)
+            n = n - 50 if n > 50 else n - 1
+        if not lengths:
+            return ""
+        offsets = _TokenOffsets(fragment + suffix)
+        suffix_tokens = offsets.count(len(fragment), len(offsets.text))
+        for n in lengths:
+            if n == len(fragment):
+                fits = offsets.total <= self.max_tokens_per_section
+            else:
+                estimate = offsets.count(0, n) + suffix_tokens
+                fits = _fits_token_limit(estimate, self.max_tokens_per_section, fragment[:n] + suffix, cuts=2)
+            if fits:
+                return fragment[:n]
+        return ""
 
     def _is_heading_like(self, line: str) -> bool:
         """Heuristic heading detector used to suppress cross-page semantic overlap when a new section starts."""
@@ -429,17 +512,7 @@ class SentenceTextSplitter(TextSplitter):
                     continue
 
                 # Process text block: split into sentence-like spans
-                spans: list[str] = []
-                current_chars: list[str] = []
-                for ch in btext:
-                    current_chars.append(ch)
-                    if ch in self.sentence_endings:
-                        spans.append("".join(current_chars))
-                        current_chars = []
-                if current_chars:  # remaining tail
-                    spans.append("".join(current_chars))
-
-                for span in spans:
+                for span in self.span_regex.findall(btext):
                     span_tokens = len(bpe.encode(span))
                     # If a single span itself exceeds token limit (rare, very long sentence), split it directly
                     if span_tokens > self.max_tokens_per_section:
@@ -506,14 +579,9 @@ class SentenceTextSplitter(TextSplitter):
                                 # of the previous chunk. Reduce to remaining character budget, then iteratively
                                 # shrink until token constraints are satisfied.
                                 remaining_chars = max_chars - len(first_new_text)  # always > 0 given builder invariants
-                                move_fragment = move_fragment[:remaining_chars]
-                                while (
-                                    move_fragment
-                                    and len(bpe.encode(move_fragment + first_new_text)) > self.max_tokens_per_section
-                                ):
-                                    move_fragment = (
-                                        move_fragment[:-50] if len(move_fragment) > 50 else move_fragment[:-1]
-                                    )
+                                move_fragment = self._trim_fragment_to_token_limit(
+                                    move_fragment[:remaining_chars], first_new_text
+                                )
                             leftover_fragment = fragment_full[len(move_fragment) :]
                             # Prepend the allowed fragment
                             if move_fragment:
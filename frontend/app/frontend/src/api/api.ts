@@ -280,7 +280,7 @@ export async function getChatHistoryListApi(count: number, continuationToken: st
     const headers = await getHeaders(idToken);
     let url = `${BACKEND_URI}/chat_history/sessions?count=${count}`;
     if (continuationToken) {
-        url += `&continuationToken=${continuationToken}`;
+        url += `&continuationToken=${encodeURIComponent(continuationToken)}`;
     }
 
     const response = await fetchWithAuthRetry(url.toString(), {
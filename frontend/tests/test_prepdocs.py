@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 from argparse import Namespace
 from unittest.mock import AsyncMock
 
@@ -10,7 +12,7 @@ from azure.core.credentials import AzureKeyCredential
 from httpx import Request, Response
 from openai.types.create_embedding_response import Usage
 
-from prepdocslib.embeddings import ImageEmbeddings, OpenAIEmbeddings
+from prepdocslib.embeddings import ImageEmbeddings, OpenAIEmbeddings, TokenBudget
 
 from .mocks import (
     MOCK_EMBEDDING_DIMENSIONS,
@@ -225,6 +227,156 @@ async def test_openai_embeddings_use_deployment_for_azure_model():
     assert len(result) == 1
 
 
+class LatencyEmbeddingsClient:
+    """Fake async embeddings API: fixed latency, optional rate limits, input-derived vectors."""
+
+    def __init__(self, latency: float = 0.02, rate_limited_inputs: tuple[str, ...] = ()):
+        self.latency = latency
+        self.rate_limited_inputs = set(rate_limited_inputs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.completed: list[str] = []
+
+    async def create(self, *, model: str, input, **kwargs):
+        texts = [input] if isinstance(input, str) else list(input)
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if texts[0] in self.rate_limited_inputs:
+                self.rate_limited_inputs.discard(texts[0])
+                raise openai.RateLimitError(message="Too many requests", response=fake_response(429), body=None)
+        finally:
+            self.in_flight -= 1
+        self.completed.append(texts[0])
+        return openai.types.CreateEmbeddingResponse(
+            object="list",
+            data=[
+                openai.types.Embedding(embedding=[float(text.split("-")[1])], index=i, object="embedding")
+                for i, text in enumerate(texts)
+            ],
+            model=model,
+            usage=Usage(prompt_tokens=0, total_tokens=0),
+        )
+
+
+def _latency_embeddings(client, **kwargs) -> OpenAIEmbeddings:
+    return OpenAIEmbeddings(
+        open_ai_client=MockClient(client),
+        open_ai_model_name=MOCK_EMBEDDING_MODEL_NAME,
+        open_ai_dimensions=MOCK_EMBEDDING_DIMENSIONS,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("disable_batch", [False, True])
+async def test_compute_embeddings_concurrent_in_order(monkeypatch, disable_batch):
+    monkeypatch.setitem(
+        OpenAIEmbeddings.SUPPORTED_BATCH_MODEL, MOCK_EMBEDDING_MODEL_NAME, {"token_limit": 8100, "max_batch_size": 2}
+    )
+    texts = [f"text-{i}" for i in range(40)]
+
+    sequential_client = LatencyEmbeddingsClient()
+    sequential = _latency_embeddings(sequential_client, disable_batch=disable_batch, max_concurrency=1)
+    start = time.perf_counter()
+    assert await sequential.create_embeddings(texts) == [[float(i)] for i in range(40)]
+    sequential_elapsed = time.perf_counter() - start
+
+    concurrent_client = LatencyEmbeddingsClient()
+    concurrent = _latency_embeddings(concurrent_client, disable_batch=disable_batch, max_concurrency=8)
+    start = time.perf_counter()
+    assert await concurrent.create_embeddings(texts) == [[float(i)] for i in range(40)]
+    concurrent_elapsed = time.perf_counter() - start
+
+    assert sequential_client.max_in_flight == 1
+    assert concurrent_client.max_in_flight == 8
+    assert concurrent_elapsed < sequential_elapsed / 3
+
+
+@pytest.mark.asyncio
+async def test_compute_embeddings_rate_limited_batch_does_not_block_others(monkeypatch):
+    monkeypatch.setitem(
+        OpenAIEmbeddings.SUPPORTED_BATCH_MODEL, MOCK_EMBEDDING_MODEL_NAME, {"token_limit": 8100, "max_batch_size": 2}
+    )
+    monkeypatch.setattr(
+        "prepdocslib.embeddings.wait_random_exponential",
+        lambda *args, **kwargs: tenacity.wait_fixed(0.2),
+    )
+    client = LatencyEmbeddingsClient(latency=0.01, rate_limited_inputs=("text-0",))
+    embeddings = _latency_embeddings(client, max_concurrency=2)
+
+    result = await embeddings.create_embeddings([f"text-{i}" for i in range(20)])
+
+    assert result == [[float(i)] for i in range(20)]
+    assert client.calls == 11
+    # The throttled first batch finished last; the other nine went ahead during its backoff
+    assert client.completed[-1] == "text-0"
+    assert client.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_compute_embeddings_failure_cancels_remaining_batches(monkeypatch):
+    monkeypatch.setitem(
+        OpenAIEmbeddings.SUPPORTED_BATCH_MODEL, MOCK_EMBEDDING_MODEL_NAME, {"token_limit": 8100, "max_batch_size": 1}
+    )
+
+    class FailingClient(LatencyEmbeddingsClient):
+        async def create(self, *, model: str, input, **kwargs):
+            if input == ["text-0"]:
+                raise openai.AuthenticationError(message="Bad things happened.", response=fake_response(403), body=None)
+            return await super().create(model=model, input=input, **kwargs)
+
+    client = FailingClient(latency=0.05)
+    with pytest.raises(openai.AuthenticationError):
+        await _latency_embeddings(client, max_concurrency=2).create_embeddings([f"text-{i}" for i in range(10)])
+    await asyncio.sleep(0.1)
+    assert len(client.completed) <= 1
+
+
+@pytest.mark.asyncio
+async def test_token_budget_paces_requests(monkeypatch):
+    now = [0.0]
+    slept: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr("prepdocslib.embeddings.asyncio.sleep", fake_sleep)
+    budget = TokenBudget(tokens_per_minute=6000, clock=lambda: now[0])  # 100 tokens/s
+
+    await budget.acquire(6000)
+    assert slept == []
+    await budget.acquire(500)
+    assert slept == [pytest.approx(5.0)]
+    # Larger than the whole budget: waits for a full bucket instead of forever
+    await budget.acquire(10_000)
+    assert sum(slept) == pytest.approx(65.0)
+
+
+@pytest.mark.asyncio
+async def test_compute_embeddings_draw_from_token_budget(monkeypatch):
+    acquired: list[int] = []
+
+    async def record(self, tokens):
+        acquired.append(tokens)
+
+    monkeypatch.setattr(TokenBudget, "acquire", record)
+    embeddings = _latency_embeddings(LatencyEmbeddingsClient(latency=0), tokens_per_minute=100_000)
+    await embeddings.create_embeddings(["text-1", "text-2"])
+    assert acquired == [embeddings.calculate_token_length("text-1") + embeddings.calculate_token_length("text-2")]
+
+    acquired.clear()
+    embeddings.disable_batch = True
+    await embeddings.create_embeddings(["text-1", "text-2"])
+    assert sorted(acquired) == [embeddings.calculate_token_length("text-1")] * 2
+
+
 @pytest.mark.asyncio
 async def test_manageacl_main_uses_search_key(monkeypatch: pytest.MonkeyPatch) -> None:
     from scripts import manageacl as manageacl_module
@@ -1,14 +1,22 @@
+import asyncio
 import os
 from io import BytesIO
 
 import pytest
+from azure.core.credentials import AzureKeyCredential
 
 from prepdocslib.blobmanager import BlobManager
 from prepdocslib.figureprocessor import FigureProcessor, MediaDescriptionStrategy
 from prepdocslib.fileprocessor import FileProcessor
-from prepdocslib.filestrategy import FileStrategy, parse_file
+from prepdocslib.filestrategy import (
+    FileStrategy,
+    IngestionConcurrency,
+    parse_file,
+    process_figures,
+)
 from prepdocslib.listfilestrategy import (
     File,
+    ListFileStrategy,
     LocalListFileStrategy,
 )
 from prepdocslib.page import ImageOnPage, Page
@@ -154,3 +162,193 @@ async def test_file_strategy_setup_with_content_understanding(monkeypatch, mock_
     # create_analyzer should be called during setup for content understanding
     assert figure_processor.media_describer.create_analyzer_called
     assert figure_processor.content_understanding_ready
+
+
+class FakeListFileStrategy(ListFileStrategy):
+    def __init__(self, names: list[str]):
+        self.names = names
+        self.files: list[File] = []
+
+    async def list(self):
+        for name in self.names:
+            content = BytesIO(name.encode())
+            content.name = name
+            file = File(content=content)
+            self.files.append(file)
+            yield file
+
+
+class FakeBlobManager:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.uploaded: list[str] = []
+        self.images: list[str] = []
+
+    async def upload_blob(self, file: File) -> str:
+        await asyncio.sleep(self.latency)
+        self.uploaded.append(file.filename())
+        return f"https://blob/{file.filename()}"
+
+    async def upload_document_image(
+        self, document_filename, image_bytes, image_filename, image_page_num, user_oid=None
+    ):
+        self.images.append(image_filename)
+        return f"https://blob/{document_filename}/{image_filename}"
+
+
+class FakeParser:
+    """Yields one page per file, with `images` figures; files named 'bad*' fail to parse."""
+
+    def __init__(self, latency: float = 0.0, images: int = 0):
+        self.latency = latency
+        self.images = images
+
+    async def parse(self, content):
+        await asyncio.sleep(self.latency)
+        name = content.name
+        if name.startswith("bad"):
+            raise ValueError(f"cannot parse {name}")
+        page = Page(page_num=0, offset=0, text=f"Text of {name}")
+        page.images = [
+            ImageOnPage(
+                bytes=b"img",
+                bbox=(0, 0, 1, 1),
+                page_num=0,
+                figure_id=f"fig_{i}",
+                filename=f"{name}_{i}.png",
+                placeholder=f'<figure id="fig_{i}"></figure>',
+            )
+            for i in range(self.images)
+        ]
+        yield page
+
+
+class FakeSearchManager:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.indexed: dict[str, str] = {}
+
+    async def update_content(self, sections, url=None):
+        await asyncio.sleep(self.latency)
+        self.indexed[sections[0].content.filename()] = url
+
+
+class ConcurrencyProbe:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def describe(self, image_bytes):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        return "a figure"
+
+
+def _pipeline_strategy(monkeypatch, names, *, latency=0.0, images=0, concurrency=None, figure_processor=None):
+    search_manager = FakeSearchManager(latency)
+    monkeypatch.setattr(
+        FileStrategy, "setup_search_manager", lambda self: setattr(self, "search_manager", search_manager)
+    )
+    strategy = FileStrategy(
+        list_file_strategy=FakeListFileStrategy(names),
+        blob_manager=FakeBlobManager(latency),
+        search_info=SearchInfo(endpoint="https://search", credential=AzureKeyCredential("key"), index_name="test"),
+        file_processors={".txt": FileProcessor(FakeParser(latency, images), SimpleTextSplitter())},
+        figure_processor=figure_processor,
+        concurrency=concurrency,
+    )
+    return strategy, search_manager
+
+
+@pytest.mark.asyncio
+async def test_file_strategy_pipeline_isolates_failures(monkeypatch):
+    names = ["a.txt", "bad.txt", "b.txt", "notes.bin", "c.txt"]
+    strategy, search_manager = _pipeline_strategy(monkeypatch, names, images=2, figure_processor=ConcurrencyProbe(0))
+
+    with pytest.raises(RuntimeError, match="1 of 5 files failed to ingest: bad.txt"):
+        await strategy.run()
+
+    assert search_manager.indexed == {name: f"https://blob/{name}" for name in ["a.txt", "b.txt", "c.txt"]}
+    progress = strategy.progress
+    assert (progress.listed, progress.uploaded, progress.parsed) == (5, 5, 3)
+    assert (progress.indexed, progress.skipped, progress.failed) == (3, 1, 1)
+    assert progress.failed_files == ["bad.txt"]
+    assert progress.figures == 6
+    expected_images = [f"{name}_{i}.png" for name in ["a.txt", "b.txt", "c.txt"] for i in range(2)]
+    assert sorted(strategy.blob_manager.images) == sorted(expected_images)
+    assert all(file.content.closed for file in strategy.list_file_strategy.files)
+
+
+@pytest.mark.asyncio
+async def test_file_strategy_pipeline_overlaps_stages(monkeypatch):
+    names = [f"doc{i}.txt" for i in range(24)]
+    strategy, search_manager = _pipeline_strategy(monkeypatch, names, latency=0.01)
+    in_flight = {"upload": 0, "index": 0}
+    max_uploads = 0
+    uploads_during_index: list[int] = []
+    upload_blob = strategy.blob_manager.upload_blob
+    update_content = search_manager.update_content
+
+    async def tracked_upload(file):
+        nonlocal max_uploads
+        in_flight["upload"] += 1
+        max_uploads = max(max_uploads, in_flight["upload"])
+        try:
+            return await upload_blob(file)
+        finally:
+            in_flight["upload"] -= 1
+
+    async def tracked_update(sections, url=None):
+        uploads_during_index.append(in_flight["upload"])
+        await update_content(sections, url=url)
+
+    strategy.blob_manager.upload_blob = tracked_upload
+    search_manager.update_content = tracked_update
+    await strategy.run()
+
+    assert len(search_manager.indexed) == 24
+    # Several uploads run at once, and later files upload while earlier ones are indexed
+    assert max_uploads == strategy.concurrency.upload
+    assert max(uploads_during_index) > 0
+
+
+@pytest.mark.asyncio
+async def test_file_strategy_pipeline_applies_backpressure(monkeypatch):
+    names = [f"doc{i}.txt" for i in range(30)]
+    limits = IngestionConcurrency(upload=1, parse=1, figure_workers=1, figures=1, index=1, queue_size=1)
+    strategy, search_manager = _pipeline_strategy(monkeypatch, names, concurrency=limits)
+    in_flight: list[int] = []
+    update_content = search_manager.update_content
+
+    async def slow_update(sections, url=None):
+        in_flight.append(strategy.progress.listed - strategy.progress.finished)
+        await asyncio.sleep(0.005)
+        await update_content(sections, url=url)
+
+    search_manager.update_content = slow_update
+    await strategy.run()
+
+    assert strategy.progress.indexed == 30
+    # One file per worker and per queue slot at most, plus the one the producer is handing over
+    assert max(in_flight) <= 4 * 2 + 1
+
+
+@pytest.mark.asyncio
+async def test_process_figures_runs_figures_concurrently():
+    pages = [Page(page_num=0, offset=0, text="t")]
+    pages[0].images = [
+        ImageOnPage(
+            bytes=b"img", bbox=(0, 0, 1, 1), page_num=0, figure_id=f"f{i}", filename=f"f{i}.png", placeholder=""
+        )
+        for i in range(10)
+    ]
+    probe = ConcurrencyProbe(0.01)
+    count = await process_figures(
+        pages, "doc.pdf", blob_manager=FakeBlobManager(), figure_processor=probe, limit=asyncio.Semaphore(3)
+    )
+    assert count == 10
+    assert probe.max_in_flight == 3
+    assert all(image.description == "a figure" and image.url for image in pages[0].images)
@@ -704,3 +704,67 @@ def test_append_overlap_preserves_next_chunk_start():
             # If this occurs, safe_concat would have inserted a space earlier; treat as failure
             boundary_ok = tail_of_first.endswith(" ")
     assert boundary_ok, "First chunk tail and second chunk head joined mid-word without boundary handling"
+
+
+def _reference_split_by_max_tokens(
+    text: str, max_tokens: int, splitter: SentenceTextSplitter, encoded: list[str]
+) -> list[str]:
+    """Re-encode-every-half recursion the offset-map split must reproduce."""
+    encoded.append(text)
+    if len(_bpe_for_guard.encode(text)) <= max_tokens:
+        return [text]
+    split_pos, use_overlap = splitter._find_split_pos(text)
+    if not use_overlap and split_pos > 0:
+        halves = [text[: split_pos + 1], text[split_pos + 1 :]]
+    else:
+        middle = len(text) // 2
+        overlap = int(len(text) * 0.1)
+        halves = [text[: middle + overlap], text[middle - overlap :]]
+    return [part for half in halves for part in _reference_split_by_max_tokens(half, max_tokens, splitter, encoded)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        " ".join(["alpha", "beta", "gamma", "delta"] * 900),
+        "abcdefghij" * 600,
+        "1234567890" * 600,
+        SINGLE_TOKEN_CHAR * 2500,
+        "混沌初開，乾坤始奠" * 300,
+    ],
+)
+def test_split_page_by_max_tokens_encodes_once(monkeypatch, text):
+    """Halves are sized from one encoding; chunk outputs match re-encoding each half."""
+    splitter = SentenceTextSplitter(max_tokens_per_section=120)
+    reference_encoded: list[str] = []
+    expected = _reference_split_by_max_tokens(text, 120, splitter, reference_encoded)
+
+    encoded: list[str] = []
+    original_encode = _bpe_for_guard.encode
+
+    class _Counting:
+        def encode(self, s, *args, **kwargs):
+            encoded.append(s)
+            return original_encode(s, *args, **kwargs)
+
+        def __getattr__(self, name):
+            return getattr(_bpe_for_guard, name)
+
+    monkeypatch.setattr("prepdocslib.textsplitter.bpe", _Counting())
+    chunks = [c.text for c in splitter.split_page_by_max_tokens(0, text)]
+
+    assert chunks == expected
+    assert encoded[0] == text
+    # Only halves whose estimate lands near the limit are re-encoded
+    assert sum(len(s) for s in encoded) < sum(len(s) for s in reference_encoded)
+
+
+def test_trim_fragment_matches_stepwise_shrink():
+    """The offset-map trim picks the same fragment as shrinking 50 chars at a time."""
+    splitter = SentenceTextSplitter(max_tokens_per_section=60)
+    suffix = "continues on the next page with more words"
+    for fragment in ["word " * 90, "x" * 400, SINGLE_TOKEN_CHAR * 75, "a b " * 10, ""]:
+        expected = fragment
+        while expected and len(_bpe_for_guard.encode(expected + suffix)) > 60:
+            expected = expected[:-50] if len(expected) > 50 else expected[:-1]
+        assert splitter._trim_fragment_to_token_limit(fragment, suffix) == expected
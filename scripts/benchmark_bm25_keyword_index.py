@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BM25 inverted index vs. normalise-and-CONTAINS keyword scans
+=======================================================================
+
+Compares the two ways the keyword paths (``get_keyword_boost_chunks``,
+``Neo4jTextUnitStore.get_chunks_for_query``) can rank text for a query over
+a synthetic corpus:
+
+  scan   – the per-query work of the previous Cypher: lowercase + strip
+           whitespace/punctuation from every sentence, then test each
+           keyword needle with substring ``CONTAINS`` (emulated in Python;
+           Neo4j does the same full property scan server-side)
+  index  – ``BM25Index.search`` over postings built once
+
+Also reports index build time, on-disk size (``BM25Index.save``) and reload
+time, which bound the cost of the startup build / refresh on version change.
+
+Usage:
+    python scripts/benchmark_bm25_keyword_index.py
+    python scripts/benchmark_bm25_keyword_index.py --sentences 100000 --queries 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.worker.hybrid_v2.retrievers.bm25_index import BM25Index  # noqa: E402
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+_NORMALISE = re.compile(r"[\s\-\.,:;()\[\]{}]")
+
+
+def _corpus(n: int, vocab_size: int, seed: int) -> Tuple[List[Tuple[str, str]], List[str]]:
+    rng = random.Random(seed)
+    # Suffixed so no word is a substring of another (keeps the scan honest).
+    vocab = [f"w{i}x" for i in range(vocab_size)]
+    # Zipf-ish word frequencies, like real contract text.
+    weights = [1.0 / (i + 1) for i in range(vocab_size)]
+    docs = []
+    for i in range(n):
+        words = rng.choices(vocab, weights=weights, k=rng.randint(8, 30))
+        docs.append((f"doc_{i // 200:05d}_sent_{i:07d}", " ".join(words).capitalize() + "."))
+    return docs, vocab
+
+
+def _queries(vocab: List[str], count: int, seed: int) -> List[List[str]]:
+    rng = random.Random(seed + 1)
+    mid = vocab[50:2000]
+    return [rng.sample(mid, rng.randint(2, 5)) for _ in range(count)]
+
+
+def _scan(docs: List[Tuple[str, str]], keywords: List[str], limit: int) -> List[Tuple[str, int]]:
+    needles = [_NORMALISE.sub("", k.lower()) for k in keywords]
+    hits = []
+    for key, text in docs:
+        norm = _NORMALISE.sub("", text.lower())
+        count = sum(1 for k in needles if k in norm)
+        if count:
+            hits.append((key, count))
+    hits.sort(key=lambda h: -h[1])
+    return hits[:limit]
+
+
+def _latency(fn, queries: List[List[str]]) -> Dict[str, float]:
+    samples = []
+    for q in queries:
+        t0 = time.perf_counter()
+        fn(q)
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(0.95 * (len(samples) - 1))], 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BM25 index vs CONTAINS scan keyword lookup")
+    parser.add_argument("--sentences", type=int, default=100_000)
+    parser.add_argument("--vocab", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--scan-queries", type=int, default=10, help="Queries timed for the (slow) scan")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    docs, vocab = _corpus(args.sentences, args.vocab, args.seed)
+    queries = _queries(vocab, args.queries, args.seed)
+
+    t0 = time.perf_counter()
+    index = BM25Index.build(docs)
+    build_s = time.perf_counter() - t0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bm25.npz"
+        index.save(path)
+        size_mb = path.stat().st_size / 1e6
+        t0 = time.perf_counter()
+        BM25Index.load(path)
+        load_s = time.perf_counter() - t0
+
+    scan = _latency(lambda q: _scan(docs, q, args.limit), queries[: args.scan_queries])
+    indexed = _latency(lambda q: index.search(q, top_k=args.limit), queries)
+
+    # Overlap of the two candidate sets (the scan is substring-based, the
+    # index token-based; on single-token keywords they agree on matches).
+    overlap = []
+    for q in queries[: args.scan_queries]:
+        a = {k for k, _ in _scan(docs, q, 10_000)}
+        b = {k for k, _, _ in index.search(q, top_k=10_000)}
+        overlap.append(len(a & b) / max(len(a | b), 1))
+
+    report: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "sentences": args.sentences,
+        "vocabulary": index.vocabulary_size,
+        "build_s": round(build_s, 2),
+        "index_file_mb": round(size_mb, 1),
+        "load_s": round(load_s, 3),
+        "scan": scan,
+        "index": indexed,
+        "speedup_p50": round(scan["p50_ms"] / max(indexed["p50_ms"], 1e-6), 1),
+        "match_set_jaccard": round(statistics.fmean(overlap), 3) if overlap else None,
+    }
+
+    print(f"corpus      {args.sentences} sentences, {index.vocabulary_size} terms")
+    print(f"build       {report['build_s']:.2f}s   file {report['index_file_mb']:.1f}MB   load {report['load_s']:.3f}s")
+    print(f"scan        p50={scan['p50_ms']:>9.2f}ms  p95={scan['p95_ms']:>9.2f}ms")
+    print(f"index       p50={indexed['p50_ms']:>9.2f}ms  p95={indexed['p95_ms']:>9.2f}ms")
+    print(f"speedup     {report['speedup_p50']}x   match-set jaccard {report['match_set_jaccard']}")
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"bm25_keyword_index_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
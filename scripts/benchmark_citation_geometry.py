@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark: citation geometry enrichment, event-loop stall before/after
+======================================================================
+
+Measures how long citation geometry enrichment blocks the event loop while
+several route requests are in flight. A simulated Neo4j driver adds a fixed
+round-trip latency; a loop-lag probe (``asyncio.sleep`` of 1 ms in a tight
+loop) records how late each wake-up is.
+
+  legacy   – sync ``_enrich_citations_with_geometry`` called from the async
+             route (query + ``json.loads`` of the full Sentence metadata,
+             whose page_dimensions list every page of the document)
+  current  – ``_enrich_citations_with_geometry_async`` via the shared graph
+             reader (executor / async driver) and the compact ``geometry``
+             property
+
+Usage:
+    python scripts/benchmark_citation_geometry.py
+    python scripts/benchmark_citation_geometry.py --requests 50 --db-latency-ms 20 --pages 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.worker.hybrid_v2.routes.base import BaseRouteHandler, Citation  # noqa: E402
+from src.worker.hybrid_v2.services.graph_read_repository import GraphReadRepository  # noqa: E402
+from src.worker.hybrid_v2.utils.geometry import compact_sentence_geometry  # noqa: E402
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+def _sentence_metadata(i: int, pages: int) -> Dict[str, Any]:
+    page = 1 + i % pages
+    return {
+        "sentences": [{
+            "text": f"Sentence {i} of the agreement text.",
+            "polygons": [[0.1, 0.1 + 0.001 * j, 0.9, 0.1, 0.9, 0.12, 0.1, 0.12] for j in range(4)],
+            "page": page,
+            "confidence": 0.99,
+        }],
+        "page_dimensions": [
+            {"page": p, "width": 8.5, "height": 11.0, "unit": "inch", "angle": 0.0}
+            for p in range(1, pages + 1)
+        ],
+    }
+
+
+class _FakeResult:
+    def __init__(self, records):
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def keys(self):
+        return ["id", "text", "geometry", "metadata"]
+
+    def consume(self):
+        return None
+
+
+class _FakeDriver:
+    """Sync driver stand-in: every read sleeps for the simulated round trip."""
+
+    def __init__(self, rows: Dict[str, Dict[str, Any]], latency_s: float):
+        self.rows = rows
+        self.latency_s = latency_s
+
+    @contextmanager
+    def session(self, **kwargs):
+        driver = self
+
+        class _Tx:
+            def run(self, query, params):
+                time.sleep(driver.latency_s)
+                return _FakeResult([driver.rows[i] for i in params["ids"] if i in driver.rows])
+
+        class _Session:
+            def execute_read(self, fn):
+                return fn(_Tx())
+
+        yield _Session()
+
+
+def _handler(driver: _FakeDriver) -> BaseRouteHandler:
+    handler = BaseRouteHandler.__new__(BaseRouteHandler)
+    handler.neo4j_driver = driver
+    handler.group_ids = ["bench"]
+    handler._graph_reads = GraphReadRepository(driver=driver)
+    return handler
+
+
+def _citations(offset: int, n: int) -> List[Citation]:
+    return [
+        Citation(index=i + 1, sentence_id=f"s{offset + i}", document_id="d",
+                 document_title="Doc", score=1.0, text_preview="")
+        for i in range(n)
+    ]
+
+
+async def _probe(stop: asyncio.Event, lags: List[float]) -> None:
+    interval = 0.001
+    while not stop.is_set():
+        t = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - t - interval))
+
+
+async def _run_mode(mode: str, handler: BaseRouteHandler, requests: int, per_request: int) -> Dict[str, Any]:
+    async def route_request(k: int) -> None:
+        await asyncio.sleep(0)  # stand-in for retrieval / synthesis awaits
+        citations = _citations(k * per_request, per_request)
+        if mode == "legacy":
+            handler._enrich_citations_with_geometry(citations)
+        else:
+            await handler._enrich_citations_with_geometry_async(citations)
+        assert all(c.sentences for c in citations)
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(stop, lags))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(route_request(k) for k in range(requests)))
+    wall = time.perf_counter() - start
+    stop.set()
+    await probe
+
+    lags.sort()
+    return {
+        "wall_ms": round(wall * 1000, 1),
+        "loop_lag_max_ms": round(lags[-1] * 1000, 2) if lags else 0.0,
+        "loop_lag_p99_ms": round(lags[int(0.99 * (len(lags) - 1))] * 1000, 2) if lags else 0.0,
+        "loop_lag_total_ms": round(sum(lags) * 1000, 1),
+        "probe_samples": len(lags),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Citation geometry event-loop stall benchmark")
+    parser.add_argument("--requests", type=int, default=20, help="concurrent route requests")
+    parser.add_argument("--citations", type=int, default=10, help="citations per request")
+    parser.add_argument("--pages", type=int, default=120, help="pages per source document")
+    parser.add_argument("--db-latency-ms", type=float, default=15.0)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    n = args.requests * args.citations
+    metas = [_sentence_metadata(i, args.pages) for i in range(n)]
+    legacy_rows = {
+        f"s{i}": {"id": f"s{i}", "text": m["sentences"][0]["text"], "geometry": None, "metadata": json.dumps(m)}
+        for i, m in enumerate(metas)
+    }
+    compact_rows = {
+        f"s{i}": {"id": f"s{i}", "text": m["sentences"][0]["text"],
+                  "geometry": compact_sentence_geometry(m), "metadata": None}
+        for i, m in enumerate(metas)
+    }
+    latency = args.db_latency_ms / 1000
+
+    results = {
+        "legacy": asyncio.run(_run_mode("legacy", _handler(_FakeDriver(legacy_rows, latency)),
+                                        args.requests, args.citations)),
+        "current": asyncio.run(_run_mode("current", _handler(_FakeDriver(compact_rows, latency)),
+                                         args.requests, args.citations)),
+    }
+    results["legacy"]["bytes_per_sentence"] = round(sum(len(r["metadata"]) for r in legacy_rows.values()) / n)
+    results["current"]["bytes_per_sentence"] = round(sum(len(r["geometry"]) for r in compact_rows.values()) / n)
+
+    for mode, r in results.items():
+        print(
+            f"{mode:>8}  wall {r['wall_ms']:>8.1f} ms   loop lag max {r['loop_lag_max_ms']:>7.2f} ms  "
+            f"p99 {r['loop_lag_p99_ms']:>6.2f} ms  total {r['loop_lag_total_ms']:>8.1f} ms   "
+            f"{r['bytes_per_sentence']} B/sentence"
+        )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "requests": args.requests,
+        "citations_per_request": args.citations,
+        "pages": args.pages,
+        "db_latency_ms": args.db_latency_ms,
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"citation_geometry_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: community matching, pure-Python cosine vs normalised matrix
+======================================================================
+
+Compares the per-query scoring step of ``CommunityMatcher._semantic_match``
+on synthetic 2048-d embeddings:
+
+  legacy   – the previous ``_cosine_similarity`` (zip/sum over Python floats)
+             called once per community, then a full sort
+  current  – ``utils.vectors``: one ``unit_rows`` matrix (built once per
+             group version, reported separately) scored with a single
+             matrix-vector product and ``top_k_indices``
+
+Usage:
+    python scripts/benchmark_cosine.py
+    python scripts/benchmark_cosine.py --communities 50 500 5000 --queries 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.worker.hybrid_v2.utils.vectors import top_k_indices, unit_rows, unit_vector  # noqa: E402
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+def _legacy_cosine(vec1: List[float], vec2: List[float]) -> float:
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = sum(a * a for a in vec1) ** 0.5
+    norm2 = sum(b * b for b in vec2) ** 0.5
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return dot_product / (norm1 * norm2)
+
+
+def _legacy_top_k(query: List[float], embeddings: List[List[float]], k: int) -> List[int]:
+    scored = [(i, _legacy_cosine(query, emb)) for i, emb in enumerate(embeddings)]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [i for i, _ in scored[:k]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Community cosine scoring benchmark")
+    parser.add_argument("--communities", type=int, nargs="+", default=[50, 500, 5_000])
+    parser.add_argument("--dim", type=int, default=2048)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(args.seed)
+    rows: List[Dict[str, Any]] = []
+    for n in args.communities:
+        embeddings = rng.normal(size=(n, args.dim)).tolist()
+        queries = rng.normal(size=(args.queries, args.dim)).tolist()
+
+        t0 = time.perf_counter()
+        legacy = [_legacy_top_k(q, embeddings, args.top_k) for q in queries]
+        legacy_ms = (time.perf_counter() - t0) * 1000 / args.queries
+
+        t0 = time.perf_counter()
+        matrix = unit_rows(embeddings)
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        current = [top_k_indices(matrix @ unit_vector(q), args.top_k).tolist() for q in queries]
+        current_ms = (time.perf_counter() - t0) * 1000 / args.queries
+
+        row = {
+            "communities": n,
+            "legacy_ms_per_query": round(legacy_ms, 3),
+            "current_ms_per_query": round(current_ms, 3),
+            "matrix_build_ms": round(build_ms, 2),
+            "speedup": round(legacy_ms / current_ms, 1) if current_ms else None,
+            "same_top_k": legacy == current,
+        }
+        rows.append(row)
+        print(
+            f"n={n:>6}  legacy {row['legacy_ms_per_query']:>9.3f} ms/q   "
+            f"current {row['current_ms_per_query']:>7.3f} ms/q   "
+            f"(build {row['matrix_build_ms']:.1f} ms)   x{row['speedup']}   same={row['same_top_k']}"
+        )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "dim": args.dim,
+        "queries": args.queries,
+        "top_k": args.top_k,
+        "results": rows,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"cosine_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prepdocslib OpenAIEmbeddings dispatch, sequential vs concurrent
+=========================================================================
+
+Embeds a set of section-sized texts through ``OpenAIEmbeddings`` against a
+fake async embeddings API that adds a fixed per-request latency and answers a
+fraction of requests with ``RateLimitError``. Retry backoff is shortened to
+``--backoff-s`` so runs finish quickly.
+
+  sequential – ``max_concurrency=1`` (one request in flight, like the old
+               one-batch-at-a-time loop)
+  concurrent – ``max_concurrency=N``
+
+Usage:
+    python scripts/benchmark_embedding_dispatch.py
+    python scripts/benchmark_embedding_dispatch.py --texts 2000 --concurrency 8 --rate-limit-pct 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+BACKEND_DIR = PROJECT_ROOT / "frontend" / "app" / "backend"
+for p in [str(THIS_DIR), str(PROJECT_ROOT), str(BACKEND_DIR)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import httpx  # noqa: E402
+import openai  # noqa: E402
+import tenacity  # noqa: E402
+from openai.types.create_embedding_response import Usage  # noqa: E402
+from prepdocslib import embeddings as embeddings_module  # noqa: E402
+from prepdocslib.embeddings import OpenAIEmbeddings  # noqa: E402
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+MODEL = "text-embedding-3-large"
+
+
+class _FakeEmbeddingsAPI:
+    def __init__(self, latency_s: float, rate_limit_pct: float, seed: int):
+        self.latency_s = latency_s
+        self.rate_limit_pct = rate_limit_pct
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.rate_limited = 0
+
+    async def create(self, *, model: str, input, **kwargs):
+        texts = [input] if isinstance(input, str) else list(input)
+        self.requests += 1
+        await asyncio.sleep(self.latency_s)
+        if self.rng.random() * 100 < self.rate_limit_pct:
+            self.rate_limited += 1
+            response = httpx.Response(429, request=httpx.Request("POST", "https://example.invalid/embeddings"))
+            raise openai.RateLimitError(message="Too many requests", response=response, body=None)
+        return openai.types.CreateEmbeddingResponse(
+            object="list",
+            data=[openai.types.Embedding(embedding=[0.0], index=i, object="embedding") for i in range(len(texts))],
+            model=model,
+            usage=Usage(prompt_tokens=0, total_tokens=0),
+        )
+
+
+class _FakeClient:
+    def __init__(self, api: _FakeEmbeddingsAPI):
+        self.embeddings = api
+
+
+def _texts(n: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    words = "agreement payment warranty invoice tenant landlord notice clause liability section".split()
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(150, 400))) for _ in range(n)]
+
+
+async def _run(texts: List[str], concurrency: int, args: argparse.Namespace) -> Dict[str, Any]:
+    api = _FakeEmbeddingsAPI(args.latency_ms / 1000, args.rate_limit_pct, args.seed)
+    service = OpenAIEmbeddings(
+        open_ai_client=_FakeClient(api),
+        open_ai_model_name=MODEL,
+        open_ai_dimensions=3072,
+        disable_batch=args.disable_batch,
+        max_concurrency=concurrency,
+    )
+    start = time.perf_counter()
+    vectors = await service.create_embeddings(texts)
+    elapsed = time.perf_counter() - start
+    assert len(vectors) == len(texts)
+    return {
+        "max_concurrency": concurrency,
+        "wall_s": round(elapsed, 3),
+        "texts_per_s": round(len(texts) / elapsed, 1),
+        "requests": api.requests,
+        "rate_limited": api.rate_limited,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Embedding dispatch throughput benchmark")
+    parser.add_argument("--texts", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=OpenAIEmbeddings.DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="simulated request latency")
+    parser.add_argument("--rate-limit-pct", type=float, default=5.0, help="share of requests answered with 429")
+    parser.add_argument("--backoff-s", type=float, default=1.0, help="retry wait after a 429")
+    parser.add_argument("--disable-batch", action="store_true", help="one request per text")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    embeddings_module.wait_random_exponential = lambda *a, **k: tenacity.wait_fixed(args.backoff_s)
+    texts = _texts(args.texts, args.seed)
+
+    results = {
+        "sequential": asyncio.run(_run(texts, 1, args)),
+        "concurrent": asyncio.run(_run(texts, args.concurrency, args)),
+    }
+    speedup = results["sequential"]["wall_s"] / results["concurrent"]["wall_s"]
+
+    for mode, r in results.items():
+        print(
+            f"{mode:>10}  concurrency {r['max_concurrency']:>2}   {r['wall_s']:>7.2f} s   "
+            f"{r['texts_per_s']:>7.1f} texts/s   {r['requests']} requests, {r['rate_limited']} rate limited"
+        )
+    print(f"speedup: {speedup:.1f}x")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "texts": args.texts,
+        "latency_ms": args.latency_ms,
+        "rate_limit_pct": args.rate_limit_pct,
+        "backoff_s": args.backoff_s,
+        "disable_batch": args.disable_batch,
+        "results": results,
+        "speedup": round(speedup, 2),
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"embedding_dispatch_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
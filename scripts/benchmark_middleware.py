@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark: gateway middleware stack, BaseHTTPMiddleware layers vs pure ASGI
+===========================================================================
+
+Local load test of the API gateway's per-request middleware on a minimal
+FastAPI app (no network, no Azure). Two stacks are compared:
+
+  legacy   – CorrelationId → Version → GroupIsolation → JWTAuth, four
+             BaseHTTPMiddleware layers (the previous main.py setup)
+  current  – one RequestContextMiddleware (pure ASGI) with the JWT claims
+             cache
+
+The app is driven directly over ASGI with concurrent requests, so the
+numbers reflect middleware overhead only:
+
+  JSON      – requests/sec for a small authenticated JSON endpoint
+  SSE       – time to first event and total time for a 20-event stream
+
+Usage:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --requests 5000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import jwt as pyjwt  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+
+from src.api_gateway.middleware import auth as auth_module  # noqa: E402
+from src.api_gateway.middleware.auth import JWTAuthMiddleware  # noqa: E402
+from src.api_gateway.middleware.correlation import CorrelationIdMiddleware  # noqa: E402
+from src.api_gateway.middleware.group_isolation import GroupIsolationMiddleware  # noqa: E402
+from src.api_gateway.middleware.request_context import RequestContextMiddleware  # noqa: E402
+from src.api_gateway.middleware.version import VersionHeaderMiddleware  # noqa: E402
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+def _build_app(stack: str, stream_events: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping(request: Request):
+        return {"group_id": request.state.group_id}
+
+    @app.get("/api/stream")
+    async def stream():
+        async def events():
+            for i in range(stream_events):
+                yield f"data: {i}\n\n"
+                await asyncio.sleep(0)
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    if stack == "legacy":
+        app.add_middleware(CorrelationIdMiddleware)
+        app.add_middleware(VersionHeaderMiddleware)
+        app.add_middleware(GroupIsolationMiddleware)
+        app.add_middleware(JWTAuthMiddleware, auth_type="B2B", require_auth=True)
+    else:
+        app.add_middleware(RequestContextMiddleware, auth_type="B2B", require_auth=True)
+    return app
+
+
+async def _call(app, path: str, token: str) -> Tuple[float, float, int]:
+    """Run one request; returns (first body chunk s, total s, status)."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "server": ("bench", 80), "client": ("127.0.0.1", 1),
+        "headers": [(b"authorization", f"Bearer {token}".encode()), (b"host", b"bench")],
+    }
+    sent = False
+    status = 0
+    first = None
+    start = time.perf_counter()
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status, first
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body") and first is None:
+            first = time.perf_counter() - start
+
+    await app(scope, receive, send)
+    total = time.perf_counter() - start
+    return (first if first is not None else total), total, status
+
+
+async def _load(app, path: str, token: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    queue = iter(range(requests))
+    firsts: List[float] = []
+    totals: List[float] = []
+    failures = 0
+
+    async def worker():
+        nonlocal failures
+        for _ in queue:
+            first, total, status = await _call(app, path, token)
+            if status != 200:
+                failures += 1
+            firsts.append(first)
+            totals.append(total)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    def pct(values: List[float], q: float) -> float:
+        return round(sorted(values)[min(len(values) - 1, int(q * len(values)))] * 1000, 3)
+
+    return {
+        "requests": requests,
+        "failures": failures,
+        "rps": round(requests / elapsed, 1),
+        "first_chunk_ms_p50": round(statistics.median(firsts) * 1000, 3),
+        "first_chunk_ms_p95": pct(firsts, 0.95),
+        "total_ms_p50": round(statistics.median(totals) * 1000, 3),
+        "total_ms_p95": pct(totals, 0.95),
+    }
+
+
+async def _run(args: argparse.Namespace) -> Dict[str, Any]:
+    token = pyjwt.encode(
+        {"oid": "bench-user", "groups": ["bench-group"], "roles": ["User"], "exp": int(time.time()) + 3600},
+        "benchmark-signing-key-0123456789abcdef", algorithm="HS256",
+    )
+    results: Dict[str, Any] = {}
+    for stack in ("legacy", "current"):
+        auth_module.clear_claims_cache()
+        app = _build_app(stack, args.stream_events)
+        await _load(app, "/api/ping", token, min(200, args.requests), args.concurrency)  # warm-up
+        results[stack] = {
+            "json": await _load(app, "/api/ping", token, args.requests, args.concurrency),
+            "sse": await _load(app, "/api/stream", token, args.stream_requests, args.concurrency),
+        }
+        j, s = results[stack]["json"], results[stack]["sse"]
+        print(
+            f"{stack:>8}  json {j['rps']:>8.1f} req/s (p95 {j['total_ms_p95']:.2f} ms)   "
+            f"sse first-event p50 {s['first_chunk_ms_p50']:.2f} ms  p95 {s['first_chunk_ms_p95']:.2f} ms   "
+            f"total p50 {s['total_ms_p50']:.2f} ms"
+        )
+    legacy_rps = results["legacy"]["json"]["rps"]
+    results["json_rps_speedup"] = round(results["current"]["json"]["rps"] / legacy_rps, 2) if legacy_rps else None
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gateway middleware load test")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--stream-requests", type=int, default=500)
+    parser.add_argument("--stream-events", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    auth_module.settings.GROUP_ID_OVERRIDE = None
+    results = asyncio.run(_run(args))
+    print(f"\nJSON throughput: x{results['json_rps_speedup']}")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "concurrency": args.concurrency,
+        "stream_events": args.stream_events,
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"middleware_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MinHash/LSH near-duplicate detection vs. greedy O(n²) Jaccard
+=======================================================================
+
+Compares the two ways semantic dedup (synthesis chunk dedup, sentence
+denoising, Route 7 MMR) can drop near-duplicate text:
+
+  legacy    – the previous inline loop: each candidate is compared with
+              every already-kept text by word-set Jaccard
+  detector  – ``dedup_indices`` (exact hash tier + MinHash/LSH candidates,
+              each candidate verified with the exact Jaccard)
+
+Reports wall time at several corpus sizes and whether the kept sets agree.
+
+Usage:
+    python scripts/benchmark_near_duplicates.py
+    python scripts/benchmark_near_duplicates.py --sizes 100 1000 10000 --threshold 0.92
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.worker.hybrid_v2.utils.near_duplicates import (  # noqa: E402
+    dedup_indices,
+    jaccard,
+    word_set,
+)
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+def _corpus(n: int, dup_rate: float, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    vocab = [f"w{i}x" for i in range(20_000)]
+    texts: List[str] = []
+    for _ in range(n):
+        if texts and rng.random() < dup_rate:
+            words = rng.choice(texts).split()
+            for _ in range(rng.randint(0, 2)):
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+            texts.append(" ".join(words))
+        else:
+            texts.append(" ".join(rng.sample(vocab, rng.randint(40, 120))))
+    return texts
+
+
+def _legacy(texts: List[str], threshold: float) -> List[int]:
+    sets = [word_set(t) for t in texts]
+    kept: List[int] = []
+    for idx, ws in enumerate(sets):
+        if ws and any(sets[k] and jaccard(ws, sets[k]) >= threshold for k in kept):
+            continue
+        kept.append(idx)
+    return kept
+
+
+def _timed(fn) -> Any:
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MinHash/LSH vs brute-force near-duplicate removal")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--threshold", type=float, default=0.92)
+    parser.add_argument("--dup-rate", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    rows: List[Dict[str, Any]] = []
+    for n in args.sizes:
+        texts = _corpus(n, args.dup_rate, args.seed)
+        legacy_kept, legacy_ms = _timed(lambda: _legacy(texts, args.threshold))
+        kept, detector_ms = _timed(lambda: dedup_indices(texts, args.threshold))
+        rows.append({
+            "texts": n,
+            "kept": len(kept),
+            "legacy_ms": round(legacy_ms, 1),
+            "detector_ms": round(detector_ms, 1),
+            "speedup": round(legacy_ms / max(detector_ms, 1e-6), 1),
+            "identical_kept_set": kept == legacy_kept,
+        })
+        r = rows[-1]
+        print(
+            f"n={n:>6}  kept={r['kept']:>6}  legacy={r['legacy_ms']:>10.1f}ms  "
+            f"detector={r['detector_ms']:>8.1f}ms  speedup={r['speedup']:>6}x  "
+            f"identical={r['identical_kept_set']}"
+        )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "threshold": args.threshold,
+        "dup_rate": args.dup_rate,
+        "results": rows,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"near_duplicates_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Benchmark: native async Neo4j reads vs. thread-offloaded sync reads
+===================================================================
+
+Drives ``GraphReadRepository.fetch`` at several concurrency levels twice:
+
+  baseline – ``NEO4J_ASYNC_READS=0``: sync driver + ``asyncio.to_thread``
+             (the pre-repository behaviour of every route handler)
+  async    – ``NEO4J_ASYNC_READS=1``: ``AsyncNeo4jService`` native driver
+
+Two backends:
+
+  --simulate-latency-ms N  (default) SIMULATION — fake drivers that hold each
+                           read for N ms (``time.sleep`` on the sync side,
+                           ``asyncio.sleep`` on the async side).  Only shows
+                           thread-pool vs event-loop scheduling of those
+                           sleeps; no Neo4j driver, network or server work is
+                           measured.
+  --live                   real Neo4j from settings (NEO4J_URI / NEO4J_PASSWORD);
+                           runs ``--query`` against the configured database.
+                           Use this for any claim about async Neo4j reads.
+
+Usage:
+    python scripts/benchmark_neo4j_async_reads.py
+    python scripts/benchmark_neo4j_async_reads.py --concurrency 8 32 128 --requests 512
+    python scripts/benchmark_neo4j_async_reads.py --live --query "MATCH (n:Entity) RETURN n.name LIMIT 20"
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.worker.hybrid_v2.services.graph_read_repository import GraphReadRepository  # noqa: E402
+
+DEFAULT_QUERY = "RETURN 1 AS ok"
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+# ── Simulated drivers ────────────────────────────────────────────────────────
+
+class _FakeResult:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __aiter__(self):
+        self._it = iter(self._rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    def keys(self):
+        return list(self._rows[0]) if self._rows else []
+
+    def consume(self):
+        return None
+
+
+class _FakeSyncSession:
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+
+    def execute_read(self, fn):
+        return fn(self)
+
+    def run(self, query, params):
+        time.sleep(self._latency_s)
+        return _FakeResult([{"ok": 1}])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _FakeAsyncResult(_FakeResult):
+    async def consume(self):  # type: ignore[override]
+        return None
+
+
+class _FakeAsyncSession:
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+
+    async def execute_read(self, fn):
+        return await fn(self)
+
+    async def run(self, query, params):
+        await asyncio.sleep(self._latency_s)
+        return _FakeAsyncResult([{"ok": 1}])
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class _FakeSyncDriver:
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+
+    def session(self, **kwargs):
+        return _FakeSyncSession(self._latency_s)
+
+
+class _FakeAsyncDriver:
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+
+    def session(self, **kwargs):
+        return _FakeAsyncSession(self._latency_s)
+
+
+def _simulated_repository(latency_ms: float) -> GraphReadRepository:
+    from src.worker.services.async_neo4j_service import AsyncNeo4jService
+
+    latency_s = latency_ms / 1000.0
+    service = AsyncNeo4jService("neo4j://simulated", "neo4j", "")
+    service._driver = _FakeAsyncDriver(latency_s)
+    return GraphReadRepository(driver=_FakeSyncDriver(latency_s), async_neo4j=service)
+
+
+async def _live_repository() -> GraphReadRepository:
+    from src.core.config import settings
+    from src.worker.services.async_neo4j_service import AsyncNeo4jService
+    from src.worker.services.neo4j_pool import get_neo4j_pool
+
+    service = AsyncNeo4jService.from_settings()
+    await service.connect()
+    return GraphReadRepository(
+        driver=get_neo4j_pool().get_driver(),
+        async_neo4j=service,
+        database=settings.NEO4J_DATABASE or "neo4j",
+    )
+
+
+# ── Load generator ──────────────────────────────────────────────────────────
+
+async def _run_level(repo: GraphReadRepository, query: str, concurrency: int, requests: int) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def _one():
+        async with semaphore:
+            t0 = time.perf_counter()
+            await repo.fetch(query)
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(requests)))
+    wall_s = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "wall_s": round(wall_s, 3),
+        "throughput_rps": round(requests / wall_s, 1),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 1),
+    }
+
+
+async def _run(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.live:
+        repo = await _live_repository()
+    else:
+        print(
+            f"SIMULATION: no Neo4j is contacted; each read is a {args.simulate_latency_ms:g} ms sleep. "
+            "Use --live to measure real async reads.\n"
+        )
+        repo = _simulated_repository(args.simulate_latency_ms)
+    results: Dict[str, List[Dict[str, Any]]] = {"baseline_to_thread": [], "native_async": []}
+    for mode, flag in (("baseline_to_thread", "0"), ("native_async", "1")):
+        os.environ["NEO4J_ASYNC_READS"] = flag
+        await repo.fetch(args.query)  # warm-up (driver pools, default executor)
+        for concurrency in args.concurrency:
+            requests = max(args.requests, concurrency)
+            row = await _run_level(repo, args.query, concurrency, requests)
+            results[mode].append(row)
+            print(
+                f"{mode:<20} c={concurrency:<4} {row['throughput_rps']:>8.1f} req/s"
+                f"  p50={row['p50_ms']:>7.1f}ms  p95={row['p95_ms']:>7.1f}ms"
+            )
+    if args.live and repo.async_neo4j is not None:
+        await repo.async_neo4j.close()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "backend": "live" if args.live else f"simulated_{args.simulate_latency_ms}ms",
+        "cpu_count": os.cpu_count(),
+        "query": args.query,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark async vs thread-offloaded Neo4j reads")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--requests", type=int, default=512, help="Reads per concurrency level")
+    parser.add_argument(
+        "--simulate-latency-ms", type=float, default=20.0,
+        help="Simulated read latency (default backend; no Neo4j involved)",
+    )
+    parser.add_argument("--live", action="store_true", help="Use the Neo4j instance from settings")
+    parser.add_argument("--query", default=DEFAULT_QUERY)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    report = asyncio.run(_run(args))
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"neo4j_async_reads_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark: peak RSS of eager vs streamed embedding loads from Neo4j
+===================================================================
+
+Compares the two ways a bulk load (triple store, sentence KNN) can pull a
+group's embeddings through ``RetrySession``:
+
+  eager   – ``session.run()`` materializes every record (a Python float list
+            per embedding), then ``np.array`` copies them into a matrix
+            (the previous behaviour)
+  stream  – ``session.read_embeddings()``: keyset pages copied straight into a
+            preallocated float32 matrix
+
+Each mode runs in its own subprocess against a synthetic in-memory "driver"
+that produces driver-shaped records (lists of Python floats), and reports the
+process's peak RSS (``ru_maxrss``) above the post-import baseline.
+
+Usage:
+    python scripts/benchmark_neo4j_streaming_load.py
+    python scripts/benchmark_neo4j_streaming_load.py --rows 20000 --dim 2048 --page-size 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+class _SyntheticResult:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def keys(self):
+        return ["id", "document_id", "embedding"]
+
+    def consume(self):
+        return None
+
+
+class _SyntheticSession:
+    """Raw session that builds driver-shaped records on demand."""
+
+    def __init__(self, rows: int, dim: int):
+        self._n = rows
+        self._dim = dim
+
+    def _record(self, i: int) -> Dict[str, Any]:
+        value = (i % 997) / 997.0
+        return {
+            "id": f"s{i:09d}",
+            "document_id": f"doc{i % 50}",
+            "embedding": [value + k * 1e-6 for k in range(self._dim)],
+        }
+
+    def execute_read(self, fn):
+        return fn(self)
+
+    def run(self, query, params):
+        if "limit" not in params:
+            return _SyntheticResult([self._record(i) for i in range(self._n)])
+        after = params["after"]
+        start = 0 if after is None else int(after[1:]) + 1
+        stop = min(self._n, start + params["limit"])
+        return _SyntheticResult([self._record(i) for i in range(start, stop)])
+
+
+def _child(mode: str, rows: int, dim: int, page_size: int) -> Dict[str, Any]:
+    import numpy as np
+
+    from src.worker.hybrid_v2.services.neo4j_retry import RetrySession
+
+    session = RetrySession(_SyntheticSession(rows, dim), read_only=True)
+    baseline = _peak_rss_mb()
+    t0 = time.perf_counter()
+    if mode == "eager":
+        records = [dict(r) for r in session.run("MATCH (s:Sentence) RETURN s")]
+        matrix = np.array([list(r["embedding"]) for r in records], dtype=np.float32)
+    else:
+        records, matrix, _ = session.read_embeddings(
+            "MATCH (s:Sentence) RETURN s", expected_rows=rows, page_size=page_size,
+        )
+    elapsed = time.perf_counter() - t0
+    return {
+        "mode": mode,
+        "rows": len(records),
+        "matrix_mb": round(matrix.nbytes / 1e6, 1),
+        "peak_rss_over_baseline_mb": round(_peak_rss_mb() - baseline, 1),
+        "elapsed_s": round(elapsed, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Peak RSS of eager vs streamed embedding loads")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--dim", type=int, default=2048)
+    parser.add_argument("--page-size", type=int, default=2000)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--child", choices=["eager", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_child(args.child, args.rows, args.dim, args.page_size)))
+        return
+
+    results = []
+    for mode in ("eager", "stream"):
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", mode, "--rows", str(args.rows),
+             "--dim", str(args.dim), "--page-size", str(args.page_size)],
+            capture_output=True, text=True, check=True, cwd=PROJECT_ROOT,
+        )
+        row = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append(row)
+        print(
+            f"{mode:<7} rows={row['rows']:<7} matrix={row['matrix_mb']:>7.1f}MB "
+            f"peak_rss=+{row['peak_rss_over_baseline_mb']:>8.1f}MB  {row['elapsed_s']:>6.2f}s"
+        )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "rows": args.rows,
+        "dim": args.dim,
+        "page_size": args.page_size,
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"neo4j_streaming_load_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
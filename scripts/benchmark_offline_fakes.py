@@ -0,0 +1,1492 @@
+"""
+In-memory stand-ins for the hybrid pipeline's external services.
+
+Used by ``benchmark_offline_pipeline.py`` to run ``HybridPipeline.query`` and
+``LazyGraphRAGIndexingPipeline.index_documents`` without Azure OpenAI, Voyage
+or Neo4j, so CPU time and allocations of the pipeline's own code can be
+profiled on a laptop or in CI:
+
+  FakeLLM           – deterministic LlamaIndex-shaped LLM with configurable
+                      latency and token counts; wrap it in the real
+                      ``TrackedLLM`` via ``make_tracked_llm``.  Router, NER,
+                      triple, key-point and sentence-review prompts get
+                      well-formed JSON back.
+  HashEmbedder      – hashing-trick bag-of-words vectors (unit length), so
+                      texts sharing words are close in cosine space.
+  FakeVoyageClient  – ``voyageai.Client`` look-alike (``contextualized_embed``,
+                      ``embed``, ``rerank``) backed by ``HashEmbedder``.
+  SyntheticCorpus   – documents → sections → sentences with entities and
+                      triples, generated from a seed at a configurable size.
+  FixtureDriver     – ``neo4j.Driver`` look-alike (``as_async()`` gives the
+                      async API).  Replays recorded rows (``RecordingDriver``
+                      captures them from a live database) and falls back to
+                      ``SyntheticResponder``, which shapes rows from the
+                      query's RETURN clause over the synthetic corpus.
+
+``install_offline_services`` patches the Voyage client, the LlamaIndex
+Voyage embedding class, the wtpsplit sentence splitter and the Neo4j pool
+so the real service classes run against these stand-ins.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from unittest import mock
+
+import numpy as np
+
+EMBED_DIM = 2048  # settings.VOYAGE_EMBEDDING_DIM
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+def _stable_hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class _Stats:
+    """Call counter and cumulative wall time for one stand-in (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.seconds = 0.0
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.calls += 1
+            self.seconds += seconds
+
+    def snapshot(self) -> Tuple[int, float]:
+        with self._lock:
+            return self.calls, self.seconds
+
+
+# ─── Embeddings ──────────────────────────────────────────────────
+
+
+class HashEmbedder:
+    """Deterministic unit vectors from hashed, signed word counts."""
+
+    def __init__(self, dim: int = EMBED_DIM, cache_size: int = 50_000) -> None:
+        self.dim = dim
+        self._cache: Dict[str, np.ndarray] = {}
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def vector(self, text: str) -> np.ndarray:
+        with self._lock:
+            cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in _TOKEN_RE.findall(text.lower()):
+            h = _stable_hash(token)
+            vec[h % self.dim] += 1.0 if (h >> 32) & 1 else -1.0
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            vec[_stable_hash(text) % self.dim] = 1.0
+        else:
+            vec /= norm
+        with self._lock:
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[text] = vec
+        return vec
+
+    def embed(self, text: str) -> List[float]:
+        return self.vector(text).tolist()
+
+
+class FakeVoyageClient:
+    """The subset of ``voyageai.Client`` used by ``VoyageEmbedService`` and the routes."""
+
+    stats = _Stats()
+
+    def __init__(self, embedder: HashEmbedder, latency_s: float = 0.0) -> None:
+        self._embedder = embedder
+        self._latency_s = latency_s
+
+    def _wait(self, start: float) -> None:
+        if self._latency_s:
+            time.sleep(self._latency_s)
+        self.stats.add(time.perf_counter() - start)
+
+    @staticmethod
+    def _usage(texts: Sequence[str]) -> SimpleNamespace:
+        return SimpleNamespace(total_tokens=sum(len(t) // 4 + 1 for t in texts))
+
+    def contextualized_embed(self, inputs, model=None, input_type=None, output_dimension=None, **kwargs):
+        start = time.perf_counter()
+        results = [
+            SimpleNamespace(index=i, embeddings=[self._embedder.embed(t) for t in chunks])
+            for i, chunks in enumerate(inputs)
+        ]
+        self._wait(start)
+        return SimpleNamespace(results=results, usage=self._usage([t for chunks in inputs for t in chunks]))
+
+    def embed(self, texts, model=None, input_type=None, output_dimension=None, **kwargs):
+        start = time.perf_counter()
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        embeddings = [self._embedder.embed(t) for t in texts]
+        self._wait(start)
+        return SimpleNamespace(embeddings=embeddings, total_tokens=self._usage(texts).total_tokens)
+
+    def rerank(self, query, documents, model=None, top_k=None, truncation=True, **kwargs):
+        start = time.perf_counter()
+        q = self._embedder.vector(query)
+        scored = [
+            SimpleNamespace(index=i, document=doc, relevance_score=float((np.dot(q, self._embedder.vector(doc)) + 1) / 2))
+            for i, doc in enumerate(documents)
+        ]
+        scored.sort(key=lambda r: -r.relevance_score)
+        if top_k:
+            scored = scored[:top_k]
+        self._wait(start)
+        return SimpleNamespace(results=scored, total_tokens=self._usage([query, *documents]).total_tokens)
+
+
+def make_hash_embedding(embedder: HashEmbedder):
+    """LlamaIndex ``BaseEmbedding`` factory standing in for ``VoyageEmbedding``."""
+    from llama_index.core.base.embeddings.base import BaseEmbedding
+
+    class HashEmbedding(BaseEmbedding):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(model_name=kwargs.get("model_name") or "hash-embedding")
+
+        def _get_query_embedding(self, query: str) -> List[float]:
+            return embedder.embed(query)
+
+        def _get_text_embedding(self, text: str) -> List[float]:
+            return embedder.embed(text)
+
+        async def _aget_query_embedding(self, query: str) -> List[float]:
+            return embedder.embed(query)
+
+    return HashEmbedding
+
+
+# ─── LLM ─────────────────────────────────────────────────────────
+
+
+class FakeLLM:
+    """Deterministic LLM with the LlamaIndex completion/chat surface.
+
+    Latency is ``latency_s + completion_tokens * per_token_s``; usage is
+    reported in ``response.raw["usage"]`` so ``TrackedLLM`` accounts for it.
+    """
+
+    stats = _Stats()
+
+    def __init__(
+        self,
+        route: str = "local_search",
+        latency_s: float = 0.0,
+        per_token_s: float = 0.0,
+        completion_tokens: int = 200,
+        seed: int = 0,
+    ) -> None:
+        self.route = route
+        self.latency_s = latency_s
+        self.per_token_s = per_token_s
+        self.completion_tokens = completion_tokens
+        self.seed = seed
+        self.model = "fake-llm"
+        self.metadata = SimpleNamespace(context_window=128_000, num_output=4096, model_name=self.model)
+
+    # ── Responses ────────────────────────────────────────────────
+    def respond(self, prompt: str) -> str:
+        if "You are a query router" in prompt:
+            return json.dumps({"route": self.route, "reasoning": "offline benchmark"})
+        lowered = prompt.lower()
+        if "named_entities" in lowered:
+            return json.dumps({"named_entities": _capitalised_phrases(prompt)[:20]})
+        if "triples" in lowered and "json" in lowered:
+            return json.dumps({"triples": _triples_from_prompt(prompt)})
+        if '{"points"' in prompt:
+            return json.dumps({"points": _points_from_prompt(prompt)})
+        review = re.search(r"(?:Sections|Segments) to review[^:]*:\n(.*?)\n\nReturn ONLY", prompt, re.DOTALL)
+        if review:
+            # Sentence-boundary review: accept the input unchanged
+            return review.group(1).strip()
+        return self._answer(prompt)
+
+    def _answer(self, prompt: str) -> str:
+        rng = random.Random(_stable_hash(prompt) ^ self.seed)
+        words = _TOKEN_RE.findall(prompt)[-400:] or ["offline"]
+        sentences = []
+        remaining = self.completion_tokens
+        i = 1
+        while remaining > 0:
+            n = min(remaining, rng.randint(12, 24))
+            sentences.append(f"{i}. " + " ".join(rng.choice(words) for _ in range(n)) + f" [{i}].")
+            remaining -= n
+            i += 1
+        return "\n".join(sentences)
+
+    def _usage(self, prompt: str, text: str) -> Dict[str, Any]:
+        prompt_tokens = len(prompt) // 4 + 1
+        completion_tokens = len(text) // 4 + 1
+        return {
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            }
+        }
+
+    def _delay(self) -> float:
+        return self.latency_s + self.completion_tokens * self.per_token_s
+
+    def _completion(self, prompt: str, start: float):
+        from llama_index.core.base.llms.types import CompletionResponse
+
+        text = self.respond(prompt)
+        response = CompletionResponse(text=text, raw=self._usage(prompt, text))
+        self.stats.add(time.perf_counter() - start)
+        return response
+
+    # ── LlamaIndex surface ───────────────────────────────────────
+    def complete(self, prompt: str, **kwargs: Any):
+        start = time.perf_counter()
+        if self._delay():
+            time.sleep(self._delay())
+        return self._completion(prompt, start)
+
+    def complete_json(self, prompt: str) -> Optional[Any]:
+        """``sentence_extraction_service._call_llm_json`` replacement."""
+        try:
+            return json.loads(self.complete(prompt).text)
+        except ValueError:
+            return None
+
+    async def acomplete(self, prompt: str, **kwargs: Any):
+        import asyncio
+
+        start = time.perf_counter()
+        if self._delay():
+            await asyncio.sleep(self._delay())
+        return self._completion(prompt, start)
+
+    async def astream_complete(self, prompt: str, **kwargs: Any):
+        response = await self.acomplete(prompt, **kwargs)
+
+        async def _gen():
+            from llama_index.core.base.llms.types import CompletionResponse
+
+            text = ""
+            for token in response.text.split(" "):
+                delta = token + " "
+                text += delta
+                yield CompletionResponse(text=text, delta=delta)
+
+        return _gen()
+
+    def _chat(self, messages: Sequence[Any], start: float):
+        from llama_index.core.base.llms.types import ChatMessage, ChatResponse
+
+        prompt = "\n".join(str(getattr(m, "content", m) or "") for m in messages)
+        text = self.respond(prompt)
+        response = ChatResponse(message=ChatMessage(role="assistant", content=text), raw=self._usage(prompt, text))
+        self.stats.add(time.perf_counter() - start)
+        return response
+
+    def chat(self, messages: Sequence[Any], **kwargs: Any):
+        start = time.perf_counter()
+        if self._delay():
+            time.sleep(self._delay())
+        return self._chat(messages, start)
+
+    async def achat(self, messages: Sequence[Any], **kwargs: Any):
+        import asyncio
+
+        start = time.perf_counter()
+        if self._delay():
+            await asyncio.sleep(self._delay())
+        return self._chat(messages, start)
+
+
+_CAPS_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b")
+_SID_LINE_RE = re.compile(r"^\s*\[?([\w:.-]+)\]?\s*:\s*(.+)$", re.MULTILINE)
+
+
+def _capitalised_phrases(text: str) -> List[str]:
+    seen: Dict[str, None] = {}
+    for match in _CAPS_RE.findall(text):
+        if len(match) > 3:
+            seen.setdefault(match, None)
+    return list(seen)
+
+
+def _triples_from_prompt(prompt: str) -> List[Dict[str, str]]:
+    triples = []
+    for sid, line in _SID_LINE_RE.findall(prompt):
+        names = _capitalised_phrases(line)
+        for subj, obj in zip(names, names[1:]):
+            triples.append({"sid": sid, "s": subj, "p": "related to", "o": obj})
+    return triples[:50]
+
+
+def _points_from_prompt(prompt: str) -> List[Dict[str, Any]]:
+    """Community key points: one scored point per source-text line."""
+    points = []
+    for line in prompt.splitlines():
+        line = line.strip()
+        if line.startswith("[") and "]:" in line:
+            title, _, text = line[1:].partition("]:")
+            points.append({"description": text.strip()[:300], "score": 80 - len(points), "community": title})
+    return points[:20]
+
+
+def make_tracked_llm(llm: FakeLLM, deployment_name: str = "fake-llm"):
+    """Wrap *llm* in the real ``TrackedLLM`` so usage flows into the accumulator."""
+    from src.core.services.tracked_llm import TrackedLLM
+
+    return TrackedLLM(llm, deployment_name=deployment_name)
+
+
+# ─── Synthetic corpus ────────────────────────────────────────────
+
+_COMPANIES = [
+    "Contoso", "Fabrikam", "Northwind", "Adventure Works", "Tailspin", "Litware", "Proseware",
+    "Woodgrove", "Wingtip", "Alpine Ski", "Coho Winery", "Lamna Healthcare", "Margie Travel",
+    "Relecloud", "Trey Research", "Wide World Importers", "Blue Yonder", "Humongous Insurance",
+]
+_PEOPLE = [
+    "Alice Brown", "Carlos Diaz", "Dana Evans", "Farah Ghani", "Hiro Ito", "Jana Kral",
+    "Liam Moore", "Nadia Okafor", "Pavel Quinn", "Rosa Silva", "Tomas Ueda", "Vera Walsh",
+]
+_SECTIONS = [
+    "Payment Terms", "Warranty", "Termination", "Confidentiality", "Liability", "Insurance",
+    "Governing Law", "Delivery", "Indemnification", "Notices", "Scope of Work", "Fees",
+]
+_TEMPLATES = [
+    "{a} shall pay {b} the invoiced amount of ${amount} within {days} days of receipt.",
+    "{a} warrants to {b} that all deliverables conform to the specification for {days} months.",
+    "Either {a} or {b} may terminate this agreement with {days} days written notice.",
+    "{a} shall keep confidential all information disclosed by {b} under this agreement.",
+    "The liability of {a} to {b} shall not exceed ${amount} in aggregate.",
+    "{a} shall maintain insurance coverage of at least ${amount} naming {b} as insured.",
+    "This agreement between {a} and {b} is governed by the laws of the State of Washington.",
+    "{a} shall deliver the goods to the premises of {b} within {days} business days.",
+    "{a} shall indemnify {b} against third party claims arising from negligence.",
+    "Notices to {a} shall be sent to the attention of {person} at the registered address.",
+    "{person} signed on behalf of {a} and approved the statement of work for {b}.",
+    "The fees payable by {b} to {a} are ${amount} per month plus applicable taxes.",
+]
+_QUERY_TEMPLATES = [
+    "What are the payment terms between {a} and {b}?",
+    "Who signed the agreement on behalf of {a}?",
+    "What is the liability cap for {a}?",
+    "How many days notice is required to terminate the {b} agreement?",
+    "Summarise the warranty obligations of {a}.",
+    "Which documents mention {a} and {b} together?",
+    "What insurance must {a} maintain?",
+    "Compare the fees charged by {a} across all agreements.",
+]
+
+
+@dataclass
+class SyntheticCorpus:
+    """Documents, sections, sentences, entities and triples as plain dicts."""
+
+    group_id: str
+    documents: List[Dict[str, Any]] = field(default_factory=list)
+    sections: List[Dict[str, Any]] = field(default_factory=list)
+    sentences: List[Dict[str, Any]] = field(default_factory=list)
+    entities: List[Dict[str, Any]] = field(default_factory=list)
+    triples: List[Dict[str, Any]] = field(default_factory=list)
+    communities: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def generate(
+        cls,
+        group_id: str,
+        documents: int = 10,
+        sections_per_document: int = 6,
+        sentences_per_section: int = 8,
+        seed: int = 0,
+    ) -> "SyntheticCorpus":
+        rng = random.Random(seed)
+        corpus = cls(group_id=group_id)
+        entity_index: Dict[str, Dict[str, Any]] = {}
+
+        def entity(name: str, etype: str) -> Dict[str, Any]:
+            if name not in entity_index:
+                entity_index[name] = {
+                    "id": f"{group_id}_ent_{len(entity_index)}",
+                    "name": name,
+                    "type": etype,
+                    "description": f"{name} ({etype.lower()})",
+                    "sentence_ids": [],
+                    "document_ids": [],
+                }
+            return entity_index[name]
+
+        for d in range(documents):
+            a, b = rng.sample(_COMPANIES, 2)
+            doc_id = f"{group_id}_doc_{d}"
+            title = f"{a} {b} Agreement {d}"
+            doc = {"id": doc_id, "title": title, "source": f"{title.lower().replace(' ', '_')}.pdf",
+                   "section_ids": [], "sentence_ids": [], "content": ""}
+            paragraphs = []
+            index_in_doc = 0
+            for s in range(sections_per_document):
+                section_title = _SECTIONS[(d + s) % len(_SECTIONS)]
+                path = f"{s + 1}. {section_title}"
+                section_id = f"{doc_id}_sec_{s}"
+                section = {"id": section_id, "title": section_title, "path_key": path, "document_id": doc_id,
+                           "sentence_ids": [], "summary": ""}
+                texts = []
+                for i in range(sentences_per_section):
+                    person = rng.choice(_PEOPLE)
+                    text = rng.choice(_TEMPLATES).format(
+                        a=a, b=b, person=person, amount=rng.randint(1, 500) * 1000, days=rng.choice([10, 15, 30, 45, 60, 90]),
+                    )
+                    sid = f"{doc_id}_sent_{index_in_doc}"
+                    names = [n for n in (a, b, person) if n in text]
+                    corpus.sentences.append({
+                        "id": sid, "text": text, "document_id": doc_id, "doc_title": title,
+                        "section_id": section_id, "section_path": path, "index_in_doc": index_in_doc,
+                        "index_in_section": i, "page": 1 + index_in_doc // 20, "source": "paragraph",
+                        "entity_names": names,
+                    })
+                    for n in names:
+                        ent = entity(n, "PERSON" if n in _PEOPLE else "ORGANIZATION")
+                        ent["sentence_ids"].append(sid)
+                        if doc_id not in ent["document_ids"]:
+                            ent["document_ids"].append(doc_id)
+                    for subj, obj in zip(names, names[1:]):
+                        corpus.triples.append({"id": f"{sid}_t{len(corpus.triples)}", "subject": subj,
+                                               "predicate": "related to", "object": obj, "sentence_id": sid})
+                    section["sentence_ids"].append(sid)
+                    doc["sentence_ids"].append(sid)
+                    texts.append(text)
+                    index_in_doc += 1
+                section["summary"] = " ".join(texts[:2])
+                corpus.sections.append(section)
+                doc["section_ids"].append(section_id)
+                paragraphs.append(f"{path}\n\n" + " ".join(texts))
+            doc["content"] = "\n\n".join(paragraphs)
+            corpus.documents.append(doc)
+
+        corpus.entities = list(entity_index.values())
+        for c, start in enumerate(range(0, len(corpus.entities), 5)):
+            members = corpus.entities[start:start + 5]
+            names = [m["name"] for m in members]
+            corpus.communities.append({
+                "id": f"{group_id}_comm_{c}", "title": " / ".join(names[:2]),
+                "summary": "Agreements involving " + ", ".join(names) + ".",
+                "entity_ids": [m["id"] for m in members], "level": 0, "rank": float(len(members)),
+            })
+        return corpus
+
+    def queries(self, n: int, seed: int = 0) -> List[str]:
+        rng = random.Random(seed)
+        companies = [e["name"] for e in self.entities if e["type"] == "ORGANIZATION"] or _COMPANIES
+        return [
+            rng.choice(_QUERY_TEMPLATES).format(a=rng.choice(companies), b=rng.choice(companies))
+            for _ in range(n)
+        ]
+
+    def index_documents(self) -> List[Dict[str, Any]]:
+        """Documents in the shape ``LazyGraphRAGIndexingPipeline.index_documents`` accepts."""
+        return [{"id": d["id"], "title": d["title"], "source": d["source"], "content": d["content"]}
+                for d in self.documents]
+
+
+# ─── Neo4j stand-ins ─────────────────────────────────────────────
+
+
+def normalize_cypher(query: str) -> str:
+    return " ".join(str(query).split())
+
+
+class FakeRecord(dict):
+    """Dict with the ``neo4j.Record`` accessors the pipeline uses."""
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return super().__getitem__(key)
+
+    def __missing__(self, key):
+        return None
+
+    def data(self, *keys: str) -> Dict[str, Any]:
+        return {k: self[k] for k in keys} if keys else dict(self)
+
+    def value(self, key=0, default=None):
+        try:
+            return self[key]
+        except (IndexError, KeyError):
+            return default
+
+
+class FakeResult:
+    """Eager ``neo4j.Result`` look-alike."""
+
+    def __init__(self, rows: Sequence[Dict[str, Any]], keys: Optional[Sequence[str]] = None) -> None:
+        self._records = [r if isinstance(r, FakeRecord) else FakeRecord(r) for r in rows]
+        self._keys = list(keys) if keys is not None else (list(self._records[0]) if self._records else [])
+
+    def __iter__(self) -> Iterator[FakeRecord]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def keys(self) -> List[str]:
+        return self._keys
+
+    def single(self, strict: bool = False) -> Optional[FakeRecord]:
+        return self._records[0] if self._records else None
+
+    def peek(self) -> Optional[FakeRecord]:
+        return self.single()
+
+    def data(self, *keys: str) -> List[Dict[str, Any]]:
+        return [r.data(*keys) for r in self._records]
+
+    def values(self, *keys: str) -> List[List[Any]]:
+        return [[r[k] for k in keys] if keys else list(r.values()) for r in self._records]
+
+    def value(self, key=0, default=None) -> List[Any]:
+        return [r.value(key, default) for r in self._records]
+
+    def fetch(self, n: int) -> List[FakeRecord]:
+        return self._records[:n]
+
+    def consume(self) -> SimpleNamespace:
+        return SimpleNamespace(counters=SimpleNamespace(), result_available_after=0, result_consumed_after=0)
+
+    def to_eager_result(self):
+        return self._records, self.consume(), self._keys
+
+
+class _FakeTx:
+    def __init__(self, driver: "FixtureDriver") -> None:
+        self._driver = driver
+
+    def run(self, query, parameters=None, **kwargs):
+        return self._driver.run(query, {**(parameters or {}), **kwargs})
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, driver: "FixtureDriver") -> None:
+        self._driver = driver
+
+    def run(self, query, parameters=None, **kwargs):
+        return self._driver.run(query, {**(parameters or {}), **kwargs})
+
+    def execute_read(self, fn: Callable, *args, **kwargs):
+        return fn(_FakeTx(self._driver), *args, **kwargs)
+
+    execute_write = execute_read
+    read_transaction = execute_read
+    write_transaction = execute_read
+
+    def begin_transaction(self, *args, **kwargs) -> _FakeTx:
+        return _FakeTx(self._driver)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FixtureDriver:
+    """Sync driver answering from recorded fixtures, then a synthetic responder.
+
+    Fixtures map a normalised Cypher string to the row lists it returned, in
+    call order; repeated calls cycle through them.  ``latency_s`` adds a
+    simulated round trip per query.
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[Dict[str, List[List[Dict[str, Any]]]]] = None,
+        responder: Optional["SyntheticResponder"] = None,
+        latency_s: float = 0.0,
+    ) -> None:
+        self._fixtures = fixtures or {}
+        self._responder = responder
+        self._latency_s = latency_s
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.stats = _Stats()
+        self.replayed = 0
+        self.synthesised = 0
+        self.unanswered: Dict[str, int] = defaultdict(int)
+
+    @classmethod
+    def from_file(cls, path: Path, **kwargs: Any) -> "FixtureDriver":
+        payload = json.loads(Path(path).read_text())
+        return cls({q["cypher"]: q["responses"] for q in payload.get("queries", [])}, **kwargs)
+
+    def run(self, query: str, params: Dict[str, Any]) -> FakeResult:
+        start = time.perf_counter()
+        key = normalize_cypher(query)
+        rows: Optional[List[Dict[str, Any]]] = None
+        responses = self._fixtures.get(key)
+        if responses:
+            with self._lock:
+                rows = responses[self._cursor[key] % len(responses)]
+                self._cursor[key] += 1
+                self.replayed += 1
+        elif self._responder is not None:
+            rows = self._responder.respond(key, params)
+            with self._lock:
+                self.synthesised += 1
+        else:
+            with self._lock:
+                self.unanswered[key[:120]] += 1
+        if self._latency_s:
+            time.sleep(self._latency_s)
+        self.stats.add(time.perf_counter() - start)
+        return FakeResult(rows or [])
+
+    def session(self, **kwargs: Any) -> _FakeSession:
+        return _FakeSession(self)
+
+    def execute_query(self, query, parameters=None, **kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if k not in ("database_", "routing_", "result_transformer_")}
+        return self.run(query, {**(parameters or {}), **kwargs}).to_eager_result()
+
+    def verify_connectivity(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def as_async(self) -> "AsyncFixtureDriver":
+        return AsyncFixtureDriver(self)
+
+
+class _AsyncFakeResult(FakeResult):
+    async def single(self, strict: bool = False):  # type: ignore[override]
+        return super().single(strict)
+
+    async def peek(self):  # type: ignore[override]
+        return super().peek()
+
+    async def data(self, *keys: str):  # type: ignore[override]
+        return super().data(*keys)
+
+    async def values(self, *keys: str):  # type: ignore[override]
+        return super().values(*keys)
+
+    async def value(self, key=0, default=None):  # type: ignore[override]
+        return super().value(key, default)
+
+    async def fetch(self, n: int):  # type: ignore[override]
+        return super().fetch(n)
+
+    async def consume(self):  # type: ignore[override]
+        return super().consume()
+
+    async def to_eager_result(self):  # type: ignore[override]
+        return super().to_eager_result()
+
+    def __aiter__(self):
+        async def _gen():
+            for record in self._records:
+                yield record
+        return _gen()
+
+
+class _AsyncFakeTx:
+    def __init__(self, driver: FixtureDriver) -> None:
+        self._driver = driver
+
+    async def run(self, query, parameters=None, **kwargs):
+        result = self._driver.run(query, {**(parameters or {}), **kwargs})
+        return _AsyncFakeResult(list(result), result.keys())
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class _AsyncFakeSession(_AsyncFakeTx):
+    async def execute_read(self, fn: Callable, *args, **kwargs):
+        return await fn(_AsyncFakeTx(self._driver), *args, **kwargs)
+
+    execute_write = execute_read
+
+    async def begin_transaction(self, *args, **kwargs) -> _AsyncFakeTx:
+        return _AsyncFakeTx(self._driver)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class AsyncFixtureDriver:
+    """``neo4j.AsyncDriver`` façade over a ``FixtureDriver`` (shared fixtures and stats)."""
+
+    def __init__(self, driver: FixtureDriver) -> None:
+        self._sync = driver
+        self.stats = driver.stats
+
+    def session(self, **kwargs: Any) -> _AsyncFakeSession:
+        return _AsyncFakeSession(self._sync)
+
+    async def execute_query(self, query, parameters=None, **kwargs):
+        return self._sync.execute_query(query, parameters, **kwargs)
+
+    async def verify_connectivity(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, dict) or hasattr(value, "items"):
+        return {str(k): _jsonable(v) for k, v in dict(value).items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class RecordingDriver:
+    """Wraps a live sync driver and records every query's rows for ``FixtureDriver``.
+
+    Nodes and relationships are stored as their property dicts; other
+    driver types are stored as strings.
+    """
+
+    def __init__(self, driver: Any) -> None:
+        self._driver = driver
+        self._lock = threading.Lock()
+        self._queries: Dict[str, List[List[Dict[str, Any]]]] = defaultdict(list)
+
+    def _record(self, query: str, result: Any) -> FakeResult:
+        records = list(result)
+        rows = [_jsonable({k: r[k] for k in r.keys()}) for r in records]
+        with self._lock:
+            self._queries[normalize_cypher(query)].append(rows)
+        return FakeResult(rows, keys=list(result.keys()))
+
+    def session(self, **kwargs: Any):
+        recorder = self
+        inner = self._driver.session(**kwargs)
+
+        class _Tx:
+            def __init__(self, tx):
+                self._tx = tx
+
+            def run(self, query, parameters=None, **kw):
+                return recorder._record(query, self._tx.run(query, parameters, **kw))
+
+        class _Session:
+            def run(self, query, parameters=None, **kw):
+                return recorder._record(query, inner.run(query, parameters, **kw))
+
+            def execute_read(self, fn, *args, **kw):
+                return inner.execute_read(lambda tx, *a, **k: fn(_Tx(tx), *a, **k), *args, **kw)
+
+            def execute_write(self, fn, *args, **kw):
+                return inner.execute_write(lambda tx, *a, **k: fn(_Tx(tx), *a, **k), *args, **kw)
+
+            def close(self):
+                inner.close()
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                inner.close()
+                return False
+
+        return _Session()
+
+    async def _arecord(self, query: str, result: Any) -> _AsyncFakeResult:
+        records = [r async for r in result]
+        rows = [_jsonable({k: r[k] for k in r.keys()}) for r in records]
+        with self._lock:
+            self._queries[normalize_cypher(query)].append(rows)
+        return _AsyncFakeResult(rows, keys=list(result.keys()))
+
+    def as_async(self, driver: Any) -> Any:
+        """Recording façade over the live async *driver*, sharing this recorder."""
+        recorder = self
+
+        class _Tx:
+            def __init__(self, tx):
+                self._tx = tx
+
+            async def run(self, query, parameters=None, **kw):
+                return await recorder._arecord(query, await self._tx.run(query, parameters, **kw))
+
+            def __getattr__(self, name):
+                return getattr(self._tx, name)
+
+        class _Session:
+            def __init__(self, inner):
+                self._inner = inner
+
+            async def run(self, query, parameters=None, **kw):
+                return await recorder._arecord(query, await self._inner.run(query, parameters, **kw))
+
+            async def execute_read(self, fn, *args, **kw):
+                return await self._inner.execute_read(lambda tx, *a, **k: fn(_Tx(tx), *a, **k), *args, **kw)
+
+            async def execute_write(self, fn, *args, **kw):
+                return await self._inner.execute_write(lambda tx, *a, **k: fn(_Tx(tx), *a, **k), *args, **kw)
+
+            async def begin_transaction(self, *args, **kw):
+                return _Tx(await self._inner.begin_transaction(*args, **kw))
+
+            async def close(self):
+                await self._inner.close()
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                await self._inner.close()
+                return False
+
+        class _Driver:
+            def session(self, **kwargs):
+                return _Session(driver.session(**kwargs))
+
+            def __getattr__(self, name):
+                return getattr(driver, name)
+
+        return _Driver()
+
+    def save(self, path: Path) -> int:
+        with self._lock:
+            queries = [{"cypher": q, "responses": r} for q, r in self._queries.items()]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps({"queries": queries}, indent=1))
+        return len(queries)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
+
+
+# ─── Synthetic responder ─────────────────────────────────────────
+
+_RETURN_RE = re.compile(r"\bRETURN\b", re.IGNORECASE)
+_TAIL_RE = re.compile(r"(?<![$.])\b(ORDER\s+BY|SKIP|LIMIT|UNION)\b", re.IGNORECASE)
+_LIMIT_RE = re.compile(r"(?<![$.])\bLIMIT\s+(\$?\w+)", re.IGNORECASE)
+_AS_RE = re.compile(r"^(.*?)\s+AS\s+([`\w]+)$", re.IGNORECASE | re.DOTALL)
+_VAR_LABEL_RE = re.compile(r"\(\s*(\w+)\s*:\s*`?(\w+)`?")
+_WITH_RE = re.compile(
+    r"\bWITH\b(.*?)(?=(?<![$.])\b(?:OPTIONAL|MATCH|WITH|RETURN|UNWIND|WHERE|ORDER|CALL|MERGE|CREATE|SET|LIMIT|SKIP)\b|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_UNWIND_RE = re.compile(r"\bUNWIND\s+\$(\w+)\s+AS\s+(\w+)", re.IGNORECASE)
+_CALL_RE = re.compile(r"^\s*(\w+)\s*\((.*)\)\s*$", re.DOTALL)
+_SLICE_RE = re.compile(r"^(.*)\[\s*(\$?\w*)\s*\.\.\s*(\$?\w*)\s*\]\s*$", re.DOTALL)
+_PROP_RE = re.compile(r"^(\w+)\.(\w+)$")
+_WRITE_RE = re.compile(r"\b(CREATE|MERGE|DELETE|SET|REMOVE|DROP)\b", re.IGNORECASE)
+_AGGREGATES = {"count", "collect", "sum", "avg", "min", "max", "percentilecont", "stdev"}
+_COUNTS = {"size", "count", "length"}
+_PASSTHROUGH = {"coalesce", "tolower", "toupper", "trim", "tostring", "head", "last", "distinct",
+                "tointeger", "tofloat", "properties", "nodes", "reverse"}
+
+_LABEL_KINDS = {
+    "sentence": "sentences", "textchunk": "sentences", "chunk": "sentences", "passage": "sentences",
+    "entity": "entities", "__entity__": "entities", "keyvalue": "entities", "concept": "entities",
+    "document": "documents", "section": "sections", "community": "communities", "triple": "triples",
+}
+_PLURAL_KINDS = {
+    "sentences": "sentences", "chunks": "sentences", "passages": "sentences", "texts": "sentences",
+    "entities": "entities", "neighbors": "entities", "neighbours": "entities", "mentions": "entities",
+    "documents": "documents", "docs": "documents", "sections": "sections", "communities": "communities",
+    "triples": "triples", "facts": "triples",
+}
+
+
+def _split_top_level(text: str, sep: str = ",") -> List[str]:
+    parts, depth, current, quote = [], 0, [], None
+    for ch in text:
+        if quote:
+            current.append(ch)
+            if ch == quote:
+                quote = None
+            continue
+        if ch in "'\"":
+            quote = ch
+        elif ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return parts
+
+
+def _enclosed(expr: str, open_ch: str, close_ch: str) -> bool:
+    """Whether *expr* is one bracketed group, e.g. ``{a: 1}`` but not ``{a: 1}[0]``."""
+    if not (expr.startswith(open_ch) and expr.endswith(close_ch)):
+        return False
+    depth = 0
+    for i, ch in enumerate(expr):
+        depth += ch in "([{"
+        depth -= ch in ")]}"
+        if depth == 0 and i < len(expr) - 1:
+            return False
+    return True
+
+
+def _with_aliases(query: str) -> Dict[str, str]:
+    """``alias -> expression`` for every ``expr AS alias`` projected by a WITH clause."""
+    aliases = {}
+    for clause in _WITH_RE.findall(query):
+        clause = re.sub(r"^\s*DISTINCT\b", "", clause, flags=re.IGNORECASE)
+        for part in _split_top_level(clause):
+            m = _AS_RE.match(part)
+            if m and m.group(1).strip() != m.group(2):
+                aliases[m.group(2).strip("`")] = m.group(1).strip()
+    return aliases
+
+
+def _return_items(query: str) -> List[Tuple[str, str]]:
+    """``(expression, column)`` pairs of the query's last top-level RETURN."""
+    matches = list(_RETURN_RE.finditer(query))
+    if not matches:
+        return []
+    clause = query[matches[-1].end():]
+    depth = 0
+    for i, ch in enumerate(clause):  # a RETURN inside CALL { } closes before the outer query resumes
+        depth += ch in "([{"
+        depth -= ch in ")]}"
+        if depth < 0:
+            clause = clause[:i]
+            break
+    tail = _TAIL_RE.search(clause)
+    if tail:
+        clause = clause[:tail.start()]
+    clause = re.sub(r"^\s*DISTINCT\b", "", clause, flags=re.IGNORECASE)
+    items = []
+    for part in _split_top_level(clause):
+        m = _AS_RE.match(part)
+        items.append((m.group(1).strip(), m.group(2).strip("`")) if m else (part, part))
+    return items
+
+
+@dataclass
+class _Scope:
+    """What a RETURN expression is evaluated against for one row."""
+
+    item: Dict[str, Any]
+    kind: str
+    score: float
+    count: int
+    labels: Dict[str, str]
+    params: Dict[str, Any]
+    bindings: Dict[str, Any] = field(default_factory=dict)
+    aliases: Dict[str, str] = field(default_factory=dict)
+
+    def at(self, item: Dict[str, Any], kind: str) -> "_Scope":
+        return _Scope(item, kind, self.score, self.count, self.labels, self.params, self.bindings, self.aliases)
+
+
+class SyntheticResponder:
+    """Shapes result rows from a query's RETURN clause over a ``SyntheticCorpus``.
+
+    Not a Cypher engine.  The row's node kind comes from the labels bound to
+    the returned variables; each RETURN expression is evaluated by a small
+    interpreter that understands property access, maps, lists, pattern and
+    list comprehensions, ``collect``/``count``/``size``/``coalesce``,
+    parameters and ``UNWIND $param``.  Anything else is filled in from the
+    column name (``*_id``, ``text``, ``score``, ``embedding``...).  Rows are
+    ranked against any vector or text parameter and capped by LIMIT /
+    ``$top_k``; keyset ``$after`` paging is honoured.
+    """
+
+    def __init__(self, corpus: SyntheticCorpus, embedder: HashEmbedder, default_rows: int = 25,
+                 fanout: int = 5) -> None:
+        self.corpus = corpus
+        self.embedder = embedder
+        self.default_rows = default_rows
+        self.fanout = fanout
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._kinds: Dict[str, List[Dict[str, Any]]] = {
+            "sentences": corpus.sentences, "entities": corpus.entities, "documents": corpus.documents,
+            "sections": corpus.sections, "communities": corpus.communities, "triples": corpus.triples,
+        }
+        for items in self._kinds.values():
+            for item in items:
+                self._by_id[item["id"]] = item
+        self._by_name = {e["name"].lower(): e for e in corpus.entities}
+        self._matrices: Dict[str, np.ndarray] = {}
+
+    # ── Corpus navigation ────────────────────────────────────────
+    @staticmethod
+    def _text(item: Dict[str, Any]) -> str:
+        return (item.get("text") or item.get("summary") or item.get("description") or item.get("title")
+                or item.get("name") or " ".join(str(item.get(k, "")) for k in ("subject", "predicate", "object")))
+
+    def _matrix(self, kind: str) -> np.ndarray:
+        if kind not in self._matrices:
+            items = self._kinds[kind]
+            self._matrices[kind] = (
+                np.stack([self.embedder.vector(self._text(i)) for i in items])
+                if items else np.zeros((0, self.embedder.dim), dtype=np.float32)
+            )
+        return self._matrices[kind]
+
+    def _ids(self, ids: Sequence[str]) -> List[Dict[str, Any]]:
+        return [self._by_id[i] for i in ids[: self.fanout] if i in self._by_id]
+
+    def _related(self, item: Dict[str, Any], kind: str) -> List[Dict[str, Any]]:
+        """Up to ``fanout`` items of *kind* linked to *item* in the corpus."""
+        if kind == "documents":
+            doc = self._by_id.get(item.get("document_id", ""))
+            return [doc] if doc else self._ids(item.get("document_ids") or [])
+        if kind == "sections":
+            sec = self._by_id.get(item.get("section_id", ""))
+            return [sec] if sec else self._ids(item.get("section_ids") or [])
+        if kind == "sentences":
+            if "sentence_id" in item:
+                return self._ids([item["sentence_id"]])
+            ids = item.get("sentence_ids") or []
+            if not ids and item.get("entity_ids"):
+                ids = [s for e in self._ids(item["entity_ids"]) for s in e["sentence_ids"]]
+            if not ids and "section_id" in item:  # neighbouring sentences
+                sec = self._by_id.get(item["section_id"], {})
+                ids = [s for s in sec.get("sentence_ids", []) if s != item["id"]]
+            return self._ids(ids)
+        if kind == "entities":
+            if "sentence_ids" in item and "name" in item:  # co-mentioned entities
+                names = {n for s in self._ids(item["sentence_ids"]) for n in s["entity_names"]} - {item["name"]}
+            else:
+                names = item.get("entity_names") or [item.get("subject"), item.get("object")]
+            found = [self._by_name[n.lower()] for n in sorted(n for n in names if n) if n.lower() in self._by_name]
+            return found[: self.fanout] or self._ids(item.get("entity_ids") or [])
+        if kind == "triples":
+            sids = set(item.get("sentence_ids") or ([item["sentence_id"]] if "sentence_id" in item else [item["id"]]))
+            return [t for t in self.corpus.triples if t["sentence_id"] in sids][: self.fanout]
+        if kind == "communities":
+            return [c for c in self.corpus.communities if item.get("id") in c["entity_ids"]][:1]
+        return []
+
+    def _switch(self, scope: _Scope, kind: Optional[str]) -> Optional[_Scope]:
+        if kind is None or kind == scope.kind:
+            return scope
+        related = self._related(scope.item, kind)
+        return scope.at(related[0], kind) if related else None
+
+    def _node(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        node = {k: list(v) if isinstance(v, (list, tuple)) else v for k, v in item.items() if k != "content"}
+        node["embedding"] = self.embedder.embed(self._text(item))
+        return node
+
+    # ── Query analysis ───────────────────────────────────────────
+    def _kind_of(self, var: Optional[str], labels: Dict[str, str]) -> Optional[str]:
+        if not var:
+            return None
+        label = labels.get(var)
+        if label:
+            return _LABEL_KINDS.get(label.lower())
+        return None
+
+    def _primary_kind(self, query: str, items: List[Tuple[str, str]], labels: Dict[str, str]) -> str:
+        for expr, _ in items:
+            for var in re.findall(r"\b(\w+)\.\w+|^\s*(\w+)\s*$", expr):
+                kind = self._kind_of(var[0] or var[1], labels)
+                if kind:
+                    return kind
+        for label in labels.values():
+            kind = _LABEL_KINDS.get(label.lower())
+            if kind:
+                return kind
+        lowered = query.lower()
+        for needle, kind in (("sentence", "sentences"), ("entity", "entities"), ("section", "sections"),
+                             ("document", "documents"), ("community", "communities")):
+            if needle in lowered:
+                return kind
+        return "sentences"
+
+    def _row_limit(self, query: str, params: Dict[str, Any]) -> int:
+        m = None
+        for m in _LIMIT_RE.finditer(query):
+            pass
+        if m:
+            token = m.group(1)
+            value = params.get(token[1:]) if token.startswith("$") else token
+            try:
+                return max(0, int(value))
+            except (TypeError, ValueError):
+                pass
+        for key in ("top_k", "k", "limit", "page_size", "batch_size", "max_results"):
+            if isinstance(params.get(key), int):
+                return params[key]
+        return self.default_rows
+
+    def _lookup(self, value: Any, kind: str) -> List[Dict[str, Any]]:
+        """Items of *kind* named or identified by *value* (an id, entity name, or list of them)."""
+        values = value if isinstance(value, (list, tuple)) else [value]
+        found: Dict[str, Dict[str, Any]] = {}
+        for v in values:
+            if not isinstance(v, str):
+                continue
+            seed = self._by_id.get(v) or self._by_name.get(v.lower())
+            if seed is None:
+                continue
+            for item in ([seed] if seed in self._kinds[kind] else self._related(seed, kind)):
+                found.setdefault(item["id"], item)
+        return list(found.values())
+
+    def _candidates(self, kind: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        for key, value in params.items():
+            if key in ("group_id", "group_ids", "folder_id"):
+                continue
+            found = self._lookup(value, kind)
+            if found:
+                return found
+        items = self._kinds[kind]
+        if "after" in params:
+            after = params.get("after")
+            items = sorted((i for i in items if after is None or i["id"] > str(after)), key=lambda i: i["id"])
+        return items
+
+    def _rank(self, kind: str, items: List[Dict[str, Any]], params: Dict[str, Any]) -> List[Tuple[Dict[str, Any], float]]:
+        query_vec = None
+        for value in params.values():
+            if isinstance(value, (list, tuple)) and len(value) >= 16 and isinstance(value[0], float):
+                query_vec = np.asarray(value, dtype=np.float32)
+                break
+        if query_vec is None:
+            text = next((v for k, v in params.items() if isinstance(v, str) and len(v.split()) > 1
+                         and k not in ("group_id", "folder_id")), None)
+            if text:
+                query_vec = self.embedder.vector(text)
+        if query_vec is None or not items or "after" in params:
+            return [(item, 1.0 / (1 + n)) for n, item in enumerate(items)]
+        if len(items) == len(self._kinds[kind]):
+            matrix = self._matrix(kind)
+        else:
+            matrix = np.stack([self.embedder.vector(self._text(i)) for i in items])
+        if matrix.shape[1] != query_vec.shape[0]:
+            return [(item, 1.0 / (1 + n)) for n, item in enumerate(items)]
+        scores = matrix @ query_vec
+        order = np.argsort(-scores)
+        return [(items[i], float(scores[i])) for i in order]
+
+    # ── Expression evaluation ────────────────────────────────────
+    def _eval(self, expr: str, column: str, scope: _Scope) -> Any:
+        expr = expr.strip()
+        m = _SLICE_RE.match(expr)
+        if m and not _enclosed(expr, "[", "]"):
+            value = self._eval(m.group(1), column, scope)
+            bounds = [scope.params.get(b[1:]) if b.startswith("$") else (int(b) if b.isdigit() else None)
+                      for b in (m.group(2), m.group(3))]
+            return value[bounds[0]:bounds[1]] if isinstance(value, list) else value
+        if _enclosed(expr, "(", ")"):
+            return self._eval(expr[1:-1], column, scope)
+        if _enclosed(expr, "{", "}"):
+            out = {}
+            for part in _split_top_level(expr[1:-1]):
+                key, _, sub = part.partition(":")
+                key = key.strip().strip("`")
+                out[key] = self._eval(sub, key, scope)
+            return out
+        if _enclosed(expr, "[", "]"):
+            return self._eval_list(expr[1:-1], column, scope)
+        if expr.startswith("$"):
+            return scope.params.get(expr[1:])
+        if re.fullmatch(r"-?\d+", expr):
+            return int(expr)
+        if re.fullmatch(r"-?\d*\.\d+", expr):
+            return float(expr)
+        if expr[:1] in "'\"":
+            return expr[1:-1]
+        if expr.lower() in ("true", "false", "null"):
+            return {"true": True, "false": False, "null": None}[expr.lower()]
+
+        call = _CALL_RE.match(expr)
+        if call:
+            return self._eval_call(call.group(1).lower(), call.group(2), column, scope)
+
+        prop = _PROP_RE.match(expr)
+        if prop:
+            var, name = prop.groups()
+            if var in scope.bindings and isinstance(scope.bindings[var], dict):
+                return scope.bindings[var].get(name)
+            target = self._switch(scope, self._kind_of(var, scope.labels))
+            if target is None:
+                return None
+            if name in target.item:
+                value = target.item[name]
+                return list(value) if isinstance(value, (list, tuple)) else value
+            return self._by_column(name.lower(), target)
+
+        if re.fullmatch(r"\w+", expr):
+            if expr in scope.bindings:
+                return scope.bindings[expr]
+            if expr in scope.aliases:
+                alias_expr = scope.aliases[expr]
+                inner = _Scope(scope.item, scope.kind, scope.score, scope.count, scope.labels, scope.params,
+                               scope.bindings, {k: v for k, v in scope.aliases.items() if k != expr})
+                return self._eval(alias_expr, column, inner)
+            kind = self._kind_of(expr, scope.labels)
+            if kind:
+                target = self._switch(scope, kind)
+                return self._node(target.item) if target else None
+        terms = _split_top_level(expr, "+")
+        if len(terms) > 1:
+            values = [self._eval(t, column, scope) for t in terms]
+            if all(isinstance(v, (int, float)) for v in values):
+                return sum(values)
+            if all(isinstance(v, list) for v in values):
+                return [x for v in values for x in v]
+            return "".join("" if v is None else str(v) for v in values)
+        if re.search(r"\s[+\-*/]\s", expr):
+            left = _split_top_level(re.split(r"\s[+\-*/]\s", expr, maxsplit=1)[0])[0]
+            value = self._eval(left, column, scope)
+            return value if isinstance(value, (int, float)) else scope.count
+        return self._by_column(column.lower(), scope)
+
+    def _eval_list(self, body: str, column: str, scope: _Scope) -> Any:
+        parts = _split_top_level(body, "|")
+        if len(parts) == 2:  # pattern / list comprehension
+            source, projection = parts
+            labels = {**scope.labels, **dict(_VAR_LABEL_RE.findall(source))}
+            var = re.match(r"^\s*\(?\s*(\w+)", source)
+            inner_vars = [v for v, _ in _VAR_LABEL_RE.findall(source) if v != (var.group(1) if var else None)]
+            target_var = inner_vars[-1] if inner_vars else (var.group(1) if var else None)
+            kind = self._kind_of(target_var, labels) or scope.kind
+            inner = _Scope(scope.item, scope.kind, scope.score, scope.count, labels, scope.params,
+                           scope.bindings, scope.aliases)
+            related = self._related(scope.item, kind) if kind != scope.kind else [scope.item]
+            return [self._eval(projection, column, inner.at(r, kind)) for r in related]
+        return [self._eval(p, column, scope) for p in _split_top_level(body)]
+
+    def _eval_call(self, fn: str, args: str, column: str, scope: _Scope) -> Any:
+        args = re.sub(r"^\s*DISTINCT\b", "", args, flags=re.IGNORECASE).strip()
+        arg_list = _split_top_level(args)
+        if fn in _COUNTS:
+            if fn == "size" and arg_list and not arg_list[0].startswith("("):
+                value = self._eval(arg_list[0], column, scope)
+                if isinstance(value, (list, str)):
+                    return len(value)
+            return scope.count
+        if fn == "collect":
+            inner = arg_list[0] if arg_list else ""
+            vars_ = re.findall(r"\b([a-z_]\w*)\b(?=\.|\s*[,}]|$)", inner)
+            kind = next((k for k in (self._kind_of(v, scope.labels) for v in vars_) if k), scope.kind)
+            related = self._related(scope.item, kind) if kind != scope.kind else [scope.item]
+            return [self._eval(inner, column, scope.at(r, kind)) for r in related]
+        if fn in ("sum", "avg", "min", "max", "percentilecont", "stdev"):
+            value = self._eval(arg_list[0], column, scope) if arg_list else None
+            return value if isinstance(value, (int, float)) else scope.score
+        if fn in ("id", "elementid"):
+            return scope.item["id"]
+        if fn == "labels":
+            return [next((l for l, k in _LABEL_KINDS.items() if k == scope.kind), "node").capitalize()]
+        if fn == "type":
+            return "MENTIONS"
+        if fn in ("keys",):
+            return list(scope.item)
+        if fn in _PASSTHROUGH or fn.startswith(("gds.", "vector.")):
+            for arg in arg_list:
+                value = self._eval(arg, column, scope)
+                if value is not None:
+                    if fn == "tolower" and isinstance(value, str):
+                        return value.lower()
+                    if fn == "head" and isinstance(value, list):
+                        return value[0] if value else None
+                    return value
+            return None
+        if fn.startswith(("vector.similarity", "gds.similarity")):
+            return scope.score
+        return self._by_column(column.lower(), scope)
+
+    def _by_column(self, col: str, scope: _Scope) -> Any:
+        item, kind = scope.item, scope.kind
+        if col in item:
+            value = item[col]
+            return list(value) if isinstance(value, (list, tuple)) else value
+        if "embedding" in col or "vector" in col:
+            return self.embedder.embed(self._text(item))
+        if any(k in col for k in ("score", "similarity", "sim", "weight", "relevance", "ppr", "pagerank", "rank")):
+            return scope.score
+        if col.endswith("_ids") or col == "ids":
+            sub = col[:-4] if col.endswith("_ids") else ""
+            sub_kind = _PLURAL_KINDS.get(sub + "s") or _PLURAL_KINDS.get(sub) or kind
+            return [r["id"] for r in (self._related(item, sub_kind) if sub_kind != kind else [item])]
+        if col == "id" or col.endswith("_id") or (col.endswith("id") and len(col) <= 8):
+            for prefix, other in (("doc", "documents"), ("section", "sections"), ("entity", "entities"),
+                                  ("sentence", "sentences"), ("chunk", "sentences"), ("community", "communities")):
+                if col.startswith(prefix) and kind != other:
+                    related = self._related(item, other)
+                    return related[0]["id"] if related else None
+            return item["id"]
+        if col.startswith(("num_", "n_")) or col.endswith(("count", "cnt", "total", "degree", "size", "deleted",
+                                                          "created", "updated", "merged")):
+            return scope.count
+        if col in _PLURAL_KINDS:
+            other = _PLURAL_KINDS[col]
+            return [self._node(r) for r in (self._related(item, other) if other != kind else [item])]
+        if "title" in col or col.endswith("name"):
+            if col.startswith(("doc", "document")) and kind != "documents":
+                related = self._related(item, "documents")
+                return related[0]["title"] if related else None
+            return item.get("name") or item.get("title") or item.get("doc_title")
+        if any(k in col for k in ("text", "content", "summary", "description", "snippet", "context")):
+            return self._text(item)
+        if any(k in col for k in ("props", "properties", "metadata", "node")):
+            return self._node(item)
+        if col.endswith("s") and col[:-1] in ("name", "alias", "keyword"):
+            return [self._text(item)]
+        if "path" in col:
+            return item.get("section_path") or item.get("path_key") or ""
+        if col.startswith(("is_", "has_")):
+            return True
+        if col in ("page", "page_number", "chunk_index", "index", "position", "level", "index_in_doc"):
+            return 0
+        return self._text(item)
+
+    # ── Entry point ──────────────────────────────────────────────
+    def respond(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if query.lstrip().upper().startswith(("SHOW", "CREATE", "DROP", "CALL DB.AWAIT")):
+            return []
+        items = _return_items(query)
+        if not items:
+            return []
+        labels = dict(_VAR_LABEL_RE.findall(query))
+        aliases = _with_aliases(query)
+        kind = self._primary_kind(query, items, labels)
+        candidates = self._candidates(kind, params)
+        limit = self._row_limit(query, params)
+
+        def row(item: Dict[str, Any], score: float, bindings: Dict[str, Any]) -> Dict[str, Any]:
+            scope = _Scope(item, kind, score, len(candidates), labels, params, bindings, aliases)
+            return {col: self._eval(expr, col, scope) for expr, col in items}
+
+        returned = {e.strip() for e, _ in items}
+        unwind = [(p, v) for p, v in _UNWIND_RE.findall(query) if v in returned]
+        if unwind:  # one row per element of the unwound parameter
+            param, var = unwind[0]
+            rows = []
+            for element in list(params.get(param) or [])[:limit]:
+                matches = self._lookup(element, kind) or candidates[:1]
+                if matches:
+                    rows.append(row(matches[0], 1.0, {var: element}))
+            return rows
+        aggregate_only = all(_CALL_RE.match(e) and _CALL_RE.match(e).group(1).lower() in _AGGREGATES | _COUNTS
+                             for e, _ in items)
+        if aggregate_only or (_WRITE_RE.search(query) and not candidates):
+            head = candidates[0] if candidates else {"id": ""}
+            return [row(head, 1.0, {})]
+        return [row(item, score, {}) for item, score in self._rank(kind, candidates, params)[:limit]]
+
+
+# ─── Wiring ──────────────────────────────────────────────────────
+
+
+class _RegexSentenceSplitter:
+    """Stands in for the wtpsplit ``SaT`` model: splits on terminal punctuation."""
+
+    _SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+    def split(self, text: str, do_paragraph_segmentation: bool = False, **kwargs: Any):
+        paragraphs = [p for p in re.split(r"\n\s*\n", text) if p.strip()]
+        sentences = [[s for s in self._SPLIT_RE.split(p.strip()) if s] for p in paragraphs]
+        return sentences if do_paragraph_segmentation else [s for p in sentences for s in p]
+
+
+@contextlib.contextmanager
+def install_offline_services(
+    embedder: HashEmbedder,
+    driver: Any,
+    voyage_latency_s: float = 0.0,
+    llm: Optional[FakeLLM] = None,
+) -> Iterator[None]:
+    """Patch the Voyage client/embedding class, sentence splitter and Neo4j pool.
+
+    With *llm*, the sentence-boundary review (which builds its own Azure
+    client) is answered by the fake too.
+
+    ``Neo4jPoolManager`` hands out *driver* (a ``FixtureDriver`` or
+    ``RecordingDriver``) for sync sessions and its async façade for
+    ``AsyncNeo4jService``, so code that connects through the pool rather
+    than taking a driver argument stays offline too.
+    """
+    from src.core.config import settings
+    from src.worker.hybrid_v2 import orchestrator
+    from src.worker.hybrid_v2.embeddings import voyage_embed
+    from src.worker.services import sentence_extraction_service
+    from src.worker.services.neo4j_pool import Neo4jPoolManager
+
+    client = FakeVoyageClient(embedder, voyage_latency_s)
+    real_get_async_driver = Neo4jPoolManager.get_async_driver
+
+    async def get_async_driver(pool, *args, **kwargs):
+        if isinstance(driver, RecordingDriver):
+            return driver.as_async(await real_get_async_driver(pool, *args, **kwargs))
+        return driver.as_async()
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(mock.patch.object(Neo4jPoolManager, "get_driver", lambda pool, *a, **k: driver))
+        stack.enter_context(mock.patch.object(Neo4jPoolManager, "get_async_driver", get_async_driver))
+        stack.enter_context(mock.patch.object(settings, "VOYAGE_API_KEY", settings.VOYAGE_API_KEY or "offline"))
+        stack.enter_context(mock.patch("voyageai.Client", lambda *a, **k: client))
+        stack.enter_context(mock.patch.object(voyage_embed, "VoyageEmbedding", make_hash_embedding(embedder)))
+        stack.enter_context(mock.patch.object(voyage_embed, "LLAMAINDEX_VOYAGE_AVAILABLE", True))
+        stack.enter_context(mock.patch.object(voyage_embed, "_voyage_service", None))
+        stack.enter_context(mock.patch.object(orchestrator, "_v2_embedder", None))
+        stack.enter_context(mock.patch.object(sentence_extraction_service, "_sat", _RegexSentenceSplitter()))
+        if llm is not None:
+            stack.enter_context(mock.patch.object(sentence_extraction_service, "_call_llm_json", llm.complete_json))
+        for name in ("route_2_local", "route_3_global", "route_4_drift", "route_5_unified",
+                     "route_6_concept", "route_7_hipporag2"):
+            module = importlib.import_module(f"src.worker.hybrid_v2.routes.{name}")
+            # Route modules cache the service (or a failed init) at module level
+            stack.enter_context(mock.patch.object(module, "_voyage_service", None))
+            if hasattr(module, "_voyage_init_attempted"):
+                stack.enter_context(mock.patch.object(module, "_voyage_init_attempted", False))
+        yield
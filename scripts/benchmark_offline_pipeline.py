@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hybrid pipeline offline, per-stage latency / CPU / allocations
+=========================================================================
+
+Runs ``HybridPipeline.query`` and ``LazyGraphRAGIndexingPipeline.index_documents``
+against the in-memory stand-ins in ``benchmark_offline_fakes.py`` (fake LLM
+behind the real ``TrackedLLM``, hash embeddings behind the real
+``VoyageEmbedService``, a fixture/synthetic Neo4j driver) on a synthetic
+corpus of configurable size.  With external latency set to zero the numbers
+are the pipeline's own cost, so regressions in routing, graph assembly,
+PPR, reranking glue or synthesis prompt building show up without network
+noise.
+
+Per route it reports p50/p95 of:
+
+  wall_ms / cpu_ms  – per query (``time.perf_counter`` / ``time.process_time``)
+  stage ms          – ``pipeline_timings_ms`` and the route's ``timings_ms``
+                      (``ROUTE7_RETURN_TIMINGS=1`` is set) plus time spent in
+                      the LLM / embedding / Neo4j stand-ins
+  alloc_blocks      – net ``sys.getallocatedblocks()`` growth per query
+  gc_gen0           – generation-0 collections per query (allocation churn)
+  peak_kib          – ``tracemalloc`` peak per query (``--trace-alloc`` only;
+                      tracing slows everything else down)
+
+Routes are reached through the router: the fake LLM answers the routing
+prompt with the requested route.  ``unified_search`` is not a router
+output, so it goes through ``force_route``.
+
+Neo4j answers come from ``--fixtures`` (rows recorded from a live database
+with ``--record``) and fall back to the synthetic responder.
+
+Usage:
+    python scripts/benchmark_offline_pipeline.py
+    python scripts/benchmark_offline_pipeline.py --docs 50 --queries 40 --routes hipporag2_search,global_search
+    python scripts/benchmark_offline_pipeline.py --llm-latency-ms 300 --per-token-ms 5 --trace-alloc
+    python scripts/benchmark_offline_pipeline.py --record benchmarks/fixtures/neo4j_rows.json   # needs NEO4J_* env
+    python scripts/benchmark_offline_pipeline.py --fixtures benchmarks/fixtures/neo4j_rows.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import numpy as np  # noqa: E402
+
+from benchmark_offline_fakes import (  # noqa: E402
+    FakeLLM,
+    FakeVoyageClient,
+    FixtureDriver,
+    HashEmbedder,
+    RecordingDriver,
+    SyntheticCorpus,
+    SyntheticResponder,
+    install_offline_services,
+    make_tracked_llm,
+)
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+GROUP_ID = "offline-bench"
+DEFAULT_ROUTES = "hipporag2_search,local_search,global_search,drift_multi_hop,concept_search,unified_search"
+ROUTER_ROUTES = {"local_search", "hipporag2_search", "concept_search", "global_search", "drift_multi_hop"}
+
+# Features that call services with no offline stand-in, or that add
+# non-determinism, are pinned off; everything else runs with repo defaults.
+OFFLINE_ENV = {
+    "ROUTE7_RETURN_TIMINGS": "1",
+    "ANSWER_CACHE": "0",
+}
+
+
+class _StageClock:
+    """Cumulative time spent in the LLM / embedding / Neo4j stand-ins."""
+
+    def __init__(self, driver: Any) -> None:
+        self._driver = driver
+
+    def read(self) -> Dict[str, float]:
+        llm_calls, llm_s = FakeLLM.stats.snapshot()
+        embed_calls, embed_s = FakeVoyageClient.stats.snapshot()
+        neo4j_calls, neo4j_s = self._driver.stats.snapshot() if hasattr(self._driver, "stats") else (0, 0.0)
+        return {
+            "llm_calls": llm_calls, "llm_ms": llm_s * 1000,
+            "embed_calls": embed_calls, "embed_ms": embed_s * 1000,
+            "neo4j_calls": neo4j_calls, "neo4j_ms": neo4j_s * 1000,
+        }
+
+
+class _Probe:
+    """Wall, CPU and allocation deltas around one unit of work."""
+
+    def __init__(self, clock: _StageClock, trace_alloc: bool) -> None:
+        self._clock = clock
+        self._trace_alloc = trace_alloc
+
+    def __enter__(self) -> "_Probe":
+        gc.collect()
+        self.metrics: Dict[str, float] = {}
+        self._gen0 = gc.get_stats()[0]["collections"]
+        self._blocks = sys.getallocatedblocks()
+        self._stages = self._clock.read()
+        if self._trace_alloc:
+            tracemalloc.reset_peak()
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        stages = self._clock.read()
+        self.metrics = {
+            "wall_ms": wall * 1000,
+            "cpu_ms": cpu * 1000,
+            "alloc_blocks": sys.getallocatedblocks() - self._blocks,
+            "gc_gen0": gc.get_stats()[0]["collections"] - self._gen0,
+        }
+        for key, value in stages.items():
+            self.metrics[key] = value - self._stages[key]
+        if self._trace_alloc:
+            self.metrics["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+
+
+def _error_key(exc: BaseException) -> str:
+    """Exception type, message and the innermost repo frame it came from."""
+    where = ""
+    for frame in traceback.extract_tb(exc.__traceback__):
+        if str(PROJECT_ROOT / "src") in frame.filename:
+            where = f" @ {Path(frame.filename).relative_to(PROJECT_ROOT)}:{frame.lineno}"
+    return f"{type(exc).__name__}: {str(exc)[:160]}{where}"
+
+
+def _percentiles(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    out = {}
+    for stage, values in sorted(samples.items()):
+        arr = np.asarray(values, dtype=float)
+        out[stage] = {
+            "p50": round(float(np.percentile(arr, 50)), 2),
+            "p95": round(float(np.percentile(arr, 95)), 2),
+            "n": len(values),
+        }
+    return out
+
+
+def _route_stage_timings(result: Dict[str, Any]) -> Dict[str, float]:
+    metadata = result.get("metadata") or {}
+    stages: Dict[str, float] = {}
+    for prefix, timings in (("pipeline.", metadata.get("pipeline_timings_ms")), ("route.", metadata.get("timings_ms"))):
+        for key, value in (timings or {}).items():
+            if isinstance(value, (int, float)):
+                stages[prefix + key] = float(value)
+    return stages
+
+
+def _build_driver(args: argparse.Namespace, corpus: SyntheticCorpus, embedder: HashEmbedder) -> Any:
+    if args.record:
+        from src.core.config import settings
+        from src.worker.services.neo4j_pool import get_neo4j_pool
+
+        live = get_neo4j_pool().get_driver(settings.NEO4J_URI, settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD)
+        return RecordingDriver(live)
+    responder = None if args.no_synthetic else SyntheticResponder(corpus, embedder)
+    latency_s = args.neo4j_latency_ms / 1000
+    if args.fixtures:
+        return FixtureDriver.from_file(args.fixtures, responder=responder, latency_s=latency_s)
+    return FixtureDriver(responder=responder, latency_s=latency_s)
+
+
+async def _bench_queries(args: argparse.Namespace, corpus: SyntheticCorpus, driver: Any, fake_llm: FakeLLM,
+                         embedder: HashEmbedder) -> Dict[str, Any]:
+    from src.worker.hybrid_v2.orchestrator import HybridPipeline
+    from src.worker.hybrid_v2.indexing.text_store import Neo4jTextUnitStore
+    from src.worker.hybrid_v2.router.main import QueryRoute
+    from benchmark_offline_fakes import make_hash_embedding
+
+    pipeline = HybridPipeline(
+        llm_client=make_tracked_llm(fake_llm),
+        embedding_client=make_hash_embedding(embedder)(),
+        neo4j_driver=driver,
+        text_unit_store=Neo4jTextUnitStore(driver, group_id=args.group_id),
+        group_id=args.group_id,
+    )
+    await pipeline.initialize()
+
+    queries = corpus.queries(args.queries, seed=args.seed)
+    clock = _StageClock(driver)
+    report: Dict[str, Any] = {}
+    try:
+        for route in [r.strip() for r in args.routes.split(",") if r.strip()]:
+            fake_llm.route = route
+            samples: Dict[str, List[float]] = defaultdict(list)
+            errors: Dict[str, int] = defaultdict(int)
+            for i in range(args.warmup + len(queries)):
+                query = queries[i % len(queries)]
+                try:
+                    with _Probe(clock, args.trace_alloc) as probe:
+                        if route in ROUTER_ROUTES:
+                            result = await pipeline.query(query, args.response_type)
+                        else:
+                            result = await pipeline.force_route(query, QueryRoute(route), args.response_type)
+                except Exception as e:
+                    errors[_error_key(e)] += 1
+                    continue
+                if i < args.warmup:
+                    continue
+                for key, value in {**probe.metrics, **_route_stage_timings(result)}.items():
+                    samples[key].append(value)
+            measured = len(samples.get("wall_ms", []))
+            report[route] = {
+                "queries": measured,
+                "route_used": result.get("route_used") if measured else None,
+                "errors": dict(errors),
+                "stages": _percentiles(samples),
+            }
+            _print_route(route, report[route])
+    finally:
+        await pipeline.close()
+    return report
+
+
+async def _bench_indexing(args: argparse.Namespace, corpus: SyntheticCorpus, driver: Any,
+                          fake_llm: FakeLLM) -> Dict[str, Any]:
+    from src.worker.hybrid_v2.embeddings.voyage_embed import get_voyage_embed_service
+    from src.worker.hybrid_v2.indexing.lazygraphrag_pipeline import LazyGraphRAGIndexingPipeline
+    from src.worker.hybrid_v2.services.neo4j_store import Neo4jStoreV3
+
+    store = Neo4jStoreV3(uri="offline://", username="", password="")
+    store._driver = driver
+    voyage_service = get_voyage_embed_service()
+    pipeline = LazyGraphRAGIndexingPipeline(
+        neo4j_store=store,
+        llm=make_tracked_llm(fake_llm),
+        section_embed_model=voyage_service.get_llama_index_embed_model(),
+        voyage_service=voyage_service,
+    )
+
+    # Time the top-level stages by wrapping the pipeline's step methods
+    stage_ms: Dict[str, List[float]] = defaultdict(list)
+
+    def _timed(name: str, fn: Any) -> Any:
+        async def wrapper(*a: Any, **k: Any) -> Any:
+            t0 = time.perf_counter()
+            try:
+                return await fn(*a, **k)
+            finally:
+                stage_ms[name].append((time.perf_counter() - t0) * 1000)
+        return wrapper
+
+    for name in dir(pipeline):
+        if name == "_index_documents":  # the whole run, already in wall_ms
+            continue
+        attr = getattr(pipeline, name)
+        if name.startswith("_") and not name.startswith("__") and asyncio.iscoroutinefunction(attr):
+            setattr(pipeline, name, _timed(name.lstrip("_"), attr))
+
+    clock = _StageClock(driver)
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    documents = corpus.index_documents()
+    for i in range(args.warmup + args.index_runs):
+        stage_ms.clear()
+        try:
+            with _Probe(clock, args.trace_alloc) as probe:
+                stats = await pipeline.index_documents(group_id=args.group_id, documents=documents)
+        except Exception as e:
+            errors[_error_key(e)] += 1
+            continue
+        if i < args.warmup:
+            continue
+        for key, value in probe.metrics.items():
+            samples[key].append(value)
+        for name, values in stage_ms.items():
+            samples["step." + name].append(sum(values))
+
+    report = {
+        "runs": len(samples.get("wall_ms", [])),
+        "documents": len(documents),
+        "sentences": len(corpus.sentences),
+        "errors": dict(errors),
+        "last_stats": {k: v for k, v in (stats or {}).items() if isinstance(v, (int, float, str, list))}
+        if samples else None,
+        "stages": _percentiles(samples),
+    }
+    _print_route("index_documents", report)
+    return report
+
+
+def _print_route(name: str, report: Dict[str, Any]) -> None:
+    print(f"\n── {name} ({report.get('queries', report.get('runs'))} measured) ──")
+    for err, count in report["errors"].items():
+        print(f"   error x{count}: {err}")
+    for stage, p in report["stages"].items():
+        print(f"   {stage:<42} p50 {p['p50']:>10.2f}   p95 {p['p95']:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline hybrid pipeline benchmark (fake LLM/Voyage/Neo4j)")
+    parser.add_argument("--docs", type=int, default=20, help="synthetic documents")
+    parser.add_argument("--sections", type=int, default=6, help="sections per document")
+    parser.add_argument("--sentences", type=int, default=8, help="sentences per section")
+    parser.add_argument("--queries", type=int, default=20, help="measured queries per route")
+    parser.add_argument("--warmup", type=int, default=2, help="unmeasured leading iterations")
+    parser.add_argument("--routes", default=DEFAULT_ROUTES, help="comma-separated QueryRoute values")
+    parser.add_argument("--response-type", default="summary")
+    parser.add_argument("--index-runs", type=int, default=3, help="index_documents runs (0 = skip indexing)")
+    parser.add_argument("--skip-queries", action="store_true")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="fixed latency per LLM call")
+    parser.add_argument("--per-token-ms", type=float, default=0.0, help="extra LLM latency per completion token")
+    parser.add_argument("--completion-tokens", type=int, default=200, help="tokens per free-text completion")
+    parser.add_argument("--voyage-latency-ms", type=float, default=0.0, help="latency per embed/rerank call")
+    parser.add_argument("--neo4j-latency-ms", type=float, default=0.0, help="latency per Cypher query")
+    parser.add_argument("--fixtures", type=Path, default=None, help="recorded Neo4j rows to replay")
+    parser.add_argument("--record", type=Path, default=None, help="record rows from the live NEO4J_* database here")
+    parser.add_argument("--no-synthetic", action="store_true", help="unrecorded queries return no rows")
+    parser.add_argument("--trace-alloc", action="store_true", help="report tracemalloc peak per query")
+    parser.add_argument("--group-id", default=GROUP_ID)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true", help="keep pipeline logging")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    for key, value in OFFLINE_ENV.items():
+        os.environ.setdefault(key, value)
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+        import structlog
+
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    embedder = HashEmbedder()
+    corpus = SyntheticCorpus.generate(
+        args.group_id, documents=args.docs, sections_per_document=args.sections,
+        sentences_per_section=args.sentences, seed=args.seed,
+    )
+    driver = _build_driver(args, corpus, embedder)
+    fake_llm = FakeLLM(
+        latency_s=args.llm_latency_ms / 1000, per_token_s=args.per_token_ms / 1000,
+        completion_tokens=args.completion_tokens, seed=args.seed,
+    )
+    print(f"corpus: {len(corpus.documents)} docs, {len(corpus.sentences)} sentences, "
+          f"{len(corpus.entities)} entities, {len(corpus.triples)} triples")
+
+    if args.trace_alloc:
+        tracemalloc.start()
+    results: Dict[str, Any] = {}
+    with install_offline_services(embedder, driver, voyage_latency_s=args.voyage_latency_ms / 1000, llm=fake_llm):
+        if not args.skip_queries:
+            results["query"] = asyncio.run(_bench_queries(args, corpus, driver, fake_llm, embedder))
+        if args.index_runs > 0:
+            results["indexing"] = asyncio.run(_bench_indexing(args, corpus, driver, fake_llm))
+    if args.trace_alloc:
+        tracemalloc.stop()
+
+    neo4j: Optional[Dict[str, Any]] = None
+    if isinstance(driver, RecordingDriver):
+        saved = driver.save(args.record)
+        print(f"\nRecorded {saved} distinct queries: {args.record}")
+    elif isinstance(driver, FixtureDriver):
+        neo4j = {
+            "replayed": driver.replayed,
+            "synthesised": driver.synthesised,
+            "unanswered": dict(sorted(driver.unanswered.items(), key=lambda kv: -kv[1])[:20]),
+        }
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "corpus": {
+            "documents": len(corpus.documents),
+            "sections": len(corpus.sections),
+            "sentences": len(corpus.sentences),
+            "entities": len(corpus.entities),
+            "triples": len(corpus.triples),
+        },
+        "config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "env": {k: os.environ.get(k) for k in OFFLINE_ENV},
+        "neo4j": neo4j,
+        "results": results,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"offline_pipeline_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, default=str))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
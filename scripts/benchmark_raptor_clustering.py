@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RAPTOR level clustering, legacy vs reduced-dimension GMM
+===================================================================
+
+Compares the clustering step of ``RaptorService._cluster_nodes`` on
+synthetic 2048-d embeddings:
+
+  legacy   – ``GaussianMixture(covariance_type='full')`` directly on the raw
+             embeddings, then exact ``silhouette_score`` + ``silhouette_samples``
+  current  – ``raptor_clustering.cluster_embeddings``: randomized PCA to
+             ``RAPTOR_REDUCE_DIM`` dims, diagonal-covariance GMM, sampled
+             silhouette
+
+Wall time and peak traced memory (``tracemalloc``; numpy buffers included)
+are reported per size.  The legacy path is only run up to ``--legacy-max``
+nodes — beyond that its O(n²) silhouette and O(k·d³) EM steps take hours.
+
+Usage:
+    python scripts/benchmark_raptor_clustering.py
+    python scripts/benchmark_raptor_clustering.py --sizes 1000 10000 50000 --legacy-max 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+for p in [str(THIS_DIR), str(PROJECT_ROOT)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from src.worker.services.raptor_clustering import (  # noqa: E402
+    ClusteringConfig,
+    cluster_embeddings,
+)
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+
+def _embeddings(n: int, dim: int, topics: int, seed: int) -> np.ndarray:
+    rng = np.random.RandomState(seed)
+    centers = rng.normal(size=(topics, dim)).astype(np.float32)
+    labels = rng.randint(0, topics, size=n)
+    points = centers[labels] + 0.8 * rng.normal(size=(n, dim)).astype(np.float32)
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    return points
+
+
+def _legacy(embeddings: np.ndarray, n_clusters: int) -> Tuple[np.ndarray, float]:
+    from sklearn.metrics import silhouette_samples, silhouette_score
+    from sklearn.mixture import GaussianMixture
+
+    x = embeddings.astype(np.float64)
+    labels = GaussianMixture(n_components=n_clusters, covariance_type="full", random_state=42).fit_predict(x)
+    avg = silhouette_score(x, labels)
+    silhouette_samples(x, labels)
+    return labels, float(avg)
+
+
+def _measure(fn: Callable[[], Any]) -> Tuple[Any, float, float]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, elapsed, peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RAPTOR clustering benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--dim", type=int, default=2048)
+    parser.add_argument("--clusters", type=int, default=10)
+    parser.add_argument("--legacy-max", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    config = ClusteringConfig.from_env()
+    # Warm up imports / BLAS so the first size isn't charged for them.
+    cluster_embeddings(_embeddings(200, args.dim, args.clusters, args.seed), args.clusters, "gmm", config)
+    rows: List[Dict[str, Any]] = []
+    for n in args.sizes:
+        emb = _embeddings(n, args.dim, args.clusters, args.seed)
+        row: Dict[str, Any] = {"nodes": n, "input_mb": round(emb.nbytes / 1e6, 1)}
+
+        (labels, avg, _), secs, peak = _measure(lambda: cluster_embeddings(emb, args.clusters, "gmm", config))
+        row.update(current_s=round(secs, 2), current_peak_mb=round(peak, 1), current_silhouette=round(avg or 0.0, 3))
+
+        if n <= args.legacy_max:
+            (_, legacy_avg), secs, peak = _measure(lambda: _legacy(emb, args.clusters))
+            row.update(legacy_s=round(secs, 2), legacy_peak_mb=round(peak, 1), legacy_silhouette=round(legacy_avg, 3))
+        else:
+            row.update(legacy_s=None, legacy_peak_mb=None, legacy_silhouette=None)
+        rows.append(row)
+
+        legacy = f"{row['legacy_s']:>8.2f}s {row['legacy_peak_mb']:>8.1f}MB" if row["legacy_s"] is not None else f"{'skipped':>20}"
+        print(
+            f"n={n:>6}  current {row['current_s']:>7.2f}s {row['current_peak_mb']:>8.1f}MB "
+            f"sil={row['current_silhouette']:.3f}   legacy {legacy}"
+        )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "dim": args.dim,
+        "clusters": args.clusters,
+        "config": config.__dict__,
+        "results": rows,
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"raptor_clustering_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prepdocslib SentenceTextSplitter on a long synthetic document
+=======================================================================
+
+Splits a synthetic N-page document (prose pages plus periodic run-on pages
+with no sentence endings, which force the recursive token split) and reports
+wall time, ``bpe.encode`` calls and characters encoded.
+
+Pass ``--baseline`` with another copy of ``textsplitter.py`` (e.g. from
+``git show <rev>:frontend/app/backend/prepdocslib/textsplitter.py``) to time
+it on the same pages and check that the chunk outputs are byte-identical.
+
+Usage:
+    python scripts/benchmark_text_splitter.py
+    python scripts/benchmark_text_splitter.py --pages 500 --baseline /tmp/textsplitter_old.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List
+
+# ─── Path setup ──────────────────────────────────────────────────
+THIS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = THIS_DIR.parent
+BACKEND_DIR = PROJECT_ROOT / "frontend" / "app" / "backend"
+for p in [str(THIS_DIR), str(PROJECT_ROOT), str(BACKEND_DIR)]:
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+from prepdocslib import textsplitter  # noqa: E402
+from prepdocslib.page import Page  # noqa: E402
+
+OUTPUT_DIR = PROJECT_ROOT / "benchmarks"
+
+_WORDS = (
+    "the of agreement shall party tenant landlord payment within thirty days notice warranty "
+    "defect clause section liability indemnify provided however invoice 2024 USD 1,250"
+).split()
+
+
+def _synthetic_pages(n: int, seed: int) -> List[Page]:
+    rng = random.Random(seed)
+    pages = []
+    for i in range(n):
+        parts = []
+        for _ in range(rng.randint(20, 40)):
+            sentence = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 30)))
+            parts.append(sentence.capitalize() + rng.choice([". ", ". ", "; ", ", ", "\n"]))
+        if i % 5 == 0:  # table / OCR dump without sentence endings
+            parts.append(" ".join(rng.choice(_WORDS) for _ in range(rng.randint(800, 3000))))
+        pages.append(Page(page_num=i, offset=0, text="".join(parts)))
+    return pages
+
+
+class _CountingEncoder:
+    """Wraps the module's tiktoken encoding to count encode work."""
+
+    def __init__(self, inner):
+        self._inner = inner
+        self.calls = 0
+        self.chars = 0
+
+    def encode(self, text, *args, **kwargs):
+        self.calls += 1
+        self.chars += len(text)
+        return self._inner.encode(text, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+def _load_baseline(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location("prepdocslib._baseline_textsplitter", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(module: ModuleType, pages: List[Page], repeats: int) -> Dict[str, Any]:
+    inner = module.bpe
+    counter = _CountingEncoder(inner)
+    module.bpe = counter
+    try:
+        chunks = [(c.page_num, c.text) for c in module.SentenceTextSplitter().split_pages(pages)]
+        encode_calls, encode_chars = counter.calls, counter.chars
+    finally:
+        module.bpe = inner
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        list(module.SentenceTextSplitter().split_pages(pages))
+        timings.append(time.perf_counter() - start)
+    return {
+        "chunks": chunks,
+        "wall_ms": round(min(timings) * 1000, 1),
+        "encode_calls": encode_calls,
+        "encoded_chars": encode_chars,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SentenceTextSplitter throughput benchmark")
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=None, help="another textsplitter.py to compare against")
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    pages = _synthetic_pages(args.pages, args.seed)
+    page_chars = sum(len(p.text) for p in pages)
+    modules = {"current": textsplitter}
+    if args.baseline:
+        modules = {"baseline": _load_baseline(args.baseline), **modules}
+
+    results: Dict[str, Dict[str, Any]] = {name: _run(mod, pages, args.repeats) for name, mod in modules.items()}
+    identical = None
+    if "baseline" in results:
+        identical = results["baseline"]["chunks"] == results["current"]["chunks"]
+
+    print(f"{args.pages} pages, {page_chars:,} chars")
+    for name, r in results.items():
+        print(
+            f"{name:>9}  {r['wall_ms']:>8.1f} ms   {len(r['chunks']):>5} chunks   "
+            f"{r['encode_calls']:>6} encodes   {r['encoded_chars'] / page_chars:>5.2f}x chars encoded"
+        )
+    if identical is not None:
+        print(f"chunk outputs identical: {identical}")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "pages": args.pages,
+        "page_chars": page_chars,
+        "identical": identical,
+        "results": {
+            name: {k: v for k, v in r.items() if k != "chunks"} | {"chunks": len(r["chunks"])}
+            for name, r in results.items()
+        },
+    }
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = args.output or OUTPUT_DIR / f"text_splitter_{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nSaved: {out}")
+
+
+if __name__ == "__main__":
+    main()
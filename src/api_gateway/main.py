@@ -12,10 +12,7 @@ from fastapi.staticfiles import StaticFiles
 import structlog
 import logging
 from src.core.config import settings
-from src.api_gateway.middleware.group_isolation import GroupIsolationMiddleware
-from src.api_gateway.middleware.auth import JWTAuthMiddleware
-from src.api_gateway.middleware.correlation import CorrelationIdMiddleware
-from src.api_gateway.middleware.version import VersionHeaderMiddleware
+from src.api_gateway.middleware.request_context import RequestContextMiddleware
 from src.api_gateway.routers import (
     health, graphrag, orchestration, hybrid, document_analysis, knowledge_map,
     config, folders, chat,
@@ -247,6 +244,10 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.warning("cosmos_usage_tracking_init_failed", error=str(e))
 
+        # Usage queued from per-job indexing loops is flushed on this loop
+        from src.core.services.usage_tracker import get_usage_tracker
+        get_usage_tracker().bind_loop()
+
     except Exception as e:
         logger.error("frontend_services_init_failed", error=str(e))
 
@@ -254,13 +255,30 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("service_shutdown")
+
+    # Write any usage records still queued for the next batch
+    try:
+        import asyncio
+        from src.core.services.usage_tracker import get_usage_tracker
+        await asyncio.wait_for(get_usage_tracker().flush(), timeout=10)
+    except Exception as e:
+        logger.error("usage_flush_failed", error=str(e))
+
     try:
         graph_service = GraphService()
         graph_service.close()
-        logger.info("neo4j_connection_closed")
+        logger.info("graph_service_released")
     except Exception as e:
         logger.error("neo4j_close_failed", error=str(e))
 
+    # Close every pooled Neo4j driver (async drivers + shared executor)
+    try:
+        from src.worker.services.neo4j_pool import get_neo4j_pool
+        await get_neo4j_pool().aclose_all()
+        logger.info("neo4j_pool_closed")
+    except Exception as e:
+        logger.error("neo4j_pool_close_failed", error=str(e))
+
     # Close Cosmos DB clients
     for attr in ["_cosmos_history_client", "_cosmos_metadata_client"]:
         client = getattr(app.state, attr, None)
@@ -331,19 +349,10 @@ app.add_middleware(
                    "X-Admin-Key", "X-Correlation-ID", "Accept", "Accept-Language"],
 )
 
-# Custom Middleware (order matters: first added = last executed)
-# Execution order: CORS → Correlation → Version → JWT → GroupIsolation → Handler
-
-# 1. Correlation ID - generates/propagates trace ID for all requests
-app.add_middleware(CorrelationIdMiddleware)
-
-# 2. Version Header - resolves API/algorithm version from request headers
-app.add_middleware(VersionHeaderMiddleware)
-
-# 3. Group Isolation - enforces tenant isolation using JWT or legacy headers
-app.add_middleware(GroupIsolationMiddleware)
-
-# 4. JWT Authentication - validates Azure Easy Auth tokens and extracts tenant claims
+# Request context middleware (pure ASGI, one layer):
+# Correlation ID → JWT Authentication → Group Isolation → Version Header → CORS → Handler
+# JWT validates Azure Easy Auth tokens and extracts tenant claims; group
+# isolation enforces the tenant group_id from JWT or legacy headers.
 # SECURITY: REQUIRE_AUTH defaults to True (fail closed). Set REQUIRE_AUTH=false for local dev.
 _require_auth = settings.REQUIRE_AUTH if hasattr(settings, "REQUIRE_AUTH") else True
 if not _require_auth:
@@ -364,7 +373,7 @@ if _require_auth and settings.GROUP_ID_OVERRIDE:
 _auth_type = settings.AUTH_TYPE if hasattr(settings, "AUTH_TYPE") else "B2B"
 app.state.auth_type = _auth_type
 app.add_middleware(
-    JWTAuthMiddleware,
+    RequestContextMiddleware,
     auth_type=_auth_type,
     require_auth=_require_auth,
 )
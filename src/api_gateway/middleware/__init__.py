@@ -8,6 +8,7 @@ from .correlation import (
     CORRELATION_ID_HEADER,
 )
 from .group_isolation import GroupIsolationMiddleware
+from .request_context import RequestContextMiddleware
 
 __all__ = [
     "JWTAuthMiddleware",
@@ -18,4 +19,5 @@ __all__ = [
     "get_correlation_headers",
     "CORRELATION_ID_HEADER",
     "GroupIsolationMiddleware",
+    "RequestContextMiddleware",
 ]
@@ -14,16 +14,21 @@ Token Claims:
 """
 
 import base64
+import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt as pyjwt
 from jwt.exceptions import DecodeError as JWTDecodeError, ExpiredSignatureError
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -31,27 +36,80 @@ logger = logging.getLogger(__name__)
 # Security scheme for OpenAPI docs
 security = HTTPBearer()
 
+# Decoded claims keyed by (sha256(token), skip_exp) → (monotonic deadline, claims).
+# Every API call carries the same token for the lifetime of a session, so the
+# pyjwt decode only needs to happen once per token.  Entries expire at the
+# earlier of the TTL and the token's own exp (when exp is enforced).
+_claims_cache: "OrderedDict[Tuple[str, bool], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_claims_cache_lock = threading.Lock()
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
+
+def _claims_cache_key(token: str, skip_exp: bool) -> Tuple[str, bool]:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest(), skip_exp
+
+
+def _get_cached_claims(token: str, skip_exp: bool) -> Optional[Dict[str, Any]]:
+    key = _claims_cache_key(token, skip_exp)
+    with _claims_cache_lock:
+        entry = _claims_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            _claims_cache.pop(key, None)
+            return None
+        _claims_cache.move_to_end(key)
+        return dict(entry[1])
+
+
+def _set_cached_claims(token: str, skip_exp: bool, claims: Dict[str, Any]) -> None:
+    max_entries = int(getattr(settings, "JWT_CLAIMS_CACHE_SIZE", 2048))
+    if max_entries <= 0:
+        return
+    now = time.monotonic()
+    deadline = now + float(getattr(settings, "JWT_CLAIMS_CACHE_TTL_SECONDS", 300))
+    exp = claims.get("exp")
+    if not skip_exp and isinstance(exp, (int, float)):
+        deadline = min(deadline, now + (exp - time.time()))
+    if deadline <= now:
+        return
+    key = _claims_cache_key(token, skip_exp)
+    with _claims_cache_lock:
+        _claims_cache[key] = (deadline, dict(claims))
+        _claims_cache.move_to_end(key)
+        while len(_claims_cache) > max_entries:
+            _claims_cache.popitem(last=False)
+
+
+def clear_claims_cache() -> None:
+    """Drop all cached token claims (tests, key rotation)."""
+    with _claims_cache_lock:
+        _claims_cache.clear()
+
+
+@lru_cache(maxsize=256)
+def _principal_token(client_principal: str) -> Optional[str]:
+    """Token inside a base64 ``X-MS-CLIENT-PRINCIPAL`` header (parse errors propagate, uncached)."""
+    principal = json.loads(base64.b64decode(client_principal).decode("utf-8"))
+    return principal.get("access_token") or principal.get("id_token")
+
+
+class JWTAuthenticator:
     """
-    Middleware to validate JWT tokens and extract tenant claims.
-    
-    Sets request.state.group_id and request.state.user_id for downstream handlers.
+    Token validation and tenant-claim extraction shared by the auth middlewares.
+
+    ``authenticate`` populates request.state (group_id, user_id, user, roles)
+    and returns an error response when the request must be rejected.
     """
-    
-    def __init__(self, app, auth_type: str = "B2B", require_auth: bool = True):
+
+    def __init__(self, auth_type: str = "B2B", require_auth: bool = True):
         """
-        Initialize JWT auth middleware.
-        
         Args:
-            app: FastAPI application
             auth_type: "B2B" (Azure AD with groups) or "B2C" (Azure AD B2C with oid)
             require_auth: If True, reject requests without valid tokens
         """
-        super().__init__(app)
         self.auth_type = auth_type.upper()
         self.require_auth = require_auth
-        
+
     # Static file extensions that never require auth
     STATIC_EXTENSIONS = {
         ".html", ".js", ".css", ".ico", ".svg", ".png", ".jpg", ".jpeg",
@@ -78,13 +136,13 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
                 return True
         return False
 
-    async def dispatch(self, request: Request, call_next):
-        """Process request and validate JWT token."""
-        
+    def authenticate(self, request: Request) -> Optional[Response]:
+        """Validate the request's token; return an error response or None to continue."""
+
         # Skip auth for health, config, static files, and SPA routes
         if self._is_static_request(request.url.path):
-            return await call_next(request)
-        
+            return None
+
         try:
             # Extract token from Easy Auth headers or Authorization header
             token = self._extract_token(request)
@@ -217,8 +275,8 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
                     content={"detail": f"Invalid authentication: {str(e)}"},
                     headers={"WWW-Authenticate": "Bearer"},
                 )
-        
-        return await call_next(request)
+
+        return None
     
     def _extract_token(self, request: Request) -> Optional[str]:
         """
@@ -244,10 +302,8 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         )
         if client_principal:
             try:
-                decoded = base64.b64decode(client_principal).decode("utf-8")
-                principal = json.loads(decoded)
                 # Extract access token or id token
-                return principal.get("access_token") or principal.get("id_token")
+                return _principal_token(client_principal)
             except Exception as e:
                 logger.warning(f"Failed to parse X-MS-CLIENT-PRINCIPAL: {e}")
                 # Fallback: treat header as raw JWT if it looks like one
@@ -283,13 +339,18 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         For Easy Auth, Azure App Service already validates the token,
         so we can safely decode without re-verification of signature or exp.
         For direct Bearer tokens (API/Swagger), exp is still checked.
+        Successful decodes are cached per token (see ``_set_cached_claims``).
         """
+        cached = _get_cached_claims(token, skip_exp)
+        if cached is not None:
+            return cached
         try:
             claims = pyjwt.decode(
                 token,
                 options={"verify_signature": False, "verify_exp": not skip_exp},
                 algorithms=["RS256", "HS256"],
             )
+            _set_cached_claims(token, skip_exp, claims)
             return claims
         except ExpiredSignatureError:
             logger.warning("jwt_token_expired")
@@ -307,6 +368,35 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
             )
 
 
+class JWTAuthMiddleware(JWTAuthenticator, BaseHTTPMiddleware):
+    """
+    Middleware to validate JWT tokens and extract tenant claims.
+    
+    Sets request.state.group_id and request.state.user_id for downstream handlers.
+    The gateway app uses ``RequestContextMiddleware``, which runs the same
+    checks without a BaseHTTPMiddleware layer.
+    """
+
+    def __init__(self, app, auth_type: str = "B2B", require_auth: bool = True):
+        """
+        Initialize JWT auth middleware.
+        
+        Args:
+            app: FastAPI application
+            auth_type: "B2B" (Azure AD with groups) or "B2C" (Azure AD B2C with oid)
+            require_auth: If True, reject requests without valid tokens
+        """
+        BaseHTTPMiddleware.__init__(self, app)
+        JWTAuthenticator.__init__(self, auth_type=auth_type, require_auth=require_auth)
+
+    async def dispatch(self, request: Request, call_next):
+        """Process request and validate JWT token."""
+        response = self.authenticate(request)
+        if response is not None:
+            return response
+        return await call_next(request)
+
+
 def get_group_id(
     request: Request,
     x_group_id: Optional[str] = Header(None, alias="X-Group-ID")
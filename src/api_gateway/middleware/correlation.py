@@ -45,21 +45,7 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
     """
     
     async def dispatch(self, request: Request, call_next) -> Response:
-        # Extract or generate correlation ID
-        correlation_id = request.headers.get(CORRELATION_ID_HEADER)
-        
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
-        
-        # Store in request state for downstream handlers
-        request.state.correlation_id = correlation_id
-        
-        # Bind to structlog context (all logs in this request will include it)
-        structlog.contextvars.bind_contextvars(
-            correlation_id=correlation_id,
-            path=request.url.path,
-            method=request.method,
-        )
+        correlation_id = bind_correlation_id(request)
         
         try:
             # Process request
@@ -78,6 +64,27 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
                 pass
 
 
+def bind_correlation_id(request: Request) -> str:
+    """
+    Extract or generate the request's correlation ID, store it in
+    request.state and bind it to the structlog context.
+    """
+    correlation_id = request.headers.get(CORRELATION_ID_HEADER)
+    if not correlation_id:
+        correlation_id = str(uuid.uuid4())
+
+    # Store in request state for downstream handlers
+    request.state.correlation_id = correlation_id
+
+    # Bind to structlog context (all logs in this request will include it)
+    structlog.contextvars.bind_contextvars(
+        correlation_id=correlation_id,
+        path=request.url.path,
+        method=request.method,
+    )
+    return correlation_id
+
+
 def get_correlation_id(request: Request) -> str:
     """
     FastAPI dependency to get correlation ID from request.
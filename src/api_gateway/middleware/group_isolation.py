@@ -15,6 +15,7 @@ Security Note:
 """
 
 import re
+from typing import Optional
 
 from fastapi import Request
 from fastapi.responses import JSONResponse
@@ -32,125 +33,151 @@ _require_auth = getattr(settings, "REQUIRE_AUTH", True)
 ALLOW_LEGACY_GROUP_HEADER = _allow_legacy and not _require_auth
 
 
-class GroupIsolationMiddleware(BaseHTTPMiddleware):
+# Static file extensions that never require group isolation
+STATIC_EXTENSIONS = {
+    ".html", ".js", ".css", ".ico", ".svg", ".png", ".jpg", ".jpeg",
+    ".gif", ".woff", ".woff2", ".ttf", ".eot", ".map", ".json",
+}
+
+# Health/metrics/docs/admin/SPA endpoints skip the isolation check
+SKIP_PATHS = (
+    "/health", "/health/detailed", "/metrics", "/docs", "/redoc", "/admin", "/openapi.json",
+    "/auth_setup", "/redirect", "/config", "/favicon.ico", "/dashboard/health",
+)
+SKIP_PREFIXES = ("/api/v1/openapi.json", "/api/v1/graphrag/health", "/assets/")
+
+_GROUP_PATH_RE = re.compile(r'/groups/([^/]+)')
+
+
+def is_isolation_exempt(path: str) -> bool:
+    """True for paths that do not need a group_id (health, docs, SPA assets)."""
+    if path == "/" or path.startswith(SKIP_PATHS) or path.startswith(SKIP_PREFIXES):
+        return True
+    return path.endswith(tuple(STATIC_EXTENSIONS))
+
+
+def enforce_group_isolation(request: Request) -> Optional[JSONResponse]:
     """
-    Middleware to enforce tenant isolation via group_id.
-    
-    Works in conjunction with JWTAuthMiddleware:
-    - If JWT provides group_id, it is authoritative
-    - Falls back to path/header only when JWT doesn't provide it
+    Resolve the request's group_id and bind it to the log context.
+
+    Must run after JWT authentication.  Returns an error response when no
+    group identity is available or the sources disagree, otherwise None.
     """
-    
-    # Static file extensions that never require group isolation
-    STATIC_EXTENSIONS = {
-        ".html", ".js", ".css", ".ico", ".svg", ".png", ".jpg", ".jpeg",
-        ".gif", ".woff", ".woff2", ".ttf", ".eot", ".map", ".json",
-    }
+    path = request.url.path
+    if is_isolation_exempt(path):
+        return None
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip isolation check for health/metrics/docs/admin/SPA endpoints
-        skip_paths = ["/health", "/health/detailed", "/metrics", "/docs", "/redoc", "/admin", "/openapi.json",
-                      "/auth_setup", "/redirect", "/config", "/favicon.ico", "/dashboard/health"]
-        skip_prefixes = ["/api/v1/openapi.json", "/api/v1/graphrag/health", "/assets/"]
-        
-        path = request.url.path
-        if path == "/" or any(path.startswith(p) for p in skip_paths + skip_prefixes):
-            return await call_next(request)
-        
-        # Skip static file requests (SPA assets)
-        if any(path.endswith(ext) for ext in self.STATIC_EXTENSIONS):
-            return await call_next(request)
-        
-        # Priority 1: JWT-extracted group_id (set by JWTAuthMiddleware)
-        jwt_group_id = getattr(request.state, "group_id", None)
-        
-        # Priority 2: Extract group_id from path if present (e.g., /groups/{group_id}/...)
-        path_group_id = None
-        path_match = re.search(r'/groups/([^/]+)', request.url.path)
-        if path_match:
-            path_group_id = path_match.group(1)
-        
-        # Priority 3: X-Group-ID header (DEPRECATED)
-        header_group_id = request.headers.get("X-Group-ID")
-        
-        # Determine final group_id with proper priority
-        group_id = None
-        
-        if jwt_group_id:
-            # JWT is authoritative - use it
-            group_id = jwt_group_id
-            
-            # Validate path matches JWT if path contains group_id
-            if path_group_id and path_group_id != jwt_group_id:
-                logger.warning(
-                    "group_id_path_jwt_mismatch",
-                    path=request.url.path,
-                    path_group_id=path_group_id,
-                    jwt_group_id=jwt_group_id
-                )
-                return JSONResponse(
-                    status_code=403,
-                    content={
-                        "detail": f"Access denied: Your token grants access to group '{jwt_group_id}' but path requires '{path_group_id}'"
-                    }
-                )
-            
-            # Warn if legacy header is also present (it's ignored)
-            if header_group_id and header_group_id != jwt_group_id:
-                logger.warning(
-                    "ignoring_legacy_x_group_id_header",
-                    header_value=header_group_id,
-                    jwt_value=jwt_group_id,
-                    message="X-Group-ID header is deprecated. JWT group claim takes precedence."
-                )
-        
-        elif path_group_id:
-            # No JWT, use path parameter
-            group_id = path_group_id
-            
-            # Validate header matches path if both present
-            if header_group_id and header_group_id != path_group_id:
-                logger.warning(
-                    "group_id_mismatch",
-                    path=request.url.path,
-                    path_group_id=path_group_id,
-                    header_group_id=header_group_id
-                )
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "detail": f"Group ID mismatch: path has '{path_group_id}' but X-Group-ID header has '{header_group_id}'"
-                    }
-                )
+    # Priority 1: JWT-extracted group_id (set by JWTAuthMiddleware)
+    jwt_group_id = getattr(request.state, "group_id", None)
+    
+    # Priority 2: Extract group_id from path if present (e.g., /groups/{group_id}/...)
+    path_group_id = None
+    path_match = _GROUP_PATH_RE.search(path)
+    if path_match:
+        path_group_id = path_match.group(1)
+    
+    # Priority 3: X-Group-ID header (DEPRECATED)
+    header_group_id = request.headers.get("X-Group-ID")
+    
+    # Determine final group_id with proper priority
+    group_id = None
+    
+    if jwt_group_id:
+        # JWT is authoritative - use it
+        group_id = jwt_group_id
         
-        elif header_group_id and ALLOW_LEGACY_GROUP_HEADER:
-            # Fallback to legacy header (with deprecation warning)
-            group_id = header_group_id
+        # Validate path matches JWT if path contains group_id
+        if path_group_id and path_group_id != jwt_group_id:
             logger.warning(
-                "using_deprecated_x_group_id_header",
-                group_id=header_group_id,
-                path=request.url.path,
-                message="X-Group-ID header is deprecated. Use JWT authentication with Azure AD groups."
+                "group_id_path_jwt_mismatch",
+                path=path,
+                path_group_id=path_group_id,
+                jwt_group_id=jwt_group_id
             )
-        
-        else:
-            # No group_id available from any source
-            logger.warning("missing_group_id", path=request.url.path)
             return JSONResponse(
-                status_code=401,
+                status_code=403,
                 content={
-                    "detail": "Authentication required. No valid group identity found. "
-                              "Use JWT authentication or X-Group-ID header (deprecated)."
+                    "detail": f"Access denied: Your token grants access to group '{jwt_group_id}' but path requires '{path_group_id}'"
                 }
             )
         
-        # Only set request.state.group_id if not already set by JWT middleware
-        # This preserves JWT authority while allowing path/header fallback
-        if not jwt_group_id:
-            request.state.group_id = group_id
+        # Warn if legacy header is also present (it's ignored)
+        if header_group_id and header_group_id != jwt_group_id:
+            logger.warning(
+                "ignoring_legacy_x_group_id_header",
+                header_value=header_group_id,
+                jwt_value=jwt_group_id,
+                message="X-Group-ID header is deprecated. JWT group claim takes precedence."
+            )
+    
+    elif path_group_id:
+        # No JWT, use path parameter
+        group_id = path_group_id
         
-        # Add context to structured logging
-        structlog.contextvars.bind_contextvars(group_id=group_id)
+        # Validate header matches path if both present
+        if header_group_id and header_group_id != path_group_id:
+            logger.warning(
+                "group_id_mismatch",
+                path=path,
+                path_group_id=path_group_id,
+                header_group_id=header_group_id
+            )
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "detail": f"Group ID mismatch: path has '{path_group_id}' but X-Group-ID header has '{header_group_id}'"
+                }
+            )
+    
+    elif header_group_id and ALLOW_LEGACY_GROUP_HEADER:
+        # Fallback to legacy header (with deprecation warning)
+        group_id = header_group_id
+        logger.warning(
+            "using_deprecated_x_group_id_header",
+            group_id=header_group_id,
+            path=path,
+            message="X-Group-ID header is deprecated. Use JWT authentication with Azure AD groups."
+        )
+    
+    else:
+        # No group_id available from any source
+        logger.warning("missing_group_id", path=path)
+        return JSONResponse(
+            status_code=401,
+            content={
+                "detail": "Authentication required. No valid group identity found. "
+                          "Use JWT authentication or X-Group-ID header (deprecated)."
+            }
+        )
+    
+    # Only set request.state.group_id if not already set by JWT middleware
+    # This preserves JWT authority while allowing path/header fallback
+    if not jwt_group_id:
+        request.state.group_id = group_id
+    
+    # Add context to structured logging
+    structlog.contextvars.bind_contextvars(group_id=group_id)
+    return None
+
+
+class GroupIsolationMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware to enforce tenant isolation via group_id.
+    
+    Works in conjunction with JWTAuthMiddleware:
+    - If JWT provides group_id, it is authoritative
+    - Falls back to path/header only when JWT doesn't provide it
+    """
+    
+    STATIC_EXTENSIONS = STATIC_EXTENSIONS
+
+    async def dispatch(self, request: Request, call_next):
+        if is_isolation_exempt(request.url.path):
+            return await call_next(request)
+
+        error = enforce_group_isolation(request)
+        if error is not None:
+            return error
         
         try:
             response = await call_next(request)
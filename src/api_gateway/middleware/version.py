@@ -12,6 +12,8 @@ Response Headers (added):
 - X-Algorithm-Version-Used: Algorithm version used for this request
 """
 
+from typing import Dict
+
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
@@ -22,6 +24,44 @@ from src.core.algorithm_registry import get_version_for_header, get_algorithm
 logger = structlog.get_logger(__name__)
 
 
+def resolve_version_headers(request: Request) -> Dict[str, str]:
+    """
+    Resolve the requested algorithm version onto request.state and return
+    the version headers to add to the response.
+    """
+    # Get version from headers (X-Algorithm-Version takes precedence)
+    algorithm_header = request.headers.get("X-Algorithm-Version")
+    api_header = request.headers.get("X-API-Version")
+    
+    # Resolve version
+    header_value = algorithm_header or api_header
+    resolved_version = get_version_for_header(header_value)
+    
+    # Attach to request state for downstream use
+    request.state.algorithm_version = resolved_version
+    
+    # Get algorithm details
+    try:
+        algo = get_algorithm(resolved_version)
+        request.state.algorithm = algo
+        algorithm_model = algo.embedding_model
+    except ValueError:
+        algorithm_model = "unknown"
+    
+    # Log version resolution
+    if header_value:
+        logger.debug(
+            "version_resolved",
+            requested=header_value,
+            resolved=resolved_version,
+        )
+
+    return {
+        "X-API-Version-Used": resolved_version,
+        "X-Algorithm-Version-Used": f"{resolved_version}-{algorithm_model}",
+    }
+
+
 class VersionHeaderMiddleware(BaseHTTPMiddleware):
     """
     Middleware to handle API version negotiation.
@@ -31,38 +71,12 @@ class VersionHeaderMiddleware(BaseHTTPMiddleware):
     """
     
     async def dispatch(self, request: Request, call_next) -> Response:
-        # Get version from headers (X-Algorithm-Version takes precedence)
-        algorithm_header = request.headers.get("X-Algorithm-Version")
-        api_header = request.headers.get("X-API-Version")
-        
-        # Resolve version
-        header_value = algorithm_header or api_header
-        resolved_version = get_version_for_header(header_value)
-        
-        # Attach to request state for downstream use
-        request.state.algorithm_version = resolved_version
-        
-        # Get algorithm details
-        try:
-            algo = get_algorithm(resolved_version)
-            request.state.algorithm = algo
-            algorithm_model = algo.embedding_model
-        except ValueError:
-            algorithm_model = "unknown"
-        
-        # Log version resolution
-        if header_value:
-            logger.debug(
-                "version_resolved",
-                requested=header_value,
-                resolved=resolved_version,
-            )
+        version_headers = resolve_version_headers(request)
         
         # Call next middleware/handler
         response = await call_next(request)
         
         # Add version headers to response
-        response.headers["X-API-Version-Used"] = resolved_version
-        response.headers["X-Algorithm-Version-Used"] = f"{resolved_version}-{algorithm_model}"
+        response.headers.update(version_headers)
         
         return response
@@ -74,13 +74,15 @@ async def _write_cosmos_usage(user_id: str, route: str, query_id: str, tokens: i
                              credits_used: int = 0,
                              rerank_tokens: int = 0,
                              embed_tokens: int = 0) -> None:
-    """Fire-and-forget: write a UsageRecord to Cosmos for dashboard recent_queries."""
+    """Queue the per-query UsageRecord on the shared UsageTracker.
+
+    The tracker batches records into ``CosmosDBClient.write_usage_batch``
+    (dashboard recent_queries) and the Redis usage rollups (admin metrics),
+    so this only enqueues and never blocks on Cosmos.
+    """
     try:
-        from src.core.services.cosmos_client import get_cosmos_client
+        from src.core.services.usage_tracker import get_usage_tracker
         from src.core.models.usage import UsageRecord
-        cosmos = get_cosmos_client()
-        if cosmos.endpoint and not cosmos._usage_container:
-            await asyncio.wait_for(cosmos.initialize(), timeout=10)
         record = UsageRecord(
             partition_id=user_id,
             user_id=user_id,
@@ -98,7 +100,7 @@ async def _write_cosmos_usage(user_id: str, route: str, query_id: str, tokens: i
             rerank_tokens=rerank_tokens if rerank_tokens else None,
             embed_tokens=embed_tokens if embed_tokens else None,
         )
-        await asyncio.wait_for(cosmos.write_usage_record(record), timeout=10)
+        await get_usage_tracker().track_record(record)
     except Exception as e:
         logger.warning("chat_cosmos_usage_write_skipped", error=repr(e))
 
@@ -634,8 +636,8 @@ async def chat_completions(
             usage=ChatUsage(**result_usage),
         )
 
-        # Fire-and-forget: write usage to Cosmos for dashboard
-        task = asyncio.create_task(_write_cosmos_usage(
+        # Queue usage record (batched Cosmos write + dashboard rollups)
+        await _write_cosmos_usage(
             user_id=user_id,
             route=route_used,
             query_id=response_id,
@@ -647,9 +649,7 @@ async def chat_completions(
             credits_used=result_usage.get("credits_used", 0),
             rerank_tokens=result_usage.get("rerank_tokens", 0),
             embed_tokens=result_usage.get("embed_tokens", 0),
-        ))
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+        )
 
         # Backup: record query count if enforce_plan_limits failed
         await _ensure_query_recorded(user_id, getattr(request.state, "query_recorded", False))
@@ -751,10 +751,10 @@ async def _execute_async_job(
         
         logger.info("async_job_completed", job_id=job_id)
 
-        # Fire-and-forget: write usage to Cosmos for dashboard
+        # Queue usage record (batched Cosmos write + dashboard rollups)
         result_usage = result.get("usage", {})
         route_used = result.get("route_used", approach)
-        cosmos_task = asyncio.create_task(_write_cosmos_usage(
+        await _write_cosmos_usage(
             user_id=user_id,
             route=route_used,
             query_id=job_id,
@@ -766,9 +766,7 @@ async def _execute_async_job(
             credits_used=result_usage.get("credits_used", 0) if result_usage else 0,
             rerank_tokens=result_usage.get("rerank_tokens", 0) if result_usage else 0,
             embed_tokens=result_usage.get("embed_tokens", 0) if result_usage else 0,
-        ))
-        _background_tasks.add(cosmos_task)
-        cosmos_task.add_done_callback(_background_tasks.discard)
+        )
         
     except Exception as e:
         logger.error("async_job_failed", job_id=job_id, error=str(e))
@@ -856,9 +854,9 @@ async def _stream_chat_response(
                 response_id, created, route_used, "", thoughts, finish_reason="stop"
             )
 
-            # Fire-and-forget: write usage to Cosmos for dashboard
+            # Queue usage record (batched Cosmos write + dashboard rollups)
             result_usage = result.get("usage", {})
-            task = asyncio.create_task(_write_cosmos_usage(
+            await _write_cosmos_usage(
                 user_id=user_id,
                 route=route_used,
                 query_id=response_id,
@@ -870,9 +868,7 @@ async def _stream_chat_response(
                 credits_used=result_usage.get("credits_used", 0),
                 rerank_tokens=result_usage.get("rerank_tokens", 0),
                 embed_tokens=result_usage.get("embed_tokens", 0),
-            ))
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
+            )
 
             # Backup: record query count if enforce_plan_limits failed
             await _ensure_query_recorded(user_id, query_recorded)
@@ -1235,10 +1231,10 @@ async def frontend_chat(
                 f"Are there any related topics I should explore?",
             ]
         
-        # Fire-and-forget: write usage to Cosmos for dashboard
+        # Queue usage record (batched Cosmos write + dashboard rollups)
         result_usage = result.get("usage", {})
         route_used = result.get("route_used", approach)
-        task = asyncio.create_task(_write_cosmos_usage(
+        await _write_cosmos_usage(
             user_id=user_id,
             route=route_used,
             query_id=str(uuid.uuid4()),
@@ -1251,9 +1247,7 @@ async def frontend_chat(
             credits_used=result_usage.get("credits_used", 0),
             rerank_tokens=result_usage.get("rerank_tokens", 0),
             embed_tokens=result_usage.get("embed_tokens", 0),
-        ))
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+        )
 
         # Backup: record query count if enforce_plan_limits failed
         await _ensure_query_recorded(user_id, getattr(request.state, "query_recorded", False))
@@ -1381,29 +1375,25 @@ async def _frontend_stream_response(
                 yield json.dumps({"delta": {}, "session_state": session_state}) + "\n"
         result = query_task.result()
         
-        # Fire-and-forget Cosmos usage record (quota already tracked by enforce_plan_limits)
+        # Queue usage record (quota already tracked by enforce_plan_limits)
         try:
             route_used = result.get("route_used", approach)
             result_usage = result.get("usage", {})
             query_id = str(uuid.uuid4())
-            task = asyncio.create_task(
-                _write_cosmos_usage(
-                    user_id=user_id,
-                    route=route_used,
-                    query_id=query_id,
-                    tokens=result_usage.get("total_tokens", 0),
-                    model=f"graphrag-{route_used.lower()}",
-                    detected_language=result_usage.get("detected_language"),
-                    was_translated=result_usage.get("was_translated", False),
-                    translation_chars=result_usage.get("translation_chars", 0),
-                    speech_detected_language=overrides.speech_detected_language if overrides else None,
-                    credits_used=result_usage.get("credits_used", 0),
-                    rerank_tokens=result_usage.get("rerank_tokens", 0),
-                    embed_tokens=result_usage.get("embed_tokens", 0),
-                )
+            await _write_cosmos_usage(
+                user_id=user_id,
+                route=route_used,
+                query_id=query_id,
+                tokens=result_usage.get("total_tokens", 0),
+                model=f"graphrag-{route_used.lower()}",
+                detected_language=result_usage.get("detected_language"),
+                was_translated=result_usage.get("was_translated", False),
+                translation_chars=result_usage.get("translation_chars", 0),
+                speech_detected_language=overrides.speech_detected_language if overrides else None,
+                credits_used=result_usage.get("credits_used", 0),
+                rerank_tokens=result_usage.get("rerank_tokens", 0),
+                embed_tokens=result_usage.get("embed_tokens", 0),
             )
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
         except Exception as e:
             logger.warning("stream_cosmos_usage_failed", error=str(e))
         
@@ -7,7 +7,7 @@ Replaces the Quart chat_history_cosmosdb_bp blueprint.
 
 import logging
 import time
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, Response
@@ -19,6 +19,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat_history", tags=["chat-history"])
 
+# Cosmos DB transactional batches accept at most 100 operations.
+BATCH_OPERATION_LIMIT = 100
+# Upper bound on items returned per page (sessions list / session messages).
+MAX_PAGE_SIZE = 100
+
 
 # ==================== Request Models ====================
 
@@ -41,6 +46,36 @@ def _get_history_version(request: Request) -> str:
     return getattr(request.app.state, "cosmos_history_version", "1")
 
 
+def _page_size(count: int) -> int:
+    return max(1, min(count, MAX_PAGE_SIZE))
+
+
+async def _read_page(res, continuation_token: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Read one server-side page of a query; returns (items, next continuation token)."""
+    pager = res.by_page(continuation_token)
+    try:
+        page = await pager.__anext__()
+    except StopAsyncIteration:
+        return [], None
+    items = [item async for item in page]
+    return items, pager.continuation_token
+
+
+async def _iter_items(res) -> AsyncIterator[Dict[str, Any]]:
+    async for page in res.by_page():
+        async for item in page:
+            yield item
+
+
+async def _execute_in_batches(container, operations: List[tuple], partition_key: List[str]) -> None:
+    """Run *operations* as transactional batches of at most BATCH_OPERATION_LIMIT."""
+    for start in range(0, len(operations), BATCH_OPERATION_LIMIT):
+        await container.execute_item_batch(
+            batch_operations=operations[start:start + BATCH_OPERATION_LIMIT],
+            partition_key=partition_key,
+        )
+
+
 # ==================== Endpoints ====================
 
 @router.post("")
@@ -80,13 +115,11 @@ async def post_chat_history(
                 "response": pair[1],
             })
 
-        batch_operations = [("upsert", (session_item,))] + [
-            ("upsert", (item,)) for item in message_pair_items
-        ]
-        await container.execute_item_batch(
-            batch_operations=batch_operations,
-            partition_key=[user_id, body.id],
-        )
+        # The session item goes in the last batch so a session only appears
+        # in the sidebar once its messages are written.
+        batch_operations = [("upsert", (item,)) for item in message_pair_items]
+        batch_operations.append(("upsert", (session_item,)))
+        await _execute_in_batches(container, batch_operations, [user_id, body.id])
         return JSONResponse({}, status_code=201)
     except Exception as e:
         logger.exception("Error saving chat history")
@@ -100,13 +133,17 @@ async def get_chat_history_sessions(
     continuation_token: Optional[str] = Query(default=None, alias="continuationToken"),
     user_id: str = Depends(get_user_id),
 ):
-    """List chat sessions for the current user, paginated."""
+    """List chat sessions for the current user, one server-side page at a time.
+
+    Only the fields the sidebar shows are projected; pass the returned
+    continuation_token back as ``continuationToken`` for the next page.
+    """
     container = _get_history_container(request)
 
     try:
         res = container.query_items(
             query=(
-                "SELECT c.id, c.entra_oid, c.title, c.timestamp "
+                "SELECT c.id, c.title, c.timestamp "
                 "FROM c WHERE c.entra_oid = @entra_oid AND c.type = @type "
                 "ORDER BY c.timestamp DESC"
             ),
@@ -115,25 +152,19 @@ async def get_chat_history_sessions(
                 {"name": "@type", "value": "session"},
             ],
             partition_key=[user_id],
-            max_item_count=count,
+            max_item_count=_page_size(count),
         )
 
-        pager = res.by_page(continuation_token)
-        sessions = []
-        next_token = None
-        try:
-            page = await pager.__anext__()
-            next_token = pager.continuation_token
-            async for item in page:
-                sessions.append({
-                    "id": item.get("id"),
-                    "entra_oid": item.get("entra_oid"),
-                    "title": item.get("title", "untitled"),
-                    "timestamp": item.get("timestamp"),
-                })
-        except StopAsyncIteration:
-            next_token = None
-
+        items, next_token = await _read_page(res, continuation_token)
+        sessions = [
+            {
+                "id": item.get("id"),
+                "entra_oid": user_id,
+                "title": item.get("title", "untitled"),
+                "timestamp": item.get("timestamp"),
+            }
+            for item in items
+        ]
         return {"sessions": sessions, "continuation_token": next_token}
     except Exception as e:
         logger.exception("Error listing chat sessions")
@@ -144,30 +175,45 @@ async def get_chat_history_sessions(
 async def get_chat_history_session(
     request: Request,
     session_id: str,
+    count: Optional[int] = Query(default=None),
+    continuation_token: Optional[str] = Query(default=None, alias="continuationToken"),
     user_id: str = Depends(get_user_id),
 ):
-    """Get a specific chat session with all message pairs."""
+    """Get a chat session's message pairs.
+
+    Without ``count`` all pairs are returned.  With ``count`` one page of at
+    most that many pairs is returned together with a continuation_token.
+    """
     container = _get_history_container(request)
 
     try:
+        query_kwargs: Dict[str, Any] = {}
+        if count is not None:
+            query_kwargs["max_item_count"] = _page_size(count)
         res = container.query_items(
-            query="SELECT * FROM c WHERE c.session_id = @session_id AND c.type = @type",
+            query=(
+                "SELECT c.question, c.response FROM c "
+                "WHERE c.session_id = @session_id AND c.type = @type"
+            ),
             parameters=[
                 {"name": "@session_id", "value": session_id},
                 {"name": "@type", "value": "message_pair"},
             ],
             partition_key=[user_id, session_id],
+            **query_kwargs,
         )
 
-        message_pairs = []
-        async for page in res.by_page():
-            async for item in page:
-                message_pairs.append([item["question"], item["response"]])
+        next_token = None
+        if count is not None:
+            items, next_token = await _read_page(res, continuation_token)
+        else:
+            items = [item async for item in _iter_items(res)]
 
         return {
             "id": session_id,
             "entra_oid": user_id,
-            "answers": message_pairs,
+            "answers": [[item["question"], item["response"]] for item in items],
+            "continuation_token": next_token,
         }
     except Exception as e:
         logger.exception("Error getting chat session %s", session_id)
@@ -180,26 +226,36 @@ async def delete_chat_history_session(
     session_id: str,
     user_id: str = Depends(get_user_id),
 ):
-    """Delete a chat session and all its message pairs."""
+    """Delete a chat session and all its message pairs.
+
+    Items are deleted in transactional batches within the session partition
+    as their ids are read.  The session item is deleted last, so a partial
+    failure leaves the session listed and the delete can be retried.
+    """
     container = _get_history_container(request)
+    partition_key = [user_id, session_id]
 
     try:
         res = container.query_items(
-            query="SELECT c.id FROM c WHERE c.session_id = @session_id",
+            query="SELECT c.id, c.type FROM c WHERE c.session_id = @session_id",
             parameters=[{"name": "@session_id", "value": session_id}],
-            partition_key=[user_id, session_id],
+            partition_key=partition_key,
+            max_item_count=BATCH_OPERATION_LIMIT,
         )
 
-        ids_to_delete = []
-        async for page in res.by_page():
-            async for item in page:
-                ids_to_delete.append(item["id"])
-
-        batch_operations = [("delete", (id_,)) for id_ in ids_to_delete]
-        await container.execute_item_batch(
-            batch_operations=batch_operations,
-            partition_key=[user_id, session_id],
-        )
+        pending: List[tuple] = []
+        session_ops: List[tuple] = []
+        async for item in _iter_items(res):
+            op = ("delete", (item["id"],))
+            if item.get("type") == "session":
+                session_ops.append(op)
+                continue
+            pending.append(op)
+            if len(pending) == BATCH_OPERATION_LIMIT:
+                await _execute_in_batches(container, pending, partition_key)
+                pending = []
+
+        await _execute_in_batches(container, pending + session_ops, partition_key)
         return Response(status_code=204)
     except Exception as e:
         logger.exception("Error deleting chat session %s", session_id)
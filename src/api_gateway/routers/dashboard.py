@@ -29,6 +29,7 @@ from src.core.roles import (
 )
 from src.core.services.quota_enforcer import get_quota_enforcer
 from src.core.services.cosmos_client import get_cosmos_client
+from src.core.services.usage_rollups import get_usage_rollups, rollups_read_enabled
 
 logger = structlog.get_logger(__name__)
 
@@ -132,6 +133,8 @@ class SystemMetricsResponse(BaseModel):
     # Recent activity
     queries_per_hour: List[Dict[str, Any]] = []
     top_users: List[Dict[str, Any]] = []
+    queries_by_route: Dict[str, int] = {}
+    queries_by_model: Dict[str, int] = {}
     error_rate: float = 0.0
 
 
@@ -637,10 +640,20 @@ async def _fetch_dashboard_all(
             logger.warning("dashboard_credit_fetch_failed", user_id=user_id)
             return {}
 
+    async def _rollup_summary() -> Optional[Dict[str, int]]:
+        if not rollups_read_enabled():
+            return None
+        try:
+            rollups = await asyncio.wait_for(get_usage_rollups(), timeout=5)
+            return await asyncio.wait_for(rollups.tenant_summary(user_id), timeout=5)
+        except Exception as e:
+            logger.warning("dashboard_rollups_fetch_failed", user_id=user_id, error=str(e))
+            return None
+
     (documents_count, storage_used_gb, global_documents_count), \
         (recent_queries, cosmos_doc_count, cosmos_doc_storage), \
-        credit_info = await asyncio.gather(
-            _blob_stats(), _recent_queries(), _credits()
+        credit_info, rollup = await asyncio.gather(
+            _blob_stats(), _recent_queries(), _credits(), _rollup_summary()
         )
 
     if documents_count == 0:
@@ -650,8 +663,12 @@ async def _fetch_dashboard_all(
     personal_documents_count = documents_count
     total_documents = personal_documents_count
 
-    translated_queries_month = sum(1 for q in recent_queries if q.get("was_translated"))
-    speech_queries_month = sum(1 for q in recent_queries if q.get("was_speech_input"))
+    if rollup is not None:
+        translated_queries_month = rollup["translated_month"]
+        speech_queries_month = rollup["speech_month"]
+    else:
+        translated_queries_month = sum(1 for q in recent_queries if q.get("was_translated"))
+        speech_queries_month = sum(1 for q in recent_queries if q.get("was_speech_input"))
 
     usage_resp = UsageStatsResponse(
         queries_today=redis_usage["queries_today"],
@@ -714,7 +731,8 @@ async def get_system_metrics(
 ):
     """
     Get system-wide metrics for the admin management dashboard.
-    Aggregates data from Cosmos DB usage records.
+    Reads the Redis usage rollups; falls back to aggregating Cosmos DB
+    usage records when rollups are disabled, unavailable or not yet populated.
     """
     from src.core.algorithm_registry import (
         ALGORITHM_VERSIONS,
@@ -722,6 +740,15 @@ async def get_system_metrics(
     )
     from collections import Counter
 
+    if rollups_read_enabled():
+        try:
+            metrics = await asyncio.wait_for(_system_metrics_from_rollups(), timeout=10)
+            if metrics is not None:
+                return metrics
+            logger.info("admin_metrics_rollups_empty")
+        except Exception as e:
+            logger.warning("admin_metrics_rollups_failed", error=str(e))
+
     cosmos = get_cosmos_client()
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
@@ -828,6 +855,61 @@ async def get_system_metrics(
     )
 
 
+async def _system_metrics_from_rollups() -> Optional[SystemMetricsResponse]:
+    """Build the admin metrics from the pre-aggregated usage rollups (``None`` if not populated)."""
+    from src.core.algorithm_registry import (
+        ALGORITHM_VERSIONS,
+        get_default_version,
+    )
+
+    rollups = await get_usage_rollups()
+    summary = await rollups.admin_summary(top_n=200)
+    if summary is None:
+        return None
+    month_users = summary["top_users"]
+
+    plan_dist: Dict[str, int] = {"free": 0, "starter": 0, "professional": 0, "enterprise": 0}
+    plans: Dict[str, str] = {}
+    try:
+        enforcer = await get_quota_enforcer()
+        tiers = await asyncio.gather(*[enforcer.get_plan(u["user_id"]) for u in month_users])
+        for u, plan in zip(month_users, tiers):
+            plans[u["user_id"]] = plan.value
+            plan_dist[plan.value] = plan_dist.get(plan.value, 0) + 1
+    except Exception:
+        plan_dist["enterprise"] = summary["active_users_month"]
+
+    return SystemMetricsResponse(
+        total_users=summary["active_users_month"],
+        active_users_today=summary["active_users_today"],
+        active_users_month=summary["active_users_month"],
+        total_queries_today=summary["queries_today"],
+        total_queries_month=summary["queries_month"],
+        total_documents=summary["total_documents"],
+        total_storage_gb=round(summary["doc_pages"] * 0.0001, 4),
+        plan_distribution=plan_dist,
+        algorithm_version=get_default_version(),
+        enabled_versions=[
+            v for v, algo in ALGORITHM_VERSIONS.items()
+            if algo.is_enabled()
+        ],
+        system_status="healthy",
+        queries_per_hour=[h for h in summary["queries_per_hour"] if h["count"]],
+        top_users=[
+            {
+                "user_id": u["user_id"],
+                "name": u["user_id"][:20],
+                "queries": u["queries"],
+                "plan": plans.get(u["user_id"], "enterprise"),
+                "last_active": u["last_active"],
+            }
+            for u in month_users[:10]
+        ],
+        queries_by_route=summary["queries_by_route"],
+        queries_by_model=summary["queries_by_model"],
+    )
+
+
 @router.get("/admin/users")
 async def list_users(
     _: bool = Depends(verify_admin),
@@ -835,10 +917,22 @@ async def list_users(
     offset: int = 0,
 ):
     """
-    List users with their activity, aggregated from Cosmos DB usage records.
+    List users with their activity, from the Redis usage rollups (this
+    month) or aggregated from Cosmos DB usage records as a fallback.
     """
     from collections import Counter
 
+    if rollups_read_enabled():
+        try:
+            rollups = await asyncio.wait_for(get_usage_rollups(), timeout=5)
+            users = await asyncio.wait_for(
+                rollups.list_users(limit=limit, offset=offset), timeout=5
+            )
+            if users is not None:
+                return users
+        except Exception as e:
+            logger.warning("admin_users_rollups_failed", error=str(e))
+
     cosmos = get_cosmos_client()
 
     try:
@@ -39,8 +39,10 @@ async def detailed_health_check() -> Dict[str, Any]:
             with graph_service.driver.session() as session:
                 result = session.run("RETURN 1 as ping")
                 result.single()
+            from src.worker.services.neo4j_pool import get_neo4j_pool
             health_status["components"]["neo4j"] = {
                 "status": "healthy",
+                "pool": get_neo4j_pool().metrics(),
             }
         else:
             health_status["components"]["neo4j"] = {
@@ -33,6 +33,9 @@ import time
 from src.worker.hybrid_v2.orchestrator import HybridPipeline, HighQualityError
 from src.worker.hybrid_v2.router.main import DeploymentProfile, QueryRoute
 from src.worker.hybrid_v2.indexing import DualIndexService, get_hipporag_service
+from src.worker.hybrid_v2.retrievers.bm25_index import get_keyword_index_cache
+from src.worker.hybrid_v2.retrievers.hub_table import get_hub_table_cache
+from src.worker.hybrid_v2.retrievers.sentence_graph import get_sentence_graph_cache
 from src.api_gateway.middleware.auth import get_group_id
 from src.core.config import settings
 from src.core.services.quota_enforcer import enforce_plan_limits
@@ -66,11 +69,9 @@ def _get_neo4j_updated_at(group_id: str) -> Optional[float]:
     the async cache-check path via ``asyncio.to_thread``.
     """
     try:
-        from src.core.config import settings as _s
-        from neo4j import GraphDatabase as _GD
+        from src.worker.services.neo4j_pool import get_neo4j_pool
 
-        driver = _GD.driver(_s.NEO4J_URI, auth=(_s.NEO4J_USERNAME, _s.NEO4J_PASSWORD))
-        with driver.session() as session:
+        with get_neo4j_pool().session(read_only=True) as session:
             result = session.run(
                 "MATCH (n {group_id: $gid}) "
                 "RETURN max(n.updated_at) AS ts",
@@ -86,7 +87,6 @@ def _get_neo4j_updated_at(group_id: str) -> Optional[float]:
                     ts = float(ts)
                 else:
                     ts = None
-        driver.close()
         return ts
     except Exception as e:
         logger.debug("neo4j_updated_at_check_failed", group_id=group_id, error=str(e))
@@ -99,7 +99,9 @@ async def _invalidate_pipeline_cache(group_id: str) -> int:
     Route 7's triple store and PPR engine are lazy-loaded once via
     ``_ensure_initialized()`` and never refreshed.  Evicting the
     ``HybridPipeline`` (which owns the handler) forces a fresh load on
-    the next query.
+    the next query.  The process-wide keyword index, sentence graph and
+    hub table caches are dropped too instead of waiting for their next
+    group-version check.
 
     Returns the number of cache entries removed.
     """
@@ -110,6 +112,9 @@ async def _invalidate_pipeline_cache(group_id: str) -> int:
             del _pipeline_cache[key]
             _pipeline_cache_timestamps.pop(key, None)
             removed += 1
+    get_keyword_index_cache().invalidate(group_id)
+    get_sentence_graph_cache().invalidate(group_id)
+    get_hub_table_cache().invalidate(group_id)
     if removed:
         logger.info("pipeline_cache_invalidated", group_id=group_id, entries_removed=removed)
     return removed
@@ -592,6 +597,7 @@ async def hybrid_query(
                 "forced": body.force_route is not None,
                 "confidence": result.get("confidence"),
                 "model": result.get("usage", {}).get("model", ""),
+                "answer_cache_hit": bool(result.get("usage", {}).get("answer_cache_hit")),
             },
         )
         
@@ -1197,6 +1203,12 @@ async def _run_indexing_job(
                     logger.exception("indexing_thread_error", job_id=job_id)
                     raise
                 finally:
+                    # Async drivers are bound to this loop: release their pools
+                    from src.worker.services.neo4j_pool import get_neo4j_pool
+                    try:
+                        loop.run_until_complete(get_neo4j_pool().aclose_loop())
+                    except Exception:
+                        logger.warning("indexing_thread_pool_close_failed", job_id=job_id)
                     loop.close()
 
             stats = await _aio.to_thread(_run_pipeline_in_thread)
@@ -1631,6 +1643,7 @@ async def init_vector_index(request: Request, force: bool = False):
         force: If True, drop and recreate the index (useful when new chunks are added)
     """
     from src.worker.services.graph_service import GraphService
+    from src.worker.services.schema_registry import get_schema_registry
     
     group_id = request.state.group_id
     graph_service = GraphService()
@@ -1658,6 +1671,7 @@ async def init_vector_index(request: Request, force: bool = False):
             }}
             """
             session.run(vector_index_query)
+        get_schema_registry().invalidate(graph_service.driver)
         
         logger.info("vector_index_created", group_id=group_id, force=force)
         return {
@@ -1687,6 +1701,7 @@ async def init_textchunk_fulltext_index(request: Request, force: bool = False):
         force: If True, drop and recreate the index.
     """
     from src.worker.services.graph_service import GraphService
+    from src.worker.services.schema_registry import get_schema_registry
 
     group_id = request.state.group_id
     graph_service = GraphService()
@@ -1706,6 +1721,7 @@ async def init_textchunk_fulltext_index(request: Request, force: bool = False):
             session.run(
                 "CREATE FULLTEXT INDEX textchunk_fulltext IF NOT EXISTS FOR (c:TextChunk) ON EACH [c.text]"
             )
+        get_schema_registry().invalidate(graph_service.driver)
 
         logger.info("textchunk_fulltext_index_created", group_id=group_id, force=force)
         return {
@@ -2400,7 +2416,7 @@ async def debug_rebuild_similarity_edges(request: Request):
         
         result = await pipeline._build_section_similarity_edges(group_id)
         
-        neo4j_store.driver.close()
+        neo4j_store.close()
         
         return {
             "status": "success",
@@ -135,6 +135,10 @@ class DocumentSyncService:
                 query_id=f"upload-{group_id}-{filename}",
             )
             await asyncio.wait_for(cosmos.write_usage_record(record), timeout=10)
+            # Document count / page rollups for the dashboards (best-effort)
+            from src.core.services.usage_rollups import record_usage_rollups
+
+            await record_usage_rollups([record])
             logger.info(
                 "doc_sync_cosmos_usage_written",
                 extra={"user_id": user_id, "file_name": filename},
@@ -215,6 +219,11 @@ class DocumentSyncService:
                     "chunks_deleted": result.chunks_deleted,
                 },
             )
+            if result.success:
+                # Keep the dashboard document counts in step (best-effort)
+                from src.core.services.usage_rollups import forget_document_rollups
+
+                await forget_document_rollups([filename])
         except Exception as e:
             logger.error(
                 "doc_sync_delete_failed",
@@ -173,6 +173,12 @@ class Settings(BaseSettings):
     NEO4J_USERNAME: Optional[str] = None
     NEO4J_PASSWORD: Optional[str] = None
     NEO4J_DATABASE: Optional[str] = None
+    # Shared driver pool (src/worker/services/neo4j_pool.py) — one per process
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 120.0
+    NEO4J_MAX_CONNECTION_LIFETIME: int = 300
+    NEO4J_MAX_TRANSACTION_RETRY_TIME: float = 120.0
+    NEO4J_SYNC_EXECUTOR_WORKERS: int = 16
     AURA_INSTANCEID: Optional[str] = None
     AURA_INSTANCENAME: Optional[str] = None
     
@@ -224,6 +230,8 @@ class Settings(BaseSettings):
     REQUIRE_AUTH: bool = True  # Fail closed. Set to False for local dev without Easy Auth.
     ALLOW_LEGACY_GROUP_HEADER: bool = False  # Allow X-Group-ID header (deprecated, only for local dev)
     GROUP_ID_OVERRIDE: Optional[str] = Field(default=None)  # Optional fixed group_id override for auth testing
+    JWT_CLAIMS_CACHE_SIZE: int = 2048  # Decoded-claims cache entries (0 disables the cache)
+    JWT_CLAIMS_CACHE_TTL_SECONDS: int = 300  # Upper bound on claim reuse; token exp still applies
     GLOBAL_GROUP_ID: str = "__global__"  # Sentinel group_id for shared/public documents
     
     # Performance & Rate Limiting
@@ -14,6 +14,9 @@ from src.core.models.chat import ChatSession
 
 logger = structlog.get_logger(__name__)
 
+# Cosmos transactional batch limit (operations per partition-key batch)
+_USAGE_BATCH_MAX_OPS = 100
+
 
 class CosmosDBClient:
     """Async Cosmos DB client for GraphRAG."""
@@ -95,16 +98,44 @@ class CosmosDBClient:
             # Don't raise - fire-and-forget pattern
     
     async def write_usage_batch(self, records: List[UsageRecord]) -> None:
-        """Write multiple usage records in batch."""
+        """Write multiple usage records, one transactional batch per partition.
+
+        Records are grouped by ``partition_id`` and upserted with
+        ``execute_item_batch`` (max 100 operations per batch).  A partition
+        whose batch fails falls back to individual upserts.
+        """
+        if not records:
+            return
+        if not self._usage_container:
+            await self.ensure_initialized()
         if not self._usage_container:
             logger.warning("usage_batch_write_skipped", reason="Cosmos not initialized")
             return
-        
+
+        by_partition: Dict[str, List[UsageRecord]] = {}
+        for record in records:
+            by_partition.setdefault(record.partition_id, []).append(record)
+
+        async def _write_partition(partition_id: str, items: List[UsageRecord]) -> None:
+            for start in range(0, len(items), _USAGE_BATCH_MAX_OPS):
+                chunk = items[start:start + _USAGE_BATCH_MAX_OPS]
+                try:
+                    await self._usage_container.execute_item_batch(
+                        batch_operations=[
+                            ("upsert", (r.model_dump(mode="json"),)) for r in chunk
+                        ],
+                        partition_key=partition_id,
+                    )
+                except Exception as e:
+                    logger.debug("usage_batch_partition_fallback",
+                                 partition_id=partition_id, error=str(e))
+                    await asyncio.gather(*[self.write_usage_record(r) for r in chunk])
+
         try:
             await asyncio.gather(
-                *[self.write_usage_record(record) for record in records]
+                *[_write_partition(pid, items) for pid, items in by_partition.items()]
             )
-            logger.info("usage_batch_written", count=len(records))
+            logger.info("usage_batch_written", count=len(records), partitions=len(by_partition))
         except Exception as e:
             logger.warning("usage_batch_write_failed", error=str(e), count=len(records))
     
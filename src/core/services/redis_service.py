@@ -612,6 +612,11 @@ class RedisService:
         self.results = RedisResultStore(redis_client)
         self.queue = RedisJobQueue(redis_client)
     
+    @property
+    def client(self) -> aioredis.Redis:
+        """Underlying client, for commands the stores above don't wrap."""
+        return self._redis
+    
     @classmethod
     async def create(cls, redis_url: Optional[str] = None) -> "RedisService":
         """Create RedisService with connection."""
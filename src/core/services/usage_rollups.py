@@ -0,0 +1,360 @@
+"""
+Usage Rollups — write-time Redis aggregates for admin metrics and dashboards.
+
+Every usage record written through ``UsageTracker`` also increments a few
+pre-aggregated counters, so dashboards read O(hours) small hashes instead
+of scanning a month of Cosmos usage records across partitions.
+
+Keys:
+    usage_rollup:hour:{YYYYMMDDHH}          → HASH counters        (TTL: 8d)
+    usage_rollup:day:{YYYYMMDD}             → HASH counters        (TTL: 40d)
+    usage_rollup:month:{YYYYMM}             → HASH counters        (TTL: 400d)
+    usage_rollup:users:day:{YYYYMMDD}       → ZSET user → queries  (TTL: 40d)
+    usage_rollup:users:month:{YYYYMM}       → ZSET user → queries  (TTL: 400d)
+    usage_rollup:tokens:month:{YYYYMM}      → ZSET user → tokens   (TTL: 400d)
+    usage_rollup:last_active                → HASH user → ISO timestamp
+    usage_rollup:totals                     → HASH all-time counters
+    usage_rollup:documents:{tenant} / :all  → SET of document ids
+    usage_rollup:document_owner             → HASH document id → tenant
+
+Counter fields inside the period hashes:
+    queries, tokens, credits, translated, speech, doc_pages,
+    route:{route}, model:{model},
+    tenant:{tenant}:queries, tenant:{tenant}:tokens, tenant:{tenant}:credits,
+    tenant:{tenant}:translated, tenant:{tenant}:speech,
+    tenant:{tenant}:route:{route}, tenant:{tenant}:model:{model}
+
+"Queries" are ``llm_completion`` records (one summary per user query),
+matching what the admin dashboard used to count from Cosmos.  Document sets
+shrink through ``forget_document_rollups`` when a document is deleted.
+
+Best-effort: rollup failures are logged and never raised into the request
+path.  Rollups only see records written after they were deployed and nothing
+backfills history, so dashboards read them only with ``USAGE_ROLLUPS_READ=1``
+(default off).  Enable it once a deployment has accumulated a full month and
+its all-time document / page totals.  The read methods return ``None`` when
+the keys they need are missing, and callers fall back to the Cosmos scan.
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import structlog
+
+from src.core.models.usage import UsageRecord
+from src.core.services.redis_service import RedisService, get_redis_service
+
+logger = structlog.get_logger(__name__)
+
+_PREFIX = "usage_rollup"
+_HOUR_TTL = 8 * 86400
+_DAY_TTL = 40 * 86400
+_MONTH_TTL = 400 * 86400
+
+
+def rollups_read_enabled() -> bool:
+    """Whether dashboards read the Redis rollups (default off, see module docstring)."""
+    return os.getenv("USAGE_ROLLUPS_READ", "0").strip().lower() in {"1", "true", "yes"}
+
+
+class UsageRollups:
+    """Redis-backed hourly / daily / monthly usage counters."""
+
+    def __init__(self, redis_service: RedisService):
+        self._redis = redis_service.client
+
+    # ── Key builders ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _hour_key(dt: datetime) -> str:
+        return f"{_PREFIX}:hour:{dt.strftime('%Y%m%d%H')}"
+
+    @staticmethod
+    def _day_key(dt: datetime) -> str:
+        return f"{_PREFIX}:day:{dt.strftime('%Y%m%d')}"
+
+    @staticmethod
+    def _month_key(dt: datetime) -> str:
+        return f"{_PREFIX}:month:{dt.strftime('%Y%m')}"
+
+    @staticmethod
+    def _users_key(period: str, dt: datetime) -> str:
+        fmt = "%Y%m%d" if period == "day" else "%Y%m"
+        return f"{_PREFIX}:users:{period}:{dt.strftime(fmt)}"
+
+    @staticmethod
+    def _tokens_key(dt: datetime) -> str:
+        return f"{_PREFIX}:tokens:month:{dt.strftime('%Y%m')}"
+
+    @staticmethod
+    def _docs_key(tenant: str) -> str:
+        return f"{_PREFIX}:documents:{tenant}"
+
+    # ── Write path ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _counters(record: UsageRecord) -> Dict[str, int]:
+        """Hash-field increments contributed by one record."""
+        tenant = record.partition_id
+        usage_type = getattr(record.usage_type, "value", record.usage_type)
+        fields: Dict[str, int] = {}
+
+        def add(name: str, value: Optional[int]) -> None:
+            if value:
+                fields[name] = fields.get(name, 0) + int(value)
+                fields[f"tenant:{tenant}:{name}"] = fields.get(f"tenant:{tenant}:{name}", 0) + int(value)
+
+        if usage_type == "llm_completion":
+            add("queries", 1)
+            add("tokens", record.total_tokens)
+            add("credits", record.credits_used)
+            add("translated", 1 if record.was_translated else 0)
+            add("speech", 1 if record.was_speech_input else 0)
+            if record.route:
+                add(f"route:{record.route}", 1)
+            if record.model:
+                add(f"model:{record.model}", 1)
+        elif usage_type == "doc_intel":
+            add("doc_pages", record.pages_analyzed)
+        else:
+            add(f"{usage_type}:tokens", record.total_tokens)
+        return fields
+
+    async def record_batch(self, records: Iterable[UsageRecord]) -> None:
+        """Fold *records* into the rollups with one pipelined round-trip."""
+        pipe = self._redis.pipeline(transaction=False)
+        expiries: Dict[str, int] = {}
+        queued = 0
+        for record in records:
+            ts = record.timestamp
+            user = record.user_id or record.partition_id
+            counters = self._counters(record)
+            for key, ttl in (
+                (self._hour_key(ts), _HOUR_TTL),
+                (self._day_key(ts), _DAY_TTL),
+                (self._month_key(ts), _MONTH_TTL),
+            ):
+                for field, value in counters.items():
+                    pipe.hincrby(key, field, value)
+                expiries[key] = ttl
+
+            usage_type = getattr(record.usage_type, "value", record.usage_type)
+            if usage_type == "llm_completion":
+                for period, ttl in (("day", _DAY_TTL), ("month", _MONTH_TTL)):
+                    key = self._users_key(period, ts)
+                    pipe.zincrby(key, 1, user)
+                    expiries[key] = ttl
+                if record.total_tokens:
+                    key = self._tokens_key(ts)
+                    pipe.zincrby(key, int(record.total_tokens), user)
+                    expiries[key] = _MONTH_TTL
+                pipe.hset(f"{_PREFIX}:last_active", user, ts.isoformat())
+            elif usage_type == "doc_intel" and record.document_id:
+                pipe.sadd(self._docs_key(record.partition_id), record.document_id)
+                pipe.sadd(self._docs_key("all"), record.document_id)
+                pipe.hset(f"{_PREFIX}:document_owner", record.document_id, record.partition_id)
+                if record.pages_analyzed:
+                    pipe.hincrby(f"{_PREFIX}:totals", "doc_pages", int(record.pages_analyzed))
+                    pipe.hincrby(
+                        f"{_PREFIX}:totals",
+                        f"tenant:{record.partition_id}:doc_pages",
+                        int(record.pages_analyzed),
+                    )
+            queued += 1
+
+        if not queued:
+            return
+        for key, ttl in expiries.items():
+            pipe.expire(key, ttl)
+        await pipe.execute()
+        logger.debug("usage_rollups_recorded", records=queued)
+
+    async def forget_documents(self, document_ids: Sequence[str]) -> None:
+        """Remove deleted documents from the per-tenant and total document counts."""
+        document_ids = [d for d in document_ids if d]
+        if not document_ids:
+            return
+        owners = await self._redis.hmget(f"{_PREFIX}:document_owner", document_ids)
+        pipe = self._redis.pipeline(transaction=False)
+        for document_id, owner in zip(document_ids, owners):
+            pipe.srem(self._docs_key("all"), document_id)
+            if owner:
+                pipe.srem(self._docs_key(self._str(owner)), document_id)
+        pipe.hdel(f"{_PREFIX}:document_owner", *document_ids)
+        await pipe.execute()
+
+    # ── Read path ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _ints(raw: Optional[Dict[Any, Any]]) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        for k, v in (raw or {}).items():
+            key = k.decode() if isinstance(k, bytes) else str(k)
+            out[key] = int(v)
+        return out
+
+    @staticmethod
+    def _str(value: Any) -> str:
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    @staticmethod
+    def _breakdown(counters: Dict[str, int], prefix: str) -> Dict[str, int]:
+        return {k[len(prefix):]: v for k, v in counters.items() if k.startswith(prefix) and ":" not in k[len(prefix):]}
+
+    async def admin_summary(self, now: Optional[datetime] = None, top_n: int = 10) -> Optional[Dict[str, Any]]:
+        """System-wide counters for the admin metrics endpoint.
+
+        ``queries_per_hour`` covers today's hours (UTC), like the Cosmos scan.
+        Returns ``None`` unless this month's counters and the all-time
+        document / page totals exist.
+        """
+        now = now or datetime.utcnow()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        hours = [today + timedelta(hours=h) for h in range(now.hour + 1)]
+
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hgetall(self._day_key(now))
+        pipe.hgetall(self._month_key(now))
+        pipe.zcard(self._users_key("day", now))
+        pipe.zcard(self._users_key("month", now))
+        pipe.zrevrange(self._users_key("month", now), 0, top_n - 1, withscores=True)
+        pipe.scard(self._docs_key("all"))
+        pipe.hget(f"{_PREFIX}:totals", "doc_pages")
+        for h in hours:
+            pipe.hget(self._hour_key(h), "queries")
+        pipe.exists(self._month_key(now), self._docs_key("all"), f"{_PREFIX}:totals")
+        results = await pipe.execute()
+        *hour_counts, present = results[7:]
+        if int(present or 0) < 3:
+            return None
+
+        day, month = self._ints(results[0]), self._ints(results[1])
+        top_users = [(self._str(uid), int(score)) for uid, score in results[4]]
+        last_active: List[Any] = []
+        if top_users:
+            last_active = await self._redis.hmget(
+                f"{_PREFIX}:last_active", [uid for uid, _ in top_users]
+            )
+
+        return {
+            "queries_today": day.get("queries", 0),
+            "queries_month": month.get("queries", 0),
+            "active_users_today": int(results[2] or 0),
+            "active_users_month": int(results[3] or 0),
+            "total_documents": int(results[5] or 0),
+            "doc_pages": int(results[6] or 0),
+            "queries_per_hour": [
+                {"hour": h.strftime("%Y-%m-%dT%H"), "count": int(c or 0)}
+                for h, c in zip(hours, hour_counts)
+            ],
+            "top_users": [
+                {
+                    "user_id": uid,
+                    "queries": count,
+                    "last_active": self._str(ts) if ts else "",
+                }
+                for (uid, count), ts in zip(top_users, last_active or [None] * len(top_users))
+            ],
+            "queries_by_route": self._breakdown(month, "route:"),
+            "queries_by_model": self._breakdown(month, "model:"),
+        }
+
+    async def list_users(
+        self, limit: int = 50, offset: int = 0, now: Optional[datetime] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Users active this month ordered by query count (``None`` if none are recorded)."""
+        now = now or datetime.utcnow()
+        users_key = self._users_key("month", now)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.zcard(users_key)
+        pipe.zrevrange(users_key, offset, offset + limit - 1, withscores=True)
+        total, page = await pipe.execute()
+        if not total:
+            return None
+
+        user_ids = [self._str(uid) for uid, _ in page]
+        tokens: List[Any] = []
+        last_active: List[Any] = []
+        if user_ids:
+            pipe = self._redis.pipeline(transaction=False)
+            for uid in user_ids:
+                pipe.zscore(self._tokens_key(now), uid)
+            pipe.hmget(f"{_PREFIX}:last_active", user_ids)
+            *tokens, last_active = await pipe.execute()
+
+        users = []
+        for i, (uid, (_, score)) in enumerate(zip(user_ids, page)):
+            ts = last_active[i] if last_active else None
+            users.append({
+                "user_id": uid,
+                "display_name": uid[:30],
+                "queries": int(score),
+                "last_active": self._str(ts) if ts else "",
+                "total_tokens": int(tokens[i] or 0),
+            })
+        return {"users": users, "total": int(total or 0), "limit": limit, "offset": offset}
+
+    async def tenant_summary(self, tenant: str, now: Optional[datetime] = None) -> Optional[Dict[str, int]]:
+        """Per-tenant month counters plus all-time document stats.
+
+        Returns ``None`` when this month's counters don't exist yet.
+        """
+        now = now or datetime.utcnow()
+        prefix = f"tenant:{tenant}:"
+        fields = ["queries", "tokens", "credits", "translated", "speech"]
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hmget(self._month_key(now), [prefix + f for f in fields])
+        pipe.scard(self._docs_key(tenant))
+        pipe.hget(f"{_PREFIX}:totals", f"{prefix}doc_pages")
+        pipe.exists(self._month_key(now))
+        month, docs, pages, present = await pipe.execute()
+        if not present:
+            return None
+        summary = {f"{f}_month": int(v or 0) for f, v in zip(fields, month)}
+        summary["documents"] = int(docs or 0)
+        summary["doc_pages"] = int(pages or 0)
+        return summary
+
+
+# =============================================================================
+# Singleton accessor
+# =============================================================================
+
+_rollups: Optional[UsageRollups] = None
+
+
+async def get_usage_rollups() -> UsageRollups:
+    """Get or create singleton UsageRollups.
+
+    Deliberately unlocked: a module-level ``asyncio.Lock`` binds to the first
+    loop that waits on it, and rollups are reached from per-job loops too.
+    Concurrent first calls just wrap the same ``RedisService`` twice.
+    """
+    global _rollups
+    if _rollups is None:
+        _rollups = UsageRollups(await get_redis_service())
+    return _rollups
+
+
+async def record_usage_rollups(records: List[UsageRecord]) -> None:
+    """Best-effort rollup write; never raises."""
+    if not records:
+        return
+    try:
+        rollups = await asyncio.wait_for(get_usage_rollups(), timeout=5)
+        await asyncio.wait_for(rollups.record_batch(records), timeout=5)
+    except Exception as e:
+        logger.warning("usage_rollups_write_failed", records=len(records), error=str(e))
+
+
+async def forget_document_rollups(document_ids: List[str]) -> None:
+    """Best-effort removal of deleted documents from the counts; never raises."""
+    if not document_ids:
+        return
+    try:
+        rollups = await asyncio.wait_for(get_usage_rollups(), timeout=5)
+        await asyncio.wait_for(rollups.forget_documents(document_ids), timeout=5)
+    except Exception as e:
+        logger.warning("usage_rollups_forget_failed", documents=len(document_ids), error=str(e))
@@ -2,12 +2,14 @@
 
 from typing import Optional, List
 import asyncio
+import os
 import threading
 import structlog
 from datetime import datetime
 
 from src.core.models.usage import UsageRecord, UsageType
 from src.core.services.cosmos_client import get_cosmos_client
+from src.core.services.usage_rollups import record_usage_rollups
 
 logger = structlog.get_logger(__name__)
 
@@ -22,15 +24,31 @@ class UsageTracker:
     Logs token and page consumption to Cosmos DB asynchronously without
     blocking the main request flow. Falls back to structured logging if
     Cosmos is unavailable.
+
+    Records are queued and flushed together — when ``USAGE_BATCH_SIZE``
+    records are pending or ``USAGE_BATCH_FLUSH_SECONDS`` after the first
+    queued record — through ``CosmosDBClient.write_usage_batch`` and the
+    Redis usage rollups (``usage_rollups.py``).
+
+    Flushes run on the loop passed to ``bind_loop`` (the app's loop) even
+    when records are queued from a short-lived per-job loop, so a pending
+    flush timer is not dropped when that loop closes.
     """
     
     def __init__(self):
         """Initialize usage tracker."""
         self._cosmos_client = get_cosmos_client()
         self._batch_queue: List[UsageRecord] = []
-        self._batch_size = 10
-        self._batch_interval = 60  # seconds
+        self._queue_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_size = int(os.getenv("USAGE_BATCH_SIZE", "10"))
+        self._batch_interval = float(os.getenv("USAGE_BATCH_FLUSH_SECONDS", "2"))  # seconds
         self._last_flush = datetime.utcnow()
+        self._flush_timer: Optional[asyncio.Task] = None
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Run batch flushes on *loop* (default: the running loop)."""
+        self._loop = loop or asyncio.get_running_loop()
     
     async def log_llm_usage(
         self,
@@ -225,27 +243,90 @@ class UsageTracker:
         except Exception as e:
             logger.warning("gds_usage_tracking_failed", error=str(e))
     
+    async def track_record(self, record: UsageRecord) -> None:
+        """
+        Queue a prebuilt usage record (e.g. the per-query chat summary).
+        
+        Fire-and-forget: Does not raise exceptions or block the caller.
+        """
+        try:
+            await self._write_record(record)
+        except Exception as e:
+            logger.warning("usage_record_tracking_failed", error=str(e))
+
     async def _write_record(self, record: UsageRecord) -> None:
         """
-        Write record to Cosmos DB asynchronously.
+        Queue record for the next batched Cosmos write + rollup update.
         
         Uses fire-and-forget pattern - logs warnings on failure but doesn't raise.
         """
         try:
-            # Write immediately (non-blocking)
-            task = asyncio.create_task(self._cosmos_client.write_usage_record(record))
-            _background_tasks.add(task)
-            task.add_done_callback(_background_tasks.discard)
+            with self._queue_lock:
+                self._batch_queue.append(record)
+                full = len(self._batch_queue) >= self._batch_size
+            home = self._loop
+            if (
+                home is not None
+                and home is not asyncio.get_running_loop()
+                and home.is_running()
+            ):
+                home.call_soon_threadsafe(self._schedule_flush, full)
+            else:
+                self._schedule_flush(full)
         except Exception as e:
             # Fallback: just log to structlog
             logger.warning("cosmos_write_failed_using_structlog",
                           error=str(e),
                           record_id=record.id)
+
+    def _schedule_flush(self, full: bool) -> None:
+        """Start a flush now if the queue is full, else arm the interval timer."""
+        if full:
+            self._spawn(self._flush_queue())
+        elif (
+            self._flush_timer is None
+            or self._flush_timer.done()
+            or self._flush_timer.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._flush_timer = self._spawn(self._flush_after_interval())
+
+    @staticmethod
+    def _spawn(coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return task
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self._batch_interval)
+        await self._flush_queue()
+
+    async def _flush_queue(self) -> None:
+        """Write every queued record in one batch (Cosmos + rollups)."""
+        with self._queue_lock:
+            batch, self._batch_queue = self._batch_queue, []
+        if not batch:
+            return
+        self._last_flush = datetime.utcnow()
+        results = await asyncio.gather(
+            self._cosmos_client.write_usage_batch(batch),
+            record_usage_rollups(batch),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("usage_batch_flush_failed", error=str(result), count=len(batch))
     
     async def flush(self) -> None:
-        """Flush any pending fire-and-forget tasks."""
-        if _background_tasks:
-            await asyncio.gather(*_background_tasks, return_exceptions=True)
+        """Write queued records and wait for this loop's pending background tasks."""
+        loop = asyncio.get_running_loop()
+        timer = self._flush_timer
+        if timer is not None and not timer.done() and timer.get_loop() is loop:
+            timer.cancel()
+        await self._flush_queue()
+        pending = [t for t in _background_tasks if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 # Singleton instance
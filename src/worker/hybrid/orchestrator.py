@@ -43,7 +43,6 @@ Router (all routes):
 from typing import Dict, Any, Optional, List, Tuple
 import structlog
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 
 from .pipeline.intent import IntentDisambiguator
 from .pipeline.tracing import DeterministicTracer
@@ -64,6 +63,8 @@ except ImportError:
     ASYNC_NEO4J_AVAILABLE = False
     AsyncNeo4jService = None
 
+from src.worker.services.neo4j_pool import get_neo4j_pool
+
 logger = structlog.get_logger(__name__)
 
 # LlamaIndex Workflow for parallel DRIFT execution (Jan 2026)
@@ -167,9 +168,9 @@ class HybridPipeline:
         # Cached one-time checks for Neo4j indexes used by Route 1
         self._textchunk_fulltext_index_checked = False
         
-        # Thread pool for running sync Neo4j calls without blocking event loop
-        # This is a production best practice when mixing sync I/O with async code
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="neo4j-sync")
+        # Thread pool for running sync Neo4j calls without blocking event loop.
+        # Shared process-wide so cached pipelines don't each hold idle threads.
+        self._executor = get_neo4j_pool().get_executor()
         
         # Initialize async Neo4j service for native async operations (Route 2/3)
         self._async_neo4j: Optional[AsyncNeo4jService] = None
@@ -277,9 +278,9 @@ class HybridPipeline:
                 logger.info("async_neo4j_closed")
             except Exception as e:
                 logger.warning("async_neo4j_close_error", error=str(e))
-        
-        if self._executor:
-            self._executor.shutdown(wait=False)
+
+        # The executor is shared via Neo4jPoolManager; just drop the reference.
+        self._executor = None
     
     async def __aenter__(self) -> "HybridPipeline":
         """Async context manager entry - initializes resources."""
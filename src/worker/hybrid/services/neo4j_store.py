@@ -21,9 +21,11 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from dataclasses import dataclass, field
 
 import neo4j
-from neo4j import GraphDatabase, AsyncGraphDatabase
+from neo4j import AsyncGraphDatabase
 from neo4j import Query
 
+from src.worker.services.neo4j_pool import get_neo4j_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,12 +159,10 @@ class Neo4jStoreV3:
             return self._driver
         with self._driver_lock:
             if self._driver is None:
-                self._driver = GraphDatabase.driver(
-                    self.uri,
-                    auth=(self.username, self.password),
+                # Shared, pool-managed driver (verified on creation)
+                self._driver = get_neo4j_pool().get_driver(
+                    self.uri, self.username, self.password,
                 )
-                # Verify connectivity
-                self._driver.verify_connectivity()
                 logger.info(f"Connected to Neo4j at {self.uri}")
         return self._driver
     
@@ -181,10 +181,8 @@ class Neo4jStoreV3:
         return self._async_driver
     
     def close(self):
-        """Close the Neo4j driver."""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """Release the shared driver (closed by ``Neo4jPoolManager`` at shutdown)."""
+        self._driver = None
     
     async def aclose(self):
         """Close the async Neo4j driver."""
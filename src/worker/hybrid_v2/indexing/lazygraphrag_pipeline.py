@@ -250,6 +250,45 @@ class LazyGraphRAGIndexingPipeline:
         knn_config: Optional[str] = None,  # Tag for KNN edges (e.g., "knn-1", "knn-2") for A/B testing
         # Entity synonymy parameters (cross-doc bridging via embedding similarity)
         entity_synonymy_threshold: float = 0.65,
+    ) -> Dict[str, Any]:
+        try:
+            return await self._index_documents(
+                group_id=group_id,
+                documents=documents,
+                reindex=reindex,
+                reextract_entities=reextract_entities,
+                ingestion=ingestion,
+                dry_run=dry_run,
+                knn_enabled=knn_enabled,
+                knn_top_k=knn_top_k,
+                knn_similarity_cutoff=knn_similarity_cutoff,
+                knn_config=knn_config,
+                entity_synonymy_threshold=entity_synonymy_threshold,
+            )
+        finally:
+            # Query-time caches version the group on this stamp; set it on
+            # every exit so a failed run still invalidates them.
+            try:
+                await asyncio.to_thread(self.neo4j_store.mark_indexing_completed, group_id)
+            except Exception as e:
+                logger.warning(f"mark_indexing_completed_failed: {e}")
+
+    async def _index_documents(
+        self,
+        *,
+        group_id: str,
+        documents: List[Dict[str, Any]],
+        reindex: bool = False,
+        reextract_entities: bool = False,
+        ingestion: str = "none",
+        dry_run: bool = False,
+        # KNN tuning parameters
+        knn_enabled: bool = True,
+        knn_top_k: int = 5,
+        knn_similarity_cutoff: float = 0.60,
+        knn_config: Optional[str] = None,  # Tag for KNN edges (e.g., "knn-1", "knn-2") for A/B testing
+        # Entity synonymy parameters (cross-doc bridging via embedding similarity)
+        entity_synonymy_threshold: float = 0.65,
     ) -> Dict[str, Any]:
         start_time = time.time()
         
@@ -338,6 +377,9 @@ class LazyGraphRAGIndexingPipeline:
             except Exception as e:
                 logger.warning(f"reextract_gds_failed: {e}")
 
+            if not dry_run:
+                await asyncio.to_thread(self.neo4j_store.materialize_hub_tables, group_id)
+
             stats["elapsed_s"] = round(time.time() - start_time, 2)
             logger.info(f"reextract_entities_complete: {stats}")
             return stats
@@ -628,6 +670,10 @@ class LazyGraphRAGIndexingPipeline:
                 stats["communities_created"] = 0
                 stats["summaries_generated"] = 0
                 stats["embeddings_stored"] = 0
+
+        # ── Step 10: Hub / degree tables for query-time hub selection ──
+        if not dry_run:
+            await asyncio.to_thread(self.neo4j_store.materialize_hub_tables, group_id)
         
         stats["elapsed_s"] = round(time.time() - start_time, 2)
         return stats
@@ -1300,42 +1346,57 @@ class LazyGraphRAGIndexingPipeline:
         if sim_deleted > 0:
             logger.info(f"step_4.2_cleanup: deleted {sim_deleted} stale SEMANTICALLY_SIMILAR edges")
         
-        # Fetch all sentences with embeddings for this group
-        result = await self.neo4j_store.arun_query(
-            """
+        # Fetch all sentences with embeddings for this group.  Embeddings are
+        # streamed page by page into one float32 matrix instead of holding
+        # every driver float list at once.
+        def _read_sentences(session):
+            record = session.run(
+                """
+                MATCH (s:Sentence {group_id: $group_id})
+                WHERE s.sentence_embedding IS NOT NULL
+                RETURN count(s) AS n
+                """,
+                group_id=group_id,
+            ).single()
+            return session.read_embeddings(
+                """
                 MATCH (s:Sentence {group_id: $group_id})
                 WHERE s.sentence_embedding IS NOT NULL
+                  AND ($after IS NULL OR s.id > $after)
                 RETURN s.id AS id,
                        s.document_id AS document_id,
                        s.index_in_doc AS index_in_doc,
                        s.sentence_embedding AS embedding
+                ORDER BY s.id LIMIT $limit
                 """,
-            read_only=True,
-            group_id=group_id,
+                expected_rows=int(record["n"]) if record else 0,
+                group_id=group_id,
+            )
+
+        rows, embeddings, present = await self.neo4j_store.arun_in_session(
+            _read_sentences, read_only=True,
         )
         sentences = [
             {
-                "id": record["id"],
-                "document_id": record["document_id"] or "",
-                "index_in_doc": record["index_in_doc"] or 0,
-                "embedding": record["embedding"],
+                "id": row["id"],
+                "document_id": row["document_id"] or "",
+                "index_in_doc": row["index_in_doc"] or 0,
             }
-            for record in result
+            for row in rows
         ]
         
         if len(sentences) < 2:
             return {"edges_created": 0, "reason": "insufficient_sentences"}
         
-        # Filter to consistent embedding dimensions (defensive: mixed dims crash np.array)
-        if sentences:
-            target_dim = len(sentences[0]["embedding"])
-            filtered = [s for s in sentences if len(s["embedding"]) == target_dim]
-            if len(filtered) < len(sentences):
-                logger.warning(
-                    f"step_4.2_sentence_knn: filtered {len(sentences) - len(filtered)} sentences "
-                    f"with mismatched embedding dim (expected {target_dim})"
-                )
-                sentences = filtered
+        # Drop rows whose embedding dimension differs from the first one seen
+        # (defensive: mixed dims from partial re-embeds)
+        if not present.all():
+            logger.warning(
+                f"step_4.2_sentence_knn: filtered {int((~present).sum())} sentences "
+                f"with mismatched embedding dim (expected {embeddings.shape[1]})"
+            )
+            sentences = [row for row, ok in zip(sentences, present) if ok]
+            embeddings = embeddings[present]
         
         if len(sentences) < 2:
             return {"edges_created": 0, "reason": "insufficient_sentences_after_dim_filter"}
@@ -1346,7 +1407,6 @@ class LazyGraphRAGIndexingPipeline:
         # Compute pairwise cosine similarities (cross-chunk only)
         # Use numpy for efficiency. With 181 sentences this is instant;
         # for larger corpora we'd switch to vector index queries.
-        embeddings = np.array([s["embedding"] for s in sentences])
         norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
         norms[norms == 0] = 1  # Avoid division by zero
         normalized = embeddings / norms
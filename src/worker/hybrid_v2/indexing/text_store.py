@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 
+from src.worker.hybrid_v2.services.graph_read_repository import GraphReadRepository
+from src.worker.hybrid_v2.services.neo4j_retry import retry_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -63,11 +66,26 @@ class Neo4jTextUnitStore:
     It is intentionally read-only and returns dicts shaped for `EvidenceSynthesizer`.
     """
 
-    def __init__(self, neo4j_driver: Any, *, group_id: str, limit_per_entity: int = 12, folder_id: Optional[str] = None):
+    def __init__(
+        self,
+        neo4j_driver: Any,
+        *,
+        group_id: str,
+        limit_per_entity: int = 12,
+        folder_id: Optional[str] = None,
+        async_neo4j: Any = None,
+    ):
         self._driver = neo4j_driver
         self._group_id = group_id
         self._limit = int(limit_per_entity)
         self._folder_id = folder_id
+        # Hot-path reads (entity chunks, vector safety net) go through the
+        # repository so they use the native async driver when available.
+        self._repo = GraphReadRepository(driver=neo4j_driver, async_neo4j=async_neo4j)
+
+    def attach_async_neo4j(self, async_neo4j: Any) -> None:
+        """Route hot-path reads through *async_neo4j* once it is connected."""
+        self._repo.async_neo4j = async_neo4j
 
     async def get_chunks_for_entity(self, entity_name: str) -> List[Dict[str, Any]]:
         """Get chunks for a single entity (backward compatibility wrapper)."""
@@ -183,6 +201,18 @@ class Neo4jTextUnitStore:
         return await asyncio.to_thread(self._get_chunks_for_query_sync, keywords, int(limit))
 
     def _get_chunks_for_query_sync(self, keywords: List[str], limit: int) -> List[Dict[str, Any]]:
+        from src.worker.hybrid_v2.retrievers.bm25_index import keyword_index_enabled
+
+        if keyword_index_enabled():
+            try:
+                rows = self._get_chunks_for_query_indexed(keywords, limit)
+                # No hits may mean substrings the tokenizer cannot isolate
+                # (unsegmented scripts): let the CONTAINS scan try.
+                if rows:
+                    return rows
+            except Exception as e:
+                logger.warning("keyword_index_lookup_failed_falling_back", error=str(e))
+
         # Enhanced query: also fetch document-level date for corpus-level reasoning
         query = """
         MATCH (c)
@@ -208,64 +238,113 @@ class Neo4jTextUnitStore:
                 limit=int(limit),
             )
             for record in result:
-                c = record.get("chunk")
-                d = record.get("doc")
-                if not c:
-                    continue
+                row = self._query_chunk_row(record)
+                if row is not None:
+                    rows.append(row)
 
-                raw_meta = c.get("metadata")
-                meta: Dict[str, Any] = {}
-                if raw_meta:
-                    if isinstance(raw_meta, str):
-                        try:
-                            meta = json.loads(raw_meta)
-                        except Exception:
-                            meta = {}
-                    elif isinstance(raw_meta, dict):
-                        meta = dict(raw_meta)
+        return rows
 
-                for prop_key in ("page_number", "section_path", "di_section_path", "document_id", "url"):
-                    if prop_key not in meta:
-                        try:
-                            v = c.get(prop_key)
-                        except Exception:
-                            v = None
-                        if v is not None and v != "":
-                            meta[prop_key] = v
+    def warm_keyword_index(self) -> None:
+        """Build (or load) this group's chunk keyword index ahead of the first query."""
+        from src.worker.hybrid_v2.retrievers.bm25_index import get_keyword_index_cache
 
-                doc_title = (d.get("title") if d else "") or meta.get("document_title") or ""
-                doc_source = (d.get("source") if d else "") or meta.get("document_source") or ""
-                url = meta.get("url") or doc_source or ""
+        get_keyword_index_cache().get(self._driver, "chunk", [self._group_id])
 
-                section_path = meta.get("section_path")
-                section_label = ""
-                if isinstance(section_path, list) and section_path:
-                    section_label = " > ".join(str(x) for x in section_path if x)
-                elif isinstance(section_path, str) and section_path:
-                    section_label = section_path
+    def _get_chunks_for_query_indexed(self, keywords: List[str], limit: int) -> List[Dict[str, Any]]:
+        """Score chunks with the in-process BM25 index, then fetch only the winners."""
+        from src.worker.hybrid_v2.retrievers.bm25_index import get_keyword_index_cache
 
-                source_label = doc_title or doc_source or url or "neo4j"
-                if section_label:
-                    source_label = f"{source_label} — {section_label}"
+        index = get_keyword_index_cache().get(self._driver, "chunk", [self._group_id])
+        hits = index.search(keywords, top_k=int(limit))
+        if not hits:
+            return []
 
-                rows.append(
-                    {
-                        "id": str(c.get("id") or ""),
-                        "source": str(source_label),
-                        "text": str(c.get("text") or ""),
-                        "entity": "__query__",
-                        "metadata": {
-                            **meta,
-                            "document_title": str(doc_title),
-                            "document_source": str(doc_source),
-                            "document_id": str(record.get("doc_id") or ""),
-                            "document_date": str(record.get("doc_date") or ""),
-                            "keyword_score": int(record.get("score") or 0),
-                        },
-                    }
+        # elementIds are reused after deletes, so a stale index key may now
+        # name another group's node: re-check tenant and label on the way back.
+        query = """
+        MATCH (c)
+        WHERE elementId(c) IN $keys
+          AND c.group_id = $group_id
+          AND (c:TextChunk OR c:Chunk OR c:`__Node__`)
+        OPTIONAL MATCH (c)-[:IN_DOCUMENT]->(d:Document {group_id: $group_id})
+        RETURN elementId(c) AS key, c AS chunk, d AS doc,
+               coalesce(d.date, '') AS doc_date,
+               coalesce(d.id, '') AS doc_id
+        """
+        with retry_session(self._driver, read_only=True) as session:
+            by_key = {
+                record["key"]: record
+                for record in session.run(
+                    query, keys=[key for key, _, _ in hits], group_id=self._group_id,
                 )
+            }
 
+        rows: List[Dict[str, Any]] = []
+        for key, bm25_score, match_count in hits:
+            record = by_key.get(key)
+            row = self._query_chunk_row(record, score=match_count) if record else None
+            if row is not None:
+                row["metadata"]["bm25_score"] = round(bm25_score, 4)
+                rows.append(row)
         return rows
+
+    @staticmethod
+    def _query_chunk_row(record: Any, score: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Shape a keyword-lookup record (chunk, doc, doc_id, doc_date) for synthesis."""
+        c = record.get("chunk")
+        d = record.get("doc")
+        if not c:
+            return None
+
+        raw_meta = c.get("metadata")
+        meta: Dict[str, Any] = {}
+        if raw_meta:
+            if isinstance(raw_meta, str):
+                try:
+                    meta = json.loads(raw_meta)
+                except Exception:
+                    meta = {}
+            elif isinstance(raw_meta, dict):
+                meta = dict(raw_meta)
+
+        for prop_key in ("page_number", "section_path", "di_section_path", "document_id", "url"):
+            if prop_key not in meta:
+                try:
+                    v = c.get(prop_key)
+                except Exception:
+                    v = None
+                if v is not None and v != "":
+                    meta[prop_key] = v
+
+        doc_title = (d.get("title") if d else "") or meta.get("document_title") or ""
+        doc_source = (d.get("source") if d else "") or meta.get("document_source") or ""
+        url = meta.get("url") or doc_source or ""
+
+        section_path = meta.get("section_path")
+        section_label = ""
+        if isinstance(section_path, list) and section_path:
+            section_label = " > ".join(str(x) for x in section_path if x)
+        elif isinstance(section_path, str) and section_path:
+            section_label = section_path
+
+        source_label = doc_title or doc_source or url or "neo4j"
+        if section_label:
+            source_label = f"{source_label} — {section_label}"
+
+        return {
+            "id": str(c.get("id") or ""),
+            "source": str(source_label),
+            "text": str(c.get("text") or ""),
+            "entity": "__query__",
+            "metadata": {
+                **meta,
+                "document_title": str(doc_title),
+                "document_source": str(doc_source),
+                "document_id": str(record.get("doc_id") or ""),
+                "document_date": str(record.get("doc_date") or ""),
+                "keyword_score": int((record.get("score") if score is None else score) or 0),
+            },
+        }
     
     async def get_entity_communities(self, entity_names: List[str]) -> Dict[str, Optional[int]]:
         """Batch-fetch Louvain community_id for a list of entity names.
@@ -327,37 +406,26 @@ class Neo4jTextUnitStore:
         if not names:
             return {}
         
-        # Neo4j python driver is sync; run in a thread to avoid blocking the event loop.
-        return await asyncio.to_thread(
-            self._get_chunks_for_entities_batch_sync,
+        query, query_params = self._chunks_for_entities_query(names, target_document_ids)
+        records = await self._repo.fetch(query, **query_params)
+        return self._collect_chunks_for_entities(
+            records,
             names,
             3,   # max_per_section default
             6,   # max_per_document default
-            target_document_ids,
         )
 
-    def _get_chunks_for_entities_batch_sync(
+    def _chunks_for_entities_query(
         self,
         entity_names: List[str],
-        max_per_section: int = 3,
-        max_per_document: int = 6,
         target_document_ids: Optional[List[str]] = None,
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """Batch query to fetch chunks for multiple entities in a single round-trip.
-        
-        Enhanced with section-aware diversification (Jan 2026):
-        - Fetches section_id via IN_SECTION edge
-        - Applies max_per_section and max_per_document caps for better coverage
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Batch query (and params) fetching chunks for multiple entities in one round-trip.
 
         Document-scoped retrieval (Feb 10, 2026):
         - When target_document_ids is provided, only return chunks from those docs
         - Uses MATCH + WHERE instead of OPTIONAL MATCH for the document edge
         """
-        import os
-        
-        # Check if section diversification is enabled
-        section_graph_enabled = os.getenv("SECTION_GRAPH_ENABLED", "1").strip().lower() in {"1", "true", "yes"}
-        
         # --- Document-scoped vs document-blind query (Feb 10, 2026) ---
         # Phase B: Support both Sentence-based and TextChunk-based MENTIONS.
         # When MENTIONS comes from a Sentence, traverse PART_OF to get parent TextChunk.
@@ -404,9 +472,7 @@ class Neo4jTextUnitStore:
             WITH entity_name, collect({chunk: c, doc: d, section: s})[0..$limit] AS items
             RETURN entity_name, items
             """
-        
-        results: Dict[str, List[Dict[str, Any]]] = {name: [] for name in entity_names}
-        
+
         query_params = dict(
             group_id=self._group_id,
             entity_names=entity_names,
@@ -415,141 +481,157 @@ class Neo4jTextUnitStore:
         )
         if target_document_ids:
             query_params["target_document_ids"] = target_document_ids
+        return query, query_params
 
-        with self._driver.session() as session:
-            result = session.run(query, **query_params)
+    def _collect_chunks_for_entities(
+        self,
+        records: List[Any],
+        entity_names: List[str],
+        max_per_section: int = 3,
+        max_per_document: int = 6,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Group batch-query records into per-entity chunk dicts.
+
+        Section-aware diversification (Jan 2026): applies max_per_section and
+        max_per_document caps (keyed on the IN_SECTION edge) for better coverage.
+        """
+        import os
+
+        section_graph_enabled = os.getenv("SECTION_GRAPH_ENABLED", "1").strip().lower() in {"1", "true", "yes"}
+
+        results: Dict[str, List[Dict[str, Any]]] = {name: [] for name in entity_names}
+
+        for record in records:
+            entity_name = record.get("entity_name")
+            items = record.get("items") or []
             
-            for record in result:
-                entity_name = record.get("entity_name")
-                items = record.get("items") or []
-                
-                if not entity_name:
+            if not entity_name:
+                continue
+            
+            # Track per-section and per-document counts for diversification
+            per_section_counts: Dict[str, int] = {}
+            per_doc_counts: Dict[str, int] = {}
+            
+            rows: List[Dict[str, Any]] = []
+            seen_chunk_ids: set[str] = set()
+            for item in items:
+                c = (item or {}).get("chunk")
+                d = (item or {}).get("doc")
+                s = (item or {}).get("section")
+                if not c:
                     continue
-                
-                # Track per-section and per-document counts for diversification
-                per_section_counts: Dict[str, int] = {}
-                per_doc_counts: Dict[str, int] = {}
-                
-                rows: List[Dict[str, Any]] = []
-                seen_chunk_ids: set[str] = set()
-                for item in items:
-                    c = (item or {}).get("chunk")
-                    d = (item or {}).get("doc")
-                    s = (item or {}).get("section")
-                    if not c:
-                        continue
 
-                    chunk_id = str(c.get("id") or "")
-                    if chunk_id and chunk_id in seen_chunk_ids:
-                        continue
-                    if chunk_id:
-                        seen_chunk_ids.add(chunk_id)
-                    
-                    raw_meta = c.get("metadata")
-                    meta: Dict[str, Any] = {}
-                    if raw_meta:
-                        if isinstance(raw_meta, str):
-                            try:
-                                meta = json.loads(raw_meta)
-                            except Exception:
-                                meta = {}
-                        elif isinstance(raw_meta, dict):
-                            meta = dict(raw_meta)
+                chunk_id = str(c.get("id") or "")
+                if chunk_id and chunk_id in seen_chunk_ids:
+                    continue
+                if chunk_id:
+                    seen_chunk_ids.add(chunk_id)
+                
+                raw_meta = c.get("metadata")
+                meta: Dict[str, Any] = {}
+                if raw_meta:
+                    if isinstance(raw_meta, str):
+                        try:
+                            meta = json.loads(raw_meta)
+                        except Exception:
+                            meta = {}
+                    elif isinstance(raw_meta, dict):
+                        meta = dict(raw_meta)
 
-                    # Some chunk types store common fields as top-level props.
-                    for prop_key in ("page_number", "section_path", "di_section_path", "document_id", "url"):
-                        if prop_key not in meta:
-                            try:
-                                v = c.get(prop_key)
-                            except Exception:
-                                v = None
-                            if v is not None and v != "":
-                                meta[prop_key] = v
-                    
-                    # Prefer Document attribution when available.
-                    # document_id from the graph is the authoritative grouping key
-                    doc_id = (d.get("id") if d else "") or meta.get("document_id") or ""
-                    doc_title = (d.get("title") if d else "") or meta.get("document_title") or ""
-                    doc_source = (d.get("source") if d else "") or meta.get("document_source") or ""
-                    url = meta.get("url") or doc_source or ""
-                    
-                    # Extract section info from IN_SECTION edge (preferred) or metadata
-                    section_id = (s.get("id") if s else "") or ""
-                    section_path_key = (s.get("path_key") if s else "") or ""
-                    
-                    # Build a readable section label for citations.
-                    section_path = meta.get("section_path")
-                    section_label = ""
-                    if section_path_key:
-                        section_label = section_path_key
-                    elif isinstance(section_path, list) and section_path:
-                        section_label = " > ".join(str(x) for x in section_path if x)
-                    elif isinstance(section_path, str) and section_path:
-                        section_label = section_path
+                # Some chunk types store common fields as top-level props.
+                for prop_key in ("page_number", "section_path", "di_section_path", "document_id", "url"):
+                    if prop_key not in meta:
+                        try:
+                            v = c.get(prop_key)
+                        except Exception:
+                            v = None
+                        if v is not None and v != "":
+                            meta[prop_key] = v
+                
+                # Prefer Document attribution when available.
+                # document_id from the graph is the authoritative grouping key
+                doc_id = (d.get("id") if d else "") or meta.get("document_id") or ""
+                doc_title = (d.get("title") if d else "") or meta.get("document_title") or ""
+                doc_source = (d.get("source") if d else "") or meta.get("document_source") or ""
+                url = meta.get("url") or doc_source or ""
+                
+                # Extract section info from IN_SECTION edge (preferred) or metadata
+                section_id = (s.get("id") if s else "") or ""
+                section_path_key = (s.get("path_key") if s else "") or ""
+                
+                # Build a readable section label for citations.
+                section_path = meta.get("section_path")
+                section_label = ""
+                if section_path_key:
+                    section_label = section_path_key
+                elif isinstance(section_path, list) and section_path:
+                    section_label = " > ".join(str(x) for x in section_path if x)
+                elif isinstance(section_path, str) and section_path:
+                    section_label = section_path
+                
+                # Apply section-aware diversification (if enabled)
+                if section_graph_enabled:
+                    # Use section_id for diversification key (stable), fallback to path_key
+                    section_key = section_id or section_label or "[unknown]"
+                    doc_key = doc_id or doc_title or doc_source or "[unknown]"
                     
-                    # Apply section-aware diversification (if enabled)
-                    if section_graph_enabled:
-                        # Use section_id for diversification key (stable), fallback to path_key
-                        section_key = section_id or section_label or "[unknown]"
-                        doc_key = doc_id or doc_title or doc_source or "[unknown]"
-                        
-                        # Check section cap
-                        if per_section_counts.get(section_key, 0) >= max_per_section:
-                            logger.debug(
-                                "route2_section_cap_reached",
-                                entity=entity_name,
-                                section=section_key,
-                                count=per_section_counts.get(section_key, 0),
-                            )
-                            continue
-                        
-                        # Check document cap
-                        if per_doc_counts.get(doc_key, 0) >= max_per_document:
-                            logger.debug(
-                                "route2_document_cap_reached",
-                                entity=entity_name,
-                                document=doc_key,
-                                count=per_doc_counts.get(doc_key, 0),
-                            )
-                            continue
-                        
-                        # Update counts
-                        per_section_counts[section_key] = per_section_counts.get(section_key, 0) + 1
-                        per_doc_counts[doc_key] = per_doc_counts.get(doc_key, 0) + 1
+                    # Check section cap
+                    if per_section_counts.get(section_key, 0) >= max_per_section:
+                        logger.debug(
+                            "route2_section_cap_reached",
+                            entity=entity_name,
+                            section=section_key,
+                            count=per_section_counts.get(section_key, 0),
+                        )
+                        continue
                     
-                    source_label = doc_title or doc_source or url or "neo4j"
-                    if section_label:
-                        source_label = f"{source_label} — {section_label}"
+                    # Check document cap
+                    if per_doc_counts.get(doc_key, 0) >= max_per_document:
+                        logger.debug(
+                            "route2_document_cap_reached",
+                            entity=entity_name,
+                            document=doc_key,
+                            count=per_doc_counts.get(doc_key, 0),
+                        )
+                        continue
                     
-                    rows.append(
-                        {
-                            "id": chunk_id,
-                            "source": str(source_label),
-                            "text": str(c.get("text") or ""),
-                            "entity": entity_name,
-                            "metadata": {
-                                **meta,
-                                "document_id": str(doc_id),  # Graph node ID - authoritative grouping key
-                                "document_title": str(doc_title),
-                                "document_source": str(doc_source),
-                                "section_id": str(section_id),  # Section node ID for diversification
-                                "section_path_key": str(section_path_key),
-                            },
-                        }
-                    )
+                    # Update counts
+                    per_section_counts[section_key] = per_section_counts.get(section_key, 0) + 1
+                    per_doc_counts[doc_key] = per_doc_counts.get(doc_key, 0) + 1
                 
-                results[entity_name] = rows
-
-                if not rows:
-                    logger.debug("neo4j_text_store_no_chunks", entity=entity_name)
-                elif section_graph_enabled:
-                    logger.debug(
-                        "route2_section_diversification_applied",
-                        entity=entity_name,
-                        chunks_returned=len(rows),
-                        unique_sections=len(per_section_counts),
-                        unique_docs=len(per_doc_counts),
-                    )
+                source_label = doc_title or doc_source or url or "neo4j"
+                if section_label:
+                    source_label = f"{source_label} — {section_label}"
+                
+                rows.append(
+                    {
+                        "id": chunk_id,
+                        "source": str(source_label),
+                        "text": str(c.get("text") or ""),
+                        "entity": entity_name,
+                        "metadata": {
+                            **meta,
+                            "document_id": str(doc_id),  # Graph node ID - authoritative grouping key
+                            "document_title": str(doc_title),
+                            "document_source": str(doc_source),
+                            "section_id": str(section_id),  # Section node ID for diversification
+                            "section_path_key": str(section_path_key),
+                        },
+                    }
+                )
+            
+            results[entity_name] = rows
+
+            if not rows:
+                logger.debug("neo4j_text_store_no_chunks", entity=entity_name)
+            elif section_graph_enabled:
+                logger.debug(
+                    "route2_section_diversification_applied",
+                    entity=entity_name,
+                    chunks_returned=len(rows),
+                    unique_sections=len(per_section_counts),
+                    unique_docs=len(per_doc_counts),
+                )
 
         # Summary log for Route 2 chunk retrieval
         total_chunks = sum(len(v) for v in results.values())
@@ -563,7 +645,7 @@ class Neo4jTextUnitStore:
             max_per_section=max_per_section if section_graph_enabled else None,
             max_per_document=max_per_document if section_graph_enabled else None,
         )
-        
+
         return results
 
     # ------------------------------------------------------------------
@@ -589,11 +671,9 @@ class Neo4jTextUnitStore:
         """
         if not embedding:
             return []
-        return await asyncio.to_thread(
-            self._search_chunks_by_vector_sync, embedding, top_k, index_name,
-        )
+        return await self._search_chunks_by_vector(embedding, top_k, index_name)
 
-    def _search_chunks_by_vector_sync(
+    async def _search_chunks_by_vector(
         self,
         embedding: list,
         top_k: int,
@@ -611,60 +691,59 @@ class Neo4jTextUnitStore:
 
         results: list = []
         try:
-            with self._driver.session() as session:
-                records = session.run(
-                    query,
-                    embedding=embedding,
-                    group_id=self._group_id,
-                    top_k=int(top_k),
-                )
-                for record in records:
-                    t = record["t"]
-                    d = record.get("d")
-                    sim = float(record.get("score", 0.0))
-                    if not t:
-                        continue
+            records = await self._repo.fetch(
+                query,
+                embedding=embedding,
+                group_id=self._group_id,
+                top_k=int(top_k),
+            )
+            for record in records:
+                t = record["t"]
+                d = record.get("d")
+                sim = float(record.get("score", 0.0))
+                if not t:
+                    continue
 
-                    raw_meta = t.get("metadata")
-                    meta: dict = {}
-                    if raw_meta:
-                        if isinstance(raw_meta, str):
-                            try:
-                                meta = json.loads(raw_meta)
-                            except Exception:
-                                meta = {}
-                        elif isinstance(raw_meta, dict):
-                            meta = dict(raw_meta)
+                raw_meta = t.get("metadata")
+                meta: dict = {}
+                if raw_meta:
+                    if isinstance(raw_meta, str):
+                        try:
+                            meta = json.loads(raw_meta)
+                        except Exception:
+                            meta = {}
+                    elif isinstance(raw_meta, dict):
+                        meta = dict(raw_meta)
 
-                    doc_title = (d.get("title") if d else "") or meta.get("document_title", "")
-                    doc_source = (d.get("source") if d else "") or meta.get("document_source", "")
-                    doc_id = (d.get("id") if d else "") or meta.get("document_id", "")
+                doc_title = (d.get("title") if d else "") or meta.get("document_title", "")
+                doc_source = (d.get("source") if d else "") or meta.get("document_source", "")
+                doc_id = (d.get("id") if d else "") or meta.get("document_id", "")
 
-                    section_path = meta.get("section_path")
-                    section_label = ""
-                    if isinstance(section_path, list) and section_path:
-                        section_label = " > ".join(str(x) for x in section_path if x)
-                    elif isinstance(section_path, str) and section_path:
-                        section_label = section_path
+                section_path = meta.get("section_path")
+                section_label = ""
+                if isinstance(section_path, list) and section_path:
+                    section_label = " > ".join(str(x) for x in section_path if x)
+                elif isinstance(section_path, str) and section_path:
+                    section_label = section_path
 
-                    source_label = doc_title or doc_source or "neo4j"
-                    if section_label:
-                        source_label = f"{source_label} — {section_label}"
+                source_label = doc_title or doc_source or "neo4j"
+                if section_label:
+                    source_label = f"{source_label} — {section_label}"
 
-                    chunk_dict = {
-                        "id": str(t.get("id") or ""),
-                        "source": str(source_label),
-                        "text": str(t.get("text") or ""),
-                        "entity": "__vector_fallback__",
-                        "metadata": {
-                            **meta,
-                            "document_id": str(doc_id),
-                            "document_title": str(doc_title),
-                            "document_source": str(doc_source),
-                            "vector_similarity": sim,
-                        },
-                    }
-                    results.append((chunk_dict, sim))
+                chunk_dict = {
+                    "id": str(t.get("id") or ""),
+                    "source": str(source_label),
+                    "text": str(t.get("text") or ""),
+                    "entity": "__vector_fallback__",
+                    "metadata": {
+                        **meta,
+                        "document_id": str(doc_id),
+                        "document_title": str(doc_title),
+                        "document_source": str(doc_source),
+                        "vector_similarity": sim,
+                    },
+                }
+                results.append((chunk_dict, sim))
 
             logger.info(
                 "vector_safety_net_search",
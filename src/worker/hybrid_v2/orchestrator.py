@@ -43,7 +43,7 @@ from typing import Dict, Any, Optional, List, Tuple
 import structlog
 import asyncio
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
 
 from .pipeline.intent import IntentDisambiguator
 from .pipeline.tracing import DeterministicTracer
@@ -51,7 +51,20 @@ from .pipeline.synthesis import EvidenceSynthesizer
 from .pipeline.community_matcher import CommunityMatcher
 from .pipeline.hub_extractor import HubExtractor
 from .pipeline.enhanced_graph_retriever import EnhancedGraphRetriever
+from .retrievers.bm25_index import (
+    get_keyword_index_cache,
+    group_version_in_progress,
+    keyword_index_enabled,
+    read_group_version,
+)
 from .router.main import HybridRouter, QueryRoute, DeploymentProfile
+from .services.answer_cache import (
+    AnswerCacheHit,
+    AnswerCacheKey,
+    answer_cache_enabled,
+    get_answer_cache,
+    semantic_tier_enabled,
+)
 
 # Modular route handlers (Jan 2026 refactor)
 from .routes import LocalSearchHandler, GlobalSearchHandler, DRIFTHandler, UnifiedSearchHandler, ConceptSearchHandler, HippoRAG2Handler
@@ -64,6 +77,8 @@ except ImportError:
     ASYNC_NEO4J_AVAILABLE = False
     AsyncNeo4jService = None
 
+from src.worker.services.neo4j_pool import get_neo4j_pool
+
 # V2 Voyage embedding support (Jan 26, 2026)
 from src.core.config import settings, build_group_ids
 
@@ -219,9 +234,10 @@ class HybridPipeline:
         # Cached one-time checks for Neo4j indexes (used by Route 2 Local Search)
         self._textchunk_fulltext_index_checked = False
         
-        # Thread pool for running sync Neo4j calls without blocking event loop
-        # This is a production best practice when mixing sync I/O with async code
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="neo4j-sync")
+        # Thread pool for running sync Neo4j calls without blocking event loop.
+        # Shared process-wide so cached pipelines don't each hold idle threads.
+        self._executor = get_neo4j_pool().get_executor()
+        self._keyword_index_warmup: Optional[asyncio.Future] = None
         
         # Initialize async Neo4j service for native async operations (Route 2/3)
         self._async_neo4j: Optional[AsyncNeo4jService] = None
@@ -231,6 +247,8 @@ class HybridPipeline:
                 logger.info("async_neo4j_service_configured")
             except Exception as e:
                 logger.warning("async_neo4j_service_init_failed", error=str(e))
+        if self._async_neo4j is not None and hasattr(text_unit_store, "attach_async_neo4j"):
+            text_unit_store.attach_async_neo4j(self._async_neo4j)
         
         # Initialize components
         self.router = HybridRouter(
@@ -268,6 +286,7 @@ class HybridPipeline:
             group_id=group_id,
             folder_id=folder_id,
             group_ids=self.group_ids,
+            async_neo4j=self._async_neo4j,
         )
         
         # Routes 3 & 4: Deterministic tracing
@@ -326,6 +345,25 @@ class HybridPipeline:
             except Exception as e:
                 logger.warning("async_neo4j_connection_failed", error=str(e))
                 self._async_neo4j = None
+
+        # Build the keyword BM25 indexes off the event loop.  Queries that
+        # arrive before the build finishes wait on the same per-group lock.
+        if self.neo4j_driver is not None and keyword_index_enabled():
+            loop = asyncio.get_running_loop()
+            self._keyword_index_warmup = loop.run_in_executor(
+                self._executor, self._warm_keyword_indexes
+            )
+
+    def _warm_keyword_indexes(self) -> None:
+        """Build (or load) the Sentence and chunk BM25 indexes for this group."""
+        cache = get_keyword_index_cache()
+        try:
+            cache.get(self.neo4j_driver, "sentence", self.group_ids)
+            text_store = getattr(self.synthesizer, "text_store", None)
+            if hasattr(text_store, "warm_keyword_index"):
+                text_store.warm_keyword_index()
+        except Exception as e:
+            logger.warning("keyword_index_warmup_failed", group_id=self.group_id, error=str(e))
     
     async def close(self) -> None:
         """
@@ -339,9 +377,9 @@ class HybridPipeline:
                 logger.info("async_neo4j_closed")
             except Exception as e:
                 logger.warning("async_neo4j_close_error", error=str(e))
-        
-        if self._executor:
-            self._executor.shutdown(wait=False)
+
+        # The executor is shared via Neo4jPoolManager; just drop the reference.
+        self._executor = None
     
     async def __aenter__(self) -> "HybridPipeline":
         """Async context manager entry - initializes resources."""
@@ -447,18 +485,38 @@ class HybridPipeline:
         # Step 0: Create per-request TokenAccumulator and attach to TrackedLLM
         from src.core.services.token_accumulator import TokenAccumulator
         accumulator = TokenAccumulator()
+        t_query_start = time.perf_counter()
+        stage_timings_ms: Dict[str, int] = {}
 
-        # Step 0a: Translate query if user language ≠ document language
-        translated_query, detected_lang, was_translated = await self._maybe_translate_query(
-            query, accumulator=accumulator,
-        )
-        if was_translated and detected_lang and not language:
-            # Respond in the user's original language
-            language = detected_lang
-        search_query = translated_query if was_translated else query
+        # Speculative Route 7 seed retrieval, overlapped with translation + routing
+        prefetch = self._start_speculative_prefetch(query, accumulator) if use_modular_handlers else None
 
-        # Step 0b: Route the (translated) query and determine weight profile
-        route, weight_profile = await self.router.route_with_profile(search_query)
+        try:
+            # Step 0a: Translate query if user language ≠ document language
+            t0 = time.perf_counter()
+            translated_query, detected_lang, was_translated = await self._maybe_translate_query(
+                query, accumulator=accumulator,
+            )
+            stage_timings_ms["translate_ms"] = int((time.perf_counter() - t0) * 1000)
+            if was_translated and detected_lang and not language:
+                # Respond in the user's original language
+                language = detected_lang
+            search_query = translated_query if was_translated else query
+
+            if prefetch is not None and prefetch.query != search_query:
+                # Speculation was on the untranslated text — throw it away
+                prefetch.cancel()
+                prefetch = None
+                logger.info("speculative_prefetch_cancelled", reason="query_translated")
+
+            # Step 0b: Route the (translated) query and determine weight profile
+            t0 = time.perf_counter()
+            route, weight_profile = await self.router.route_with_profile(search_query)
+            stage_timings_ms["route_ms"] = int((time.perf_counter() - t0) * 1000)
+        except BaseException:
+            if prefetch is not None:
+                prefetch.cancel()
+            raise
 
         if hasattr(self.llm, "set_accumulator"):
             self.llm.set_accumulator(accumulator)
@@ -474,6 +532,25 @@ class HybridPipeline:
             route = QueryRoute.HIPPORAG2_SEARCH
 
         if use_modular_handlers and route in self._route_handlers:
+            # Answer cache: a hit skips handler execution entirely
+            t0 = time.perf_counter()
+            cache_key, cache_embedding = await self._answer_cache_key(
+                query, original_route, response_type,
+                prompt_variant=prompt_variant,
+                folder_id=folder_id,
+                knn_config=knn_config,
+                synthesis_model=synthesis_model,
+                include_context=include_context,
+                language=language,
+            )
+            if cache_key is not None:
+                hit = await get_answer_cache().get(cache_key, cache_embedding)
+                stage_timings_ms["answer_cache_ms"] = int((time.perf_counter() - t0) * 1000)
+                if hit is not None:
+                    if prefetch is not None:
+                        prefetch.cancel()
+                    return await self._answer_from_cache(hit, accumulator, stage_timings_ms, t_query_start)
+
             handler = self._route_handlers[route]
             # Attach accumulator to handler for RouteResult.usage population
             handler._token_accumulator = accumulator
@@ -484,6 +561,15 @@ class HybridPipeline:
                 extra_kwargs["weight_profile"] = weight_profile
             if route == QueryRoute.HIPPORAG2_SEARCH:
                 extra_kwargs["query_mode"] = original_route.value
+                if prefetch is not None:
+                    extra_kwargs["prefetch"] = prefetch
+                    stage_timings_ms["prefetch_head_start_ms"] = int(
+                        (time.perf_counter() - prefetch.started_at) * 1000
+                    )
+            elif prefetch is not None:
+                prefetch.cancel()
+                logger.info("speculative_prefetch_cancelled", reason="route_mismatch", route=route.value)
+            t0 = time.perf_counter()
             result = await handler.execute(
                 search_query, response_type,
                 knn_config=knn_config,
@@ -494,6 +580,9 @@ class HybridPipeline:
                 folder_id=folder_id,
                 **extra_kwargs,
             )
+            stage_timings_ms["handler_ms"] = int((time.perf_counter() - t0) * 1000)
+            stage_timings_ms["total_ms"] = int((time.perf_counter() - t_query_start) * 1000)
+            result.metadata["pipeline_timings_ms"] = stage_timings_ms
             # Attach accumulated token usage to the result
             if result.usage is None and accumulator.call_count > 0:
                 result.usage = accumulator.snapshot()
@@ -502,36 +591,145 @@ class HybridPipeline:
                 result.usage.update({"credits_used": accumulator.compute_credits()})
 
             # Post-query credit deduction (fire-and-forget, 5s timeout)
-            credits = accumulator.compute_credits()
-            if credits > 0:
-                try:
-                    from src.core.services.quota_enforcer import get_quota_enforcer
-                    enforcer = await asyncio.wait_for(get_quota_enforcer(), timeout=5)
-                    user_id = getattr(self, "user_id", None) or self.group_id
-                    await asyncio.wait_for(enforcer.record_credits(user_id, credits), timeout=5)
-                    if result.usage is not None:
-                        credit_info = await asyncio.wait_for(enforcer.check_credit_limits(user_id), timeout=5)
-                        result.usage["credits_remaining"] = credit_info.get("credits_remaining")
-                        result.usage["credits_limit"] = credit_info.get("credits_limit")
-                except Exception as _ce:
-                    logger.warning("credit_deduction_failed", error=str(_ce))
+            await self._deduct_credits(accumulator, result.usage)
 
             # Detach accumulator to avoid leaking across requests
             if hasattr(self.llm, "set_accumulator"):
                 self.llm.set_accumulator(None)
             # Convert RouteResult to dict for API compatibility
-            return result.to_dict()
+            response = result.to_dict()
+            if cache_key is not None:
+                await get_answer_cache().put(cache_key, response, cache_embedding)
+                response["metadata"]["answer_cache"] = {"hit": False}
+            return response
         
         # =======================================================================
         # Legacy Fallback (original inline methods)
         # Route 1 (Vector RAG) was removed - now handled by Route 2 (Local Search)
         # =======================================================================
+        if prefetch is not None:
+            prefetch.cancel()
         if route == QueryRoute.LOCAL_SEARCH:
             return await self._execute_route_2_local_search(search_query, response_type)
         elif route == QueryRoute.GLOBAL_SEARCH:
             return await self._execute_route_3_global_search(search_query, response_type)
         else:  # DRIFT_MULTI_HOP
             return await self._execute_route_4_drift(search_query, response_type)
+
+    async def _deduct_credits(self, accumulator, usage: Optional[Dict[str, Any]]) -> None:
+        """Record the request's credits against the user's quota (5s timeouts, best effort)."""
+        credits = accumulator.compute_credits()
+        if credits <= 0:
+            return
+        try:
+            from src.core.services.quota_enforcer import get_quota_enforcer
+            enforcer = await asyncio.wait_for(get_quota_enforcer(), timeout=5)
+            user_id = getattr(self, "user_id", None) or self.group_id
+            await asyncio.wait_for(enforcer.record_credits(user_id, credits), timeout=5)
+            if usage is not None:
+                credit_info = await asyncio.wait_for(enforcer.check_credit_limits(user_id), timeout=5)
+                usage["credits_remaining"] = credit_info.get("credits_remaining")
+                usage["credits_limit"] = credit_info.get("credits_limit")
+        except Exception as _ce:
+            logger.warning("credit_deduction_failed", error=str(_ce))
+
+    async def _answer_cache_key(
+        self,
+        query: str,
+        route: QueryRoute,
+        response_type: str,
+        prompt_variant: Optional[str],
+        folder_id: Optional[str],
+        include_context: bool,
+        **options: Any,
+    ) -> Tuple[Optional[AnswerCacheKey], Optional[List[float]]]:
+        """Answer cache key (and semantic-tier embedding) for this request.
+
+        Returns ``(None, None)`` when the cache is disabled, when raw context
+        is requested (that payload is large and debugging-only), when the
+        group version cannot be read — without a version stamp cached
+        citations could point at superseded documents — or while the group
+        is being re-indexed.
+        """
+        if not answer_cache_enabled() or include_context:
+            return None, None
+        try:
+            version = await asyncio.to_thread(read_group_version, self.neo4j_driver, self.group_ids)
+        except Exception as e:
+            logger.warning("answer_cache_version_failed", error=str(e))
+            return None, None
+        if group_version_in_progress(version):
+            return None, None
+        key = AnswerCacheKey.build(
+            self.group_id,
+            folder_id if folder_id is not None else self.folder_id,
+            version,
+            route.value,
+            response_type,
+            prompt_variant,
+            query,
+            **options,
+        )
+        embedding = None
+        if semantic_tier_enabled():
+            try:
+                embedding = await asyncio.to_thread(get_query_embedding, query)
+            except Exception as e:
+                logger.warning("answer_cache_embedding_failed", error=str(e))
+        return key, embedding
+
+    async def _answer_from_cache(
+        self,
+        hit: AnswerCacheHit,
+        accumulator,
+        stage_timings_ms: Dict[str, int],
+        t_query_start: float,
+    ) -> Dict[str, Any]:
+        """Response for an answer cache hit; usage carries this request only (no LLM tokens)."""
+        response = dict(hit.result)
+        stage_timings_ms["total_ms"] = int((time.perf_counter() - t_query_start) * 1000)
+        response["metadata"] = {
+            **(response.get("metadata") or {}),
+            "pipeline_timings_ms": stage_timings_ms,
+            "answer_cache": hit.metadata(),
+        }
+        response["usage"] = {**accumulator.snapshot(), "answer_cache_hit": True}
+        await self._deduct_credits(accumulator, response["usage"])
+        if hasattr(self.llm, "set_accumulator"):
+            self.llm.set_accumulator(None)
+        logger.info(
+            "answer_cache_hit",
+            group_id=self.group_id,
+            route=response.get("route_used"),
+            tier=hit.tier,
+            similarity=hit.similarity,
+        )
+        return response
+
+    def _start_speculative_prefetch(self, query: str, accumulator=None):
+        """Start Route 7 seed retrieval before translation/routing finish.
+
+        Enabled with ``HYBRID_SPECULATIVE_PREFETCH=1``.  Most traffic lands on
+        Route 7 (LOCAL_SEARCH is consolidated into it), and its query
+        embedding, triple linking and DPR search do not depend on the route
+        decision, so they can run while the router LLM call is in flight.
+        Returns the ``Route7Prefetch`` handle, or None when disabled.
+        """
+        enabled = os.getenv(
+            "HYBRID_SPECULATIVE_PREFETCH", "0"
+        ).strip().lower() in {"1", "true", "yes"}
+        if not enabled:
+            return None
+        handler = self._route_handlers.get(QueryRoute.HIPPORAG2_SEARCH)
+        if handler is None or not hasattr(handler, "start_prefetch"):
+            return None
+        # Triple reranking records Voyage usage on the handler's accumulator
+        handler._token_accumulator = accumulator
+        try:
+            return handler.start_prefetch(query)
+        except Exception as e:
+            logger.warning("speculative_prefetch_start_failed", error=str(e))
+            return None
     
     # Route 2: Local Search Equivalent (LazyGraphRAG Only)
     # =========================================================================
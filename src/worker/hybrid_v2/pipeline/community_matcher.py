@@ -14,12 +14,17 @@ Used in: Route 3 (Global Search), Route 5 (Unified Search — Tier 3 seeds)
 
 from typing import List, Dict, Any, Optional, Tuple
 import hashlib
+import os
+import time
+import numpy as np
 import structlog
 import json
 from pathlib import Path
 import asyncio
 
 from src.core.config import settings, build_group_ids
+from ..retrievers.bm25_index import GROUP_VERSION_QUERY
+from ..utils.vectors import cosine_similarity, top_k_indices, unit_rows, unit_vector
 
 logger = structlog.get_logger(__name__)
 
@@ -67,6 +72,13 @@ class CommunityMatcher:
         self._summary_hashes: Dict[str, str] = {}  # community_id -> hash of text that was embedded
         self._loaded = False
         self._load_lock = asyncio.Lock()
+        # Group version the communities were loaded at (GroupMeta timestamps);
+        # a change triggers a reload on the next match.
+        self._loaded_version: Optional[str] = None
+        self._version_checked_at = 0.0
+        # (rev, matrix, communities, dims) — see _embedding_matrix()
+        self._matrix_cache: Optional[Tuple[Any, ...]] = None
+        self._embeddings_rev = 0
         
         logger.info("community_matcher_created",
                    group_id=group_id,
@@ -104,8 +116,7 @@ class CommunityMatcher:
                 with open(self.communities_path) as f:
                     data = json.load(f)
 
-                self._communities = data.get("communities", [])
-                self._community_embeddings = data.get("embeddings", {})
+                self._set_communities(data.get("communities", []), data.get("embeddings", {}))
                 self._loaded = True
 
                 logger.info("communities_loaded_from_json",
@@ -149,6 +160,8 @@ class CommunityMatcher:
         async with self.neo4j_service._get_session() as session:
             result = await session.run(query, group_ids=self.group_ids)
             records = await result.data()
+            self._loaded_version = await self._read_group_version(session)
+            self._version_checked_at = time.monotonic()
 
         if not records:
             logger.info("no_neo4j_communities_found", group_id=self.group_id)
@@ -172,8 +185,7 @@ class CommunityMatcher:
             if rec.get("embedding_text_hash"):
                 summary_hashes[rec["id"]] = rec["embedding_text_hash"]
 
-        self._communities = communities
-        self._community_embeddings = embeddings
+        self._set_communities(communities, embeddings)
         self._summary_hashes = summary_hashes
         self._loaded = True
 
@@ -201,6 +213,7 @@ class CommunityMatcher:
             descending similarity.  Empty list when no communities exist or
             none exceed the minimum similarity threshold.
         """
+        await self._reload_if_group_changed()
         if not self._loaded:
             await self.load_communities()
 
@@ -250,43 +263,36 @@ class CommunityMatcher:
                 f"Failed to embed query for community matching: {query[:80]!r}"
             )
 
-        # Calculate similarities
-        scored: List[Tuple[Dict[str, Any], float]] = []
-        dimension_mismatches = 0
-        community_emb = None
-        for community in self._communities:
-            community_id = community.get("id", community.get("title", ""))
-            community_emb = self._community_embeddings.get(community_id)
-
-            if community_emb:
-                if len(query_embedding) != len(community_emb):
-                    dimension_mismatches += 1
-                    continue
-                similarity = self._cosine_similarity(query_embedding, community_emb)
-                scored.append((community, similarity))
-
+        # Score every community with one matrix-vector product
+        matrix, scored_communities, dims = self._embedding_matrix()
+        mismatched = dims != len(query_embedding)
+        dimension_mismatches = int(np.count_nonzero(mismatched))
         if dimension_mismatches > 0:
             raise RuntimeError(
                 f"Community embedding dimension mismatch: query={len(query_embedding)}, "
-                f"community={len(community_emb) if community_emb else '?'}, "
+                f"community={int(dims[mismatched][0])}, "
                 f"affected={dimension_mismatches}/{len(self._communities)}. "
                 "Re-index communities or ensure the same Voyage model is used everywhere."
             )
-
-        # Sort by similarity
-        scored.sort(key=lambda x: x[1], reverse=True)
+        scores = matrix @ unit_vector(query_embedding) if len(dims) else np.empty(0, dtype=np.float32)
 
         # Filter out near-zero scores (indicates broken matching)
         min_threshold = 0.05
-        meaningful = [(c, s) for c, s in scored if s >= min_threshold]
+        keep = scores >= min_threshold
 
-        if scored and not meaningful:
+        if len(scores) and not keep.any():
             raise RuntimeError(
-                f"All {len(scored)} community similarity scores are below threshold "
-                f"{min_threshold} (max={scored[0][1]:.4f}). "
+                f"All {len(scores)} community similarity scores are below threshold "
+                f"{min_threshold} (max={float(scores.max()):.4f}). "
                 "Community embeddings are likely from a different model than the query embedder."
             )
 
+        # Top-k in descending score order (ties keep community rank order)
+        best = top_k_indices(np.where(keep, scores, -np.inf), max(top_k, 5))
+        meaningful = [
+            (scored_communities[i], float(scores[i])) for i in best if keep[i]
+        ]
+
         logger.info("semantic_community_match",
                    query=query[:50],
                    top_scores=[round(s, 4) for _, s in meaningful[:5]],
@@ -412,15 +418,85 @@ class CommunityMatcher:
                 f"Cannot compute cosine similarity: dimension mismatch "
                 f"({len(vec1)} vs {len(vec2)})"
             )
-        
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = sum(a * a for a in vec1) ** 0.5
-        norm2 = sum(b * b for b in vec2) ** 0.5
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
+        return cosine_similarity(vec1, vec2)
+
+    def _set_communities(
+        self, communities: List[Dict[str, Any]], embeddings: Dict[str, List[float]],
+    ) -> None:
+        """Replace the loaded communities and embeddings (invalidates the matrix)."""
+        self._communities = communities
+        self._community_embeddings = embeddings
+        self._embeddings_changed()
+
+    def _embeddings_changed(self) -> None:
+        """Call after any change to ``_communities`` / ``_community_embeddings``."""
+        self._embeddings_rev += 1
+        self._matrix_cache = None
+
+    def _embedding_matrix(self) -> Tuple[np.ndarray, List[Dict[str, Any]], np.ndarray]:
+        """Normalised community embedding matrix, rebuilt only when embeddings change.
+
+        Returns ``(matrix, communities, dims)``: ``communities[i]`` is the
+        community scored by ``matrix[i]`` (in ``self._communities`` order),
+        and ``dims`` holds the stored dimension of every community that has an
+        embedding.  The matrix only contains rows of the most common
+        dimension; any other dimension is reported as a mismatch.
+        """
+        key = self._embeddings_rev
+        cached = self._matrix_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2], cached[3]
+
+        with_embedding: List[Tuple[Dict[str, Any], List[float]]] = []
+        for community in self._communities:
+            community_id = community.get("id", community.get("title", ""))
+            emb = self._community_embeddings.get(community_id)
+            if emb:
+                with_embedding.append((community, emb))
+
+        dims = np.array([len(emb) for _, emb in with_embedding], dtype=np.int64)
+        if len(dims):
+            values, counts = np.unique(dims, return_counts=True)
+            dim = int(values[np.argmax(counts)])
+            rows = [(c, emb) for c, emb in with_embedding if len(emb) == dim]
+            matrix = unit_rows([emb for _, emb in rows])
+            communities = [c for c, _ in rows]
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+            communities = []
+
+        self._matrix_cache = (key, matrix, communities, dims)
+        return matrix, communities, dims
+
+    async def _read_group_version(self, session: Any) -> Optional[str]:
+        """Group version tag (see ``bm25_index.read_group_version``); None on failure."""
+        try:
+            result = await session.run(GROUP_VERSION_QUERY, group_ids=list(self.group_ids))
+            record = await result.single()
+            parts = (record["parts"] if record else None) or []
+            return ";".join(parts)
+        except Exception as e:
+            logger.debug("community_group_version_read_failed", error=str(e))
+            return None
+
+    async def _reload_if_group_changed(self) -> None:
+        """Drop loaded communities when the group was re-indexed since loading.
+
+        Checked at most every ``COMMUNITY_VERSION_CHECK_SECONDS`` (default 60).
+        """
+        if not self._loaded or not self.neo4j_service or self._loaded_version is None:
+            return
+        interval = float(os.getenv("COMMUNITY_VERSION_CHECK_SECONDS", "60"))
+        if time.monotonic() - self._version_checked_at < interval:
+            return
+        self._version_checked_at = time.monotonic()
+        async with self.neo4j_service._get_session() as session:
+            version = await self._read_group_version(session)
+        if version is None or version == self._loaded_version:
+            return
+        logger.info("community_matcher_group_version_changed", group_id=self.group_id)
+        async with self._load_lock:
+            self._loaded = False
     
     # ==================================================================
     # Embedding Repair
@@ -550,6 +626,7 @@ class CommunityMatcher:
                 self._community_embeddings[cid] = emb
                 refreshed += 1
                 cids_refreshed.append(cid)
+        self._embeddings_changed()
 
         logger.info(
             "ensure_embeddings_complete",
@@ -559,7 +636,6 @@ class CommunityMatcher:
         )
 
         # Optional: write embeddings back to Neo4j for persistence
-        import os
         writeback = os.getenv("COMMUNITY_WRITEBACK_EMBEDDINGS", "1").strip().lower() in {"1", "true", "yes"}
         if writeback and self.neo4j_service and cids_refreshed:
             await self._writeback_embeddings(cids_refreshed)
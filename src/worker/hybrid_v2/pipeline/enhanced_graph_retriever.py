@@ -35,7 +35,9 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.config import settings, build_group_ids
-from src.worker.hybrid_v2.services.neo4j_retry import retry_session
+from src.worker.hybrid_v2.retrievers.bm25_index import get_keyword_index_cache, keyword_index_enabled
+from src.worker.hybrid_v2.retrievers.hub_table import get_hub_table_cache, hub_table_enabled
+from src.worker.hybrid_v2.services.graph_read_repository import GraphReadRepository
 
 logger = structlog.get_logger(__name__)
 
@@ -138,7 +140,7 @@ class EnhancedGraphRetriever:
     """
     
     def __init__(self, neo4j_driver, group_id: str, folder_id: Optional[str] = None,
-                 group_ids: Optional[List[str]] = None):
+                 group_ids: Optional[List[str]] = None, async_neo4j: Any = None):
         """
         Initialize the enhanced retriever.
         
@@ -147,8 +149,11 @@ class EnhancedGraphRetriever:
             group_id: Document group ID for filtering
             folder_id: Optional folder ID for scoped search (None = all folders)
             group_ids: Optional list of group IDs (two-tier). Defaults to build_group_ids(group_id).
+            async_neo4j: Optional AsyncNeo4jService; reads run on the native
+                async driver once it is connected (sync driver otherwise).
         """
         self.driver = neo4j_driver
+        self._repo = GraphReadRepository(driver=neo4j_driver, async_neo4j=async_neo4j)
         self.group_id = group_id
         self.group_ids = group_ids or build_group_ids(group_id)
         self.folder_id = folder_id
@@ -195,6 +200,38 @@ class EnhancedGraphRetriever:
 
         return (chunk.document_id or chunk.document_source or chunk.document_title or "unknown").strip().lower()
 
+    @staticmethod
+    def _source_sentence_from_record(record: Any) -> SourceSentence:
+        """Build a SourceSentence from a chunk row (sentence_id, text, metadata, section/doc fields)."""
+        metadata: Dict[str, Any] = {}
+        if record.get("metadata"):
+            try:
+                metadata = (
+                    json.loads(record["metadata"]) if isinstance(record["metadata"], str) else record["metadata"]
+                )
+            except Exception:
+                metadata = {}
+
+        section_path = metadata.get("section_path", [])
+        if record.get("section_path_key"):
+            section_path = (record["section_path_key"] or "").split(" > ")
+
+        return SourceSentence(
+            sentence_id=record.get("sentence_id") or "",
+            text=record.get("text") or "",
+            entity_name=record.get("entity_name") or "",
+            section_path=section_path,
+            section_id=record.get("section_id") or "",
+            document_id=record.get("doc_id") or metadata.get("document_id", "") or "",
+            document_title=record.get("doc_title") or metadata.get("document_title", ""),
+            document_source=record.get("doc_source") or metadata.get("url", ""),
+            relevance_score=float(record.get("score") or 0.0),
+            # Location metadata from Azure DI (for sentence-level citations)
+            page_number=metadata.get("page_number"),
+            start_offset=metadata.get("start_offset"),
+            end_offset=metadata.get("end_offset"),
+        )
+
     @staticmethod
     def is_chunk_id_entity(name: str) -> bool:
         """Check if an entity name looks like an internal chunk ID.
@@ -368,18 +405,11 @@ class EnhancedGraphRetriever:
             """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(
-                        query,
-                        entity_names=entity_names,
-                        group_ids=self.group_ids,
-                    )
-                    return [dict(record) for record in result]
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch_dicts(
+                query,
+                entity_names=entity_names,
+                group_ids=self.group_ids,
+            )
             
             logger.info("get_sections_for_entities",
                        num_entities=len(entity_names),
@@ -459,16 +489,10 @@ class EnhancedGraphRetriever:
             """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {"entity_names": entity_names, "group_ids": self.group_ids}
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return [dict(record) for record in result]
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch_dicts(query, **params)
             
             logger.info("get_documents_for_entities",
                        num_entities=len(entity_names),
@@ -518,18 +542,11 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(
-                        query,
-                        section_ids=section_ids,
-                        group_ids=self.group_ids,
-                    )
-                    return [dict(record) for record in result]
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch_dicts(
+                query,
+                section_ids=section_ids,
+                group_ids=self.group_ids,
+            )
             
             logger.info("get_hub_entities_for_sections",
                        num_sections=len(section_ids),
@@ -580,16 +597,10 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {"entity_names": entity_names, "group_ids": self.group_ids}
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             summary = {}
             for record in records:
@@ -677,7 +688,6 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {
                 "section_ids": section_ids,
                 "group_ids": self.group_ids,
@@ -686,12 +696,7 @@ class EnhancedGraphRetriever:
             }
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return [dict(record) for record in result]
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch_dicts(query, **params)
             
             # Count unique source and related sections
             unique_sources = len(set(r["source_section_id"] for r in records))
@@ -903,7 +908,6 @@ class EnhancedGraphRetriever:
                 """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {
                 "entity_names": entity_names,
                 "group_ids": self.group_ids,
@@ -911,45 +915,9 @@ class EnhancedGraphRetriever:
             }
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
 
-            chunks: List[SourceSentence] = []
-            for record in records:
-                metadata: Dict[str, Any] = {}
-                if record.get("metadata"):
-                    try:
-                        metadata = (
-                            json.loads(record["metadata"]) if isinstance(record["metadata"], str) else record["metadata"]
-                        )
-                    except Exception:
-                        metadata = {}
-
-                section_path = metadata.get("section_path", [])
-                if record.get("section_path_key"):
-                    section_path = (record["section_path_key"] or "").split(" > ")
-
-                chunks.append(
-                    SourceSentence(
-                        sentence_id=record.get("sentence_id") or "",
-                        text=record.get("text") or "",
-                        entity_name=record.get("entity_name") or "",
-                        section_path=section_path,
-                        section_id=record.get("section_id") or "",
-                        document_id=record.get("doc_id") or metadata.get("document_id", "") or "",
-                        document_title=record.get("doc_title") or metadata.get("document_title", ""),
-                        document_source=record.get("doc_source") or metadata.get("url", ""),
-                        relevance_score=float(record.get("score") or 0.0),
-                        # Location metadata from Azure DI (for sentence-level citations)
-                        page_number=metadata.get("page_number"),
-                        start_offset=metadata.get("start_offset"),
-                        end_offset=metadata.get("end_offset"),
-                    )
-                )
+            chunks = [self._source_sentence_from_record(record) for record in records]
             
             logger.info(
                 "chunks_via_new_edges_retrieved",
@@ -1082,7 +1050,6 @@ class EnhancedGraphRetriever:
                 """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {
                 "entity_names": entity_names,
                 "group_ids": self.group_ids,
@@ -1090,44 +1057,9 @@ class EnhancedGraphRetriever:
             }
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
-
-            chunks: List[SourceSentence] = []
-            for record in records:
-                metadata: Dict[str, Any] = {}
-                if record.get("metadata"):
-                    try:
-                        metadata = (
-                            json.loads(record["metadata"]) if isinstance(record["metadata"], str) else record["metadata"]
-                        )
-                    except Exception:
-                        metadata = {}
-
-                section_path = metadata.get("section_path", [])
-                if record.get("section_path_key"):
-                    section_path = (record["section_path_key"] or "").split(" > ")
+            records = await self._repo.fetch(query, **params)
 
-                chunks.append(
-                    SourceSentence(
-                        sentence_id=record.get("sentence_id") or "",
-                        text=record.get("text") or "",
-                        entity_name=record.get("entity_name") or "",
-                        section_path=section_path,
-                        section_id=record.get("section_id") or "",
-                        document_id=record.get("doc_id") or metadata.get("document_id", "") or "",
-                        document_title=record.get("doc_title") or metadata.get("document_title", ""),
-                        document_source=record.get("doc_source") or metadata.get("url", ""),
-                        relevance_score=float(record.get("score") or 0.0),
-                        page_number=metadata.get("page_number"),
-                        start_offset=metadata.get("start_offset"),
-                        end_offset=metadata.get("end_offset"),
-                    )
-                )
+            chunks = [self._source_sentence_from_record(record) for record in records]
 
             # Fallback: if the graph has no MENTIONS links, try fulltext retrieval for entity strings.
             fallback_used = False
@@ -1138,51 +1070,15 @@ class EnhancedGraphRetriever:
                     fallback_used = True
                     probe_limit = min(max_per_entity * 50, 500)
 
-                    def _run_fallback():
-                        fallback_params = {
-                            "entity_names": sanitized,
-                            "group_ids": self.group_ids,
-                            "max_per_entity": max_per_entity,
-                            "probe_limit": probe_limit,
-                        }
-                        fallback_params.update(self._get_folder_params())
-                        with retry_session(self.driver) as session:
-                            result = session.run(fallback_query, **fallback_params)
-                            return list(result)
-
-                    records = await loop.run_in_executor(None, _run_fallback)
-                    for record in records:
-                        metadata: Dict[str, Any] = {}
-                        if record.get("metadata"):
-                            try:
-                                metadata = (
-                                    json.loads(record["metadata"])
-                                    if isinstance(record["metadata"], str)
-                                    else record["metadata"]
-                                )
-                            except Exception:
-                                metadata = {}
-
-                        section_path = metadata.get("section_path", [])
-                        if record.get("section_path_key"):
-                            section_path = (record["section_path_key"] or "").split(" > ")
-
-                        chunks.append(
-                            SourceSentence(
-                                sentence_id=record.get("sentence_id") or "",
-                                text=record.get("text") or "",
-                                entity_name=record.get("entity_name") or "",
-                                section_path=section_path,
-                                section_id=record.get("section_id") or "",
-                                document_id=record.get("doc_id") or metadata.get("document_id", "") or "",
-                                document_title=record.get("doc_title") or metadata.get("document_title", ""),
-                                document_source=record.get("doc_source") or metadata.get("url", ""),
-                                relevance_score=float(record.get("score") or 0.0),
-                                page_number=metadata.get("page_number"),
-                                start_offset=metadata.get("start_offset"),
-                                end_offset=metadata.get("end_offset"),
-                            )
-                        )
+                    fallback_params = {
+                        "entity_names": sanitized,
+                        "group_ids": self.group_ids,
+                        "max_per_entity": max_per_entity,
+                        "probe_limit": probe_limit,
+                    }
+                    fallback_params.update(self._get_folder_params())
+                    records = await self._repo.fetch(fallback_query, **fallback_params)
+                    chunks.extend(self._source_sentence_from_record(record) for record in records)
 
             logger.info(
                 "mentions_retrieval_complete",
@@ -1424,21 +1320,26 @@ class EnhancedGraphRetriever:
         query = cypher25_query(query)
 
         try:
-            loop = asyncio.get_event_loop()
-
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    params = {
-                        "group_ids": self.group_ids,
-                        "keyword_needles": keyword_needles,
-                        "min_matches": min_matches,
-                        "candidate_limit": candidate_limit,
-                        "folder_id": self.folder_id,
-                    }
-                    result = session.run(query, **params)
-                    return list(result)
+            records: Optional[List[Any]] = None
+            if keyword_index_enabled():
+                try:
+                    records = await self._keyword_boost_records_from_index(
+                        cleaned_keywords, min_matches, candidate_limit
+                    )
+                except Exception as e:
+                    logger.warning("keyword_boost_index_failed_falling_back", error=str(e))
 
-            records = await loop.run_in_executor(None, _run_query)
+            # No index hits: keywords may be substrings the tokenizer cannot
+            # isolate (unsegmented scripts), so the CONTAINS scan gets a turn.
+            if not records:
+                params = {
+                    "group_ids": self.group_ids,
+                    "keyword_needles": keyword_needles,
+                    "min_matches": min_matches,
+                    "candidate_limit": candidate_limit,
+                    "folder_id": self.folder_id,
+                }
+                records = await self._repo.fetch(query, **params)
 
             candidates: List[SourceSentence] = []
             for record in records:
@@ -1498,6 +1399,59 @@ class EnhancedGraphRetriever:
             logger.error("keyword_boost_chunks_failed", error=str(e))
             return []
 
+    async def _keyword_boost_records_from_index(
+        self,
+        keywords: List[str],
+        min_matches: int,
+        candidate_limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Rank Sentences with the in-process BM25 index and fetch only the winners.
+
+        Returns rows shaped like the CONTAINS-scan query in
+        ``get_keyword_boost_chunks`` (``match_count`` = matched keywords),
+        in index rank order.
+        """
+        index = await asyncio.to_thread(
+            get_keyword_index_cache().get, self.driver, "sentence", self.group_ids
+        )
+        hits = index.search(keywords, top_k=candidate_limit, min_matches=min_matches)
+        if not hits:
+            return []
+
+        query = """
+        UNWIND $sentence_ids AS sid
+        MATCH (t:Sentence {id: sid})
+        WHERE t.group_id IN $group_ids
+        OPTIONAL MATCH (t)-[:IN_SECTION]->(s:Section)
+        OPTIONAL MATCH (t)-[:IN_DOCUMENT]->(d:Document)
+        WHERE d IS NULL OR (d.group_id IN $group_ids AND ($folder_id IS NULL OR (d)-[:IN_FOLDER]->(:Folder {id: $folder_id})))
+        RETURN
+            t.id AS sentence_id,
+            t.text AS text,
+            t.metadata AS metadata,
+            t.chunk_index AS chunk_index,
+            s.id AS section_id,
+            s.path_key AS section_path_key,
+            d.id AS doc_id,
+            d.title AS doc_title,
+            d.source AS doc_source
+        """
+        rows = await self._repo.fetch_dicts(
+            query,
+            sentence_ids=[sid for sid, _, _ in hits],
+            group_ids=self.group_ids,
+            folder_id=self.folder_id,
+        )
+        by_id = {row["sentence_id"]: row for row in rows}
+
+        ordered: List[Dict[str, Any]] = []
+        for sid, _, match_count in hits:
+            row = by_id.get(sid)
+            if row is not None:
+                row["match_count"] = match_count
+                ordered.append(row)
+        return ordered
+
     async def get_document_lead_chunks(
         self,
         *,
@@ -1545,19 +1499,13 @@ class EnhancedGraphRetriever:
         """
 
         try:
-            loop = asyncio.get_event_loop()
             params = {
                 "group_ids": self.group_ids,
                 "chunk_indexes": candidate_chunk_indexes,
             }
             params.update(self._get_folder_params())
 
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
 
             def _make_chunk(record: Any, *, text: str) -> SourceSentence:
                 metadata: Dict[str, Any] = {}
@@ -1681,21 +1629,14 @@ class EnhancedGraphRetriever:
         """
 
         try:
-            loop = asyncio.get_event_loop()
-
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(
-                        query,
-                        group_ids=self.group_ids,
-                        section_keywords=lowered,
-                        min_matches=min_matches,
-                        candidate_limit=candidate_limit,
-                        folder_id=self.folder_id,
-                    )
-                    return list(result)
-
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(
+                query,
+                group_ids=self.group_ids,
+                section_keywords=lowered,
+                min_matches=min_matches,
+                candidate_limit=candidate_limit,
+                folder_id=self.folder_id,
+            )
 
             candidates: List[SourceSentence] = []
             for record in records:
@@ -1806,20 +1747,13 @@ class EnhancedGraphRetriever:
         """
 
         try:
-            loop = asyncio.get_event_loop()
-
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(
-                        query,
-                        group_ids=self.group_ids,
-                        section_ids=normalized,
-                        candidate_limit=candidate_limit,
-                        folder_id=self.folder_id,
-                    )
-                    return list(result)
-
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(
+                query,
+                group_ids=self.group_ids,
+                section_ids=normalized,
+                candidate_limit=candidate_limit,
+                folder_id=self.folder_id,
+            )
 
             candidates: List[SourceSentence] = []
             for record in records:
@@ -2044,34 +1978,22 @@ class EnhancedGraphRetriever:
                 """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    params = {
-                        "entity_inputs": entity_names,
-                        "group_ids": self.group_ids,
-                        "max_rels": max_relationships,
-                        "folder_id": self.folder_id,
-                    }
-                    params.update(self._get_folder_params())
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            params = {
+                "entity_inputs": entity_names,
+                "group_ids": self.group_ids,
+                "max_rels": max_relationships,
+                "folder_id": self.folder_id,
+            }
+            params.update(self._get_folder_params())
+            records = await self._repo.fetch(query, **params)
 
             if not records:
-                def _run_fallback():
-                    with retry_session(self.driver) as session:
-                        result = session.run(
-                            fallback_query,
-                            entity_inputs=entity_names,
-                            group_ids=self.group_ids,
-                            max_rels=max_relationships,
-                        )
-                        return list(result)
-
-                records = await loop.run_in_executor(None, _run_fallback)
+                records = await self._repo.fetch(
+                    fallback_query,
+                    entity_inputs=entity_names,
+                    group_ids=self.group_ids,
+                    max_rels=max_relationships,
+                )
             
             relationships = []
             for record in records:
@@ -2109,14 +2031,7 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, entity_names=entity_names, group_ids=self.group_ids)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, entity_names=entity_names, group_ids=self.group_ids)
             
             return {r["name"]: r["description"] or "" for r in records}
             
@@ -2135,6 +2050,13 @@ class EnhancedGraphRetriever:
         """
         if not self.driver:
             return []
+
+        if hub_table_enabled():
+            try:
+                table = await asyncio.to_thread(get_hub_table_cache().get, self.driver, self.group_ids)
+                return table.top(top_k)
+            except Exception as e:
+                logger.warning("hub_table_degree_lookup_failed", error=str(e))
         
         query = """
         MATCH (e:Entity)-[r]-()
@@ -2146,14 +2068,7 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, group_ids=self.group_ids, top_k=top_k)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, group_ids=self.group_ids, top_k=top_k)
             
             return [(r["name"], r["degree"]) for r in records]
             
@@ -2187,19 +2102,12 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(
-                        query,
-                        group_ids=self.group_ids,
-                        query_embedding=query_embedding,
-                        top_k=top_k,
-                    )
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(
+                query,
+                group_ids=self.group_ids,
+                query_embedding=query_embedding,
+                top_k=top_k,
+            )
             
             return [(r["name"], r["score"]) for r in records]
             
@@ -2236,16 +2144,10 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {"group_ids": self.group_ids, "max_docs": max_docs}
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             docs = [
                 {
@@ -2305,16 +2207,10 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {"group_ids": self.group_ids, "limit": limit}
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             docs = [
                 {
@@ -2411,8 +2307,6 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
             params = {
                 "group_ids": self.group_ids,
                 "max_per_document": max_per_document,
@@ -2420,12 +2314,7 @@ class EnhancedGraphRetriever:
             }
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             per_doc: Dict[str, List[SourceSentence]] = {}
             
@@ -2569,7 +2458,6 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
             params = {
                 "group_ids": self.group_ids,
                 "query_embedding": query_embedding,
@@ -2577,12 +2465,7 @@ class EnhancedGraphRetriever:
             }
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             per_doc: Dict[str, List[SourceSentence]] = {}
             
@@ -2745,20 +2628,13 @@ class EnhancedGraphRetriever:
             """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    # Only pass max_per_section when using sampling mode
-                    params = {"group_ids": self.group_ids}
-                    params.update(self._get_folder_params())
-                    if max_per_section is not None:
-                        params["max_per_section"] = max_per_section
-                    
-                    result = session.run(query, **params)
-                    return list(result)
+            # Only pass max_per_section when using sampling mode
+            params = {"group_ids": self.group_ids}
+            params.update(self._get_folder_params())
+            if max_per_section is not None:
+                params["max_per_section"] = max_per_section
             
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             logger.info("section_chunks_query_executed",
                        group_ids=self.group_ids,
@@ -2862,8 +2738,6 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
             params = {
                 "group_ids": self.group_ids,
                 "query_embedding": query_embedding,
@@ -2872,12 +2746,7 @@ class EnhancedGraphRetriever:
             }
             params.update(self._get_folder_params())
             
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
             
             sections = []
             for record in records:
@@ -2964,19 +2833,13 @@ class EnhancedGraphRetriever:
         """
 
         try:
-            loop = asyncio.get_event_loop()
             params = {
                 "group_ids": self.group_ids,
                 "max_per_document": max_per_document,
             }
             params.update(self._get_folder_params())
 
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    result = session.run(query, **params)
-                    return list(result)
-
-            records = await loop.run_in_executor(None, _run_query)
+            records = await self._repo.fetch(query, **params)
 
             per_doc: Dict[str, List[SourceSentence]] = {}
             for record in records:
@@ -3082,21 +2945,14 @@ class EnhancedGraphRetriever:
         """
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _run_query():
-                with retry_session(self.driver) as session:
-                    params = {
-                        "group_ids": self.group_ids,
-                        "top_k": top_k,
-                        "folder_id": self.folder_id,
-                        **kw_params,
-                    }
-                    params.update(self._get_folder_params())
-                    result = session.run(query, **params)
-                    return list(result)
-            
-            records = await loop.run_in_executor(None, _run_query)
+            params = {
+                "group_ids": self.group_ids,
+                "top_k": top_k,
+                "folder_id": self.folder_id,
+                **kw_params,
+            }
+            params.update(self._get_folder_params())
+            records = await self._repo.fetch(query, **params)
             
             chunks = []
             for record in records:
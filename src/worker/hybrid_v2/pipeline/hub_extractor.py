@@ -25,6 +25,7 @@ import structlog
 from src.core.config import settings, build_group_ids
 from .enhanced_graph_retriever import EnhancedGraphRetriever
 from ..services.neo4j_retry import retry_session
+from ..retrievers.hub_table import HubTable, get_hub_table_cache, hub_table_enabled
 
 logger = structlog.get_logger(__name__)
 
@@ -175,6 +176,16 @@ class HubExtractor:
         
         return []
     
+    async def _hub_table(self) -> Optional[HubTable]:
+        """Cached hub/degree table for ``self.group_ids`` (None → use Cypher)."""
+        if not hub_table_enabled():
+            return None
+        try:
+            return await asyncio.to_thread(get_hub_table_cache().get, self.neo4j_driver, self.group_ids)
+        except Exception as e:
+            logger.warning("hub_table_unavailable", error=str(e))
+            return None
+
     async def _query_neo4j_hubs(
         self,
         community_id: str,
@@ -183,6 +194,15 @@ class HubExtractor:
         """Query Neo4j for hub entities in a community."""
         if self.neo4j_driver is None:
             return []
+
+        table = await self._hub_table()
+        if table is not None:
+            hubs = table.community_hubs(community_id, top_k)
+            logger.info("neo4j_hub_query_success",
+                       community_id=community_id,
+                       num_hubs=len(hubs),
+                       source="hub_table")
+            return hubs
             
         try:
             # Query for most connected entities in the community
@@ -240,6 +260,15 @@ class HubExtractor:
             keyword_list = [kw.strip().lower() for kw in (keywords or []) if kw and kw.strip()]
             keyword_list = keyword_list[:5]
 
+            table = await self._hub_table()
+            if table is not None:
+                hubs = table.keyword_hubs(keyword_list, top_k)
+                logger.info("lazygraphrag_keyword_hub_extraction_success",
+                           keywords=keywords[:3],
+                           num_hubs=len(hubs),
+                           source="hub_table")
+                return hubs
+
             query = """
             MATCH (e)
             WHERE (e:Entity)
@@ -382,6 +411,12 @@ class HubExtractor:
         if not self.neo4j_driver:
             logger.warning("no_neo4j_driver_for_global_hubs")
             return []
+
+        table = await self._hub_table()
+        if table is not None:
+            hubs = table.top(top_k)
+            logger.info("global_hub_query_success", num_hubs=len(hubs), source="hub_table")
+            return hubs
         
         try:
             # Support both Entity label variants for compatibility
@@ -0,0 +1,86 @@
+"""Per-chunk index over the sentence citation map.
+
+``_build_cited_context`` produces a flat ``sentence_citation_map`` keyed by
+sentence markers (``[1a]``, ``[1b]``, ``[2a]`` …).  Post-synthesis narrowing
+needs, for each cited chunk ``[N]``, the word sets of that chunk's sentences.
+``SentenceIndex`` groups the entries by chunk number and tokenises each
+sentence once, so narrowing touches only the cited chunk's sentences instead
+of regex-matching and re-tokenising the whole map per citation.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
+
+# Sentence markers produced by _build_cited_context: "[<chunk>][a-z]"
+_SENTENCE_KEY_RE = re.compile(r"^\[(\d+)[a-z]\]$")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Minimum Jaccard overlap for a claim/sentence match
+MIN_CLAIM_OVERLAP = 0.15
+
+
+def word_set(text: str) -> FrozenSet[str]:
+    """Lower-cased alphanumeric tokens of *text*."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+class SentenceIndex:
+    """Sentence citation entries grouped by chunk number with cached word sets."""
+
+    __slots__ = ("_by_chunk",)
+
+    def __init__(self, by_chunk: Dict[int, List[Tuple[Dict[str, Any], FrozenSet[str]]]]):
+        self._by_chunk = by_chunk
+
+    @classmethod
+    def from_map(cls, sentence_map: Mapping[str, Dict[str, Any]]) -> "SentenceIndex":
+        """Index *sentence_map*, keeping map order within each chunk."""
+        by_chunk: Dict[int, List[Tuple[Dict[str, Any], FrozenSet[str]]]] = {}
+        for key, entry in sentence_map.items():
+            m = _SENTENCE_KEY_RE.match(key)
+            if not m:
+                continue
+            sent_text = entry.get("sentence_text", "")
+            if not sent_text:
+                continue
+            words = word_set(sent_text)
+            if not words:
+                continue
+            by_chunk.setdefault(int(m.group(1)), []).append((entry, words))
+        return cls(by_chunk)
+
+    @classmethod
+    def of(cls, source: Union["SentenceIndex", Mapping[str, Dict[str, Any]], None]) -> "SentenceIndex":
+        """*source* if it is already an index, else an index built from the map."""
+        if isinstance(source, SentenceIndex):
+            return source
+        return cls.from_map(source or {})
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_chunk.values())
+
+    def sentences(self, chunk_index: int) -> List[Tuple[Dict[str, Any], FrozenSet[str]]]:
+        """``(entry, word_set)`` pairs for chunk ``[chunk_index]`` in map order."""
+        return self._by_chunk.get(chunk_index, [])
+
+    def best_match(
+        self, chunk_index: int, claim_words: FrozenSet[str], min_score: float = MIN_CLAIM_OVERLAP
+    ) -> Optional[Dict[str, Any]]:
+        """Entry of chunk *chunk_index* with the highest Jaccard overlap.
+
+        Ties keep the earliest sentence; matches below *min_score* return None.
+        """
+        if not claim_words:
+            return None
+        best_match: Optional[Dict[str, Any]] = None
+        best_score = 0.0
+        for entry, sent_words in self.sentences(chunk_index):
+            inter = len(claim_words & sent_words)
+            union = len(claim_words | sent_words)
+            score = inter / union if union > 0 else 0.0
+            if score > best_score:
+                best_score = score
+                best_match = entry
+        return best_match if best_score >= min_score else None
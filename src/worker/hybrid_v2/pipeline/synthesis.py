@@ -19,6 +19,8 @@ import structlog
 from src.worker.hybrid_v2.services.extraction_service import ExtractionService
 from src.worker.hybrid_v2.pipeline.enhanced_graph_retriever import EnhancedGraphContext
 from src.worker.hybrid_v2.pipeline.chunk_filters import apply_noise_filters
+from src.worker.hybrid_v2.pipeline.sentence_index import SentenceIndex
+from src.worker.hybrid_v2.utils.near_duplicates import NearDuplicateDetector, dedup_indices
 
 logger = structlog.get_logger(__name__)
 
@@ -160,17 +162,17 @@ class EvidenceSynthesizer:
         # Apply MD5 dedup + semantic dedup here to prevent duplicate content injection.
         if coverage_chunks:
             import hashlib as _hl
-            import re as _re_cov
 
-            # Build hash set of existing entity-retrieved chunks
+            semantic_dedup_threshold_cov = float(os.environ.get("SEMANTIC_DEDUP_THRESHOLD", "0.92"))
+
+            # Build hash set + near-dup index of existing entity-retrieved chunks
             existing_hashes: set = set()
-            existing_word_sets: list = []
+            near_dups = NearDuplicateDetector(threshold=semantic_dedup_threshold_cov)
             for ec in text_chunks:
                 t = ec.get("text", "")
                 existing_hashes.add(_hl.md5(t.encode("utf-8")).hexdigest())
-                existing_word_sets.append(set(_re_cov.findall(r'[a-z0-9]+', t.lower())))
+                near_dups.insert(t)
 
-            semantic_dedup_threshold_cov = float(os.environ.get("SEMANTIC_DEDUP_THRESHOLD", "0.92"))
             coverage_added = 0
             coverage_deduped = 0
 
@@ -184,19 +186,9 @@ class EvidenceSynthesizer:
                     continue
 
                 # 2. Semantic near-dedup (Jaccard) against existing chunks
-                cov_words = set(_re_cov.findall(r'[a-z0-9]+', cov_text.lower()))
-                is_near_dup = False
-                if cov_words:
-                    for ws in existing_word_sets:
-                        if ws:
-                            inter = len(cov_words & ws)
-                            union = len(cov_words | ws)
-                            if union > 0 and inter / union >= semantic_dedup_threshold_cov:
-                                is_near_dup = True
-                                coverage_deduped += 1
-                                break
-
-                if not is_near_dup:
+                if not near_dups.add(cov_text):
+                    coverage_deduped += 1
+                else:
                     # Stamp coverage chunks with a score for token-budget ordering.
                     # If the chunk already has a score (e.g., sentence evidence with
                     # rerank scores), preserve it — only set a default for raw
@@ -212,7 +204,6 @@ class EvidenceSynthesizer:
 
                     text_chunks.append(cov_chunk)
                     existing_hashes.add(cov_hash)
-                    existing_word_sets.append(cov_words)
                     coverage_added += 1
 
             if coverage_deduped > 0 or coverage_added > 0:
@@ -268,7 +259,9 @@ class EvidenceSynthesizer:
         # Strip to block-level [N] only; sentence text is preserved.
         # Preserve the map as a lookup table for post-synthesis sentence
         # matching — callers can narrow chunk citations to specific sentences.
+        # The per-chunk index tokenises each sentence once for narrowing.
         _sentence_lookup = dict(sentence_citation_map)
+        _sentence_index = SentenceIndex.from_map(_sentence_lookup)
         context = strip_sentence_markers(context)
         sentence_citation_map.clear()
 
@@ -422,6 +415,7 @@ class EvidenceSynthesizer:
             "llm_context": context if include_context else None,
             "context_stats": context_stats,
             "sentence_citation_map": _sentence_lookup,
+            "sentence_index": _sentence_index,
             "evidence_language": evidence_language,
             "language_mismatch": language_mismatch,
         }
@@ -1556,54 +1550,27 @@ Response:"""
             semantic_dedup_stats: Dict[str, Any] = {"enabled": semantic_dedup_enabled}
             
             if semantic_dedup_enabled and len(deduped_chunks) > 1:
-                import re as _re
-                
-                def _normalize_words(text: str) -> set:
-                    """Extract word-level token set for Jaccard comparison."""
-                    # Lowercase, strip non-alphanumeric, split on whitespace
-                    words = _re.findall(r'[a-z0-9]+', text.lower())
-                    return set(words)
-                
-                # Pre-compute word sets for all chunks
-                chunk_word_sets = [_normalize_words(c.get("text", "")) for c in deduped_chunks]
-                
                 # Greedily cluster: iterate in score order (highest first), mark
                 # near-duplicates of already-kept chunks for removal.
                 # Sort by score first so we always keep the highest-scored version.
+                # MinHash/LSH narrows the comparisons; matches are confirmed
+                # with the exact word-set Jaccard.
                 scored_indices = sorted(
                     range(len(deduped_chunks)),
                     key=lambda i: deduped_chunks[i].get("_entity_score", 0.0),
                     reverse=True,
                 )
-                
-                kept_indices: List[int] = []
-                removed_by_semantic = 0
-                
-                for idx in scored_indices:
-                    words_idx = chunk_word_sets[idx]
-                    if not words_idx:
-                        kept_indices.append(idx)  # empty chunks pass through
-                        continue
-                    
-                    is_near_dup = False
-                    for kept_idx in kept_indices:
-                        words_kept = chunk_word_sets[kept_idx]
-                        if not words_kept:
-                            continue
-                        # Jaccard similarity
-                        intersection = len(words_idx & words_kept)
-                        union = len(words_idx | words_kept)
-                        if union > 0 and intersection / union >= semantic_dedup_threshold:
-                            is_near_dup = True
-                            removed_by_semantic += 1
-                            break
-                    
-                    if not is_near_dup:
-                        kept_indices.append(idx)
+                kept_indices = dedup_indices(
+                    [c.get("text", "") for c in deduped_chunks],
+                    semantic_dedup_threshold,
+                    order=scored_indices,
+                )
+                removed_by_semantic = len(deduped_chunks) - len(kept_indices)
+                chunks_before = len(deduped_chunks)
                 
                 deduped_chunks = [deduped_chunks[i] for i in sorted(kept_indices)]
                 semantic_dedup_stats.update({
-                    "chunks_before": len(chunk_word_sets),
+                    "chunks_before": chunks_before,
                     "chunks_after": len(deduped_chunks),
                     "near_duplicates_removed": removed_by_semantic,
                     "threshold": semantic_dedup_threshold,
@@ -1611,7 +1578,7 @@ Response:"""
                 if removed_by_semantic > 0:
                     logger.info("semantic_near_dedup_applied",
                                removed=removed_by_semantic,
-                               before=len(chunk_word_sets),
+                               before=chunks_before,
                                after=len(deduped_chunks),
                                threshold=semantic_dedup_threshold)
             
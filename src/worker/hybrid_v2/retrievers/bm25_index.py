@@ -0,0 +1,447 @@
+"""In-process BM25 inverted index for keyword chunk/sentence lookup.
+
+``Neo4jTextUnitStore.get_chunks_for_query`` and
+``EnhancedGraphRetriever.get_keyword_boost_chunks`` used to answer keyword
+lookups with a ``toLower(text) CONTAINS kw`` pass over every TextChunk /
+Sentence in the group — a full property scan whose cost grows with the
+corpus on every query.
+
+This module keeps one inverted index per (kind, group set) in process:
+
+- **Build** — text is streamed once from Neo4j with keyset pagination
+  (``RetrySession.stream``) and tokenized into CSR postings
+  (term → sorted doc indices + term frequencies) held in numpy arrays.
+- **Refresh** — the index is tagged with a *group version* read from the
+  ``GroupMeta`` lifecycle timestamps (``last_indexing_completed_at``,
+  ``gds_last_computed``, ``last_lifecycle_change``, ``hub_tables_at``).
+  The version is re-checked at most every ``BM25_VERSION_CHECK_SECONDS``
+  (default 60) and the index is rebuilt when it changes.  While a group is
+  being re-indexed its version carries an ``indexing`` marker, so anything
+  built from the partial corpus is superseded once indexing completes.
+- **Persistence** — when ``BM25_INDEX_DIR`` is set, built indexes are saved
+  as ``.npz`` files keyed by group set + version and reloaded on the next
+  process start instead of re-reading the corpus.  Indexes built during
+  indexing are kept in memory only.
+
+Callers score with ``BM25Index.search`` and only go back to Neo4j to fetch
+the winning nodes.  A multi-word keyword matches a document when all of its
+tokens occur in it (the legacy path matched whitespace-stripped substrings).
+When the index returns no hits (e.g. a substring of an unsegmented CJK run)
+callers fall back to the CONTAINS scan.
+
+Set ``KEYWORD_BM25_INDEX=0`` to fall back to the Cypher CONTAINS scans.
+
+Usage::
+
+    index = get_keyword_index_cache().get(driver, "sentence", group_ids)
+    hits = index.search(["termination fee", "notice"], top_k=50)
+    # [(sentence_id, bm25_score, matched_keyword_count), ...]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from ..services.neo4j_retry import retry_session
+
+logger = structlog.get_logger(__name__)
+
+# Unicode word characters, so accented and non-Latin text tokenizes too.
+# Scripts written without spaces (CJK, Thai) yield whole runs as one token;
+# callers fall back to the CONTAINS scan when the index finds nothing.
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+# Part of the persisted file name: bump when tokenization changes.
+_TOKENIZER_VERSION = "w1"
+
+# Corpus queries per index kind.  Each returns ``key`` (the id callers use to
+# fetch winners) and ``text``.  Kinds with an index-backed key are
+# keyset-paginated on it for ``RetrySession.stream``; the rest are read in
+# one streamed pass with ``RetrySession.read_all``.
+_SOURCE_QUERIES: Dict[str, str] = {
+    # Sentence.id is unique-constrained, so the ORDER BY is index-backed.
+    "sentence": """
+        MATCH (t:Sentence)
+        WHERE t.group_id IN $group_ids
+          AND ($after IS NULL OR t.id > $after)
+        RETURN t.id AS key, t.text AS text
+        ORDER BY key
+        LIMIT $limit
+    """,
+    # Chunk labels carry no id index, so there is no cheap cursor to page
+    # on; elementId is still the cheapest way to seek the winners back.
+    "chunk": """
+        MATCH (c)
+        WHERE c.group_id IN $group_ids
+          AND (c:TextChunk OR c:Chunk OR c:`__Node__`)
+        RETURN elementId(c) AS key, c.text AS text
+        ORDER BY key
+    """,
+}
+_PAGED_KINDS = frozenset({"sentence"})
+
+# ``last_indexing_at`` is stamped when indexing starts and
+# ``last_indexing_completed_at`` when it ends; groups indexed before the
+# completion stamp existed fall back to the start stamp.
+GROUP_VERSION_QUERY = """
+OPTIONAL MATCH (g:GroupMeta)
+WHERE g.group_id IN $group_ids
+WITH g ORDER BY g.group_id
+RETURN collect(
+    g.group_id + '|' + toString(coalesce(g.last_indexing_completed_at, g.last_indexing_at, '')) +
+    CASE WHEN g.last_indexing_completed_at IS NOT NULL
+              AND g.last_indexing_at > g.last_indexing_completed_at
+         THEN '|indexing' ELSE '' END +
+    '|' + toString(coalesce(g.gds_last_computed, '')) +
+    '|' + toString(coalesce(g.last_lifecycle_change, '')) +
+    '|' + toString(coalesce(g.hub_tables_at, ''))
+) AS parts
+"""
+
+
+def read_group_version(driver: Any, group_ids: Sequence[str], database: Optional[str] = None) -> str:
+    """Version tag for *group_ids* built from their ``GroupMeta`` timestamps.
+
+    Changes whenever a group starts or finishes re-indexing, has GDS
+    recomputed, changes document lifecycle or gets its hub tables
+    re-materialized; in-process caches derived from the graph compare it to
+    decide when to rebuild.
+    """
+    with retry_session(driver, database=database, read_only=True) as session:
+        record = session.run(GROUP_VERSION_QUERY, group_ids=list(group_ids)).single()
+    parts = (record["parts"] if record else None) or []
+    return ";".join(parts)
+
+
+def group_version_in_progress(version: str) -> bool:
+    """Whether *version* was read while one of its groups was being indexed."""
+    return "|indexing|" in version
+
+
+def keyword_index_enabled() -> bool:
+    """Whether keyword lookups use the in-process BM25 index (default on)."""
+    return os.getenv("KEYWORD_BM25_INDEX", "1").strip().lower() in {"1", "true", "yes"}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens (the index and query share this)."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+class BM25Index:
+    """Immutable Okapi BM25 index over ``(key, text)`` documents.
+
+    Postings are stored CSR-style: ``postings[offsets[t]:offsets[t + 1]]``
+    are the (ascending) document indices containing term ``t`` and ``tfs``
+    the matching term frequencies.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        terms: Dict[str, int],
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        tfs: np.ndarray,
+        doc_len: np.ndarray,
+        *,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.keys = list(keys)
+        self.terms = terms
+        self.offsets = offsets
+        self.postings = postings
+        self.tfs = tfs
+        self.doc_len = doc_len
+        self.k1 = float(k1)
+        self.b = float(b)
+        self.avgdl = float(doc_len.mean()) if len(doc_len) else 0.0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self.terms)
+
+    @classmethod
+    def build(cls, docs: Iterable[Tuple[str, Optional[str]]], *, k1: float = 1.2, b: float = 0.75) -> "BM25Index":
+        """Tokenize *docs* (``(key, text)`` pairs) into an index."""
+        keys: List[str] = []
+        terms: Dict[str, int] = {}
+        term_ids = array("i")
+        doc_ids = array("i")
+        tfs = array("H")
+        doc_len = array("I")
+
+        for key, text in docs:
+            doc = len(keys)
+            keys.append(str(key))
+            tokens = tokenize(text)
+            doc_len.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                term_ids.append(terms.setdefault(term, len(terms)))
+                doc_ids.append(doc)
+                tfs.append(min(tf, 0xFFFF))
+
+        term_arr = np.frombuffer(term_ids, dtype=np.int32) if term_ids else np.zeros(0, dtype=np.int32)
+        # Stable sort keeps each term's documents in ascending order.
+        order = np.argsort(term_arr, kind="stable")
+        counts = np.bincount(term_arr, minlength=len(terms))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(
+            keys,
+            terms,
+            offsets,
+            np.frombuffer(doc_ids, dtype=np.int32)[order].copy() if doc_ids else np.zeros(0, dtype=np.int32),
+            np.frombuffer(tfs, dtype=np.uint16)[order].astype(np.float32) if tfs else np.zeros(0, dtype=np.float32),
+            np.frombuffer(doc_len, dtype=np.uint32).astype(np.float32) if doc_len else np.zeros(0, dtype=np.float32),
+            k1=k1,
+            b=b,
+        )
+
+    def _posting(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        tid = self.terms.get(term)
+        if tid is None:
+            return None
+        start, stop = self.offsets[tid], self.offsets[tid + 1]
+        return self.postings[start:stop], self.tfs[start:stop]
+
+    def search(
+        self,
+        keywords: Sequence[str],
+        top_k: int = 50,
+        *,
+        min_matches: int = 1,
+    ) -> List[Tuple[str, float, int]]:
+        """Rank documents for *keywords*.
+
+        A keyword matches a document when all of its tokens occur in it.
+        Results are ordered by matched-keyword count, then BM25 score (summed
+        over the tokens of matched keywords).
+
+        Returns:
+            ``[(key, bm25_score, match_count), ...]`` (at most *top_k*).
+        """
+        n = len(self.keys)
+        if not n or top_k <= 0:
+            return []
+
+        matches = np.zeros(n, dtype=np.int32)
+        scores = np.zeros(n, dtype=np.float32)
+        scored_terms: set = set()
+        norm = self.k1 * (1.0 - self.b + self.b * self.doc_len / (self.avgdl or 1.0))
+
+        for keyword in keywords:
+            tokens = list(dict.fromkeys(tokenize(keyword)))
+            postings = [self._posting(t) for t in tokens]
+            if not tokens or any(p is None for p in postings):
+                continue
+            docs = postings[0][0]
+            for other, _ in postings[1:]:
+                docs = np.intersect1d(docs, other, assume_unique=True)
+                if not len(docs):
+                    break
+            if not len(docs):
+                continue
+            matches[docs] += 1
+            for term, (p_docs, p_tfs) in zip(tokens, postings):
+                if term in scored_terms:
+                    continue
+                scored_terms.add(term)
+                df = len(p_docs)
+                idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+                scores[p_docs] += idf * p_tfs * (self.k1 + 1.0) / (p_tfs + norm[p_docs])
+
+        hits = np.flatnonzero(matches >= max(int(min_matches), 1))
+        if not len(hits):
+            return []
+        order = np.lexsort((-scores[hits], -matches[hits]))[:top_k]
+        return [
+            (self.keys[i], float(scores[i]), int(matches[i]))
+            for i in hits[order]
+        ]
+
+    # ── Persistence ─────────────────────────────────────────────────────
+
+    def save(self, path: Path) -> None:
+        """Write the index to *path* (``.npz``)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        vocab = sorted(self.terms, key=self.terms.__getitem__)
+        np.savez(
+            tmp,
+            keys=np.array(self.keys, dtype=np.str_),
+            vocab=np.array(vocab, dtype=np.str_),
+            offsets=self.offsets,
+            postings=self.postings,
+            tfs=self.tfs,
+            doc_len=self.doc_len,
+            params=np.array([self.k1, self.b], dtype=np.float64),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BM25Index":
+        """Read an index written by ``save``."""
+        with np.load(Path(path), allow_pickle=False) as data:
+            k1, b = (float(x) for x in data["params"])
+            return cls(
+                data["keys"].tolist(),
+                {term: i for i, term in enumerate(data["vocab"].tolist())},
+                data["offsets"],
+                data["postings"],
+                data["tfs"],
+                data["doc_len"],
+                k1=k1,
+                b=b,
+            )
+
+
+@dataclass
+class _Entry:
+    index: BM25Index
+    version: str
+    checked_at: float
+
+
+class KeywordIndexCache:
+    """Process-wide BM25 indexes keyed by (kind, group set).
+
+    ``get`` is synchronous (it may read the corpus from Neo4j); async
+    callers run it in a thread.  Builds for different groups proceed in
+    parallel; concurrent callers for the same group wait for one build.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, check_interval: Optional[float] = None):
+        self._cache_dir = cache_dir if cache_dir is not None else os.getenv("BM25_INDEX_DIR", "")
+        self._check_interval = (
+            check_interval if check_interval is not None
+            else float(os.getenv("BM25_VERSION_CHECK_SECONDS", "60"))
+        )
+        self._entries: Dict[Tuple[str, Tuple[str, ...]], _Entry] = {}
+        self._locks: Dict[Tuple[str, Tuple[str, ...]], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, key: Tuple[str, Tuple[str, ...]]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(
+        self,
+        driver: Any,
+        kind: str,
+        group_ids: Sequence[str],
+        database: Optional[str] = None,
+    ) -> BM25Index:
+        """Return the current index for *group_ids*, building it if needed."""
+        if kind not in _SOURCE_QUERIES:
+            raise ValueError(f"Unknown keyword index kind: {kind!r}")
+        key = (kind, tuple(sorted(set(group_ids))))
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.checked_at < self._check_interval:
+            return entry.index
+
+        with self._lock_for(key):
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.checked_at < self._check_interval:
+                return entry.index
+
+            version = self._read_version(driver, key[1], database)
+            if entry is not None and entry.version == version:
+                entry.checked_at = time.monotonic()
+                return entry.index
+
+            index = self._load_or_build(driver, kind, key[1], version, database)
+            self._entries[key] = _Entry(index, version, time.monotonic())
+            return index
+
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        """Drop cached indexes (all, or those covering *group_id*)."""
+        for key in list(self._entries):
+            if group_id is None or group_id in key[1]:
+                self._entries.pop(key, None)
+
+    @staticmethod
+    def _read_version(driver: Any, group_ids: Tuple[str, ...], database: Optional[str]) -> str:
+        return read_group_version(driver, group_ids, database)
+
+    def _path(self, kind: str, group_ids: Tuple[str, ...], version: str) -> Optional[Path]:
+        if not self._cache_dir:
+            return None
+        group_key = hashlib.sha1("\x1f".join(group_ids).encode()).hexdigest()[:16]
+        version_key = hashlib.sha1(f"{_TOKENIZER_VERSION}\x1f{version}".encode()).hexdigest()[:16]
+        return Path(self._cache_dir) / f"bm25_{kind}_{group_key}_{version_key}.npz"
+
+    def _load_or_build(
+        self,
+        driver: Any,
+        kind: str,
+        group_ids: Tuple[str, ...],
+        version: str,
+        database: Optional[str],
+    ) -> BM25Index:
+        # A mid-indexing snapshot must not outlive this process
+        path = None if group_version_in_progress(version) else self._path(kind, group_ids, version)
+        if path is not None and path.exists():
+            try:
+                index = BM25Index.load(path)
+                logger.info("bm25_index_loaded", kind=kind, docs=len(index), path=str(path))
+                return index
+            except Exception as e:
+                logger.warning("bm25_index_load_failed", path=str(path), error=str(e))
+
+        def build(rows) -> BM25Index:
+            return BM25Index.build((r["key"], r["text"]) for r in rows)
+
+        t0 = time.perf_counter()
+        with retry_session(driver, database=database, read_only=True) as session:
+            if kind in _PAGED_KINDS:
+                index = build(session.stream(_SOURCE_QUERIES[kind], key="key", group_ids=list(group_ids)))
+            else:
+                index = session.read_all(_SOURCE_QUERIES[kind], build, group_ids=list(group_ids))
+        logger.info(
+            "bm25_index_built",
+            kind=kind,
+            group_ids=list(group_ids),
+            docs=len(index),
+            terms=index.vocabulary_size,
+            elapsed_ms=int((time.perf_counter() - t0) * 1000),
+        )
+
+        if path is not None:
+            try:
+                index.save(path)
+            except Exception as e:
+                logger.warning("bm25_index_save_failed", path=str(path), error=str(e))
+        return index
+
+
+_cache: Optional[KeywordIndexCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_keyword_index_cache() -> KeywordIndexCache:
+    """Get or create the process-wide keyword index cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = KeywordIndexCache()
+    return _cache
@@ -0,0 +1,195 @@
+"""Compact row-normalised embedding matrix for in-process cosine search.
+
+In-process retrievers (``TripleEmbeddingStore``) used to keep a dense
+``float32`` matrix of 2048-d Voyage embeddings per group and per cached
+pipeline, so resident memory grew linearly with the number of warm groups.
+``EmbeddingMatrix`` stores the normalised rows as:
+
+- ``float16`` (default) — half the memory; cosine scores differ from
+  ``float32`` by ~1e-3, top-k order is unchanged in practice
+- ``int8`` — a quarter of the memory; symmetric per-row scalar quantisation
+  (``row ≈ q * scale``), scores are rescaled after the dot product
+- ``float32`` — the previous representation
+
+Scoring converts fixed-size row blocks to ``float32`` and accumulates dot
+products in ``float32``, so the full-precision copy never exists at once.
+
+Matrices can be saved as ``.npy`` and re-opened memory-mapped (read-only):
+worker processes that load the same file share one copy in the OS page
+cache, and pages that are not touched are not resident at all.
+
+Environment knobs:
+    EMBEDDING_STORAGE_DTYPE   float16 | int8 | float32   (default: float16)
+    EMBEDDING_MMAP_DIR        directory for per-version ``.npy`` files
+                              (default: unset — matrices stay on the heap)
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+# Rows converted to float32 per scoring block (2048-d → 32 MB scratch).
+_BLOCK_ROWS = 4096
+
+
+def storage_dtype() -> str:
+    """Configured storage dtype (``EMBEDDING_STORAGE_DTYPE``)."""
+    value = os.getenv("EMBEDDING_STORAGE_DTYPE", "float16").strip().lower()
+    return value if value in STORAGE_DTYPES else "float16"
+
+
+def mmap_dir() -> Optional[Path]:
+    """Directory for memory-mapped matrices (``EMBEDDING_MMAP_DIR``), if set."""
+    value = os.getenv("EMBEDDING_MMAP_DIR", "").strip()
+    return Path(value) if value else None
+
+
+class EmbeddingMatrix:
+    """Unit-norm embedding rows in compact storage with ``float32`` scoring."""
+
+    def __init__(self, data: np.ndarray, scale: Optional[np.ndarray] = None):
+        if data.dtype == np.int8 and scale is None:
+            raise ValueError("int8 embedding matrix requires per-row scales")
+        self.data = data
+        self.scale = scale
+
+    @classmethod
+    def from_array(
+        cls,
+        matrix: Union[np.ndarray, list],
+        dtype: Optional[str] = None,
+    ) -> "EmbeddingMatrix":
+        """Normalise the rows of *matrix* and store them as *dtype*.
+
+        Zero rows stay zero.  Conversion is done block-wise so peak memory is
+        the input plus the compact output.
+        """
+        dtype = dtype or storage_dtype()
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Unknown embedding storage dtype: {dtype!r}")
+        x = np.asarray(matrix, dtype=np.float32)
+        if x.ndim != 2:
+            x = x.reshape(len(x), -1)
+        n = x.shape[0]
+        out = np.empty(x.shape, dtype=np.dtype(dtype))
+        scale = np.ones(n, dtype=np.float32) if dtype == "int8" else None
+
+        for start in range(0, n, _BLOCK_ROWS):
+            block = x[start:start + _BLOCK_ROWS]
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            unit = block / np.where(norms == 0, 1.0, norms)
+            if scale is None:
+                out[start:start + len(block)] = unit
+            else:
+                peak = np.abs(unit).max(axis=1) if unit.shape[1] else np.zeros(len(unit), np.float32)
+                row_scale = np.where(peak > 0, peak / 127.0, 1.0).astype(np.float32)
+                scale[start:start + len(block)] = row_scale
+                out[start:start + len(block)] = np.rint(unit / row_scale[:, None]).astype(np.int8)
+        return cls(out, scale)
+
+    # ── Introspection ──────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return tuple(self.data.shape)  # type: ignore[return-value]
+
+    @property
+    def dtype(self) -> str:
+        return self.data.dtype.name
+
+    @property
+    def mapped(self) -> bool:
+        return isinstance(self.data, np.memmap)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.data.nbytes + (self.scale.nbytes if self.scale is not None else 0))
+
+    def memory_report(self) -> Dict[str, Union[int, float, str, bool]]:
+        """Size summary for logging.
+
+        ``heap_mb`` is private to this process; ``mapped_mb`` is file-backed
+        and shared with every process that maps the same file.
+        """
+        mb = round(self.nbytes / 1e6, 2)
+        return {
+            "rows": len(self),
+            "dim": int(self.data.shape[1]) if self.data.ndim == 2 else 0,
+            "dtype": self.dtype,
+            "mapped": self.mapped,
+            "heap_mb": 0.0 if self.mapped else mb,
+            "mapped_mb": mb if self.mapped else 0.0,
+            "float32_mb": round(self.data.size * 4 / 1e6, 2),
+        }
+
+    # ── Access / scoring ───────────────────────────────────────────────
+
+    def row(self, i: int) -> np.ndarray:
+        """Row *i* as unit-norm ``float32``."""
+        r = np.asarray(self.data[i], dtype=np.float32)
+        return r * self.scale[i] if self.scale is not None else r
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """Dot products of every row with *query* as ``float32`` ``(N,)``."""
+        q = np.asarray(query, dtype=np.float32)
+        if self.data.dtype == np.float32 and not self.mapped:
+            out = self.data @ q
+        else:
+            n = len(self)
+            out = np.empty(n, dtype=np.float32)
+            for start in range(0, n, _BLOCK_ROWS):
+                stop = min(start + _BLOCK_ROWS, n)
+                out[start:stop] = self.data[start:stop].astype(np.float32) @ q
+        if self.scale is not None:
+            out *= self.scale
+        return out
+
+    def top_k(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """``(indices, scores)`` of the *k* best rows, best first."""
+        scores = self.scores(query)
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return top, scores[top]
+
+    # ── Persistence ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _scale_path(path: Path) -> Path:
+        return path.with_suffix(".scale.npy")
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the matrix to *path* (``.npy``; int8 scales alongside)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        targets = [(path, self.data)]
+        if self.scale is not None:
+            targets.insert(0, (self._scale_path(path), self.scale))
+        # Scales first, data last: a reader that sees the data file also
+        # sees its scales.
+        for target, array in targets:
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+            os.replace(tmp, target)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "EmbeddingMatrix":
+        """Open a matrix written by ``save`` (memory-mapped read-only by default)."""
+        path = Path(path)
+        data = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        scale = None
+        if data.dtype == np.int8:
+            scale = np.load(cls._scale_path(path), allow_pickle=False)
+        return cls(data, scale)
@@ -199,29 +199,34 @@ class HippoRAG2PPR:
         seen_entity_edges: set = set()
         seen_synonym_edges: set = set()
 
-        with retry_session(neo4j_driver) as session:
+        # Every bulk read is keyset-paginated (``RetrySession.stream``): one
+        # row per node, ordered by node id, so only a page of driver records
+        # is alive at a time and a transient error retries a single page.
+        with retry_session(neo4j_driver, read_only=True) as session:
             # ----------------------------------------------------------
             # 1. Load Entity nodes
             # ----------------------------------------------------------
-            result = session.run(
+            for record in session.stream(
                 "MATCH (e:Entity) "
                 "WHERE e.group_id IN $group_ids "
-                "RETURN e.id AS id, e.name AS name",
+                "AND ($after IS NULL OR e.id > $after) "
+                "RETURN e.id AS id, e.name AS name "
+                "ORDER BY e.id LIMIT $limit",
                 group_ids=group_ids,
-            )
-            for record in result:
+            ):
                 self._add_node(record["id"], "entity", record["name"] or "")
 
             # ----------------------------------------------------------
             # 2. Load Sentence (passage) nodes
             # ----------------------------------------------------------
-            result = session.run(
+            for record in session.stream(
                 "MATCH (c:Sentence) "
                 "WHERE c.group_id IN $group_ids "
-                "RETURN c.id AS id, c.text AS text",
+                "AND ($after IS NULL OR c.id > $after) "
+                "RETURN c.id AS id, c.text AS text "
+                "ORDER BY c.id LIMIT $limit",
                 group_ids=group_ids,
-            )
-            for record in result:
+            ):
                 # Use first 80 chars of text as display name
                 full_text = record["text"] or ""
                 self._add_node(record["id"], "passage", full_text[:80])
@@ -230,22 +235,30 @@ class HippoRAG2PPR:
             # ----------------------------------------------------------
             # 3. Entity-Entity edges via RELATED_TO
             # ----------------------------------------------------------
-            result = session.run(
-                "MATCH (e1:Entity)-[r:RELATED_TO]->(e2:Entity) "
+            for record in session.stream(
+                "MATCH (e1:Entity) "
                 "WHERE e1.group_id IN $group_ids "
-                "AND e2.group_id IN $group_ids "
-                "RETURN e1.id AS src, e2.id AS tgt, "
-                "coalesce(r.weight, 1.0) AS weight",
+                "AND ($after IS NULL OR e1.id > $after) "
+                "WITH e1 ORDER BY e1.id LIMIT $limit "
+                "RETURN e1.id AS src, "
+                "[(e1)-[r:RELATED_TO]->(e2:Entity) "
+                " WHERE e2.group_id IN $group_ids "
+                " | [e2.id, coalesce(r.weight, 1.0)]] AS edges "
+                "ORDER BY src",
+                key="src",
                 group_ids=group_ids,
-            )
-            for record in result:
+            ):
                 src_idx = self._node_to_idx.get(record["src"])
-                tgt_idx = self._node_to_idx.get(record["tgt"])
-                if src_idx is not None and tgt_idx is not None:
+                if src_idx is None:
+                    continue
+                for tgt, weight in record["edges"]:
+                    tgt_idx = self._node_to_idx.get(tgt)
+                    if tgt_idx is None:
+                        continue
                     edge_key = (min(src_idx, tgt_idx), max(src_idx, tgt_idx))
                     if edge_key not in seen_entity_edges:
                         seen_entity_edges.add(edge_key)
-                        self._add_edge(src_idx, tgt_idx, float(record["weight"]))
+                        self._add_edge(src_idx, tgt_idx, float(weight))
                         entity_edge_count += 1
 
             # ----------------------------------------------------------
@@ -253,21 +266,27 @@ class HippoRAG2PPR:
             #    Upstream HippoRAG 2 uses weight=1.0 for passage-entity
             #    graph edges (passage_node_weight is only for PPR seeding).
             # ----------------------------------------------------------
-            result = session.run(
-                "MATCH (c:Sentence)-[:MENTIONS]->(e:Entity) "
+            for record in session.stream(
+                "MATCH (c:Sentence) "
                 "WHERE c.group_id IN $group_ids "
-                "AND e.group_id IN $group_ids "
-                "RETURN c.id AS sentence_id, e.id AS entity_id",
+                "AND ($after IS NULL OR c.id > $after) "
+                "WITH c ORDER BY c.id LIMIT $limit "
+                "RETURN c.id AS sentence_id, "
+                "[(c)-[:MENTIONS]->(e:Entity) "
+                " WHERE e.group_id IN $group_ids | e.id] AS entity_ids "
+                "ORDER BY sentence_id",
+                key="sentence_id",
                 group_ids=group_ids,
-            )
-            for record in result:
+            ):
                 src_idx = self._node_to_idx.get(record["sentence_id"])
-                tgt_idx = self._node_to_idx.get(record["entity_id"])
-                if src_idx is not None and tgt_idx is not None:
-                    self._add_edge(src_idx, tgt_idx, 1.0)
-                    mentions_edge_count += 1
-                    eid = record["entity_id"]
-                    self._entity_mention_counts[eid] = self._entity_mention_counts.get(eid, 0) + 1
+                if src_idx is None:
+                    continue
+                for eid in record["entity_ids"]:
+                    tgt_idx = self._node_to_idx.get(eid)
+                    if tgt_idx is not None:
+                        self._add_edge(src_idx, tgt_idx, 1.0)
+                        mentions_edge_count += 1
+                        self._entity_mention_counts[eid] = self._entity_mention_counts.get(eid, 0) + 1
 
             # ----------------------------------------------------------
             # 5. Entity-Entity synonym edges via SEMANTICALLY_SIMILAR
@@ -277,24 +296,31 @@ class HippoRAG2PPR:
             #    synonymy edges at lower thresholds connect semantically
             #    related but distinct entities across documents.
             # ----------------------------------------------------------
-            result = session.run(
-                "MATCH (e1:Entity)-[r:SEMANTICALLY_SIMILAR]->(e2:Entity) "
+            for record in session.stream(
+                "MATCH (e1:Entity) "
                 "WHERE e1.group_id IN $group_ids "
-                "AND e2.group_id IN $group_ids "
-                "AND r.similarity >= $threshold "
-                "RETURN e1.id AS src, e2.id AS tgt, "
-                "r.similarity AS weight",
+                "AND ($after IS NULL OR e1.id > $after) "
+                "WITH e1 ORDER BY e1.id LIMIT $limit "
+                "RETURN e1.id AS src, "
+                "[(e1)-[r:SEMANTICALLY_SIMILAR]->(e2:Entity) "
+                " WHERE e2.group_id IN $group_ids AND r.similarity >= $threshold "
+                " | [e2.id, r.similarity]] AS edges "
+                "ORDER BY src",
+                key="src",
                 group_ids=group_ids,
                 threshold=synonym_threshold,
-            )
-            for record in result:
+            ):
                 src_idx = self._node_to_idx.get(record["src"])
-                tgt_idx = self._node_to_idx.get(record["tgt"])
-                if src_idx is not None and tgt_idx is not None:
+                if src_idx is None:
+                    continue
+                for tgt, weight in record["edges"]:
+                    tgt_idx = self._node_to_idx.get(tgt)
+                    if tgt_idx is None:
+                        continue
                     edge_key = (min(src_idx, tgt_idx), max(src_idx, tgt_idx))
                     if edge_key not in seen_synonym_edges:
                         seen_synonym_edges.add(edge_key)
-                        self._add_edge(src_idx, tgt_idx, float(record["weight"]))
+                        self._add_edge(src_idx, tgt_idx, float(weight))
                         synonym_edge_count += 1
 
             # ----------------------------------------------------------
@@ -304,24 +330,31 @@ class HippoRAG2PPR:
             # ----------------------------------------------------------
             seen_sentence_edges: set = set()
             sentence_sim_count = 0
-            result = session.run(
-                "MATCH (s1:Sentence)-[r:SEMANTICALLY_SIMILAR]->(s2:Sentence) "
+            for record in session.stream(
+                "MATCH (s1:Sentence) "
                 "WHERE s1.group_id IN $group_ids "
-                "AND s2.group_id IN $group_ids "
-                "AND r.similarity >= $threshold "
-                "RETURN s1.id AS src, s2.id AS tgt, "
-                "r.similarity AS weight",
+                "AND ($after IS NULL OR s1.id > $after) "
+                "WITH s1 ORDER BY s1.id LIMIT $limit "
+                "RETURN s1.id AS src, "
+                "[(s1)-[r:SEMANTICALLY_SIMILAR]->(s2:Sentence) "
+                " WHERE s2.group_id IN $group_ids AND r.similarity >= $threshold "
+                " | [s2.id, r.similarity]] AS edges "
+                "ORDER BY src",
+                key="src",
                 group_ids=group_ids,
                 threshold=synonym_threshold,
-            )
-            for record in result:
+            ):
                 src_idx = self._node_to_idx.get(record["src"])
-                tgt_idx = self._node_to_idx.get(record["tgt"])
-                if src_idx is not None and tgt_idx is not None:
+                if src_idx is None:
+                    continue
+                for tgt, weight in record["edges"]:
+                    tgt_idx = self._node_to_idx.get(tgt)
+                    if tgt_idx is None:
+                        continue
                     edge_key = (min(src_idx, tgt_idx), max(src_idx, tgt_idx))
                     if edge_key not in seen_sentence_edges:
                         seen_sentence_edges.add(edge_key)
-                        self._add_edge(src_idx, tgt_idx, float(record["weight"]))
+                        self._add_edge(src_idx, tgt_idx, float(weight))
                         sentence_sim_count += 1
 
             # ----------------------------------------------------------
@@ -0,0 +1,213 @@
+"""In-process hub-entity / degree table per group.
+
+Hub selection (``HubExtractor``, ``EnhancedGraphRetriever.get_top_entities_by_degree``)
+used to rank entities with ``MATCH (e)-[r]-() ... count(r)`` on every Route
+3/4 query — walking the relationships of every candidate entity even though
+degree only changes when the group is (re)indexed.
+
+``materialize_hub_tables`` (``Neo4jStoreV3``) writes ``e.degree`` at the end
+of ``index_documents``, once all edges (foundation, KNN, community) exist, and
+stamps ``GroupMeta.hub_tables_at``.  This module loads degree and community
+once per *group version* (``read_group_version``) into sorted in-memory arrays, so
+top-k lookups are list slices.  Groups whose stamp is older than their last
+indexing / GDS / lifecycle change (or missing, for groups indexed before the
+materialization step existed) are computed live while building the table —
+once per version instead of once per query.
+
+Set ``HUB_TABLE=0`` to fall back to the per-query degree Cypher.
+
+Usage::
+
+    table = get_hub_table_cache().get(driver, group_ids)
+    table.top(10)                              # [(name, degree), ...]
+    table.community_hubs("17", 3)              # [name, ...]
+    table.keyword_hubs(["payment", "fee"], 3)  # [name, ...]
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import structlog
+
+from ..services.neo4j_retry import retry_session
+from .bm25_index import read_group_version
+
+logger = structlog.get_logger(__name__)
+
+_FRESH_GROUPS_QUERY = """
+MATCH (g:GroupMeta)
+WHERE g.group_id IN $group_ids
+  AND g.hub_tables_at IS NOT NULL
+  AND (g.last_indexing_at IS NULL OR g.hub_tables_at >= g.last_indexing_at)
+  AND (g.gds_last_computed IS NULL OR g.hub_tables_at >= g.gds_last_computed)
+  AND (g.last_lifecycle_change IS NULL OR g.hub_tables_at >= g.last_lifecycle_change)
+RETURN collect(g.group_id) AS fresh
+"""
+
+# Read in one streamed pass with ``RetrySession.read_all`` (no indexed
+# cursor to page on; ``HubTable`` orders rows itself).  Materialized degree
+# is read for fresh groups; the rest are computed from the graph.
+_TABLE_QUERY = """
+MATCH (e:Entity)
+WHERE e.group_id IN $group_ids
+WITH e, e.group_id IN $fresh_groups AS fresh
+RETURN
+    elementId(e) AS key,
+    e.name AS name,
+    e.id AS id,
+    e.community AS community,
+    e.community_id AS community_id,
+    CASE WHEN fresh THEN coalesce(e.degree, 0) ELSE COUNT { (e)-[]-() } END AS degree
+"""
+
+
+def hub_table_enabled() -> bool:
+    """Whether hub/degree lookups use the in-process table (default on)."""
+    return os.getenv("HUB_TABLE", "1").strip().lower() in {"1", "true", "yes"}
+
+
+class HubTable:
+    """Entities of a group set sorted by degree (descending, then name)."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        ordered = sorted(rows, key=lambda r: (-(r.get("degree") or 0), r.get("name") or "", r.get("key") or ""))
+        self.names: List[Optional[str]] = [r.get("name") for r in ordered]
+        self.ids: List[Optional[str]] = [r.get("id") for r in ordered]
+        self.degrees: List[int] = [int(r.get("degree") or 0) for r in ordered]
+        self._lower: List[str] = [(n or "").lower() for n in self.names]
+
+        self._communities: Dict[str, List[int]] = defaultdict(list)
+        for i, r in enumerate(ordered):
+            for cid in {r.get("community"), r.get("community_id")}:
+                if cid is not None:
+                    self._communities[str(cid)].append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def top(self, k: int) -> List[Tuple[Optional[str], int]]:
+        """Highest-degree entities as ``(name or id, degree)`` (connected entities only)."""
+        return [
+            (self.names[i] or self.ids[i], self.degrees[i])
+            for i in range(len(self.names)) if self.degrees[i] > 0
+        ][:k]
+
+    def community_hubs(self, community_id: Any, k: int) -> List[str]:
+        """Top-*k* entities of a community by degree (``name`` or ``id``)."""
+        out: List[str] = []
+        for i in self._communities.get(str(community_id), ()):
+            if self.degrees[i] <= 0:
+                break
+            label = self.names[i] or self.ids[i]
+            if label:
+                out.append(label)
+            if len(out) >= k:
+                break
+        return out
+
+    def keyword_hubs(self, keywords: Sequence[str], k: int) -> List[str]:
+        """Top-*k* entities whose lowercased name contains any keyword."""
+        if not keywords:
+            return []
+        out: List[str] = []
+        for i, lower in enumerate(self._lower):
+            if self.degrees[i] <= 0:
+                break
+            if self.names[i] and any(kw in lower for kw in keywords):
+                out.append(self.names[i])
+                if len(out) >= k:
+                    break
+        return out
+
+
+@dataclass
+class _Entry:
+    table: HubTable
+    version: str
+    checked_at: float
+
+
+class HubTableCache:
+    """Process-wide hub tables keyed by group set, refreshed on version change."""
+
+    def __init__(self, check_interval: Optional[float] = None):
+        self._check_interval = (
+            check_interval if check_interval is not None
+            else float(os.getenv("HUB_TABLE_VERSION_CHECK_SECONDS", "60"))
+        )
+        self._entries: Dict[Tuple[str, ...], _Entry] = {}
+        self._locks: Dict[Tuple[str, ...], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, key: Tuple[str, ...]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, driver: Any, group_ids: Sequence[str], database: Optional[str] = None) -> HubTable:
+        """Return the current table for *group_ids*, building it if needed (sync)."""
+        key = tuple(sorted(set(group_ids)))
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.checked_at < self._check_interval:
+            return entry.table
+
+        with self._lock_for(key):
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.checked_at < self._check_interval:
+                return entry.table
+
+            version = read_group_version(driver, key, database)
+            if entry is not None and entry.version == version:
+                entry.checked_at = time.monotonic()
+                return entry.table
+
+            table = self._build(driver, key, database)
+            self._entries[key] = _Entry(table, version, time.monotonic())
+            return table
+
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        """Drop cached tables (all, or those covering *group_id*)."""
+        for key in list(self._entries):
+            if group_id is None or group_id in key:
+                self._entries.pop(key, None)
+
+    @staticmethod
+    def _build(driver: Any, group_ids: Tuple[str, ...], database: Optional[str]) -> HubTable:
+        t0 = time.perf_counter()
+        with retry_session(driver, database=database, read_only=True) as session:
+            record = session.run(_FRESH_GROUPS_QUERY, group_ids=list(group_ids)).single()
+            fresh = list((record["fresh"] if record else None) or [])
+            table = session.read_all(
+                _TABLE_QUERY,
+                lambda rows: HubTable(dict(r) for r in rows),
+                group_ids=list(group_ids),
+                fresh_groups=fresh,
+            )
+        logger.info(
+            "hub_table_built",
+            group_ids=list(group_ids),
+            entities=len(table),
+            materialized_groups=fresh,
+            elapsed_ms=int((time.perf_counter() - t0) * 1000),
+        )
+        return table
+
+
+_cache: Optional[HubTableCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_hub_table_cache() -> HubTableCache:
+    """Get or create the process-wide hub table cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HubTableCache()
+    return _cache
@@ -0,0 +1,291 @@
+"""In-process sentence adjacency for Route 2 skeleton traversal (Strategy B).
+
+``LocalSearchHandler._retrieve_skeleton_graph_traversal`` used to run one
+large Cypher query per request: vector anchor, RELATED_TO expansion,
+NEXT_IN_SECTION windows in both directions and the parent context, with the
+hop structure re-walked in the database every time.  That structure only
+changes when a group is (re)indexed, so this module loads it once per *group
+version* (``read_group_version``) into CSR arrays:
+
+- ``next_offsets`` / ``next_targets`` — NEXT_IN_SECTION successors
+- ``prev_offsets`` / ``prev_targets`` — the same edges reversed
+- ``related_offsets`` / ``related_targets`` / ``related_weights`` —
+  RELATED_TO ``{source: 'knn_sentence'}`` neighbours (both directions) with
+  their ``similarity``
+- ``section_paths`` — ``Sentence.section_path`` per sentence (section-aware
+  RELATED_TO decay)
+
+``SentenceGraph.expand`` then reproduces the traversal's scoring locally from
+the vector anchors, and the route hydrates only the surviving sentence ids.
+
+Set ``SKELETON_SENTENCE_GRAPH=0`` to fall back to the single Cypher traversal.
+
+Usage::
+
+    graph = get_sentence_graph_cache().get(driver, group_ids)
+    expanded = graph.expand([("s1", 0.82), ("s7", 0.61)])
+    # [ExpandedSentence(sentence_id="s1", score=0.82, sources=["seed"]), ...]
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import structlog
+
+from ..services.neo4j_retry import retry_session
+from .bm25_index import read_group_version
+
+logger = structlog.get_logger(__name__)
+
+# Decay factors of the Strategy B traversal
+RELATED_SAME_SECTION_DECAY = 0.85
+RELATED_CROSS_SECTION_DECAY = 0.6
+NEXT_DECAY = 0.9
+# NEXT_IN_SECTION*1..2 in either direction
+NEXT_WINDOW = 2
+
+# Keyset-paginated for ``RetrySession.stream``: one row per sentence with its
+# outgoing NEXT_IN_SECTION targets and (undirected) RELATED_TO neighbours.
+_ADJACENCY_QUERY = """
+MATCH (s:Sentence)
+WHERE s.group_id IN $group_ids
+  AND ($after IS NULL OR s.id > $after)
+RETURN
+    s.id AS id,
+    s.section_path AS section_path,
+    COLLECT {
+        MATCH (s)-[:NEXT_IN_SECTION]->(n:Sentence)
+        WHERE n.group_id IN $group_ids
+        RETURN n.id
+    } AS next_ids,
+    COLLECT {
+        MATCH (s)-[r:RELATED_TO {source: 'knn_sentence'}]-(o:Sentence)
+        WHERE o.group_id IN $group_ids AND r.similarity IS NOT NULL
+        RETURN [o.id, r.similarity]
+    } AS related
+ORDER BY id
+LIMIT $limit
+"""
+
+
+def sentence_graph_enabled() -> bool:
+    """Whether Strategy B expands anchors on the in-process graph (default on)."""
+    return os.getenv("SKELETON_SENTENCE_GRAPH", "1").strip().lower() in {"1", "true", "yes"}
+
+
+@dataclass
+class ExpandedSentence:
+    """A sentence reached from the anchors, with its best score and hop types."""
+
+    sentence_id: str
+    score: float
+    sources: List[str]
+
+
+def _csr(n: int, edges: Sequence[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """``(offsets, targets)`` for *edges* grouped by source, input order kept."""
+    counts = np.zeros(n + 1, dtype=np.int64)
+    for src, _ in edges:
+        counts[src + 1] += 1
+    offsets = np.cumsum(counts)
+    targets = np.empty(len(edges), dtype=np.int64)
+    cursor = offsets[:-1].copy()
+    for src, dst in edges:
+        targets[cursor[src]] = dst
+        cursor[src] += 1
+    return offsets, targets
+
+
+class SentenceGraph:
+    """Immutable NEXT / PREV / RELATED_TO adjacency over a group's sentences."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        rows = list(rows)
+        self.ids: List[str] = [r["id"] for r in rows]
+        self.index: Dict[str, int] = {sid: i for i, sid in enumerate(self.ids)}
+        self.section_paths: List[Optional[str]] = [r.get("section_path") for r in rows]
+
+        next_edges: List[Tuple[int, int]] = []
+        related_edges: List[Tuple[int, int]] = []
+        related_weights: List[float] = []
+        for i, r in enumerate(rows):
+            for nid in r.get("next_ids") or ():
+                j = self.index.get(nid)
+                if j is not None:
+                    next_edges.append((i, j))
+            for oid, similarity in r.get("related") or ():
+                j = self.index.get(oid)
+                if j is not None and similarity is not None:
+                    related_edges.append((i, j))
+                    related_weights.append(float(similarity))
+
+        n = len(self.ids)
+        self.next_offsets, self.next_targets = _csr(n, next_edges)
+        self.prev_offsets, self.prev_targets = _csr(n, [(j, i) for i, j in next_edges])
+        self.related_offsets, self.related_targets = _csr(n, related_edges)
+        self.related_weights = np.asarray(related_weights, dtype=np.float64)
+        self.edge_count = len(next_edges) + len(related_edges)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _related(self, i: int) -> Iterable[Tuple[int, float]]:
+        lo, hi = self.related_offsets[i], self.related_offsets[i + 1]
+        return zip(self.related_targets[lo:hi].tolist(), self.related_weights[lo:hi].tolist())
+
+    @staticmethod
+    def _window(i: int, offsets: np.ndarray, targets: np.ndarray, hops: int) -> List[int]:
+        """Sentences 1..*hops* steps away along one direction (distinct, nearest first)."""
+        seen: Dict[int, None] = {}
+        frontier = [i]
+        for _ in range(hops):
+            frontier = [int(t) for f in frontier for t in targets[offsets[f]:offsets[f + 1]]]
+            for t in frontier:
+                seen.setdefault(t, None)
+        return list(seen)
+
+    def expand(self, seeds: Sequence[Tuple[str, float]], window: int = NEXT_WINDOW) -> List[ExpandedSentence]:
+        """Anchor → RELATED_TO → NEXT/PREV expansion with the traversal's decay scoring.
+
+        Seeds keep their vector score.  RELATED_TO neighbours of a seed score
+        ``seed * similarity * 0.85`` within the same ``section_path`` (0.6
+        across sections).  Every anchor (seed or related) adds its NEXT/PREV
+        window at ``anchor * 0.9``.  A sentence reached several ways keeps its
+        highest score and the hop types that reached it; the result is sorted
+        by score, highest first.  Seeds unknown to the graph are kept without
+        expansion.
+        """
+        # anchors: sentence id → (score, via); seeds take precedence for via
+        anchors: Dict[str, Tuple[float, str]] = {}
+        for sid, score in seeds:
+            prev = anchors.get(sid)
+            anchors[sid] = (max(score, prev[0]) if prev else score, "seed")
+        for sid, score in seeds:
+            i = self.index.get(sid)
+            if i is None:
+                continue
+            seed_section = self.section_paths[i]
+            for j, similarity in self._related(i):
+                section = self.section_paths[j]
+                same_section = section is not None and section == seed_section
+                decay = RELATED_SAME_SECTION_DECAY if same_section else RELATED_CROSS_SECTION_DECAY
+                related_score = score * similarity * decay
+                rid = self.ids[j]
+                prev = anchors.get(rid)
+                if prev is None:
+                    anchors[rid] = (related_score, "related_to")
+                elif related_score > prev[0]:
+                    anchors[rid] = (related_score, prev[1])
+
+        best: Dict[str, float] = {}
+        sources: Dict[str, List[str]] = {}
+
+        def _add(sid: str, score: float, via: str) -> None:
+            if sid not in best or score > best[sid]:
+                best[sid] = score
+            vias = sources.setdefault(sid, [])
+            if via not in vias:
+                vias.append(via)
+
+        for sid, (score, via) in anchors.items():
+            _add(sid, score, via)
+        for direction, offsets, targets in (
+            ("next", self.next_offsets, self.next_targets),
+            ("prev", self.prev_offsets, self.prev_targets),
+        ):
+            for sid, (score, _) in anchors.items():
+                i = self.index.get(sid)
+                if i is None:
+                    continue
+                for j in self._window(i, offsets, targets, window):
+                    _add(self.ids[j], score * NEXT_DECAY, direction)
+
+        ordered = sorted(best, key=lambda sid: -best[sid])
+        return [ExpandedSentence(sid, best[sid], sources[sid]) for sid in ordered]
+
+
+@dataclass
+class _Entry:
+    graph: SentenceGraph
+    version: str
+    checked_at: float
+
+
+class SentenceGraphCache:
+    """Process-wide sentence graphs keyed by group set, refreshed on version change."""
+
+    def __init__(self, check_interval: Optional[float] = None):
+        self._check_interval = (
+            check_interval if check_interval is not None
+            else float(os.getenv("SKELETON_SENTENCE_GRAPH_VERSION_CHECK_SECONDS", "60"))
+        )
+        self._entries: Dict[Tuple[str, ...], _Entry] = {}
+        self._locks: Dict[Tuple[str, ...], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, key: Tuple[str, ...]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, driver: Any, group_ids: Sequence[str], database: Optional[str] = None) -> SentenceGraph:
+        """Return the current graph for *group_ids*, building it if needed (sync)."""
+        key = tuple(sorted(set(group_ids)))
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.checked_at < self._check_interval:
+            return entry.graph
+
+        with self._lock_for(key):
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.checked_at < self._check_interval:
+                return entry.graph
+
+            version = read_group_version(driver, key, database)
+            if entry is not None and entry.version == version:
+                entry.checked_at = time.monotonic()
+                return entry.graph
+
+            graph = self._build(driver, key, database)
+            self._entries[key] = _Entry(graph, version, time.monotonic())
+            return graph
+
+    def invalidate(self, group_id: Optional[str] = None) -> None:
+        """Drop cached graphs (all, or those covering *group_id*)."""
+        for key in list(self._entries):
+            if group_id is None or group_id in key:
+                self._entries.pop(key, None)
+
+    @staticmethod
+    def _build(driver: Any, group_ids: Tuple[str, ...], database: Optional[str]) -> SentenceGraph:
+        t0 = time.perf_counter()
+        with retry_session(driver, database=database, read_only=True) as session:
+            rows = session.stream(_ADJACENCY_QUERY, key="id", group_ids=list(group_ids))
+            graph = SentenceGraph(dict(r) for r in rows)
+        logger.info(
+            "sentence_graph_built",
+            group_ids=list(group_ids),
+            sentences=len(graph),
+            edges=graph.edge_count,
+            elapsed_ms=int((time.perf_counter() - t0) * 1000),
+        )
+        return graph
+
+
+_cache: Optional[SentenceGraphCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_sentence_graph_cache() -> SentenceGraphCache:
+    """Get or create the process-wide sentence graph cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SentenceGraphCache()
+    return _cache
@@ -23,18 +23,22 @@ from __future__ import annotations
 
 import asyncio
 import difflib
+import hashlib
 import json
 import os
 import re
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import structlog
 
 from src.core.config import settings, build_group_ids
 from ..services.neo4j_retry import retry_session
+from ..utils.near_duplicates import dedup_indices
+from ..utils.vectors import unit_rows
+from .embedding_matrix import EmbeddingMatrix, mmap_dir, storage_dtype
 
 logger = structlog.get_logger(__name__)
 
@@ -49,7 +53,7 @@ class Triple:
     object_id: str
     object_name: str
     triple_text: str  # "{subject_name} {predicate} {object_name}"
-    embedding: Optional[List[float]] = None
+    embedding: Optional[Union[List[float], np.ndarray]] = None
     document_title: Optional[str] = None
 
 
@@ -58,14 +62,18 @@ class TripleEmbeddingStore:
 
     Loads all RELATED_TO edges from Neo4j, concatenates the triple text
     (subject + predicate + object), batch-embeds with Voyage, and caches
-    the result as a numpy matrix for fast cosine similarity search.
+    the result as an ``EmbeddingMatrix`` (float16 by default) for fast
+    cosine similarity search.
 
-    The store is lazy-loaded on first use and cached per group_id.
+    The store is lazy-loaded on first use.  ``get_shared_triple_store``
+    shares one loaded store per group set + group version across pipelines;
+    with ``EMBEDDING_MMAP_DIR`` set, the matrix is also saved per version and
+    memory-mapped, so processes serving the same group share its pages.
     """
 
     def __init__(self) -> None:
         self._triples: List[Triple] = []
-        self._embeddings_matrix: Optional[np.ndarray] = None  # (N, dim)
+        self._embeddings_matrix: Optional[Union[EmbeddingMatrix, np.ndarray]] = None  # (N, dim)
         self._loaded = False
 
     @property
@@ -76,12 +84,40 @@ class TripleEmbeddingStore:
     def triple_count(self) -> int:
         return len(self._triples)
 
+    def memory_report(self) -> Dict[str, Any]:
+        """Embedding matrix size (see ``EmbeddingMatrix.memory_report``)."""
+        matrix = self._matrix()
+        return matrix.memory_report() if matrix is not None else {"rows": 0}
+
+    def _matrix(self) -> Optional[EmbeddingMatrix]:
+        matrix = self._embeddings_matrix
+        if isinstance(matrix, np.ndarray):
+            # Plain float32 matrix assigned directly (already normalised).
+            return EmbeddingMatrix(matrix)
+        return matrix
+
+    @staticmethod
+    def _mmap_path(group_ids: List[str], version: Optional[str]) -> Optional[Any]:
+        directory = mmap_dir()
+        if directory is None or not version:
+            return None
+        group_key = hashlib.sha1("\x1f".join(sorted(set(group_ids))).encode()).hexdigest()[:16]
+        version_key = hashlib.sha1(version.encode()).hexdigest()[:16]
+        return directory / f"triples_{group_key}_{version_key}_{storage_dtype()}.npy"
+
+    def _attach_matrix(self, matrix: EmbeddingMatrix) -> None:
+        """Install *matrix* and point each ``Triple.embedding`` at its row."""
+        self._embeddings_matrix = matrix
+        for i, triple in enumerate(self._triples):
+            triple.embedding = matrix.data[i]
+
     async def load(
         self,
         neo4j_driver: Any,
         group_id: str,
         voyage_service: Any,
         group_ids: Optional[List[str]] = None,
+        version: Optional[str] = None,
     ) -> None:
         """Load triples from Neo4j, embed with Voyage, cache in memory.
 
@@ -91,12 +127,40 @@ class TripleEmbeddingStore:
             voyage_service: VoyageEmbedService instance for embedding.
             group_ids: List of group IDs for multi-group retrieval.
                        Defaults to [group_id] if not provided.
+            version: Group version (``read_group_version``).  With
+                     ``EMBEDDING_MMAP_DIR`` set, a matrix already saved for
+                     this version is memory-mapped instead of re-read.
         """
         effective_group_ids = group_ids or build_group_ids(group_id)
         t0 = time.perf_counter()
 
-        # Fetch all RELATED_TO triples from Neo4j
-        triples = await asyncio.to_thread(
+        mmap_path = self._mmap_path(effective_group_ids, version)
+        if mmap_path is not None and mmap_path.exists():
+            triples, _ = await asyncio.to_thread(
+                self._fetch_triples_sync, neo4j_driver, effective_group_ids, False
+            )
+            try:
+                matrix = EmbeddingMatrix.load(mmap_path)
+            except Exception as e:
+                logger.warning("triple_store_mmap_load_failed", path=str(mmap_path), error=str(e))
+                matrix = None
+            if matrix is not None and len(matrix) == len(triples):
+                self._triples = triples
+                self._attach_matrix(matrix)
+                self._loaded = True
+                logger.info(
+                    "triple_store_loaded",
+                    group_id=group_id,
+                    triple_count=len(triples),
+                    source="mmap",
+                    elapsed_ms=int((time.perf_counter() - t0) * 1000),
+                    **matrix.memory_report(),
+                )
+                return
+
+        # Fetch all RELATED_TO triples from Neo4j (embeddings land directly
+        # in a float32 matrix; Triple.embedding holds row views into it)
+        triples, precomputed_matrix = await asyncio.to_thread(
             self._fetch_triples_sync, neo4j_driver, effective_group_ids
         )
 
@@ -112,9 +176,7 @@ class TripleEmbeddingStore:
         if all_precomputed:
             # Use pre-computed embeddings — skip Voyage API call entirely
             self._triples = triples
-            self._embeddings_matrix = np.array(
-                [t.embedding for t in triples], dtype=np.float32
-            )
+            self._embeddings_matrix = precomputed_matrix
             logger.info(
                 "triple_store_using_precomputed_embeddings",
                 group_id=group_id,
@@ -168,10 +230,15 @@ class TripleEmbeddingStore:
 
             self._triples = triples
 
-        # Normalize for cosine similarity via dot product
-        norms = np.linalg.norm(self._embeddings_matrix, axis=1, keepdims=True)
-        norms = np.where(norms == 0, 1.0, norms)
-        self._embeddings_matrix /= norms
+        # Normalize for cosine similarity via dot product, in compact storage
+        matrix = EmbeddingMatrix.from_array(self._embeddings_matrix)
+        if mmap_path is not None:
+            try:
+                await asyncio.to_thread(matrix.save, mmap_path)
+                matrix = EmbeddingMatrix.load(mmap_path)
+            except Exception as e:
+                logger.warning("triple_store_mmap_save_failed", path=str(mmap_path), error=str(e))
+        self._attach_matrix(matrix)
 
         self._loaded = True
         elapsed_ms = int((time.perf_counter() - t0) * 1000)
@@ -179,13 +246,14 @@ class TripleEmbeddingStore:
             "triple_store_loaded",
             group_id=group_id,
             triple_count=len(triples),
-            embedding_dim=self._embeddings_matrix.shape[1],
+            source="neo4j",
             elapsed_ms=elapsed_ms,
+            **matrix.memory_report(),
         )
 
     def _fetch_triples_sync(
-        self, neo4j_driver: Any, group_ids: List[str]
-    ) -> List[Triple]:
+        self, neo4j_driver: Any, group_ids: List[str], with_embeddings: bool = True
+    ) -> Tuple[List[Triple], np.ndarray]:
         """Fetch all RELATED_TO triples from Neo4j (synchronous).
 
         If triples have pre-computed embeddings (triple_embedding property stored
@@ -194,6 +262,21 @@ class TripleEmbeddingStore:
 
         Also resolves each triple's source document via APPEARS_IN_DOCUMENT
         for document-aware embedding context.
+
+        Triples are read in one streamed pass (RELATED_TO has no indexed
+        property to page on) ordered by relationship element id, so rows line
+        up with a matrix cached on disk, and their embeddings are copied into
+        one preallocated ``float32`` matrix as records arrive, so the driver's
+        per-record float lists never accumulate for the whole group.  Returns ``(triples, matrix)``; each precomputed
+        ``Triple.embedding`` is a row view of ``matrix``.  With
+        ``with_embeddings=False`` the embedding column is not transferred
+        (used when the matrix is memory-mapped from disk).
+        """
+        count_cypher = """
+        MATCH (e1:Entity)-[r:RELATED_TO]->(e2:Entity)
+        WHERE e1.group_id IN $group_ids AND e2.group_id IN $group_ids
+              AND r.description IS NOT NULL AND r.description <> ''
+        RETURN count(r) AS n
         """
         cypher = """
         MATCH (e1:Entity)-[r:RELATED_TO]->(e2:Entity)
@@ -204,41 +287,46 @@ class TripleEmbeddingStore:
         OPTIONAL MATCH (e1)-[:APPEARS_IN_DOCUMENT]->(d2:Document)
         WHERE shared_title IS NULL
         WITH e1, r, e2, shared_title, head(collect(d2.title)) AS fallback_title
-        RETURN e1.id AS subj_id, e1.name AS subj_name,
+        RETURN elementId(r) AS rel_id,
+               e1.id AS subj_id, e1.name AS subj_name,
                r.description AS predicate,
                e2.id AS obj_id, e2.name AS obj_name,
-               r.triple_embedding AS embedding,
+               CASE WHEN $with_embeddings THEN r.triple_embedding END AS embedding,
                COALESCE(shared_title, fallback_title) AS document_title
+        ORDER BY rel_id
         """
         triples: List[Triple] = []
-        with retry_session(neo4j_driver) as session:
-            result = session.run(cypher, group_ids=group_ids)
-            for record in result:
-                subj_name = record["subj_name"] or ""
-                predicate = record["predicate"] or ""
-                obj_name = record["obj_name"] or ""
-                triple_text = f"{subj_name} {predicate} {obj_name}"
-                embedding = record["embedding"]
-                triples.append(
-                    Triple(
-                        subject_id=record["subj_id"],
-                        subject_name=subj_name,
-                        predicate=predicate,
-                        object_id=record["obj_id"],
-                        object_name=obj_name,
-                        triple_text=triple_text,
-                        embedding=list(embedding) if embedding else None,
-                        document_title=record["document_title"] or None,
-                    )
+        with retry_session(neo4j_driver, read_only=True) as session:
+            record = session.run(count_cypher, group_ids=group_ids).single()
+            expected = int(record["n"]) if record else 0
+            rows, matrix, present = session.read_embeddings(
+                cypher, key=None, expected_rows=expected, group_ids=group_ids,
+                with_embeddings=with_embeddings,
+            )
+        for i, row in enumerate(rows):
+            subj_name = row["subj_name"] or ""
+            predicate = row["predicate"] or ""
+            obj_name = row["obj_name"] or ""
+            triples.append(
+                Triple(
+                    subject_id=row["subj_id"],
+                    subject_name=subj_name,
+                    predicate=predicate,
+                    object_id=row["obj_id"],
+                    object_name=obj_name,
+                    triple_text=f"{subj_name} {predicate} {obj_name}",
+                    embedding=matrix[i] if present[i] else None,
+                    document_title=row["document_title"] or None,
                 )
+            )
         logger.debug(
             "triple_store_fetched",
             group_ids=group_ids,
             count=len(triples),
-            precomputed=sum(1 for t in triples if t.embedding is not None),
+            precomputed=int(present.sum()),
             with_doc_title=sum(1 for t in triples if t.document_title),
         )
-        return triples
+        return triples, matrix
 
     def search(
         self,
@@ -254,7 +342,8 @@ class TripleEmbeddingStore:
         Returns:
             List of (Triple, similarity_score) tuples, sorted descending.
         """
-        if not self._loaded or self._embeddings_matrix is None:
+        matrix = self._matrix()
+        if not self._loaded or matrix is None:
             return []
 
         # Normalize query
@@ -265,19 +354,66 @@ class TripleEmbeddingStore:
         q /= q_norm
 
         # Cosine similarity = dot product (both vectors normalized)
-        scores = self._embeddings_matrix @ q  # (N,)
-
-        # Top-K
-        k = min(top_k, len(scores))
-        top_indices = np.argpartition(scores, -k)[-k:]
-        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
+        top_indices, top_scores = matrix.top_k(q, top_k)
 
         return [
-            (self._triples[i], float(scores[i]))
-            for i in top_indices
+            (self._triples[i], float(score))
+            for i, score in zip(top_indices, top_scores)
         ]
 
 
+_shared_stores: Dict[Tuple[str, ...], Tuple[str, TripleEmbeddingStore]] = {}
+_shared_locks: Dict[Tuple[str, ...], asyncio.Lock] = {}
+
+
+async def get_shared_triple_store(
+    neo4j_driver: Any,
+    group_id: str,
+    voyage_service: Any,
+    group_ids: Optional[List[str]] = None,
+) -> TripleEmbeddingStore:
+    """Loaded ``TripleEmbeddingStore`` shared by every pipeline in the process.
+
+    Stores are keyed by group set and reused while the group version
+    (``GroupMeta`` lifecycle timestamps) is unchanged; a new version loads a
+    fresh store and releases the old one.  ``TRIPLE_STORE_SHARED=0`` (or a
+    failed version read) loads a private store as before.
+    """
+    from .bm25_index import read_group_version
+
+    effective_group_ids = group_ids or build_group_ids(group_id)
+    shared = os.getenv("TRIPLE_STORE_SHARED", "1").strip().lower() in {"1", "true", "yes"}
+    version: Optional[str] = None
+    if shared:
+        try:
+            version = await asyncio.to_thread(read_group_version, neo4j_driver, effective_group_ids)
+        except Exception as e:
+            logger.warning("triple_store_version_read_failed", group_id=group_id, error=str(e))
+
+    if version is None:
+        store = TripleEmbeddingStore()
+        await store.load(neo4j_driver, group_id, voyage_service, group_ids=effective_group_ids)
+        return store
+
+    key = tuple(sorted(set(effective_group_ids)))
+    entry = _shared_stores.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    lock = _shared_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        entry = _shared_stores.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        store = TripleEmbeddingStore()
+        await store.load(
+            neo4j_driver, group_id, voyage_service,
+            group_ids=effective_group_ids, version=version,
+        )
+        _shared_stores[key] = (version, store)
+        return store
+
+
 def mmr_diversity_filter(
     candidate_triples: List[Tuple[Triple, float]],
     max_facts: int | None = None,
@@ -311,6 +447,17 @@ def mmr_diversity_filter(
     if lambda_param is None:
         lambda_param = float(os.getenv("ROUTE7_MMR_LAMBDA", "0.7"))
 
+    # Optionally collapse near-identical triple texts before MMR (candidates
+    # are sorted desc, so the best-scored phrasing survives).  Opt-in with
+    # ROUTE7_MMR_DEDUP=1 until its effect on retrieval has been evaluated.
+    candidates_before_dedup = len(candidate_triples)
+    if os.getenv("ROUTE7_MMR_DEDUP", "0").strip().lower() in {"1", "true", "yes"}:
+        kept = dedup_indices(
+            [t.triple_text for t, _ in candidate_triples],
+            float(os.getenv("SEMANTIC_DEDUP_THRESHOLD", "0.92")),
+        )
+        candidate_triples = [candidate_triples[i] for i in kept]
+
     # Build embedding matrix from candidate triples
     embeddings = []
     for triple, _ in candidate_triples:
@@ -320,10 +467,7 @@ def mmr_diversity_filter(
             # Fallback: zero vector (triple will be scored purely on relevance)
             embeddings.append([0.0] * 2048)
 
-    emb_matrix = np.array(embeddings, dtype=np.float32)
-    norms = np.linalg.norm(emb_matrix, axis=1, keepdims=True)
-    norms = np.where(norms == 0, 1.0, norms)
-    emb_matrix = emb_matrix / norms
+    emb_matrix = unit_rows(embeddings)
 
     # Normalize relevance scores to [0, 1]
     scores = np.array([s for _, s in candidate_triples], dtype=np.float32)
@@ -333,41 +477,33 @@ def mmr_diversity_filter(
     else:
         norm_scores = np.ones_like(scores)
 
-    # Greedy MMR selection
+    # Greedy MMR selection.  max_sim[i] is the running max cosine similarity
+    # of candidate i to the selected set, updated with one matrix-vector
+    # product per pick.  It is 0 only until the first pick, then starts from
+    # that pick's (possibly negative) similarities.
     n = len(candidate_triples)
     selected_indices: List[int] = []
-    remaining = set(range(n))
+    available = np.ones(n, dtype=bool)
+    max_sim = np.zeros(n, dtype=np.float32)
 
     for _ in range(min(max_facts, n)):
-        best_idx = -1
-        best_mmr = -float("inf")
-
-        for idx in remaining:
-            relevance = norm_scores[idx]
-
-            if selected_indices:
-                # Max cosine similarity to any already-selected triple
-                sims = emb_matrix[idx] @ emb_matrix[selected_indices].T
-                max_sim = float(np.max(sims))
-            else:
-                max_sim = 0.0
-
-            mmr = lambda_param * relevance - (1 - lambda_param) * max_sim
-            if mmr > best_mmr:
-                best_mmr = mmr
-                best_idx = idx
-
-        if best_idx < 0:
+        mmr = lambda_param * norm_scores - (1 - lambda_param) * max_sim
+        mmr = np.where(available, mmr, -np.inf)
+        best_idx = int(np.argmax(mmr))
+        if not available[best_idx]:
             break
 
         selected_indices.append(best_idx)
-        remaining.discard(best_idx)
+        available[best_idx] = False
+        sims = emb_matrix @ emb_matrix[best_idx]
+        max_sim = sims if len(selected_indices) == 1 else np.maximum(max_sim, sims)
 
     result = [candidate_triples[i] for i in selected_indices]
 
     logger.info(
         "mmr_diversity_filter",
-        candidates=len(candidate_triples),
+        candidates=candidates_before_dedup,
+        near_duplicates_removed=candidates_before_dedup - len(candidate_triples),
         selected=len(result),
         max_facts=max_facts,
         lambda_param=lambda_param,
@@ -12,16 +12,22 @@ to the main HybridPipeline and access its services through that reference.
 from __future__ import annotations
 
 import json
+import os
 import re
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import structlog
 
 from src.core.config import settings
+from src.worker.services.schema_registry import get_schema_registry
+from ..services.graph_read_repository import GraphReadRepository
 from ..services.neo4j_retry import retry_session
+from ..pipeline.sentence_index import SentenceIndex, word_set
+from ..utils.geometry import expand_sentence_geometry
+from ..utils.near_duplicates import NearDuplicateDetector
 
 if TYPE_CHECKING:
     from ..orchestrator import HybridPipeline
@@ -189,6 +195,19 @@ class BaseRouteHandler:
         self._executor = pipeline._executor
         self._async_neo4j = pipeline._async_neo4j
 
+    @property
+    def graph_reads(self) -> GraphReadRepository:
+        """Read-only Cypher access, native async once the pipeline is connected."""
+        repo = self.__dict__.get("_graph_reads")
+        if repo is None:
+            repo = GraphReadRepository(
+                driver=self.neo4j_driver,
+                async_neo4j=getattr(self, "_async_neo4j", None),
+                executor=getattr(self, "_executor", None),
+            )
+            self._graph_reads = repo
+        return repo
+
     def _resolve_folder_id(self, folder_id: Optional[str] = None) -> Optional[str]:
         """Return per-query folder_id if provided, else fall back to pipeline default."""
         return folder_id if folder_id is not None else self.folder_id
@@ -219,16 +238,7 @@ class BaseRouteHandler:
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-            group_ids = self.group_ids
-
-            def _run():
-                with retry_session(driver, read_only=True) as session:
-                    result = session.run(query, group_ids=group_ids, doc_ids=doc_ids)
-                    return list(result)
-
-            records = await loop.run_in_executor(None, _run)
+            records = await self.graph_reads.fetch(query, group_ids=self.group_ids, doc_ids=doc_ids)
 
             spans_map: Dict[str, List[Dict]] = {}
             for record in records:
@@ -424,11 +434,14 @@ class BaseRouteHandler:
         driver = self.neo4j_driver  # Local ref for closure
 
         def _run_sync():
-            with retry_session(driver) as session:
-                session.run(
-                    "CREATE FULLTEXT INDEX sentence_fulltext IF NOT EXISTS "
-                    "FOR (s:Sentence) ON EACH [s.text]"
-                )
+            # Answered from the process-wide SHOW INDEXES snapshot; DDL only
+            # runs when the index is genuinely missing.
+            get_schema_registry().ensure_index(
+                driver,
+                "sentence_fulltext",
+                "CREATE FULLTEXT INDEX sentence_fulltext IF NOT EXISTS "
+                "FOR (s:Sentence) ON EACH [s.text]",
+            )
 
         try:
             loop = asyncio.get_running_loop()
@@ -483,122 +496,114 @@ class BaseRouteHandler:
 
         from src.worker.hybrid_v2.orchestrator import get_vector_index_name
         vector_index = get_vector_index_name()
-        driver = self.neo4j_driver
 
-        def _run_sync():
-            # Build folder filter clause - applied after document join
-            folder_filter = ""
-            if folder_id:
-                folder_filter = (
-                    "\n            WITH node, rrfScore, hasBM25, hasVector, d, top_k"
-                    "\n            WHERE d IS NULL OR EXISTS { MATCH (d)-[:IN_FOLDER]->(f:Folder {id: $folder_id}) WHERE f.group_id IN $group_ids }"
-                )
+        # Build folder filter clause - applied after document join
+        folder_filter = ""
+        if folder_id:
+            folder_filter = (
+                "\n            WITH node, rrfScore, hasBM25, hasVector, d, top_k"
+                "\n            WHERE d IS NULL OR EXISTS { MATCH (d)-[:IN_FOLDER]->(f:Folder {id: $folder_id}) WHERE f.group_id IN $group_ids }"
+            )
 
-            cypher = f"""
-            CYPHER 25
-            WITH $bm25_query AS bm25_query, $group_ids AS group_ids,
-                 $group_id AS group_id, $global_group_id AS global_group_id,
-                 $bm25_k AS bm25_k, $embedding AS embedding,
-                 $vector_k AS vector_k, $rrf_k AS rrf_k, $top_k AS top_k
-
-            CALL (bm25_query, group_ids) {{
-                CALL db.index.fulltext.queryNodes('sentence_fulltext', bm25_query)
-                YIELD node, score
-                WHERE node.group_id IN group_ids
-                WITH node, score ORDER BY score DESC LIMIT $bm25_k
-                WITH collect(node) AS nodes
-                UNWIND range(0, size(nodes)-1) AS i
-                RETURN nodes[i] AS node, (i + 1) AS rank
-            }}
-            WITH collect({{node: node, rank: rank}}) AS bm25List,
-                 embedding, group_id, global_group_id, group_ids, vector_k, rrf_k, top_k
-
-            CALL (embedding, group_id, global_group_id) {{
-                MATCH (node:Sentence)
-                SEARCH node IN (VECTOR INDEX {vector_index} FOR embedding WHERE node.group_id = group_id LIMIT $vector_k)
-                SCORE AS score
-                RETURN node, score
-                UNION ALL
-                MATCH (node:Sentence)
-                SEARCH node IN (VECTOR INDEX {vector_index} FOR embedding WHERE node.group_id = global_group_id LIMIT $vector_k)
-                SCORE AS score
-                RETURN node, score
-            }}
-            WITH bm25List, group_ids, rrf_k, top_k, node, score
-            ORDER BY score DESC LIMIT $vector_k
-            WITH bm25List, collect(node) AS nodes, group_ids, rrf_k, top_k
+        cypher = f"""
+        CYPHER 25
+        WITH $bm25_query AS bm25_query, $group_ids AS group_ids,
+             $group_id AS group_id, $global_group_id AS global_group_id,
+             $bm25_k AS bm25_k, $embedding AS embedding,
+             $vector_k AS vector_k, $rrf_k AS rrf_k, $top_k AS top_k
+
+        CALL (bm25_query, group_ids) {{
+            CALL db.index.fulltext.queryNodes('sentence_fulltext', bm25_query)
+            YIELD node, score
+            WHERE node.group_id IN group_ids
+            WITH node, score ORDER BY score DESC LIMIT $bm25_k
+            WITH collect(node) AS nodes
             UNWIND range(0, size(nodes)-1) AS i
-            WITH bm25List, nodes[i] AS node, (i + 1) AS rank, group_ids, rrf_k, top_k
-            WITH bm25List, collect({{node: node, rank: rank}}) AS vectorList,
-                 group_ids, rrf_k, top_k
-
-            WITH bm25List, vectorList, group_ids, rrf_k, top_k,
-                 [x IN bm25List | x.node] + [y IN vectorList | y.node] AS allNodes
-            UNWIND allNodes AS node
-            WITH DISTINCT node, bm25List, vectorList, group_ids, rrf_k, top_k
-            WITH node, group_ids, rrf_k, top_k,
-                 [b IN bm25List WHERE b.node = node | b.rank][0] AS bm25Rank,
-                 [v IN vectorList WHERE v.node = node | v.rank][0] AS vectorRank
-            WITH node, group_ids, top_k,
-                 (CASE WHEN bm25Rank IS NULL THEN 0.0
-                       ELSE 1.0 / (rrf_k + bm25Rank) END) +
-                 (CASE WHEN vectorRank IS NULL THEN 0.0
-                       ELSE 1.0 / (rrf_k + vectorRank) END) AS rrfScore,
-                 bm25Rank IS NOT NULL AS hasBM25,
-                 vectorRank IS NOT NULL AS hasVector
-
-            OPTIONAL MATCH (node)-[:IN_DOCUMENT]->(d:Document)
-            WHERE d.group_id IN group_ids
-            {folder_filter}
-            OPTIONAL MATCH (node)-[:IN_SECTION]->(s:Section)
-
-            RETURN node.id AS id, node.text AS text,
-                   node.chunk_index AS chunk_index,
-                   d.id AS document_id, d.title AS document_title,
-                   d.source AS document_source,
-                   s.id AS section_id, s.path_key AS section_path_key,
-                   rrfScore AS score, hasBM25, hasVector
-            ORDER BY rrfScore DESC
-            LIMIT $top_k
-            """
-
-            rows = []
-            try:
-                with retry_session(driver, read_only=True) as session:
-                    params = dict(
-                        bm25_query=bm25_query,
-                        embedding=embedding,
-                        group_id=group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=group_ids,
-                        vector_k=vector_k,
-                        bm25_k=bm25_k,
-                        rrf_k=rrf_k,
-                        top_k=top_k,
-                    )
-                    if folder_id:
-                        params["folder_id"] = folder_id
-                    result = session.run(cypher, **params)
-                    for r in result:
-                        chunk = {
-                            "id": r["id"],
-                            "text": r["text"],
-                            "chunk_index": r.get("chunk_index", 0),
-                            "document_id": r.get("document_id", ""),
-                            "document_title": r.get("document_title", ""),
-                            "document_source": r.get("document_source", ""),
-                            "section_id": r.get("section_id", ""),
-                            "section_path_key": r.get("section_path_key", ""),
-                        }
-                        is_anchor = bool(r.get("hasBM25")) and bool(r.get("hasVector"))
-                        rows.append((chunk, float(r.get("score") or 0.0), is_anchor))
-            except Exception as e:
-                logger.error("cypher25_hybrid_rrf_failed", error=str(e), error_type=type(e).__name__)
-
-            return rows
+            RETURN nodes[i] AS node, (i + 1) AS rank
+        }}
+        WITH collect({{node: node, rank: rank}}) AS bm25List,
+             embedding, group_id, global_group_id, group_ids, vector_k, rrf_k, top_k
+
+        CALL (embedding, group_id, global_group_id) {{
+            MATCH (node:Sentence)
+            SEARCH node IN (VECTOR INDEX {vector_index} FOR embedding WHERE node.group_id = group_id LIMIT $vector_k)
+            SCORE AS score
+            RETURN node, score
+            UNION ALL
+            MATCH (node:Sentence)
+            SEARCH node IN (VECTOR INDEX {vector_index} FOR embedding WHERE node.group_id = global_group_id LIMIT $vector_k)
+            SCORE AS score
+            RETURN node, score
+        }}
+        WITH bm25List, group_ids, rrf_k, top_k, node, score
+        ORDER BY score DESC LIMIT $vector_k
+        WITH bm25List, collect(node) AS nodes, group_ids, rrf_k, top_k
+        UNWIND range(0, size(nodes)-1) AS i
+        WITH bm25List, nodes[i] AS node, (i + 1) AS rank, group_ids, rrf_k, top_k
+        WITH bm25List, collect({{node: node, rank: rank}}) AS vectorList,
+             group_ids, rrf_k, top_k
+
+        WITH bm25List, vectorList, group_ids, rrf_k, top_k,
+             [x IN bm25List | x.node] + [y IN vectorList | y.node] AS allNodes
+        UNWIND allNodes AS node
+        WITH DISTINCT node, bm25List, vectorList, group_ids, rrf_k, top_k
+        WITH node, group_ids, rrf_k, top_k,
+             [b IN bm25List WHERE b.node = node | b.rank][0] AS bm25Rank,
+             [v IN vectorList WHERE v.node = node | v.rank][0] AS vectorRank
+        WITH node, group_ids, top_k,
+             (CASE WHEN bm25Rank IS NULL THEN 0.0
+                   ELSE 1.0 / (rrf_k + bm25Rank) END) +
+             (CASE WHEN vectorRank IS NULL THEN 0.0
+                   ELSE 1.0 / (rrf_k + vectorRank) END) AS rrfScore,
+             bm25Rank IS NOT NULL AS hasBM25,
+             vectorRank IS NOT NULL AS hasVector
+
+        OPTIONAL MATCH (node)-[:IN_DOCUMENT]->(d:Document)
+        WHERE d.group_id IN group_ids
+        {folder_filter}
+        OPTIONAL MATCH (node)-[:IN_SECTION]->(s:Section)
+
+        RETURN node.id AS id, node.text AS text,
+               node.chunk_index AS chunk_index,
+               d.id AS document_id, d.title AS document_title,
+               d.source AS document_source,
+               s.id AS section_id, s.path_key AS section_path_key,
+               rrfScore AS score, hasBM25, hasVector
+        ORDER BY rrfScore DESC
+        LIMIT $top_k
+        """
 
-        loop = asyncio.get_running_loop()
-        results = await loop.run_in_executor(self._executor, _run_sync)
+        results = []
+        try:
+            params = dict(
+                bm25_query=bm25_query,
+                embedding=embedding,
+                group_id=group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=group_ids,
+                vector_k=vector_k,
+                bm25_k=bm25_k,
+                rrf_k=rrf_k,
+                top_k=top_k,
+            )
+            if folder_id:
+                params["folder_id"] = folder_id
+            result = await self.graph_reads.fetch(cypher, **params)
+            for r in result:
+                chunk = {
+                    "id": r["id"],
+                    "text": r["text"],
+                    "chunk_index": r.get("chunk_index", 0),
+                    "document_id": r.get("document_id", ""),
+                    "document_title": r.get("document_title", ""),
+                    "document_source": r.get("document_source", ""),
+                    "section_id": r.get("section_id", ""),
+                    "section_path_key": r.get("section_path_key", ""),
+                }
+                is_anchor = bool(r.get("hasBM25")) and bool(r.get("hasVector"))
+                results.append((chunk, float(r.get("score") or 0.0), is_anchor))
+        except Exception as e:
+            logger.error("cypher25_hybrid_rrf_failed", error=str(e), error_type=type(e).__name__)
 
         logger.info(
             "cypher25_hybrid_rrf_complete",
@@ -632,7 +637,6 @@ class BaseRouteHandler:
         group_id = self.group_id
         group_ids = self.group_ids
         folder_id = self._resolve_folder_id(folder_id)
-        driver = self.neo4j_driver
 
         if use_phrase_boost:
             search_query = self._build_phrase_aware_fulltext_query(query_text)
@@ -642,63 +646,56 @@ class BaseRouteHandler:
         if not search_query:
             return []
 
-        def _run_sync():
-            # Build folder filter clause
-            folder_filter = ""
-            if folder_id:
-                folder_filter = "AND EXISTS { MATCH (d)-[:IN_FOLDER]->(f:Folder {id: $folder_id}) WHERE f.group_id IN $group_ids }"
-
-            cypher = f"""
-            CALL db.index.fulltext.queryNodes('sentence_fulltext', $search_query)
-            YIELD node AS chunk, score AS bm25_score
-            WHERE chunk.group_id IN $group_ids
-
-            OPTIONAL MATCH (chunk)-[:IN_DOCUMENT]->(d:Document)
-            WHERE d.group_id IN $group_ids
-            WITH chunk, d, bm25_score
-            WHERE d IS NULL OR d IS NOT NULL {folder_filter}
-            OPTIONAL MATCH (chunk)-[:IN_SECTION]->(s:Section)
-
-            RETURN chunk.id AS id, chunk.text AS text,
-                   chunk.chunk_index AS chunk_index,
-                   d.id AS document_id, d.title AS document_title,
-                   d.source AS document_source,
-                   s.id AS section_id, s.path_key AS section_path_key,
-                   bm25_score AS score, true AS is_anchor
-            ORDER BY score DESC
-            LIMIT $top_k
-            """
-
-            rows = []
-            try:
-                with retry_session(driver, read_only=True) as session:
-                    params = dict(
-                        search_query=search_query,
-                        group_ids=group_ids,
-                        top_k=top_k,
-                    )
-                    if folder_id:
-                        params["folder_id"] = folder_id
-                    result = session.run(cypher, **params)
-                    for r in result:
-                        chunk = {
-                            "id": r["id"],
-                            "text": r["text"],
-                            "chunk_index": r.get("chunk_index", 0),
-                            "document_id": r.get("document_id", ""),
-                            "document_title": r.get("document_title", ""),
-                            "document_source": r.get("document_source", ""),
-                            "section_id": r.get("section_id", ""),
-                            "section_path_key": r.get("section_path_key", ""),
-                        }
-                        rows.append((chunk, float(r.get("score") or 0.0), True))
-            except Exception as e:
-                logger.error("graph_native_bm25_query_failed", error=str(e))
-
-            return rows
+        # Build folder filter clause
+        folder_filter = ""
+        if folder_id:
+            folder_filter = "AND EXISTS { MATCH (d)-[:IN_FOLDER]->(f:Folder {id: $folder_id}) WHERE f.group_id IN $group_ids }"
+
+        cypher = f"""
+        CALL db.index.fulltext.queryNodes('sentence_fulltext', $search_query)
+        YIELD node AS chunk, score AS bm25_score
+        WHERE chunk.group_id IN $group_ids
+
+        OPTIONAL MATCH (chunk)-[:IN_DOCUMENT]->(d:Document)
+        WHERE d.group_id IN $group_ids
+        WITH chunk, d, bm25_score
+        WHERE d IS NULL OR d IS NOT NULL {folder_filter}
+        OPTIONAL MATCH (chunk)-[:IN_SECTION]->(s:Section)
+
+        RETURN chunk.id AS id, chunk.text AS text,
+               chunk.chunk_index AS chunk_index,
+               d.id AS document_id, d.title AS document_title,
+               d.source AS document_source,
+               s.id AS section_id, s.path_key AS section_path_key,
+               bm25_score AS score, true AS is_anchor
+        ORDER BY score DESC
+        LIMIT $top_k
+        """
 
-        loop = asyncio.get_running_loop()
-        results = await loop.run_in_executor(self._executor, _run_sync)
+        results = []
+        try:
+            params = dict(
+                search_query=search_query,
+                group_ids=group_ids,
+                top_k=top_k,
+            )
+            if folder_id:
+                params["folder_id"] = folder_id
+            result = await self.graph_reads.fetch(cypher, **params)
+            for r in result:
+                chunk = {
+                    "id": r["id"],
+                    "text": r["text"],
+                    "chunk_index": r.get("chunk_index", 0),
+                    "document_id": r.get("document_id", ""),
+                    "document_title": r.get("document_title", ""),
+                    "document_source": r.get("document_source", ""),
+                    "section_id": r.get("section_id", ""),
+                    "section_path_key": r.get("section_path_key", ""),
+                }
+                results.append((chunk, float(r.get("score") or 0.0), True))
+        except Exception as e:
+            logger.error("graph_native_bm25_query_failed", error=str(e))
 
         logger.info(
             "pure_bm25_phrase_search_complete",
@@ -755,89 +752,83 @@ class BaseRouteHandler:
         group_id = self.group_id
         group_ids = self.group_ids
         folder_id = self._resolve_folder_id(folder_id)
-        driver = self.neo4j_driver  # Local ref for closure
         
-        def _run_sync():
-            # Build folder filter clause
-            folder_filter = ""
+        # Build folder filter clause
+        folder_filter = ""
+        if folder_id:
+            folder_filter = "AND EXISTS { MATCH (d)-[:IN_FOLDER]->(f:Folder {id: $folder_id}) WHERE f.group_id IN $group_ids }"
+
+        cypher = f"""
+        CYPHER 25
+        MATCH (e:Entity)
+        WHERE e.group_id IN $group_ids
+          AND (e.name =~ $pattern
+           OR any(a IN coalesce(e.aliases, []) WHERE a =~ $pattern))
+
+        // Use Sentence MENTIONS for entity graph traversal
+        MATCH (t:Sentence)-[:MENTIONS]->(e)
+        WHERE t.group_id IN $group_ids
+        OPTIONAL MATCH (t)-[:IN_DOCUMENT]->(d:Document)
+        WHERE d.group_id IN $group_ids
+        WITH t, d, e
+        WHERE d IS NULL OR d IS NOT NULL {folder_filter}
+        OPTIONAL MATCH (t)-[:IN_SECTION]->(s:Section)
+
+        WITH t, d, s, count(DISTINCT e) AS entityMatches
+
+        RETURN t.id AS id,
+               t.text AS text,
+               coalesce(t.chunk_index, t.index_in_doc, 0) AS chunk_index,
+               d.id AS document_id,
+               d.title AS document_title,
+               d.source AS document_source,
+               s.id AS section_id,
+               s.path_key AS section_path_key,
+               entityMatches AS score
+        ORDER BY entityMatches DESC, t.chunk_index ASC
+        LIMIT $top_k
+        """
+
+        rows = []
+        try:
+            regex_pattern = f'(?i).*({term_pattern}).*'
+
+            params = {
+                "group_ids": group_ids,
+                "pattern": regex_pattern,
+                "top_k": top_k,
+            }
             if folder_id:
-                folder_filter = "AND EXISTS { MATCH (d)-[:IN_FOLDER]->(f:Folder {id: $folder_id}) WHERE f.group_id IN $group_ids }"
-            
-            cypher = f"""
-            CYPHER 25
-            MATCH (e:Entity)
-            WHERE e.group_id IN $group_ids
-              AND (e.name =~ $pattern
-               OR any(a IN coalesce(e.aliases, []) WHERE a =~ $pattern))
-            
-            // Use Sentence MENTIONS for entity graph traversal
-            MATCH (t:Sentence)-[:MENTIONS]->(e)
-            WHERE t.group_id IN $group_ids
-            OPTIONAL MATCH (t)-[:IN_DOCUMENT]->(d:Document)
-            WHERE d.group_id IN $group_ids
-            WITH t, d, e
-            WHERE d IS NULL OR d IS NOT NULL {folder_filter}
-            OPTIONAL MATCH (t)-[:IN_SECTION]->(s:Section)
-            
-            WITH t, d, s, count(DISTINCT e) AS entityMatches
-            
-            RETURN t.id AS id,
-                   t.text AS text,
-                   coalesce(t.chunk_index, t.index_in_doc, 0) AS chunk_index,
-                   d.id AS document_id,
-                   d.title AS document_title,
-                   d.source AS document_source,
-                   s.id AS section_id,
-                   s.path_key AS section_path_key,
-                   entityMatches AS score
-            ORDER BY entityMatches DESC, t.chunk_index ASC
-            LIMIT $top_k
-            """
-            
-            rows = []
-            try:
-                with retry_session(driver, read_only=True) as session:
-                    regex_pattern = f'(?i).*({term_pattern}).*'
-                    
-                    params = {
-                        "group_ids": group_ids,
-                        "pattern": regex_pattern,
-                        "top_k": top_k,
-                    }
-                    if folder_id:
-                        params["folder_id"] = folder_id
-                    
-                    result = session.run(cypher, **params)
-                    
-                    for r in result:
-                        chunk = {
-                            "id": r["id"],
-                            "text": r["text"],
-                            "chunk_index": r.get("chunk_index", 0),
-                            "document_id": r.get("document_id", ""),
-                            "document_title": r.get("document_title", ""),
-                            "document_source": r.get("document_source", ""),
-                            "section_id": r.get("section_id", ""),
-                            "section_path_key": r.get("section_path_key", ""),
-                        }
-                        normalized_score = float(r.get("score", 0)) / top_k
-                        rows.append((chunk, normalized_score))
-                        
-                    logger.info("entity_graph_search_complete",
-                               query=query[:50],
-                               search_terms=search_terms[:5],
-                               num_results=len(rows),
-                               folder_id=folder_id)
-                               
-            except Exception as e:
-                logger.error("entity_graph_search_failed",
-                            error=str(e),
-                            query=query[:50])
-            
-            return rows
-        
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, _run_sync)
+                params["folder_id"] = folder_id
+
+            result = await self.graph_reads.fetch(cypher, **params)
+
+            for r in result:
+                chunk = {
+                    "id": r["id"],
+                    "text": r["text"],
+                    "chunk_index": r.get("chunk_index", 0),
+                    "document_id": r.get("document_id", ""),
+                    "document_title": r.get("document_title", ""),
+                    "document_source": r.get("document_source", ""),
+                    "section_id": r.get("section_id", ""),
+                    "section_path_key": r.get("section_path_key", ""),
+                }
+                normalized_score = float(r.get("score", 0)) / top_k
+                rows.append((chunk, normalized_score))
+
+            logger.info("entity_graph_search_complete",
+                       query=query[:50],
+                       search_terms=search_terms[:5],
+                       num_results=len(rows),
+                       folder_id=folder_id)
+
+        except Exception as e:
+            logger.error("entity_graph_search_failed",
+                        error=str(e),
+                        query=query[:50])
+
+        return rows
 
     # =========================================================================
     # Citation Helpers
@@ -885,11 +876,105 @@ class BaseRouteHandler:
         self._enrich_citations_with_geometry(citations)
         return citations
 
+    # Geometry comes from the compact ``geometry`` property (see
+    # utils/geometry.py); the full metadata blob is only returned for nodes
+    # indexed before that property existed.
+    _GEOMETRY_QUERY = (
+        "UNWIND $ids AS tid "
+        "MATCH (s:Sentence {id: tid}) "
+        "WHERE s.group_id IN $group_ids "
+        "RETURN s.id AS id, s.text AS text, s.geometry AS geometry, "
+        "CASE WHEN s.geometry IS NULL THEN s.metadata END AS metadata"
+    )
+
+    @staticmethod
+    def _sentence_near_duplicates() -> Optional[NearDuplicateDetector]:
+        """Detector for the same-document near-duplicate rule of ``_denoise_sentences``.
+
+        Off unless ``DENOISE_SENTENCE_DEDUP=1``.  The first copy in input
+        order is kept; callers that denoise before reranking keep the
+        earliest-retrieved copy, not necessarily the best-scored one.
+        """
+        if os.getenv("DENOISE_SENTENCE_DEDUP", "0").strip().lower() not in {"1", "true", "yes"}:
+            return None
+        return NearDuplicateDetector(threshold=float(os.getenv("SEMANTIC_DEDUP_THRESHOLD", "0.92")))
+
+    @staticmethod
+    def _geometry_sentence_ids(citations: List[Citation]) -> List[str]:
+        """Sentence IDs worth enriching (community reports have no geometry)."""
+        return list(dict.fromkeys(
+            c.sentence_id for c in citations
+            if c.sentence_id and not c.sentence_id.startswith("community_")
+        ))
+
+    @staticmethod
+    def _geometry_from_records(records: List[Any]) -> Dict[str, Dict[str, Any]]:
+        geometry_map: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            meta = expand_sentence_geometry(record["geometry"], record["text"])
+            if not meta and record["geometry"] is None:
+                raw = record["metadata"]
+                if isinstance(raw, str):
+                    try:
+                        meta = json.loads(raw)
+                    except (json.JSONDecodeError, TypeError):
+                        meta = {}
+                elif isinstance(raw, dict):
+                    meta = raw
+            if meta:
+                geometry_map[record["id"]] = meta
+        return geometry_map
+
+    async def _fetch_citation_geometry(self, sentence_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Geometry by sentence id via the shared graph reader (never blocks the loop)."""
+        if not sentence_ids or not self.neo4j_driver:
+            return {}
+        try:
+            records = await self.graph_reads.fetch(
+                self._GEOMETRY_QUERY, ids=sentence_ids, group_ids=self.group_ids,
+            )
+        except Exception as e:
+            logger.warning("citation_geometry_enrichment_failed", error=str(e))
+            return {}
+        return self._geometry_from_records(records)
+
+    def _start_geometry_prefetch(
+        self, sentence_ids: List[str]
+    ) -> Optional["asyncio.Task[Dict[str, Dict[str, Any]]]"]:
+        """Start fetching geometry for candidate ids so it overlaps synthesis.
+
+        Pass the task to ``_enrich_citations_with_geometry_async``; ids that
+        end up cited but were not prefetched are fetched then.
+        """
+        ids = [i for i in dict.fromkeys(sentence_ids) if i and not i.startswith("community_")]
+        if not ids or not self.neo4j_driver:
+            return None
+        return asyncio.create_task(self._fetch_citation_geometry(ids))
+
+    async def _enrich_citations_with_geometry_async(
+        self,
+        citations: List[Citation],
+        prefetch: Optional["asyncio.Task[Dict[str, Dict[str, Any]]]"] = None,
+    ) -> None:
+        """Async form of ``_enrich_citations_with_geometry`` used by the routes."""
+        geometry_map: Dict[str, Dict[str, Any]] = {}
+        if prefetch is not None:
+            try:
+                geometry_map = dict(await prefetch)
+            except Exception as e:
+                logger.warning("citation_geometry_prefetch_failed", error=str(e))
+        if not citations:
+            return
+        missing = [i for i in self._geometry_sentence_ids(citations) if i not in geometry_map]
+        if missing:
+            geometry_map.update(await self._fetch_citation_geometry(missing))
+        self._apply_citation_geometry(citations, geometry_map)
+
     def _enrich_citations_with_geometry(self, citations: List[Citation]) -> None:
-        """Enrich citations with polygon geometry from Neo4j chunk metadata.
+        """Enrich citations with polygon geometry from Neo4j Sentence nodes.
 
-        After citations are built (typically 5-15 items), fetches the metadata
-        JSON blob for each cited Sentence in a single batch query. Attaches
+        After citations are built (typically 5-15 items), fetches the geometry
+        for each cited Sentence in a single batch query. Attaches
         ``page_number``, ``sentences`` (polygon coords), and
         ``page_dimensions`` so the frontend can render click-to-highlight
         overlays on source PDFs.
@@ -897,54 +982,41 @@ class BaseRouteHandler:
         Community-report citations (``community_*``) are skipped since they
         have no document geometry.  Sentence-level citations
         (``*_sent_N``) are mapped to their parent Sentence.
+
+        Synchronous; async routes use ``_enrich_citations_with_geometry_async``.
         """
         if not citations or not self.neo4j_driver:
             return
 
-        # Collect sentence IDs, skipping community reports
-        sentence_ids_to_enrich = [
-            c.sentence_id for c in citations
-            if c.sentence_id and not c.sentence_id.startswith("community_")
-        ]
+        sentence_ids_to_enrich = self._geometry_sentence_ids(citations)
         if not sentence_ids_to_enrich:
             return
 
-        # Batch fetch metadata from Sentence nodes
-        query = (
-            "UNWIND $ids AS tid "
-            "MATCH (s:Sentence {id: tid}) "
-            "WHERE s.group_id IN $group_ids "
-            "RETURN s.id AS id, s.metadata AS metadata"
-        )
-        metadata_map: Dict[str, Dict[str, Any]] = {}
         try:
             with retry_session(self.neo4j_driver, read_only=True) as session:
-                result = session.run(query, ids=sentence_ids_to_enrich, group_ids=self.group_ids)
-                for record in result:
-                    raw = record["metadata"]
-                    meta: Dict[str, Any] = {}
-                    if isinstance(raw, str):
-                        try:
-                            meta = json.loads(raw)
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                    elif isinstance(raw, dict):
-                        meta = raw
-                    if meta:
-                        metadata_map[record["id"]] = meta
+                result = session.run(
+                    self._GEOMETRY_QUERY, ids=sentence_ids_to_enrich, group_ids=self.group_ids,
+                )
+                geometry_map = self._geometry_from_records(list(result))
         except Exception as e:
             logger.warning("citation_geometry_enrichment_failed", error=str(e))
             return
 
-        if not metadata_map:
+        self._apply_citation_geometry(citations, geometry_map)
+
+    @staticmethod
+    def _apply_citation_geometry(
+        citations: List[Citation], geometry_map: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Attach fetched geometry to citations without overwriting set fields."""
+        if not geometry_map:
             return
 
-        # Attach geometry to each citation
         for citation in citations:
             cid = citation.sentence_id
             if not cid or cid.startswith("community_"):
                 continue
-            meta = metadata_map.get(cid, {})
+            meta = geometry_map.get(cid, {})
             if not meta:
                 continue
 
@@ -963,13 +1035,14 @@ class BaseRouteHandler:
     def _match_sentence_to_claim(
         chunk_index: int,
         response: str,
-        sentence_map: Dict[str, Dict[str, Any]],
+        sentence_map: Union[SentenceIndex, Dict[str, Dict[str, Any]]],
     ) -> Optional[Dict[str, Any]]:
         """Find the sentence within a chunk that best matches the LLM's claim.
 
         Extracts ~150 chars of text surrounding the ``[N]`` marker in the
         response, then computes word-overlap (Jaccard) against each sentence
-        entry ``[Na]``, ``[Nb]``, … in *sentence_map*.
+        entry ``[Na]``, ``[Nb]``, … of chunk ``N``.  *sentence_map* is either
+        the raw sentence citation map or a prebuilt :class:`SentenceIndex`.
 
         Returns the best-matching entry dict, or ``None`` if no match found.
         """
@@ -982,47 +1055,17 @@ class BaseRouteHandler:
         # Window: 100 chars before marker, 50 chars after
         start = max(0, pos - 100)
         end = min(len(response), pos + len(marker) + 50)
-        claim_text = response[start:end]
-
-        # Tokenize claim into word set
-        claim_words = set(re.findall(r"[a-z0-9]+", claim_text.lower()))
-        if not claim_words:
-            return None
-
-        # Find all sentence entries for this chunk: [Na], [Nb], [Nc] ...
-        best_match: Optional[Dict[str, Any]] = None
-        best_score = 0.0
-        for key, entry in sentence_map.items():
-            # Keys are like "[1a]", "[1b]" — check if the number matches
-            m = re.match(r"^\[(\d+)[a-z]\]$", key)
-            if not m or int(m.group(1)) != chunk_index:
-                continue
-
-            sent_text = entry.get("sentence_text", "")
-            if not sent_text:
-                continue
-
-            sent_words = set(re.findall(r"[a-z0-9]+", sent_text.lower()))
-            if not sent_words:
-                continue
+        claim_words = word_set(response[start:end])
 
-            # Jaccard similarity
-            inter = len(claim_words & sent_words)
-            union = len(claim_words | sent_words)
-            score = inter / union if union > 0 else 0.0
-
-            if score > best_score:
-                best_score = score
-                best_match = entry
-
-        # Require minimum overlap to avoid false matches
-        return best_match if best_score >= 0.15 else None
+        # Require minimum overlap (Jaccard >= 0.15) to avoid false matches
+        return SentenceIndex.of(sentence_map).best_match(chunk_index, claim_words)
 
     def _narrow_citations_to_sentences(
         self,
         citations: List[Citation],
         response: str,
         sentence_map: Dict[str, Dict[str, Any]],
+        sentence_index: Optional[SentenceIndex] = None,
     ) -> None:
         """Narrow chunk-level citations to specific sentences.
 
@@ -1032,19 +1075,19 @@ class BaseRouteHandler:
         on the Citation object.
 
         Does not alter the LLM prompt — this is purely post-synthesis
-        processing using the preserved sentence lookup table.
+        processing using the preserved sentence lookup table.  Pass the
+        synthesis result's ``sentence_index`` to skip re-indexing the map.
         """
         if not citations or not sentence_map or not response:
             return
 
+        index = sentence_index if sentence_index is not None else SentenceIndex.from_map(sentence_map)
         for citation in citations:
             if citation.sentence_text:
                 # Already has sentence-level data
                 continue
 
-            match = self._match_sentence_to_claim(
-                citation.index, response, sentence_map
-            )
+            match = self._match_sentence_to_claim(citation.index, response, index)
             if match:
                 citation.sentence_text = match.get("sentence_text")
                 citation.sentence_offset = match.get("sentence_offset")
@@ -27,8 +27,8 @@ from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import structlog
 
 from src.core.config import settings
-from ..services.neo4j_retry import retry_session
 from .base import BaseRouteHandler, RouteResult, Citation
+from ..retrievers.sentence_graph import get_sentence_graph_cache, sentence_graph_enabled
 
 if TYPE_CHECKING:
     from src.worker.hybrid_v2.embeddings import VoyageEmbedService
@@ -212,6 +212,10 @@ class LocalSearchHandler(BaseRouteHandler):
                        model=effective_model,
                        skeleton_sentences=len(skeleton_coverage_chunks))
         logger.info("stage_2.3_synthesis", model=effective_model or "default")
+        # Citation geometry for the retrieved chunks loads while synthesis runs
+        geometry_prefetch = self._start_geometry_prefetch(
+            [c.get("id", "") for c in pre_chunks or []]
+        )
         t0 = time.perf_counter()
         synthesis_result = await self.synthesizer.synthesize(
             query=query,
@@ -300,7 +304,7 @@ class LocalSearchHandler(BaseRouteHandler):
                     citation_type=c.get("citation_type", "chunk"),
                 ))
 
-        self._enrich_citations_with_geometry(citations)
+        await self._enrich_citations_with_geometry_async(citations, prefetch=geometry_prefetch)
         return RouteResult(
             response=synthesis_result["response"],
             route_used=self.ROUTE_NAME,
@@ -465,24 +469,16 @@ class LocalSearchHandler(BaseRouteHandler):
         
         sentence_results = []
         try:
-            # Run sync Neo4j query in executor to avoid blocking
-            loop = asyncio.get_running_loop()
-
-            def _run_query():
-                with retry_session(self.neo4j_driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=self.group_ids,
-                        top_k=top_k,
-                        threshold=threshold,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            sentence_results = await loop.run_in_executor(self._executor, _run_query)
+            sentence_results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=self.group_ids,
+                top_k=top_k,
+                threshold=threshold,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             logger.warning("skeleton_vector_query_failed", error=str(e))
             return []
@@ -569,8 +565,19 @@ class LocalSearchHandler(BaseRouteHandler):
         next_hops = settings.SKELETON_TRAVERSAL_NEXT_HOPS
         related_hops = settings.SKELETON_TRAVERSAL_RELATED_HOPS
         group_id = self.group_id
-        
-        # 2. Graph traversal query: seed → RELATED_TO → NEXT expansion → parent context
+
+        # 2a. Expand on the cached sentence adjacency (vector anchors only in Neo4j)
+        if sentence_graph_enabled() and self.neo4j_driver is not None:
+            try:
+                traversal_results = await self._traverse_sentence_graph(query_embedding)
+            except Exception as e:
+                logger.warning("strategy_b_local_traversal_failed", error=str(e))
+            else:
+                if not traversal_results:
+                    return []
+                return self._format_traversal_results(traversal_results)
+
+        # 2b. Graph traversal query: seed → RELATED_TO → NEXT expansion → parent context
         # Single Cypher query that does the anchor + expand + collect in one round trip.
         # SEARCH clause with in-index group_id filtering (Cypher 25) – multi-group
         cypher = """CYPHER 25
@@ -665,23 +672,16 @@ class LocalSearchHandler(BaseRouteHandler):
         
         traversal_results = []
         try:
-            loop = asyncio.get_running_loop()
-            
-            def _run_traversal():
-                with retry_session(self.neo4j_driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=self.group_ids,
-                        top_k=top_k,
-                        threshold=threshold,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            traversal_results = await loop.run_in_executor(self._executor, _run_traversal)
+            traversal_results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=self.group_ids,
+                top_k=top_k,
+                threshold=threshold,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             logger.warning("strategy_b_traversal_failed", error=str(e))
             # Fallback to Strategy A
@@ -690,7 +690,95 @@ class LocalSearchHandler(BaseRouteHandler):
         
         if not traversal_results:
             return []
-        
+        return self._format_traversal_results(traversal_results)
+
+    async def _traverse_sentence_graph(self, query_embedding: List[float]) -> List[Dict[str, Any]]:
+        """Strategy B on the cached sentence adjacency (``retrievers.sentence_graph``).
+
+        Neo4j only runs the vector anchor step and hydrates the expanded
+        sentence ids; RELATED_TO / NEXT / PREV expansion and decay scoring run
+        in-process on the group's CSR adjacency.  Returns rows shaped like the
+        single-query traversal, highest score first.
+        """
+        t0 = time.perf_counter()
+        seed_cypher = """CYPHER 25
+        CALL () {
+            MATCH (seed:Sentence)
+            SEARCH seed IN (VECTOR INDEX sentence_embedding FOR $embedding WHERE seed.group_id = $group_id LIMIT $top_k)
+            SCORE AS score
+            RETURN seed, score
+            UNION ALL
+            MATCH (seed:Sentence)
+            SEARCH seed IN (VECTOR INDEX sentence_embedding FOR $embedding WHERE seed.group_id = $global_group_id LIMIT $top_k)
+            SCORE AS score
+            RETURN seed, score
+        }
+        WITH seed, score WHERE score >= $threshold
+        RETURN seed.id AS sentence_id, score
+        """
+        seeds = await self.graph_reads.fetch_dicts(
+            seed_cypher,
+            embedding=query_embedding,
+            group_id=self.group_id,
+            global_group_id=settings.GLOBAL_GROUP_ID,
+            top_k=settings.SKELETON_SENTENCE_TOP_K,
+            threshold=settings.SKELETON_SIMILARITY_THRESHOLD,
+        )
+        if not seeds:
+            return []
+        t_anchor = time.perf_counter()
+
+        graph = await asyncio.to_thread(get_sentence_graph_cache().get, self.neo4j_driver, self.group_ids)
+        expanded = graph.expand([(r["sentence_id"], r["score"]) for r in seeds])
+        t_expand = time.perf_counter()
+
+        hydrate_cypher = """
+        UNWIND $rows AS row
+        MATCH (sent:Sentence)
+        WHERE sent.id = row.id AND sent.group_id IN $group_ids
+        OPTIONAL MATCH (sent)-[:IN_SECTION]->(sec:Section)
+        OPTIONAL MATCH (sent)-[:IN_DOCUMENT]->(doc:Document)
+        WITH row, sent, sec, doc
+        WHERE $folder_id IS NULL
+           OR (doc IS NOT NULL AND EXISTS { MATCH (doc)-[:IN_FOLDER]->(f:Folder) WHERE f.id = $folder_id AND f.group_id IN $group_ids })
+        RETURN sent.id AS sentence_id,
+               sent.text AS text,
+               sent.source AS source,
+               sent.section_path AS section_path,
+               sent.hierarchical_id AS hierarchical_id,
+               sent.parent_text AS parent_text,
+               sent.page AS page,
+               sent.document_id AS document_id,
+               sent.parent_text AS parent_passage,
+               doc.title AS document_title,
+               sec.path_key AS section_key,
+               row.score AS score,
+               row.sources AS sources
+        ORDER BY row.rank
+        """
+        results = await self.graph_reads.fetch_dicts(
+            hydrate_cypher,
+            rows=[
+                {"id": e.sentence_id, "score": e.score, "sources": e.sources, "rank": rank}
+                for rank, e in enumerate(expanded)
+            ],
+            group_ids=self.group_ids,
+            folder_id=self.folder_id,
+        )
+        logger.info(
+            "strategy_b_local_traversal",
+            seeds=len(seeds),
+            expanded=len(expanded),
+            results=len(results),
+            graph_sentences=len(graph),
+            anchor_ms=int((t_anchor - t0) * 1000),
+            expand_ms=int((t_expand - t_anchor) * 1000),
+            hydrate_ms=int((time.perf_counter() - t_expand) * 1000),
+        )
+        return results
+
+    def _format_traversal_results(self, traversal_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Strategy B rows → coverage_chunks (document-filtered)."""
         # 3. Format as coverage_chunks (same format as Strategy A for seamless integration)
         seen_sentences: set = set()  # Deduplicate by sentence_id
         coverage_chunks = []
@@ -31,7 +31,6 @@ import structlog
 from .base import BaseRouteHandler, Citation, RouteResult
 from .route_3_prompts import MAP_PROMPT, REDUCE_WITH_EVIDENCE_PROMPT, REDUCE_WITH_EVIDENCE_PROMPT_CONCISE
 from src.core.config import settings
-from ..services.neo4j_retry import retry_session
 
 logger = structlog.get_logger(__name__)
 
@@ -436,24 +435,16 @@ class GlobalSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=self.group_ids,
-                        top_k=fetch_k,
-                        threshold=threshold,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_search)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=self.group_ids,
+                top_k=fetch_k,
+                threshold=threshold,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             raise RuntimeError(f"Neo4j sentence vector search failed: {e}") from e
 
@@ -811,6 +802,7 @@ class GlobalSearchHandler(BaseRouteHandler):
         - Signature blocks and form labels
         - Tiny fragments that lack sentence structure
         - Bare headings without sentence punctuation
+        - Near-duplicates of a higher-ranked sentence from the same document
 
         This ensures the downstream reranker (voyage-rerank-2.5) receives
         clean, complete sentences — its accuracy is highest on well-formed
@@ -820,6 +812,7 @@ class GlobalSearchHandler(BaseRouteHandler):
             Filtered list of evidence dicts.
         """
         cleaned: List[Dict[str, Any]] = []
+        near_dups = BaseRouteHandler._sentence_near_duplicates()
 
         for ev in evidence:
             text = (ev.get("sentence_text") or ev.get("text", "")).strip()
@@ -851,6 +844,12 @@ class GlobalSearchHandler(BaseRouteHandler):
             if len(text) < 50 and not re.search(r"[.?!]", text):
                 continue
 
+            # --- Rule 6: Near-duplicate of a kept sentence (same document) ---
+            if near_dups is not None and not near_dups.add(
+                text, scope=ev.get("document_id") or ev.get("document_title")
+            ):
+                continue
+
             # Strip any residual HTML tags from the passage that gets sent
             if "<" in passage:
                 passage = re.sub(r"<[^>]+>", "", passage).strip()
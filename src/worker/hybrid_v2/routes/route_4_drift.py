@@ -34,7 +34,6 @@ from typing import Dict, Any, List, Tuple, Optional
 import structlog
 
 from src.core.config import settings
-from ..services.neo4j_retry import retry_session
 from .base import BaseRouteHandler, RouteResult, Citation
 
 logger = structlog.get_logger(__name__)
@@ -1249,24 +1248,16 @@ Sub-questions:"""
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=self.group_ids,
-                        top_k=top_k,
-                        threshold=threshold,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_search)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=self.group_ids,
+                top_k=top_k,
+                threshold=threshold,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             raise RuntimeError(f"Neo4j sentence vector search failed: {e}") from e
 
@@ -1323,9 +1314,11 @@ Sub-questions:"""
         """Remove noisy, non-informative sentences before reranking.
 
         Filters out HTML fragments, signature blocks, tiny fragments,
-        and bare headings. Identical logic to Route 3.
+        bare headings and same-document near-duplicates. Identical logic
+        to Route 3.
         """
         cleaned: List[Dict[str, Any]] = []
+        near_dups = BaseRouteHandler._sentence_near_duplicates()
 
         for ev in evidence:
             text = (ev.get("sentence_text") or ev.get("text", "")).strip()
@@ -1356,6 +1349,12 @@ Sub-questions:"""
             if len(text) < 50 and not re.search(r"[.?!]", text):
                 continue
 
+            # Rule 6: Near-duplicate of a kept sentence (same document)
+            if near_dups is not None and not near_dups.add(
+                text, scope=ev.get("document_id") or ev.get("document_title")
+            ):
+                continue
+
             # Strip residual HTML tags from passage
             if "<" in passage:
                 passage = re.sub(r"<[^>]+>", "", passage).strip()
@@ -46,7 +46,6 @@ import structlog
 
 from src.core.config import settings
 from .base import BaseRouteHandler, Citation, RouteResult
-from ..services.neo4j_retry import retry_session
 
 logger = structlog.get_logger(__name__)
 
@@ -546,7 +545,7 @@ class UnifiedSearchHandler(BaseRouteHandler):
                     )
                 )
 
-        self._enrich_citations_with_geometry(citations)
+        await self._enrich_citations_with_geometry_async(citations)
 
         # ------------------------------------------------------------------
         # Assemble metadata
@@ -728,24 +727,16 @@ class UnifiedSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=self.group_ids,
-                        top_k=top_k,
-                        threshold=threshold,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_search)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=self.group_ids,
+                top_k=top_k,
+                threshold=threshold,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             logger.warning("route5_sentence_search_failed", error=str(e))
             return []
@@ -808,9 +799,11 @@ class UnifiedSearchHandler(BaseRouteHandler):
 
         Structured source sentences (signature_party, table_row, figure_caption)
         are curated by the ingestion pipeline and bypass all content-heuristic
-        filters.  Only residual HTML is stripped from them.
+        filters.  Only residual HTML is stripped from them.  Other sentences
+        also drop near-duplicates of a higher-ranked sentence in the same document.
         """
         cleaned: List[Dict[str, Any]] = []
+        near_dups = BaseRouteHandler._sentence_near_duplicates()
 
         # Sources that carry structured content — skip content heuristics.
         _STRUCTURED_SOURCES = {"signature_party", "table_row", "table_caption", "figure_caption", "page_header", "page_footer", "letterhead"}
@@ -851,6 +844,12 @@ class UnifiedSearchHandler(BaseRouteHandler):
             if len(text) < 50 and not re.search(r"[.?!]", text):
                 continue
 
+            # Near-duplicate of a kept sentence (same document)
+            if near_dups is not None and not near_dups.add(
+                text, scope=ev.get("document_id") or ev.get("document_title")
+            ):
+                continue
+
             # Strip residual HTML
             if "<" in passage:
                 passage = re.sub(r"<[^>]+>", "", passage).strip()
@@ -972,16 +971,9 @@ class UnifiedSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
             group_id = self.group_id
 
-            def _run_query():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(cypher, group_ids=self.group_ids, folder_id=self.folder_id)
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_query)
+            results = await self.graph_reads.fetch_dicts(cypher, group_ids=self.group_ids, folder_id=self.folder_id)
         except Exception as e:
             logger.warning("route5_sigblock_fetch_failed", error=str(e))
             return []
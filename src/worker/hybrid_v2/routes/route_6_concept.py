@@ -37,7 +37,6 @@ import tiktoken
 from src.core.config import settings
 from .base import BaseRouteHandler, Citation, RouteResult
 from .route_6_prompts import CONCEPT_SYNTHESIS_PROMPT, COMMUNITY_EXTRACT_PROMPT
-from ..services.neo4j_retry import retry_session
 
 # Shared tiktoken encoder for token budget control (Feature 4)
 _tiktoken_enc = tiktoken.get_encoding("cl100k_base")
@@ -386,15 +385,28 @@ class ConceptSearchHandler(BaseRouteHandler):
                 },
             )
 
+        # Citations depend only on the evidence, so they are built up front
+        # and their geometry loads while synthesis runs.
+        citations = self._build_citations(
+            community_data, community_scores, sentence_evidence,
+        )
+        geometry_task = asyncio.create_task(
+            self._enrich_citations_with_geometry_async(citations)
+        )
+
         # ================================================================
         # Step 3: Single LLM synthesis (communities + sentences)
         # ================================================================
         t0 = time.perf_counter()
-        response_text = await self._synthesize(
-            query, community_data, section_headings, sentence_evidence,
-            entity_doc_map=entity_doc_map,
-            language=language,
-        )
+        try:
+            response_text = await self._synthesize(
+                query, community_data, section_headings, sentence_evidence,
+                entity_doc_map=entity_doc_map,
+                language=language,
+            )
+        except BaseException:
+            geometry_task.cancel()
+            raise
         timings_ms["step_3_synthesis_ms"] = int(
             (time.perf_counter() - t0) * 1000
         )
@@ -409,12 +421,9 @@ class ConceptSearchHandler(BaseRouteHandler):
         )
 
         # ================================================================
-        # Build citations
+        # Citation geometry (started before synthesis)
         # ================================================================
-        citations = self._build_citations(
-            community_data, community_scores, sentence_evidence,
-        )
-        self._enrich_citations_with_geometry(citations)
+        await geometry_task
 
         # ================================================================
         # Assemble metadata
@@ -886,20 +895,12 @@ class ConceptSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        community_ids=community_ids,
-                        group_ids=group_ids,
-                        folder_id=folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                community_ids=community_ids,
+                group_ids=group_ids,
+                folder_id=folder_id,
+            )
         except Exception as e:
             logger.warning("route6_community_source_query_failed", error=str(e))
             return {}
@@ -1085,19 +1086,11 @@ class ConceptSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        parent_ids=parent_ids,
-                        group_ids=group_ids,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                parent_ids=parent_ids,
+                group_ids=group_ids,
+            )
         except Exception as e:
             logger.warning("route6_community_children_query_failed", error=str(e))
             return []
@@ -1344,25 +1337,18 @@ class ConceptSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
             folder_id = self.folder_id
 
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=group_ids,
-                        top_k=fetch_k,
-                        threshold=threshold,
-                        folder_id=folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_search)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=group_ids,
+                top_k=fetch_k,
+                threshold=threshold,
+                folder_id=folder_id,
+            )
         except Exception as e:
             logger.warning("route6_sentence_search_failed", error=str(e))
             return []
@@ -1521,23 +1507,15 @@ class ConceptSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run_expansion():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        seed_ids=seed_ids,
-                        exclude_ids=exclude_ids,
-                        group_ids=group_ids,
-                        folder_id=folder_id,
-                        min_overlap=min_overlap,
-                        top_k=top_k,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_expansion)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                seed_ids=seed_ids,
+                exclude_ids=exclude_ids,
+                group_ids=group_ids,
+                folder_id=folder_id,
+                min_overlap=min_overlap,
+                top_k=top_k,
+            )
         except Exception as e:
             logger.warning("route6_entity_expansion_query_failed", error=str(e))
             return []
@@ -1662,22 +1640,14 @@ class ConceptSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        query_embedding=query_embedding,
-                        group_ids=group_ids,
-                        min_similarity=min_similarity,
-                        top_k=top_k,
-                        folder_id=folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run_search)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                query_embedding=query_embedding,
+                group_ids=group_ids,
+                min_similarity=min_similarity,
+                top_k=top_k,
+                folder_id=folder_id,
+            )
         except Exception as e:
             logger.warning("route6_section_search_failed", error=str(e))
             return []
@@ -1750,20 +1720,12 @@ class ConceptSearchHandler(BaseRouteHandler):
         """
 
         try:
-            loop = asyncio.get_running_loop()
-            driver = self.neo4j_driver
-
-            def _run():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        group_ids=group_ids,
-                        folder_id=folder_id,
-                        top_k=top_k,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await loop.run_in_executor(self._executor, _run)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                group_ids=group_ids,
+                folder_id=folder_id,
+                top_k=top_k,
+            )
             entity_map = {r["entity_name"]: r["doc_titles"] for r in results}
 
             logger.info(
@@ -1856,9 +1818,11 @@ class ConceptSearchHandler(BaseRouteHandler):
         """Remove noisy, non-informative sentences before reranking.
 
         Filters out HTML fragments, signature blocks, tiny fragments,
-        and bare headings without sentence punctuation.
+        bare headings without sentence punctuation, and near-duplicates of a
+        higher-ranked sentence from the same document.
         """
         cleaned: List[Dict[str, Any]] = []
+        near_dups = BaseRouteHandler._sentence_near_duplicates()
 
         for ev in evidence:
             text = (ev.get("sentence_text") or ev.get("text") or "").strip()
@@ -1889,6 +1853,12 @@ class ConceptSearchHandler(BaseRouteHandler):
             if len(text) < 50 and not re.search(r"[.?!]", text):
                 continue
 
+            # Rule 6: Near-duplicate of a kept sentence (same document)
+            if near_dups is not None and not near_dups.add(
+                text, scope=ev.get("document_id") or ev.get("document_title")
+            ):
+                continue
+
             # Strip residual HTML tags from the passage
             if "<" in passage:
                 passage = re.sub(r"<[^>]+>", "", passage).strip()
@@ -29,6 +29,7 @@ import re
 import time
 import threading
 from collections import defaultdict
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
@@ -164,6 +165,31 @@ def _get_voyage_service():
     return _voyage_service
 
 
+@dataclass
+class Route7Prefetch:
+    """Speculative Route 7 seed retrieval started before routing completes.
+
+    The orchestrator starts this while translation and routing are still in
+    flight.  ``embed_task`` resolves to the query embedding; once it has,
+    ``triple_task`` and ``dpr_task`` are running the same triple linking and
+    DPR passage search that ``execute()`` would otherwise start itself.
+    A prefetch is only valid for the exact ``query`` text it was started on.
+    """
+
+    query: str
+    started_at: float = field(default_factory=time.perf_counter)
+    embed_task: Optional[asyncio.Task] = None
+    triple_task: Optional[asyncio.Task] = None
+    dpr_task: Optional[asyncio.Task] = None
+    timings_ms: Dict[str, int] = field(default_factory=dict)
+
+    def cancel(self) -> None:
+        """Cancel any speculative work that has not finished yet."""
+        for task in (self.embed_task, self.triple_task, self.dpr_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+
 class HippoRAG2Handler(BaseRouteHandler):
     """Route 7: True HippoRAG 2 with passage-node PPR.
 
@@ -219,7 +245,7 @@ class HippoRAG2Handler(BaseRouteHandler):
             if self._triple_store is not None and self._ppr_engine is not None:
                 return
 
-            from ..retrievers.triple_store import TripleEmbeddingStore
+            from ..retrievers.triple_store import get_shared_triple_store
             from ..retrievers.hipporag2_ppr import HippoRAG2PPR
 
             voyage_service = _get_voyage_service()
@@ -237,12 +263,12 @@ class HippoRAG2Handler(BaseRouteHandler):
                 os.getenv("ROUTE7_SYNONYM_THRESHOLD", "0.65")
             )
 
-            # Load triple store and PPR graph in parallel
-            triple_store = TripleEmbeddingStore()
+            # Load triple store and PPR graph in parallel.  The triple store
+            # is shared by every pipeline serving the same group version.
             ppr_engine = HippoRAG2PPR()
 
-            await asyncio.gather(
-                triple_store.load(
+            triple_store, _ = await asyncio.gather(
+                get_shared_triple_store(
                     self.neo4j_driver, self.group_id, voyage_service,
                     group_ids=self.group_ids,
                 ),
@@ -261,9 +287,50 @@ class HippoRAG2Handler(BaseRouteHandler):
             logger.info(
                 "route7_initialized",
                 triple_count=triple_store.triple_count,
+                triple_matrix=triple_store.memory_report(),
                 graph_nodes=ppr_engine.node_count,
             )
 
+    @staticmethod
+    def _seed_search_config() -> Tuple[int, int, int]:
+        """Return (triple_top_k, dpr_top_k, dpr_sentence_top_k) from env."""
+        triple_top_k = int(os.getenv("ROUTE7_TRIPLE_TOP_K", "15"))
+        dpr_top_k = int(os.getenv("ROUTE7_DPR_TOP_K", "50"))  # upstream default; set -1 to disable
+        dpr_sentence_top_k = int(os.getenv("ROUTE7_DPR_SENTENCE_TOP_K", "0"))
+        return triple_top_k, dpr_top_k, dpr_sentence_top_k
+
+    def start_prefetch(self, query: str) -> Route7Prefetch:
+        """Start the route-independent seed work for *query* in the background.
+
+        Query embedding, triple linking and DPR passage search do not depend
+        on the router's decision or the query_mode preset, so the orchestrator
+        can run them concurrently with routing and hand the result to
+        ``execute(prefetch=...)``.  Callers own the returned object and must
+        ``cancel()`` it if it is not passed to ``execute``.
+        """
+        prefetch = Route7Prefetch(query=query)
+        prefetch.embed_task = asyncio.create_task(self._prefetch_seeds(prefetch))
+        return prefetch
+
+    async def _prefetch_seeds(self, prefetch: Route7Prefetch) -> List[float]:
+        """Embed the query, then launch triple linking + DPR as sibling tasks."""
+        await self._ensure_initialized()
+
+        t0 = time.perf_counter()
+        voyage_service = _get_voyage_service()
+        # Off-loop: the point of prefetching is to overlap with routing I/O
+        query_embedding = await asyncio.to_thread(voyage_service.embed_query, prefetch.query)
+        prefetch.timings_ms["embed_ms"] = int((time.perf_counter() - t0) * 1000)
+
+        triple_top_k, dpr_top_k, dpr_sentence_top_k = self._seed_search_config()
+        prefetch.triple_task = asyncio.create_task(
+            self._query_to_triple_linking(prefetch.query, query_embedding, triple_top_k)
+        )
+        prefetch.dpr_task = asyncio.create_task(
+            self._dpr_passage_search(query_embedding, dpr_top_k, dpr_sentence_top_k)
+        )
+        return query_embedding
+
     async def execute(
         self,
         query: str,
@@ -276,8 +343,13 @@ class HippoRAG2Handler(BaseRouteHandler):
         language: Optional[str] = None,
         query_mode: Optional[str] = None,
         folder_id: Optional[str] = None,
+        prefetch: Optional[Route7Prefetch] = None,
     ) -> RouteResult:
-        """Execute Route 7: True HippoRAG 2 retrieval pipeline."""
+        """Execute Route 7: True HippoRAG 2 retrieval pipeline.
+
+        When *prefetch* was started (via ``start_prefetch``) on this exact
+        query, its embedding and triple/DPR tasks replace Steps 1 and 2a/2b.
+        """
         enable_timings = os.getenv(
             "ROUTE7_RETURN_TIMINGS", "0"
         ).strip().lower() in {"1", "true", "yes"}
@@ -288,9 +360,7 @@ class HippoRAG2Handler(BaseRouteHandler):
         preset = self.QUERY_MODE_PRESETS.get(query_mode or "", {})
 
         # Config from env, with preset overrides
-        triple_top_k = int(os.getenv("ROUTE7_TRIPLE_TOP_K", "15"))
-        dpr_top_k = int(os.getenv("ROUTE7_DPR_TOP_K", "50"))  # upstream default; set -1 to disable
-        dpr_sentence_top_k = int(os.getenv("ROUTE7_DPR_SENTENCE_TOP_K", "0"))
+        triple_top_k, dpr_top_k, dpr_sentence_top_k = self._seed_search_config()
         ppr_damping = float(os.getenv("ROUTE7_DAMPING", "0.5"))
         passage_node_weight = float(os.getenv("ROUTE7_PASSAGE_NODE_WEIGHT", "0.05"))
         ppr_passage_top_k = preset.get("ppr_passage_top_k") or int(
@@ -373,11 +443,22 @@ class HippoRAG2Handler(BaseRouteHandler):
         await self._ensure_initialized()
 
         # ------------------------------------------------------------------
-        # Step 1: Embed query
+        # Step 1: Embed query (or pick up the speculative prefetch)
         # ------------------------------------------------------------------
         t0 = time.perf_counter()
-        voyage_service = _get_voyage_service()
-        query_embedding = voyage_service.embed_query(query)
+        prefetch_used = False
+        if prefetch is not None and prefetch.query == query and prefetch.embed_task is not None:
+            try:
+                query_embedding = await prefetch.embed_task
+                prefetch_used = True
+            except Exception as e:
+                logger.warning("route7_prefetch_failed", error=str(e))
+                prefetch.cancel()
+        elif prefetch is not None:
+            prefetch.cancel()
+        if not prefetch_used:
+            voyage_service = _get_voyage_service()
+            query_embedding = voyage_service.embed_query(query)
         timings_ms["step_1_embed_ms"] = int((time.perf_counter() - t0) * 1000)
 
         # ------------------------------------------------------------------
@@ -391,15 +472,20 @@ class HippoRAG2Handler(BaseRouteHandler):
         # ------------------------------------------------------------------
         t0 = time.perf_counter()
 
-        # 2a. Query-to-triple linking + recognition memory filter
-        triple_task = asyncio.create_task(
-            self._query_to_triple_linking(query, query_embedding, triple_top_k)
-        )
+        if prefetch_used:
+            # 2a/2b already running since before routing finished
+            triple_task = prefetch.triple_task
+            dpr_task = prefetch.dpr_task
+        else:
+            # 2a. Query-to-triple linking + recognition memory filter
+            triple_task = asyncio.create_task(
+                self._query_to_triple_linking(query, query_embedding, triple_top_k)
+            )
 
-        # 2b. DPR passage search (sentence-level Small-to-Big)
-        dpr_task = asyncio.create_task(
-            self._dpr_passage_search(query_embedding, dpr_top_k, dpr_sentence_top_k)
-        )
+            # 2b. DPR passage search (sentence-level Small-to-Big)
+            dpr_task = asyncio.create_task(
+                self._dpr_passage_search(query_embedding, dpr_top_k, dpr_sentence_top_k)
+            )
 
         # 2c. Optional sentence search for evidence augmentation (Phase 2)
         sentence_task = None
@@ -840,6 +926,11 @@ class HippoRAG2Handler(BaseRouteHandler):
 
         timings_ms["step_45_parallel_ms"] = int((time.perf_counter() - t0) * 1000)
 
+        # Citation geometry for the fetched chunks loads while synthesis runs
+        geometry_prefetch = self._start_geometry_prefetch(
+            [c.get("id", "") for c in pre_fetched_chunks or []]
+        )
+
         # Convert sentence evidence to coverage_chunks format
         sentence_chunks: List[Dict[str, Any]] = []
         if sentence_evidence:
@@ -920,9 +1011,10 @@ class HippoRAG2Handler(BaseRouteHandler):
         sentence_map = synthesis_result.get("sentence_citation_map", {})
         if sentence_map:
             self._narrow_citations_to_sentences(
-                citations, synthesis_result.get("response", ""), sentence_map
+                citations, synthesis_result.get("response", ""), sentence_map,
+                sentence_index=synthesis_result.get("sentence_index"),
             )
-        self._enrich_citations_with_geometry(citations)
+        await self._enrich_citations_with_geometry_async(citations, prefetch=geometry_prefetch)
 
         # ------------------------------------------------------------------
         # Assemble metadata
@@ -991,6 +1083,13 @@ class HippoRAG2Handler(BaseRouteHandler):
         if synthesis_result.get("processing_mode"):
             metadata["processing_mode"] = synthesis_result["processing_mode"]
 
+        if prefetch_used:
+            metadata["speculative_prefetch"] = {
+                "used": True,
+                **prefetch.timings_ms,
+                "wait_ms": timings_ms["step_1_embed_ms"],
+            }
+
         if enable_timings:
             metadata["timings_ms"] = timings_ms
 
@@ -1173,33 +1272,28 @@ class HippoRAG2Handler(BaseRouteHandler):
                doc_sample_chunk, doc_role_labels
         ORDER BY entity_name, doc_mentions DESC
         """
-        driver = self.neo4j_driver
-
-        def _run():
-            with retry_session(driver, read_only=True) as session:
-                records = session.run(
-                    cypher,
-                    group_ids=group_ids,
-                    entity_types=entity_types,
-                    role_rel_types=_STRUCTURED_ROLE_TYPES,
-                    folder_id=self.folder_id,
-                )
-                return [
-                    {
-                        "entity_name": r["entity_name"],
-                        "entity_type": r["entity_type"],
-                        "document_title": r["document_title"] or "",
-                        "doc_mentions": r["doc_mentions"],
-                        "doc_sample_chunk": r["doc_sample_chunk"] or "",
-                        "doc_role_labels": [
-                            rl for rl in (r["doc_role_labels"] or []) if rl
-                        ],
-                    }
-                    for r in records
-                ]
 
         try:
-            results = await asyncio.to_thread(_run)
+            records = await self.graph_reads.fetch(
+                cypher,
+                group_ids=group_ids,
+                entity_types=entity_types,
+                role_rel_types=_STRUCTURED_ROLE_TYPES,
+                folder_id=self.folder_id,
+            )
+            results = [
+                {
+                    "entity_name": r["entity_name"],
+                    "entity_type": r["entity_type"],
+                    "document_title": r["document_title"] or "",
+                    "doc_mentions": r["doc_mentions"],
+                    "doc_sample_chunk": r["doc_sample_chunk"] or "",
+                    "doc_role_labels": [
+                        rl for rl in (r["doc_role_labels"] or []) if rl
+                    ],
+                }
+                for r in records
+            ]
             logger.info(
                 "route7_entity_doc_map_v3",
                 entity_types=entity_types,
@@ -1452,21 +1546,17 @@ class HippoRAG2Handler(BaseRouteHandler):
         """
 
         try:
-            def _run_sentence():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        sentence_cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=group_ids,
-                        sentence_top_k=sentence_top_k,
-                        top_k=top_k,
-                        folder_id=folder_id,
-                    )
-                    return [(r["sentence_id"], r["score"]) for r in records]
-
-            results = await asyncio.to_thread(_run_sentence)
+            records = await self.graph_reads.fetch(
+                sentence_cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=group_ids,
+                sentence_top_k=sentence_top_k,
+                top_k=top_k,
+                folder_id=folder_id,
+            )
+            results = [(r["sentence_id"], r["score"]) for r in records]
             logger.debug("route7_dpr_sentence_complete", hits=len(results),
                          corpus_size=top_k)
             return results
@@ -1499,7 +1589,6 @@ class HippoRAG2Handler(BaseRouteHandler):
             return []
 
         group_ids = self.group_ids
-        driver = self.neo4j_driver
 
         # ── Pass 1: Sentence metadata ──
         cypher_sentences = """
@@ -1523,16 +1612,12 @@ class HippoRAG2Handler(BaseRouteHandler):
         """
 
         try:
-            def _run():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher_sentences,
-                        sentence_ids=sentence_ids,
-                        group_ids=group_ids,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-            results = await asyncio.to_thread(_run)
+            results = await self.graph_reads.fetch_dicts(
+                cypher_sentences,
+                sentence_ids=sentence_ids,
+                group_ids=group_ids,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             logger.warning("route7_fetch_chunks_failed", error=str(e))
             return []
@@ -1645,19 +1730,16 @@ class HippoRAG2Handler(BaseRouteHandler):
             expanded_sections = list(matched_sections)
             if self.neo4j_driver:
                 try:
-                    def _expand_children():
-                        with retry_session(self.neo4j_driver, read_only=True) as session:
-                            records = session.run("""
-                                UNWIND $paths AS parent_path
-                                MATCH (parent:Section)
-                                WHERE parent.group_id IN $group_ids
-                                  AND parent.path_key = parent_path
-                                MATCH (child:Section)-[:SUBSECTION_OF*1..3]->(parent)
-                                WHERE child.group_id IN $group_ids
-                                RETURN DISTINCT child.path_key AS child_path
-                            """, paths=matched_sections, group_ids=self.group_ids)
-                            return [r["child_path"] for r in records if r["child_path"]]
-                    child_paths = await asyncio.to_thread(_expand_children)
+                    records = await self.graph_reads.fetch("""
+                        UNWIND $paths AS parent_path
+                        MATCH (parent:Section)
+                        WHERE parent.group_id IN $group_ids
+                          AND parent.path_key = parent_path
+                        MATCH (child:Section)-[:SUBSECTION_OF*1..3]->(parent)
+                        WHERE child.group_id IN $group_ids
+                        RETURN DISTINCT child.path_key AS child_path
+                    """, paths=matched_sections, group_ids=self.group_ids)
+                    child_paths = [r["child_path"] for r in records if r["child_path"]]
                     expanded_sections.extend(child_paths)
                     expanded_sections = list(set(expanded_sections))
                     logger.debug(
@@ -1822,23 +1904,16 @@ class HippoRAG2Handler(BaseRouteHandler):
         """
 
         try:
-            driver = self.neo4j_driver
-
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        group_ids=group_ids,
-                        top_k=top_k,
-                        threshold=threshold,
-                        folder_id=self.folder_id,
-                    )
-                    return [dict(r) for r in records]
-
-            results = await asyncio.to_thread(_run_search)
+            results = await self.graph_reads.fetch_dicts(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                group_ids=group_ids,
+                top_k=top_k,
+                threshold=threshold,
+                folder_id=self.folder_id,
+            )
         except Exception as e:
             logger.warning("route7_sentence_search_failed", error=str(e))
             return []
@@ -1904,19 +1979,15 @@ class HippoRAG2Handler(BaseRouteHandler):
 
         group_ids = self.group_ids
 
-        def _fetch_texts():
-            with retry_session(self.neo4j_driver, read_only=True) as session:
-                result = session.run(
-                    "UNWIND $ids AS sid "
-                    "MATCH (s:Sentence {id: sid}) "
-                    "WHERE s.group_id IN $group_ids "
-                    "RETURN s.id AS id, s.text AS text",
-                    ids=candidate_ids,
-                    group_ids=group_ids,
-                )
-                return {r["id"]: r["text"] or "" for r in result}
-
-        text_map = await asyncio.to_thread(_fetch_texts)
+        result = await self.graph_reads.fetch(
+            "UNWIND $ids AS sid "
+            "MATCH (s:Sentence {id: sid}) "
+            "WHERE s.group_id IN $group_ids "
+            "RETURN s.id AS id, s.text AS text",
+            ids=candidate_ids,
+            group_ids=group_ids,
+        )
+        text_map = {r["id"]: r["text"] or "" for r in result}
 
         # Build ordered document list (preserve candidate order for fallback)
         documents = []
@@ -2028,21 +2099,15 @@ class HippoRAG2Handler(BaseRouteHandler):
         """
 
         try:
-            driver = self.neo4j_driver
-
-            def _run_search():
-                with retry_session(driver, read_only=True) as session:
-                    records = session.run(
-                        cypher,
-                        embedding=query_embedding,
-                        group_id=self.group_id,
-                        global_group_id=settings.GLOBAL_GROUP_ID,
-                        top_k=top_k,
-                        threshold=threshold,
-                    )
-                    return [(r["sentence_id"], float(r["score"])) for r in records]
-
-            results = await asyncio.to_thread(_run_search)
+            records = await self.graph_reads.fetch(
+                cypher,
+                embedding=query_embedding,
+                group_id=self.group_id,
+                global_group_id=settings.GLOBAL_GROUP_ID,
+                top_k=top_k,
+                threshold=threshold,
+            )
+            results = [(r["sentence_id"], float(r["score"])) for r in records]
         except Exception as e:
             logger.warning("route7_semantic_search_failed", error=str(e))
             return []
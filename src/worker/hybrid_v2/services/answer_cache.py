@@ -0,0 +1,262 @@
+"""Redis-backed answer cache for ``HybridPipeline.query``.
+
+Demo and support traffic repeats the same questions against an unchanged
+corpus, and every repeat re-ran routing, retrieval, reranking and synthesis.
+This cache stores the final answer dict under
+
+    (group_id, folder_id, group version, route, response_type,
+     prompt_variant, other answer-shaping options, normalised query)
+
+The group version (``read_group_version``) changes whenever the group is
+re-indexed or its documents change, so cached citations always point at the
+corpus they were produced from — stale entries are never read, they simply
+expire (``ANSWER_CACHE_TTL_SECONDS``, default 86400).  Nothing is cached
+while the group is being re-indexed (``group_version_in_progress``).
+
+Tiers:
+
+- **exact** — ``normalize_query`` (NFKC, case-folded, whitespace collapsed,
+  trailing ``?!.`` dropped) must match.
+- **semantic** (``ANSWER_CACHE_SEMANTIC=1``) — a paraphrase hits when the
+  cosine similarity of its query embedding to a cached query in the same
+  scope is at least ``ANSWER_CACHE_SEMANTIC_THRESHOLD`` (default 0.97).
+  Each scope keeps its last ``ANSWER_CACHE_SEMANTIC_MAX_ENTRIES`` (default
+  50) query embeddings in a Redis list.
+
+Enable with ``ANSWER_CACHE=1``; ``ANSWER_CACHE_NAMESPACE`` (default ``v1``)
+can be bumped to drop every entry after a prompt or synthesis change.
+
+Usage::
+
+    cache = get_answer_cache()
+    key = AnswerCacheKey.build(group_id, folder_id, version, route, response_type, prompt_variant, query)
+    hit = await cache.get(key, embedding)
+    if hit is None:
+        result = await run_query()
+        await cache.put(key, result, embedding)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_REDIS_PREFIX = "answer_cache"
+_WS_RE = re.compile(r"\s+")
+_TRAILING_PUNCT = "?!.。？！ "
+
+
+def answer_cache_enabled() -> bool:
+    """Whether ``HybridPipeline.query`` reads and writes the answer cache (default off)."""
+    return os.getenv("ANSWER_CACHE", "0").strip().lower() in {"1", "true", "yes"}
+
+
+def semantic_tier_enabled() -> bool:
+    """Whether paraphrases may hit via query-embedding similarity (default off)."""
+    return os.getenv("ANSWER_CACHE_SEMANTIC", "0").strip().lower() in {"1", "true", "yes"}
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of *query* for exact-tier matching."""
+    text = unicodedata.normalize("NFKC", query or "").casefold()
+    return _WS_RE.sub(" ", text).strip().rstrip(_TRAILING_PUNCT)
+
+
+def _digest(payload: Any) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass(frozen=True)
+class AnswerCacheKey:
+    """Everything an answer depends on; ``scope`` is the key minus the query."""
+
+    group_id: str
+    scope: str
+    query: str
+
+    @classmethod
+    def build(
+        cls,
+        group_id: str,
+        folder_id: Optional[str],
+        version: str,
+        route: str,
+        response_type: str,
+        prompt_variant: Optional[str],
+        query: str,
+        **options: Any,
+    ) -> "AnswerCacheKey":
+        """Key for *query*; *options* are further answer-shaping inputs (language, model, ...)."""
+        scope = _digest({
+            "ns": os.getenv("ANSWER_CACHE_NAMESPACE", "v1"),
+            "folder_id": folder_id,
+            "version": version,
+            "route": route,
+            "response_type": response_type,
+            "prompt_variant": prompt_variant,
+            "options": options,
+        })
+        return cls(group_id=group_id, scope=scope, query=normalize_query(query))
+
+    @property
+    def exact_key(self) -> str:
+        return f"{_REDIS_PREFIX}:{self.group_id}:{self.scope}:{_digest(self.query)}"
+
+    @property
+    def semantic_key(self) -> str:
+        return f"{_REDIS_PREFIX}:{self.group_id}:{self.scope}:semantic"
+
+
+@dataclass
+class AnswerCacheHit:
+    """A cached answer and how it was found."""
+
+    result: Dict[str, Any]
+    tier: str  # "exact" | "semantic"
+    similarity: Optional[float] = None
+    cached_at: Optional[float] = None
+
+    def metadata(self) -> Dict[str, Any]:
+        """``metadata["answer_cache"]`` for the response."""
+        info: Dict[str, Any] = {"hit": True, "tier": self.tier}
+        if self.similarity is not None:
+            info["similarity"] = round(self.similarity, 4)
+        if self.cached_at is not None:
+            info["age_s"] = int(time.time() - self.cached_at)
+        return info
+
+
+def _encode_embedding(embedding: Sequence[float]) -> str:
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec = vec / norm
+    return base64.b64encode(vec.tobytes()).decode("ascii")
+
+
+def _decode_embedding(raw: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(raw), dtype=np.float32)
+
+
+class AnswerCache:
+    """Exact + optional semantic answer lookup over a Redis client.
+
+    Args:
+        redis: Async Redis client (``decode_responses=True``); defaults to
+            the shared ``RedisService`` connection.
+        ttl_seconds: Entry lifetime.
+        semantic_threshold: Minimum cosine similarity for a semantic hit.
+        semantic_max_entries: Query embeddings kept per scope.
+    """
+
+    def __init__(
+        self,
+        redis: Any = None,
+        ttl_seconds: Optional[int] = None,
+        semantic_threshold: Optional[float] = None,
+        semantic_max_entries: Optional[int] = None,
+    ):
+        self._redis = redis
+        self.ttl_seconds = ttl_seconds or int(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+        self.semantic_threshold = (
+            semantic_threshold if semantic_threshold is not None
+            else float(os.getenv("ANSWER_CACHE_SEMANTIC_THRESHOLD", "0.97"))
+        )
+        self.semantic_max_entries = semantic_max_entries or int(
+            os.getenv("ANSWER_CACHE_SEMANTIC_MAX_ENTRIES", "50")
+        )
+
+    async def _client(self) -> Any:
+        if self._redis is None:
+            from src.core.services.redis_service import get_redis_service
+
+            self._redis = (await get_redis_service())._redis
+        return self._redis
+
+    async def get(
+        self, key: AnswerCacheKey, embedding: Optional[Sequence[float]] = None
+    ) -> Optional[AnswerCacheHit]:
+        """Cached answer for *key*, trying the semantic tier when *embedding* is given."""
+        try:
+            redis = await self._client()
+            raw = await redis.get(key.exact_key)
+            if raw:
+                entry = json.loads(raw)
+                return AnswerCacheHit(entry["result"], "exact", cached_at=entry.get("cached_at"))
+            if embedding is None:
+                return None
+            return await self._get_semantic(redis, key, embedding)
+        except Exception as e:
+            logger.warning("answer_cache_read_failed", error=str(e))
+            return None
+
+    async def _get_semantic(
+        self, redis: Any, key: AnswerCacheKey, embedding: Sequence[float]
+    ) -> Optional[AnswerCacheHit]:
+        entries: List[str] = await redis.lrange(key.semantic_key, 0, -1)
+        if not entries:
+            return None
+        query_vec = _decode_embedding(_encode_embedding(embedding))
+        best_score, best_key = -1.0, None
+        for raw in entries:
+            entry = json.loads(raw)
+            vec = _decode_embedding(entry["embedding"])
+            if vec.shape != query_vec.shape:
+                continue
+            score = float(np.dot(vec, query_vec))
+            if score > best_score:
+                best_score, best_key = score, entry["key"]
+        if best_key is None or best_score < self.semantic_threshold:
+            return None
+        raw = await redis.get(best_key)
+        if not raw:
+            return None
+        entry = json.loads(raw)
+        return AnswerCacheHit(entry["result"], "semantic", similarity=best_score, cached_at=entry.get("cached_at"))
+
+    async def put(
+        self, key: AnswerCacheKey, result: Dict[str, Any], embedding: Optional[Sequence[float]] = None
+    ) -> None:
+        """Store *result* (without per-request ``usage``) under *key*."""
+        stored = {k: v for k, v in result.items() if k != "usage"}
+        stored["metadata"] = {
+            k: v for k, v in (result.get("metadata") or {}).items()
+            if k not in ("pipeline_timings_ms", "answer_cache")
+        }
+        try:
+            payload = json.dumps({"result": stored, "cached_at": time.time()}, default=str)
+            redis = await self._client()
+            pipe = redis.pipeline(transaction=False)
+            pipe.set(key.exact_key, payload, ex=self.ttl_seconds)
+            if embedding is not None:
+                entry = json.dumps({"key": key.exact_key, "embedding": _encode_embedding(embedding)})
+                pipe.lpush(key.semantic_key, entry)
+                pipe.ltrim(key.semantic_key, 0, self.semantic_max_entries - 1)
+                pipe.expire(key.semantic_key, self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("answer_cache_write_failed", error=str(e))
+
+
+_cache: Optional[AnswerCache] = None
+
+
+def get_answer_cache() -> AnswerCache:
+    """Get or create the process-wide answer cache."""
+    global _cache
+    if _cache is None:
+        _cache = AnswerCache()
+    return _cache
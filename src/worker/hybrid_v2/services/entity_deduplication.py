@@ -30,6 +30,7 @@ logger = structlog.get_logger(__name__)
 # Try to use numpy for fast vector operations, fall back to pure Python
 try:
     import numpy as np
+    from ..utils.vectors import cosine_similarity as _np_cosine_similarity, unit_rows
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
@@ -66,13 +67,7 @@ def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
         return 0.0
 
     if HAS_NUMPY:
-        a = np.array(vec1)
-        b = np.array(vec2)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return float(np.dot(a, b) / (norm_a * norm_b))
+        return _np_cosine_similarity(vec1, vec2)
     else:
         # Pure Python fallback
         dot_product = sum(a * b for a, b in zip(vec1, vec2))
@@ -83,6 +78,24 @@ def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
         return dot_product / (norm1 * norm2)
 
 
+def _unit_embedding_matrix(
+    entity_data: List[Tuple[str, List[float], str]],
+) -> Tuple[Any, Any]:
+    """Unit-norm ``float32`` rows for entities whose embedding has the common dimension.
+
+    Returns ``(matrix, has_row)``; rows of entities without an embedding (or
+    with an odd dimension) are zero and ``has_row`` is False for them.
+    """
+    dims = [len(emb) for _, emb, _ in entity_data if emb]
+    if not dims:
+        return None, None
+    dim = max(set(dims), key=dims.count)
+    has_row = np.array([len(emb) == dim for _, emb, _ in entity_data], dtype=bool)
+    matrix = np.zeros((len(entity_data), dim), dtype=np.float32)
+    matrix[has_row] = unit_rows([emb for _, emb, _ in entity_data if len(emb) == dim])
+    return matrix, has_row
+
+
 def _is_acronym_match(name1: str, name2: str) -> bool:
     """
     Check if one name is an acronym of the other.
@@ -319,8 +332,16 @@ class EntityDeduplicationService:
             comparisons=n * (n - 1) // 2,
         )
 
+        # Score each entity against all later ones with one matrix-vector
+        # product instead of n - i pairwise cosine calls.
+        emb_matrix, has_row = _unit_embedding_matrix(entity_data) if HAS_NUMPY else (None, None)
+
         for i in range(n):
             name_i, emb_i, norm_i = entity_data[i]
+            row_sims = (
+                emb_matrix[i + 1:] @ emb_matrix[i]
+                if emb_matrix is not None and has_row[i] else None
+            )
             
             for j in range(i + 1, n):
                 name_j, emb_j, norm_j = entity_data[j]
@@ -334,7 +355,10 @@ class EntityDeduplicationService:
                 
                 # 1. Embedding similarity (if both have embeddings)
                 if emb_i and emb_j:
-                    sim = _cosine_similarity(emb_i, emb_j)
+                    if row_sims is not None:
+                        sim = float(row_sims[j - i - 1])
+                    else:
+                        sim = _cosine_similarity(emb_i, emb_j)
                     if sim >= self.similarity_threshold:
                         should_merge = True
                         reason = {"type": "embedding_similarity", "score": round(sim, 4)}
@@ -0,0 +1,101 @@
+"""
+Async read repository for the hybrid_v2 query path.
+
+Retrieval helpers (``EnhancedGraphRetriever``, ``Neo4jTextUnitStore``, route
+handlers) historically wrapped every sync Cypher call in a closure and
+pushed it through ``loop.run_in_executor(None, ...)`` / ``asyncio.to_thread``.
+Each in-flight query then occupies a default-executor thread, capping
+query-level concurrency at ``min(32, cpu + 4)`` regardless of how many
+requests the event loop could otherwise interleave.
+
+``GraphReadRepository`` runs the same Cypher on the pipeline's
+``AsyncNeo4jService`` (native async driver, ``execute_read`` routing) once
+it is connected, and falls back to the previous thread offload with the
+sync driver otherwise — e.g. before ``HybridPipeline.initialize()`` or when
+the async driver failed to connect.  Results are eager in both modes, so
+callers see the same ``neo4j.Record`` objects as before.
+
+Set ``NEO4J_ASYNC_READS=0`` to force the thread-offload path (used by the
+load test in ``scripts/benchmark_neo4j_async_reads.py`` as the baseline).
+
+Usage::
+
+    repo = GraphReadRepository(driver=sync_driver, async_neo4j=async_service)
+    records = await repo.fetch(query, group_ids=group_ids)
+    rows = await repo.fetch_dicts(query, group_ids=group_ids)
+    record = await repo.fetch_one(query, group_id=group_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.worker.hybrid_v2.services.neo4j_retry import retry_session
+
+logger = structlog.get_logger(__name__)
+
+
+def async_reads_enabled() -> bool:
+    """Whether reads may use the native async driver (default on)."""
+    return os.getenv("NEO4J_ASYNC_READS", "1").strip().lower() in {"1", "true", "yes"}
+
+
+class GraphReadRepository:
+    """Read-only Cypher access that prefers the native async driver.
+
+    Args:
+        driver: Sync Neo4j driver used for the thread-offload fallback.
+        async_neo4j: Optional ``AsyncNeo4jService``; used once connected.
+        database: Database for the sync fallback (``None`` = driver default).
+        executor: Executor for the sync fallback (``None`` = default executor).
+    """
+
+    def __init__(
+        self,
+        driver: Any = None,
+        async_neo4j: Any = None,
+        database: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.driver = driver
+        self.async_neo4j = async_neo4j
+        self.database = database
+        self.executor = executor
+
+    @property
+    def uses_async(self) -> bool:
+        """True when the next read will run on the native async driver."""
+        return (
+            self.async_neo4j is not None
+            and getattr(self.async_neo4j, "is_connected", False)
+            and async_reads_enabled()
+        )
+
+    async def fetch(self, query: str, **params: Any) -> List[Any]:
+        """Run a read query and return all records."""
+        if self.uses_async:
+            async with self.async_neo4j._get_session(read_only=True) as session:
+                result = await session.run(query, **params)
+                return list(result)
+        if self.driver is None:
+            raise RuntimeError("GraphReadRepository has neither an async service nor a sync driver")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._fetch_sync, query, params)
+
+    def _fetch_sync(self, query: str, params: Dict[str, Any]) -> List[Any]:
+        with retry_session(self.driver, database=self.database, read_only=True) as session:
+            return list(session.run(query, **params))
+
+    async def fetch_dicts(self, query: str, **params: Any) -> List[Dict[str, Any]]:
+        """Run a read query and return records as plain dicts."""
+        return [dict(record) for record in await self.fetch(query, **params)]
+
+    async def fetch_one(self, query: str, **params: Any) -> Optional[Any]:
+        """Run a read query and return the first record (or None)."""
+        records = await self.fetch(query, **params)
+        return records[0] if records else None
@@ -30,16 +30,41 @@ Usage::
 
 Context manager and ``__getattr__`` delegation ensure ``RetrySession`` is a
 drop-in replacement for a raw ``Session``.
+
+Bulk loads that would otherwise materialize a whole group in one transaction
+use the paged API instead: ``RetrySession.stream()`` yields records from
+keyset-paginated reads (one managed transaction — and one retry unit — per
+page) and ``RetrySession.read_embeddings()`` writes an embedding column
+straight into a preallocated ``float32`` matrix::
+
+    with retry_session(driver, read_only=True) as session:
+        for record in session.stream(
+            "MATCH (s:Sentence) WHERE s.group_id = $group_id "
+            "AND ($after IS NULL OR s.id > $after) "
+            "RETURN s.id AS id, s.text AS text ORDER BY s.id LIMIT $limit",
+            group_id=group_id,
+        ):
+            ...
+
+Keyset pages only pay off when the cursor is index-backed (``s.id`` above);
+otherwise every page re-matches and re-sorts the whole group.  Reads with no
+indexed cursor go through ``RetrySession.read_all()`` instead: one managed
+transaction whose result is consumed lazily as the driver fetches it.
 """
 
 from __future__ import annotations
 
 import logging
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Records per keyset page for ``RetrySession.stream`` / ``read_embeddings``.
+DEFAULT_STREAM_PAGE_SIZE = 2000
+
 
 # ── Lightweight EagerResult shim ─────────────────────────────────────────────
 # ``execute_read/write`` consume the Result inside the tx function.
@@ -228,6 +253,138 @@ class RetrySession:
             logger.debug("Neo4j %s failed: %s | query: %s", label, e, q_preview)
             raise
 
+    def stream(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        *,
+        key: str = "id",
+        page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Yield records from a keyset-paginated read, one page at a time.
+
+        The query must filter on ``$after`` (``NULL`` for the first page),
+        return the cursor column *key* and end with
+        ``ORDER BY <key> LIMIT $limit``, emitting one row per key value.
+        Each page runs in its own managed transaction, so a transient error
+        retries only that page and only one page of records is alive at once.
+        """
+        after = None
+        while True:
+            page = self.run(query, parameters, after=after, limit=page_size, **kwargs)
+            count = len(page)
+            if not count:
+                return
+            after = page[count - 1][key]
+            yield from page
+            del page
+            if count < page_size:
+                return
+
+    def read_all(
+        self,
+        query: str,
+        consume: Callable[[Iterator[Any]], T],
+        parameters: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> T:
+        """Run *query* in one managed transaction and return ``consume(records)``.
+
+        *records* is the driver's lazy result, fetched in batches while
+        *consume* iterates it, so only what *consume* keeps stays alive.  Use
+        it for bulk reads without an index-backed cursor, where ``stream()``
+        would re-match and re-sort the group for every page.  A transient
+        error re-runs the whole transaction, so *consume* must start from
+        scratch on every call.
+        """
+        merged = dict(parameters or {})
+        merged.update(kwargs)
+
+        def _tx_func(tx):
+            result = tx.run(query, merged)
+            value = consume(iter(result))
+            try:
+                result.consume()
+            except Exception:
+                pass
+            return value
+
+        executor = self._session.execute_read if self._read_only else self._session.execute_write
+        try:
+            return executor(_tx_func)
+        except Exception as e:
+            q_preview = str(query)[:80].replace("\n", " ")
+            logger.debug("Neo4j streamed read failed: %s | query: %s", e, q_preview)
+            raise
+
+    def read_embeddings(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        *,
+        embedding_key: str = "embedding",
+        key: Optional[str] = "id",
+        expected_rows: int = 0,
+        dim: Optional[int] = None,
+        page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+        **kwargs,
+    ) -> Tuple[List[Dict[str, Any]], Any, Any]:
+        """Stream *query* and copy its embedding column into a ``float32`` matrix.
+
+        Pagination follows ``stream()``; with ``key=None`` the query takes no
+        cursor and is read in a single pass through ``read_all()``.  The
+        matrix is preallocated for ``expected_rows`` (grown geometrically if
+        more arrive) and filled row by row, so the per-record float lists
+        from the driver never outlive their page.
+
+        Returns:
+            ``(rows, matrix, present)`` — ``rows`` holds every other column as a
+            dict, ``matrix`` is ``(len(rows), dim)`` ``float32`` and ``present``
+            is a bool mask of rows whose embedding was non-null with the
+            expected dimension (other rows are zero).  ``dim`` defaults to the
+            length of the first embedding seen.
+        """
+        import numpy as np
+
+        def _fill(records: Iterator[Any]) -> Tuple[List[Dict[str, Any]], Any, Any]:
+            rows: List[Dict[str, Any]] = []
+            capacity = max(int(expected_rows), 0)
+            matrix = np.zeros((capacity, dim), dtype=np.float32) if dim else None
+            present = np.zeros(capacity, dtype=bool)
+
+            for record in records:
+                row = dict(record)
+                embedding = row.pop(embedding_key, None)
+                i = len(rows)
+                rows.append(row)
+                if i >= capacity:
+                    capacity = max(2 * capacity, i + 1, 16)
+                    if matrix is not None:
+                        matrix = np.resize(matrix, (capacity, matrix.shape[1]))
+                        matrix[i:] = 0.0
+                    present = np.resize(present, capacity)
+                    present[i:] = False
+                if embedding is None:
+                    continue
+                if matrix is None:
+                    matrix = np.zeros((capacity, len(embedding)), dtype=np.float32)
+                if len(embedding) != matrix.shape[1]:
+                    continue
+                matrix[i] = embedding
+                present[i] = True
+
+            n = len(rows)
+            if matrix is None:
+                matrix = np.zeros((n, 0), dtype=np.float32)
+            elif matrix.shape[0] != n:
+                matrix = matrix[:n].copy()
+            return rows, matrix, present[:n].copy()
+
+        if key is None:
+            return self.read_all(query, _fill, parameters, **kwargs)
+        return _fill(self.stream(query, parameters, key=key, page_size=page_size, **kwargs))
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._session, name)
 
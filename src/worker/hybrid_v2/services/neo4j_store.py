@@ -21,10 +21,11 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from dataclasses import dataclass, field
 
 import neo4j
-from neo4j import GraphDatabase
 
 from src.core.config import settings, build_group_ids
 from src.worker.hybrid_v2.services.neo4j_retry import retry_session
+from src.worker.hybrid_v2.utils.geometry import compact_sentence_geometry
+from src.worker.services.neo4j_pool import get_neo4j_pool
 
 logger = logging.getLogger(__name__)
 
@@ -163,15 +164,10 @@ class Neo4jStoreV3:
             return self._driver
         with self._driver_lock:
             if self._driver is None:
-                self._driver = GraphDatabase.driver(
-                    self.uri,
-                    auth=(self.username, self.password),
-                    max_connection_lifetime=300,
-                    max_transaction_retry_time=120,
-                    connection_acquisition_timeout=120,
+                # Shared, pool-managed driver (verified on creation)
+                self._driver = get_neo4j_pool().get_driver(
+                    self.uri, self.username, self.password,
                 )
-                # Verify connectivity
-                self._driver.verify_connectivity()
                 logger.info(f"Connected to Neo4j at {self.uri}")
         return self._driver
     
@@ -207,10 +203,8 @@ class Neo4jStoreV3:
         return await asyncio.to_thread(_sync)
 
     def close(self):
-        """Close the Neo4j driver."""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """Release the shared driver (closed by ``Neo4jPoolManager`` at shutdown)."""
+        self._driver = None
     
     # ==================== Schema Management ====================
     
@@ -311,6 +305,9 @@ class Neo4jStoreV3:
                 except Exception as e:
                     logger.warning(f"Vector index creation failed: {e}")
         
+        # Index creation event: cached SHOW INDEXES snapshots are now stale
+        from src.worker.services.schema_registry import get_schema_registry
+        get_schema_registry().invalidate(self.driver)
         logger.info("Neo4j schema initialization complete")
 
     # ==================== Entity Operations ====================
@@ -430,7 +427,36 @@ class Neo4jStoreV3:
                 session.run(query, group_id=group_id).consume()
         except Exception as e:
             logger.warning(f"Failed to compute entity importance (continuing): {e}")
-    
+
+    def materialize_hub_tables(self, group_id: str) -> None:
+        """Persist the per-entity ``degree`` read by ``retrievers.hub_table``.
+
+        Run once the group's graph is final (after GDS / community steps), so
+        ``degree`` includes every edge type; ``compute_entity_importance``
+        runs before the KNN and community edges exist.
+
+        Stamps ``GroupMeta.hub_tables_at`` so readers know the column is
+        current.  Best-effort: readers compute degree live when the stamp is
+        missing or stale.
+        """
+
+        degree_query = """
+        MATCH (e:Entity {group_id: $group_id})
+        SET e.degree = COUNT { (e)-[]-() }
+        """
+
+        stamp_query = """
+        MERGE (g:GroupMeta {group_id: $group_id})
+        SET g.hub_tables_at = datetime()
+        """
+
+        try:
+            with self.get_retry_session() as session:
+                session.run(degree_query, group_id=group_id).consume()
+                session.run(stamp_query, group_id=group_id).consume()
+        except Exception as e:
+            logger.warning(f"Failed to materialize hub tables (continuing): {e}")
+
     async def aupsert_entities_batch(self, group_id: str, entities: List[Entity]) -> int:
         """Async batch insert/update entities with native vector support."""
         
@@ -1192,6 +1218,7 @@ class Neo4jStoreV3:
             sent.tokens = s.tokens,
             sent.parent_text = s.parent_text,
             sent.metadata = s.metadata,
+            sent.geometry = s.geometry,
             sent.index_in_section = s.index_in_section,
             sent.total_in_section = s.total_in_section,
             sent.hierarchical_id = s.hierarchical_id,
@@ -1245,6 +1272,8 @@ class Neo4jStoreV3:
                 "parent_text": s.parent_text or "",
                 "sentence_embedding": s.sentence_embedding,
                 "metadata": meta_str,
+                # Compact polygons + page dims read by citation enrichment
+                "geometry": compact_sentence_geometry(s.metadata),
                 "index_in_section": s.index_in_section,
                 "total_in_section": s.total_in_section,
                 "hierarchical_id": s.hierarchical_id,
@@ -1509,7 +1538,22 @@ class Neo4jStoreV3:
         with self.get_retry_session() as session:
             session.run(query, group_id=group_id)
             logger.info(f"Initialized GroupMeta for {group_id}")
-    
+
+    def mark_indexing_completed(self, group_id: str) -> None:
+        """Stamp ``GroupMeta.last_indexing_completed_at``.
+
+        Call this when an indexing run ends (successfully or not).  The group
+        version read by query-time caches is built from this stamp, so they
+        rebuild from the finished corpus rather than a mid-run snapshot.
+        """
+        query = """
+        MERGE (g:GroupMeta {group_id: $group_id})
+        SET g.last_indexing_completed_at = datetime()
+        """
+
+        with self.get_retry_session() as session:
+            session.run(query, group_id=group_id)
+
     def mark_gds_stale(self, group_id: str, reason: str = None) -> None:
         """Mark a group as needing GDS recomputation.
         
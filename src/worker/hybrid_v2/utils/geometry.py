@@ -0,0 +1,66 @@
+"""Compact per-sentence citation geometry.
+
+Sentence nodes carry a ``metadata`` JSON blob whose ``page_dimensions`` list
+holds every page of the source document, plus a copy of the sentence text.
+Citation enrichment only needs the sentence's polygons and the dimensions of
+the page(s) they sit on, so indexing also writes a compact ``geometry``
+property:
+
+    {"sentences": [{"polygons": [...], "page": 3, "confidence": 0.99}],
+     "page_dimensions": [{"page": 3, "width": 8.5, "height": 11, ...}]}
+
+``expand_sentence_geometry`` restores the citation shape (span ``text`` comes
+from the node's ``text`` property).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+
+# Scalar location fields copied through when present in the metadata.
+_LOCATION_KEYS = ("page_number", "start_offset", "end_offset")
+
+
+def _dim_page(dim: Dict[str, Any]) -> Any:
+    return dim.get("page") if dim.get("page") is not None else dim.get("page_number")
+
+
+def compact_sentence_geometry(metadata: Optional[Dict[str, Any]]) -> str:
+    """Compact geometry JSON for a Sentence's metadata ("" when there is none)."""
+    if not metadata:
+        return ""
+    geometry: Dict[str, Any] = {
+        key: metadata[key] for key in _LOCATION_KEYS if metadata.get(key) is not None
+    }
+    spans = [
+        {k: v for k, v in span.items() if k != "text"}
+        for span in metadata.get("sentences") or []
+        if isinstance(span, dict) and span.get("polygons")
+    ]
+    if spans:
+        geometry["sentences"] = spans
+        dims = [d for d in metadata.get("page_dimensions") or [] if isinstance(d, dict)]
+        pages = {span.get("page") for span in spans}
+        on_page = [d for d in dims if _dim_page(d) in pages]
+        if on_page or dims:
+            geometry["page_dimensions"] = on_page or dims
+    if not geometry:
+        return ""
+    return json.dumps(geometry, separators=(",", ":"), default=str)
+
+
+def expand_sentence_geometry(raw: Any, text: Optional[str] = None) -> Dict[str, Any]:
+    """Parse a ``geometry`` property back into citation fields (``{}`` if empty/invalid)."""
+    if not raw:
+        return {}
+    try:
+        geometry = json.loads(raw) if isinstance(raw, str) else dict(raw)
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return {}
+    if not isinstance(geometry, dict):
+        return {}
+    if text is not None:
+        for span in geometry.get("sentences") or []:
+            span.setdefault("text", text)
+    return geometry
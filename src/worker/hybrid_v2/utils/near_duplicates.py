@@ -0,0 +1,191 @@
+"""
+Near-duplicate detection for retrieved text (chunks, sentences, triples).
+
+Replaces the greedy O(n²) word-set Jaccard loops used for semantic dedup
+with a two-tier detector:
+
+1. **Exact tier** — a content hash of the normalized word set.  Texts with
+   identical word sets have Jaccard 1.0 and are duplicates at any threshold.
+2. **MinHash + LSH banding** — each word set gets a MinHash signature whose
+   bands are bucketed; only texts sharing a bucket with an already-kept text
+   become candidates, and each candidate is confirmed with the exact word-set
+   Jaccard.
+
+Because every candidate is verified exactly, kept/removed decisions are
+those of the brute-force loop whenever LSH surfaces the true match.  The
+band/row split is chosen per threshold so that a pair at the threshold is
+missed with probability below ``1e-4`` (pairs above it even less), while
+dissimilar pairs rarely collide — so comparisons stay close to linear.
+
+Usage::
+
+    detector = NearDuplicateDetector(threshold=0.92)
+    kept = [c for c in chunks if detector.add(c["text"])]
+
+    # or, for an ordering different from the list order:
+    kept_indices = dedup_indices(texts, threshold=0.92, order=ranked_indices)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_MERSENNE_PRIME = (1 << 31) - 1
+_MAX_FALSE_NEGATIVE = 1e-4
+
+
+def word_set(text: Optional[str]) -> FrozenSet[str]:
+    """Lowercase alphanumeric word set (the unit the Jaccard is computed over)."""
+    return frozenset(_WORD_RE.findall((text or "").lower()))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Word-set Jaccard similarity (0.0 when both are empty)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Return ``(bands, rows)`` for *threshold*.
+
+    Picks the most selective split (most rows per band) whose probability of
+    missing a pair at exactly *threshold* — ``(1 - t**rows) ** bands`` — stays
+    below ``1e-4``.
+    """
+    t = min(max(float(threshold), 1e-6), 1.0)
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1.0 - t ** rows) ** bands <= _MAX_FALSE_NEGATIVE:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateDetector:
+    """Incremental near-duplicate index over word-set Jaccard.
+
+    Args:
+        threshold: Jaccard similarity at or above which two texts are
+            near-duplicates.
+        num_perm: MinHash signature length.
+        seed: Seed for the MinHash permutations (deterministic per seed).
+
+    ``scope`` arguments partition the index: texts are only compared with
+    texts added under the same scope (e.g. the same document).
+    """
+
+    def __init__(self, threshold: float = 0.92, num_perm: int = 128, seed: int = 1):
+        self.threshold = float(threshold)
+        self.num_perm = int(num_perm)
+        self.bands, self.rows = lsh_params(self.threshold, self.num_perm)
+        rng = np.random.RandomState(seed)
+        # Universal hashing (a*h + b) mod p with a, b, h < p = 2**31 - 1,
+        # so a*h + b stays well inside uint64.
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=self.num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=self.num_perm, dtype=np.int64).astype(np.uint64)
+        self._p = np.uint64(_MERSENNE_PRIME)
+        self._token_hashes: Dict[str, int] = {}
+        self._exact: set = set()
+        self._buckets: Dict[Tuple[Hashable, int, bytes], List[int]] = {}
+        self._sets: List[FrozenSet[str]] = []
+        self.comparisons = 0
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+    def _signature(self, words: FrozenSet[str]) -> np.ndarray:
+        cache = self._token_hashes
+        hashes = np.fromiter(
+            (cache.get(w) or cache.setdefault(w, zlib.crc32(w.encode()) % _MERSENNE_PRIME or 1) for w in words),
+            dtype=np.uint64,
+            count=len(words),
+        )
+        return ((np.outer(self._a, hashes) + self._b[:, None]) % self._p).min(axis=1)
+
+    def _band_keys(self, words: FrozenSet[str], scope: Hashable) -> List[Tuple[Hashable, int, bytes]]:
+        sig = self._signature(words)
+        r = self.rows
+        return [(scope, band, sig[band * r:(band + 1) * r].tobytes()) for band in range(self.bands)]
+
+    @staticmethod
+    def _exact_key(words: FrozenSet[str], scope: Hashable) -> Tuple[Hashable, bytes]:
+        digest = hashlib.blake2b("\x1f".join(sorted(words)).encode(), digest_size=16).digest()
+        return scope, digest
+
+    def _check(self, words: FrozenSet[str], scope: Hashable) -> Tuple[bool, Optional[List[Tuple[Hashable, int, bytes]]]]:
+        if not words:
+            return False, None
+        if self._exact_key(words, scope) in self._exact:
+            return True, None
+        keys = self._band_keys(words, scope)
+        seen: set = set()
+        for key in keys:
+            for idx in self._buckets.get(key, ()):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                self.comparisons += 1
+                if jaccard(words, self._sets[idx]) >= self.threshold:
+                    return True, None
+        return False, keys
+
+    def is_duplicate(self, text: Optional[str], scope: Hashable = None) -> bool:
+        """True when *text* near-duplicates something already added (no insert)."""
+        return self._check(word_set(text), scope)[0]
+
+    def add(self, text: Optional[str], scope: Hashable = None) -> bool:
+        """Insert *text* unless it is a near-duplicate.
+
+        Returns:
+            True if the text was kept (inserted), False if it is a duplicate.
+            Empty texts are always kept and never match anything.
+        """
+        words = word_set(text)
+        duplicate, keys = self._check(words, scope)
+        if duplicate:
+            return False
+        if words:
+            self._insert(words, scope, keys)
+        return True
+
+    def insert(self, text: Optional[str], scope: Hashable = None) -> None:
+        """Insert *text* without checking (e.g. to seed with existing evidence)."""
+        words = word_set(text)
+        if words:
+            self._insert(words, scope, None)
+
+    def _insert(self, words: FrozenSet[str], scope: Hashable, keys: Optional[List[Tuple[Hashable, int, bytes]]]) -> None:
+        idx = len(self._sets)
+        self._sets.append(words)
+        self._exact.add(self._exact_key(words, scope))
+        for key in keys if keys is not None else self._band_keys(words, scope):
+            self._buckets.setdefault(key, []).append(idx)
+
+
+def dedup_indices(
+    texts: Sequence[Optional[str]],
+    threshold: float = 0.92,
+    *,
+    order: Optional[Iterable[int]] = None,
+    scopes: Optional[Sequence[Hashable]] = None,
+) -> List[int]:
+    """Greedy near-duplicate removal.
+
+    Visits ``texts`` in *order* (default: list order), keeping each text that
+    does not near-duplicate an already-kept one.
+
+    Returns:
+        Kept indices, in visit order.
+    """
+    detector = NearDuplicateDetector(threshold=threshold)
+    visit = range(len(texts)) if order is None else order
+    return [
+        i for i in visit
+        if detector.add(texts[i], scopes[i] if scopes is not None else None)
+    ]
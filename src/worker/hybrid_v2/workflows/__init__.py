@@ -30,11 +30,12 @@ from .events import (
     EvidenceRetrievedEvent,
 )
 
-from .drift_workflow import DRIFTWorkflow
+from .drift_workflow import DRIFTWorkflow, SubQuestionBudget
 
 __all__ = [
     # Workflows
     "DRIFTWorkflow",
+    "SubQuestionBudget",
     # Events
     "DecomposeEvent",
     "SubQuestionEvent",
@@ -11,12 +11,28 @@ Key improvements over sequential implementation:
 Flow:
     StartEvent → decompose → [SubQuestionEvent...] (parallel) → collect_results
     → check_confidence → synthesize | redecompose → StopEvent
+
+Adaptive controls:
+- Sub-questions of every DRIFT workflow in the process share one pool of
+  ``ROUTE4_SUBQUESTION_CONCURRENCY`` slots (default 8); the step's worker
+  count is derived from it.
+- With ``ROUTE4_EARLY_EXIT=1`` (default off), once at least
+  ``ROUTE4_EARLY_EXIT_MIN_ANSWERED`` (default 2) sub-questions have answered
+  and together cover every entity NER found in the original query,
+  outstanding first-round sub-questions are cancelled.  Off by default:
+  sub-questions usually target different facets of the same entities, and
+  a cancelled one loses that facet's evidence.
+- ``redecompose`` only runs when another round fits in the wall-clock budget
+  (``ROUTE4_LATENCY_BUDGET_MS``, default 20000), estimating the round from
+  the one just finished.
 """
 
 import asyncio
 import os
 import time
-from typing import Dict, Any, List, Optional, Tuple
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 
 import structlog
 from llama_index.core.workflow import (
@@ -39,6 +55,77 @@ from .events import (
 logger = structlog.get_logger(__name__)
 
 
+def early_exit_enabled() -> bool:
+    """Whether covered queries cancel outstanding sub-questions (default off)."""
+    return os.getenv("ROUTE4_EARLY_EXIT", "0").strip().lower() in {"1", "true", "yes"}
+
+
+def _entity_key(name: str) -> str:
+    return name.lower().strip()
+
+
+class SubQuestionBudget:
+    """Sub-question slots shared by every DRIFT workflow on an event loop.
+
+    ``slot()`` bounds in-flight entity discovery + tracing across concurrent
+    queries, so a query with many sub-questions cannot take every
+    disambiguator / tracer call away from the others.
+    """
+
+    def __init__(self, slots: int):
+        self.slots = max(1, slots)
+        self.in_flight = 0
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.slots)
+        async with semaphore:
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+
+SUB_QUESTION_BUDGET = SubQuestionBudget(int(os.getenv("ROUTE4_SUBQUESTION_CONCURRENCY", "8")))
+
+
+class _EarlyExit:
+    """Entity coverage of one sub-question round; ``event`` is set once complete.
+
+    Coverage is complete when at least *min_answered* sub-questions have
+    answered and their entities include every target.
+    """
+
+    def __init__(self, entities: List[str], min_answered: Optional[int] = None):
+        self.targets = {_entity_key(e) for e in entities}
+        self.min_answered = max(
+            1,
+            min_answered if min_answered is not None
+            else int(os.getenv("ROUTE4_EARLY_EXIT_MIN_ANSWERED", "2")),
+        )
+        self.answered: set = set()
+        self.answered_count = 0
+        self.event = asyncio.Event()
+
+    def record(self, entities: List[str]) -> bool:
+        """Add one answer's *entities*; True when this call completed the coverage."""
+        if self.event.is_set():
+            return False
+        self.answered_count += 1
+        self.answered.update(_entity_key(e) for e in entities)
+        if self.answered_count >= self.min_answered and self.targets <= self.answered:
+            self.event.set()
+            return True
+        return False
+
+
 class DRIFTWorkflow(Workflow):
     """DRIFT-style iterative reasoning workflow with parallel sub-question processing.
     
@@ -53,6 +140,10 @@ class DRIFTWorkflow(Workflow):
         pipeline: The HybridSearchPipeline instance for accessing services
         timeout: Maximum execution time in seconds (default: 120)
         max_redecompose_attempts: Maximum re-decomposition attempts (default: 1)
+        latency_budget_ms: Wall-clock budget a re-decomposition round must fit
+            in (default: ``ROUTE4_LATENCY_BUDGET_MS`` or 20000)
+        sub_question_budget: Shared sub-question slots (default: process-wide
+            ``SUB_QUESTION_BUDGET``; at most that many run per workflow)
     
     Example:
         workflow = DRIFTWorkflow(pipeline=pipeline, timeout=60)
@@ -67,11 +158,18 @@ class DRIFTWorkflow(Workflow):
         pipeline: Any,  # HybridSearchPipeline
         timeout: int = 120,
         max_redecompose_attempts: int = 1,
+        latency_budget_ms: Optional[int] = None,
+        sub_question_budget: Optional[SubQuestionBudget] = None,
         **kwargs
     ):
         super().__init__(timeout=timeout, **kwargs)
         self.pipeline = pipeline
         self.max_redecompose_attempts = max_redecompose_attempts
+        self.latency_budget_ms = (
+            latency_budget_ms if latency_budget_ms is not None
+            else int(os.getenv("ROUTE4_LATENCY_BUDGET_MS", "20000"))
+        )
+        self.sub_question_budget = sub_question_budget or SUB_QUESTION_BUDGET
     
     # =========================================================================
     # Step 1: Decompose Query
@@ -95,6 +193,8 @@ class DRIFTWorkflow(Workflow):
         await ctx.store.set("timings_ms", {})
         
         t0 = time.perf_counter()
+        await ctx.store.set("started_at", t0)
+        await ctx.store.set("round_started_at", t0)
         
         # Stage 4.0: Check for deterministic date metadata queries
         if self.pipeline.enhanced_retriever:
@@ -171,6 +271,12 @@ class DRIFTWorkflow(Workflow):
         sub_questions = await ctx.store.get("sub_questions", [])
         
         logger.info("drift_fan_out", num_sub_questions=len(sub_questions))
+
+        # Early exit applies to the first round: set once answers cover the
+        # original query's entities (see collect_and_check)
+        original_entities = await ctx.store.get("original_query_entities", [])
+        early_exit = _EarlyExit(original_entities) if early_exit_enabled() and original_entities else None
+        await ctx.store.set("early_exit", early_exit)
         
         # Send each sub-question event - they will be processed in PARALLEL
         for i, sq in enumerate(sub_questions):
@@ -186,17 +292,48 @@ class DRIFTWorkflow(Workflow):
     # Step 3: Process Single Sub-Question (runs in parallel for each)
     # =========================================================================
     
-    @step(num_workers=4)  # Process up to 4 sub-questions in parallel
+    @step(num_workers=SUB_QUESTION_BUDGET.slots)  # Bounded by the shared sub-question budget
     async def process_sub_question(
         self, ctx: Context, ev: SubQuestionEvent
     ) -> SubQuestionResultEvent:
         """Stage 4.2: Process a single sub-question.
         
-        This step runs IN PARALLEL for each SubQuestionEvent (num_workers=4).
-        Each instance:
+        This step runs IN PARALLEL for each SubQuestionEvent, holding one
+        slot of the shared sub-question budget while it works.  Each instance:
         1. Disambiguates entities for this sub-question
         2. Retrieves evidence via PPR tracing
+        
+        If earlier answers already cover the original query's entities, the
+        sub-question is skipped (or cancelled mid-flight) and reported as
+        ``cancelled``.
         """
+        early_exit: Optional[_EarlyExit] = await ctx.store.get("early_exit", None)
+        covered = early_exit.event if early_exit is not None else None
+        if covered is not None and covered.is_set():
+            return self._cancelled_result(ev)
+
+        async with self.sub_question_budget.slot():
+            if covered is not None and covered.is_set():
+                return self._cancelled_result(ev)
+
+            work = asyncio.ensure_future(self._answer_sub_question(ev))
+            try:
+                if covered is not None:
+                    waiter = asyncio.ensure_future(covered.wait())
+                    try:
+                        await asyncio.wait({work, waiter}, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        waiter.cancel()
+                    if not work.done():
+                        logger.info("drift_sub_question_cancelled", index=ev.index + 1)
+                        return self._cancelled_result(ev)
+                return await work
+            finally:
+                if not work.done():
+                    work.cancel()
+
+    async def _answer_sub_question(self, ev: SubQuestionEvent) -> SubQuestionResultEvent:
+        """Entity discovery + evidence retrieval for one sub-question."""
         t0 = time.perf_counter()
         
         logger.info(f"drift_sub_question_{ev.index + 1}", 
@@ -230,6 +367,17 @@ class DRIFTWorkflow(Workflow):
             evidence_count=evidence_count,
             index=ev.index,
         )
+
+    @staticmethod
+    def _cancelled_result(ev: SubQuestionEvent) -> SubQuestionResultEvent:
+        return SubQuestionResultEvent(
+            question=ev.sub_question,
+            entities=[],
+            evidence=[],
+            evidence_count=0,
+            index=ev.index,
+            cancelled=True,
+        )
     
     # =========================================================================
     # Step 4: Collect Results & Check Confidence
@@ -242,8 +390,18 @@ class DRIFTWorkflow(Workflow):
         """Stage 4.3 + 4.3.5: Collect results and compute confidence.
         
         This step collects all SubQuestionResultEvents and, once all are
-        received, computes confidence metrics to decide next action.
+        received, computes confidence metrics to decide next action.  While
+        results arrive it tracks which original-query entities answered
+        sub-questions have found evidence for, and signals early exit once
+        all of them are covered.
         """
+        early_exit: Optional[_EarlyExit] = await ctx.store.get("early_exit", None)
+        if early_exit is not None and not ev.cancelled and ev.evidence_count > 0:
+            if early_exit.record(ev.entities):
+                logger.info("drift_early_exit",
+                           covered_entities=sorted(early_exit.targets),
+                           after_index=ev.index + 1)
+
         num_expected = await ctx.store.get("num_sub_questions", 1)
         
         # Collect events - returns None until all are received
@@ -255,12 +413,18 @@ class DRIFTWorkflow(Workflow):
         
         # Sort by index to maintain order
         sorted_results = sorted(results, key=lambda r: r.index)
+        cancelled = [r.question for r in sorted_results if r.cancelled]
+        if cancelled:
+            previous = await ctx.store.get("cancelled_sub_questions", [])
+            await ctx.store.set("cancelled_sub_questions", previous + cancelled)
         
         # Aggregate all seeds
         all_seeds: List[str] = []
         intermediate_results: List[Dict[str, Any]] = []
         
         for r in sorted_results:
+            if r.cancelled:
+                continue
             all_seeds.extend(r.entities)
             intermediate_results.append({
                 "question": r.question,
@@ -305,12 +469,15 @@ class DRIFTWorkflow(Workflow):
     ) -> SynthesizeEvent | ReDecomposeEvent:
         """Stage 4.3.5: Evaluate confidence and decide next action.
         
-        If confidence is low and we haven't exceeded redecompose attempts,
-        trigger re-decomposition. Otherwise, proceed to synthesis.
+        If confidence is low, we haven't exceeded redecompose attempts and
+        another round (estimated from the one just finished) fits in the
+        latency budget, trigger re-decomposition. Otherwise, proceed to
+        synthesis.  Cancelled sub-questions don't count as unanswered.
         """
         t0 = time.perf_counter()
         
-        sub_questions = await ctx.store.get("sub_questions", [])
+        cancelled = set(await ctx.store.get("cancelled_sub_questions", []))
+        sub_questions = [q for q in await ctx.store.get("sub_questions", []) if q not in cancelled]
         intermediate_results = await ctx.store.get("intermediate_results", [])
         all_seeds = await ctx.store.get("all_seeds", [])
         redecompose_count = await ctx.store.get("redecompose_count", 0)
@@ -349,6 +516,18 @@ class DRIFTWorkflow(Workflow):
                 (len(confidence_metrics["concentrated_entities"]) > 0 and confidence < 0.7)
             )
         )
+
+        if should_redecompose:
+            now = time.perf_counter()
+            elapsed_ms = int((now - await ctx.store.get("started_at", now)) * 1000)
+            round_ms = int((now - await ctx.store.get("round_started_at", now)) * 1000)
+            if elapsed_ms + round_ms > self.latency_budget_ms:
+                should_redecompose = False
+                await ctx.store.set("redecompose_skipped", "latency_budget")
+                logger.info("drift_redecompose_skipped_budget",
+                           elapsed_ms=elapsed_ms,
+                           estimated_round_ms=round_ms,
+                           budget_ms=self.latency_budget_ms)
         
         if should_redecompose:
             thin_questions = confidence_metrics["thin_questions"]
@@ -409,6 +588,9 @@ class DRIFTWorkflow(Workflow):
         """
         redecompose_count = await ctx.store.get("redecompose_count", 0)
         await ctx.store.set("redecompose_count", redecompose_count + 1)
+        await ctx.store.set("round_started_at", time.perf_counter())
+        # Refined questions target thin evidence, not entity coverage: no early exit
+        await ctx.store.set("early_exit", None)
         
         logger.info("drift_redecompose", attempt=redecompose_count + 1)
         
@@ -450,7 +632,9 @@ class DRIFTWorkflow(Workflow):
         
         original_query = ev.original_query
         response_type = ev.response_type
-        sub_questions = await ctx.store.get("sub_questions", [])
+        cancelled = await ctx.store.get("cancelled_sub_questions", [])
+        cancelled_set = set(cancelled)
+        sub_questions = [q for q in await ctx.store.get("sub_questions", []) if q not in cancelled_set]
         intermediate_results = await ctx.store.get("intermediate_results", [])
         complete_evidence = await ctx.store.get("complete_evidence", [])
         
@@ -487,6 +671,8 @@ class DRIFTWorkflow(Workflow):
                 "parallel_sub_questions": True,
                 "timings_ms": timings,
                 "redecompose_attempts": await ctx.store.get("redecompose_count", 0),
+                "redecompose_skipped": await ctx.store.get("redecompose_skipped", None),
+                "cancelled_sub_questions": len(cancelled)
             }
         }
         
@@ -45,6 +45,7 @@ class SubQuestionResultEvent(Event):
     evidence: List[Any]  # List of (entity_name, score) tuples
     evidence_count: int
     index: int
+    cancelled: bool = False  # Skipped once earlier answers covered the query's entities
 
 
 class ConfidenceCheckEvent(Event):
@@ -31,7 +31,7 @@ import logging
 from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional, Tuple
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import AsyncDriver, AsyncSession
 from neo4j.exceptions import Neo4jError
 
 from src.core.config import settings, build_group_ids
@@ -93,14 +93,12 @@ class AsyncNeo4jService:
         username: str,
         password: str,
         database: str = "neo4j",
-        max_connection_pool_size: int = 50,
     ):
         self._uri = uri
         self._username = username
         self._password = password
         self._database = database
         self._driver: Optional[AsyncDriver] = None
-        self._max_pool_size = max_connection_pool_size
     
     @classmethod
     def from_settings(cls) -> "AsyncNeo4jService":
@@ -113,23 +111,24 @@ class AsyncNeo4jService:
         )
     
     async def connect(self) -> None:
-        """Initialize the async driver connection pool."""
+        """Attach to the process-wide async driver for this event loop."""
         if self._driver is not None:
             return
-        
-        self._driver = AsyncGraphDatabase.driver(
-            self._uri,
-            auth=(self._username, self._password),
-            max_connection_pool_size=self._max_pool_size,
+
+        from src.worker.services.neo4j_pool import get_neo4j_pool
+
+        self._driver = await get_neo4j_pool().get_async_driver(
+            self._uri, self._username, self._password,
         )
-        # Verify connectivity
-        await self._driver.verify_connectivity()
         logger.info("async_neo4j_connected", extra={"uri": self._uri})
     
     async def close(self) -> None:
-        """Close the driver and release connections."""
+        """Release this service's reference to the shared driver.
+
+        The driver itself is owned by ``Neo4jPoolManager`` and closed at
+        application shutdown.
+        """
         if self._driver:
-            await self._driver.close()
             self._driver = None
             logger.info("async_neo4j_closed")
     
@@ -140,17 +139,23 @@ class AsyncNeo4jService:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
     
-    def _get_session(self) -> AsyncSession:
+    @property
+    def is_connected(self) -> bool:
+        """True once ``connect()`` has attached a driver."""
+        return self._driver is not None
+
+    def _get_session(self, read_only: bool = False) -> AsyncSession:
         """Get a retry-enabled async session from the driver.
 
         Returns an ``AsyncRetrySession`` that transparently retries on
         transient Neo4j errors (ServiceUnavailable, SessionExpired, etc.)
-        with exponential backoff (3 attempts, 1-30 s).
+        with exponential backoff (3 attempts, 1-30 s).  ``read_only=True``
+        routes through ``execute_read`` (read replicas).
         """
         if not self._driver:
             raise RuntimeError("AsyncNeo4jService not connected. Call connect() first.")
         raw_session = self._driver.session(database=self._database)
-        return AsyncRetrySession(raw_session)  # type: ignore[return-value]
+        return AsyncRetrySession(raw_session, read_only=read_only)  # type: ignore[return-value]
     
     # =========================================================================
     # Entity Retrieval (Route 2 Hot Path)
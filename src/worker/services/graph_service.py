@@ -14,7 +14,6 @@ from typing import List, Optional, Dict, Any, Tuple
 import logging
 import threading
 import neo4j
-from neo4j import GraphDatabase
 
 # Use standalone store (compatible with neo4j driver v6.0+)
 from src.worker.services.neo4j_standalone_store import (
@@ -447,12 +446,13 @@ class GraphService:
         """Initialize the shared Neo4j driver."""
         if settings.NEO4J_URI and settings.NEO4J_USERNAME and settings.NEO4J_PASSWORD:
             try:
-                driver = GraphDatabase.driver(
+                # Shared pool driver (connectivity verified on creation)
+                from src.worker.services.neo4j_pool import get_neo4j_pool
+                driver = get_neo4j_pool().get_driver(
                     settings.NEO4J_URI,
-                    auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD)
+                    settings.NEO4J_USERNAME,
+                    settings.NEO4J_PASSWORD,
                 )
-                # Verify connectivity
-                driver.verify_connectivity()
                 self._driver = driver
                 logger.info(f"Connected to Neo4j at {settings.NEO4J_URI}")
                 
@@ -808,8 +808,7 @@ class GraphService:
             return {"url": url, "total_nodes": 0, "label_sets": [], "pages": []}
 
     def close(self) -> None:
-        """Close the Neo4j driver connection."""
+        """Release the shared driver (closed by ``Neo4jPoolManager`` at shutdown)."""
         if self._driver:
-            self._driver.close()
             self._driver = None
-            logger.info("Neo4j driver closed")
+            logger.info("Neo4j driver released")
@@ -37,6 +37,7 @@ from neo4j_graphrag.llm import AzureOpenAILLM
 from src.worker.services.graph_service import GraphService, MultiTenantNeo4jStore
 from src.worker.services.schema_aware_extractor import SchemaAwareExtractor, TableAwareExtractor
 from src.worker.services.llm_service import LLMService
+from src.worker.services.neo4j_pool import get_neo4j_pool
 from src.worker.services.schema_converter import SchemaConverter
 from src.worker.services.schema_service import SchemaService
 from src.core.config import settings
@@ -304,8 +305,6 @@ class IndexingService:
         Returns:
             Indexing statistics
         """
-        import neo4j
-        
         logger.info(f"Phase 2 native indexing for group {group_id}: {len(documents)} documents")
         
         # Create neo4j-graphrag LLM
@@ -372,48 +371,42 @@ class IndexingService:
                 rel.properties = {}
             rel.properties["group_id"] = group_id
         
-        # Write to Neo4j using driver
-        driver = neo4j.GraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
-        )
-        
-        try:
-            with driver.session(database=settings.NEO4J_DATABASE or "neo4j") as session:
-                # Write nodes
-                for node in graph.nodes:
-                    raw_labels = node.labels if node.labels else ["Entity"]
-                    labels = ":".join(_sanitize_cypher_label(l) for l in raw_labels)
-                    props = node.properties or {}
-                    props["id"] = node.id
-                    
-                    session.run(
-                        f"MERGE (n:{labels} {{id: $id, group_id: $group_id}}) SET n += $props",
-                        id=node.id,
-                        props=props,
-                        group_id=group_id,
-                    )
-                
-                # Write relationships
-                for rel in graph.relationships:
-                    rel_type = _sanitize_cypher_label(rel.type)
-                    session.run(
-                        f"""
-                        MATCH (a {{id: $start_id, group_id: $group_id}})
-                        MATCH (b {{id: $end_id, group_id: $group_id}})
-                        MERGE (a)-[r:{rel_type}]->(b)
-                        SET r += $props
-                        SET r.group_id = $group_id
-                        """,
-                        start_id=rel.start_node_id,
-                        end_id=rel.end_node_id,
-                        props=rel.properties or {},
-                        group_id=group_id,
-                    )
+        # Write to Neo4j using the shared pool driver
+        driver = get_neo4j_pool().get_driver()
+
+        with driver.session(database=settings.NEO4J_DATABASE or "neo4j") as session:
+            # Write nodes
+            for node in graph.nodes:
+                raw_labels = node.labels if node.labels else ["Entity"]
+                labels = ":".join(_sanitize_cypher_label(l) for l in raw_labels)
+                props = node.properties or {}
+                props["id"] = node.id
                 
-                logger.info(f"Native extraction wrote {len(graph.nodes)} nodes, {len(graph.relationships)} relationships")
-        finally:
-            driver.close()
+                session.run(
+                    f"MERGE (n:{labels} {{id: $id, group_id: $group_id}}) SET n += $props",
+                    id=node.id,
+                    props=props,
+                    group_id=group_id,
+                )
+            
+            # Write relationships
+            for rel in graph.relationships:
+                rel_type = _sanitize_cypher_label(rel.type)
+                session.run(
+                    f"""
+                    MATCH (a {{id: $start_id, group_id: $group_id}})
+                    MATCH (b {{id: $end_id, group_id: $group_id}})
+                    MERGE (a)-[r:{rel_type}]->(b)
+                    SET r += $props
+                    SET r.group_id = $group_id
+                    """,
+                    start_id=rel.start_node_id,
+                    end_id=rel.end_node_id,
+                    props=rel.properties or {},
+                    group_id=group_id,
+                )
+            
+            logger.info(f"Native extraction wrote {len(graph.nodes)} nodes, {len(graph.relationships)} relationships")
         
         stats = {
             "group_id": group_id,
@@ -0,0 +1,237 @@
+"""Local (offline) language detection for short queries.
+
+Used by ``TranslatorService`` to skip the Azure Translator round-trip when a
+query is confidently already in the target language — the common case for
+English tenants, where every remote call used to come back with
+``was_translated=False``.
+
+Two stages, no network and no model files:
+
+1. **Character classes** — letters are bucketed by Unicode script.  A
+   dominant non-Latin script identifies the language directly (kana → ja,
+   Hangul → ko, Han-only → zh, Thai, Greek, Hebrew, Arabic, Devanagari, …).
+2. **Latin n-gram profile** — Latin-script text is scored against compact
+   per-language profiles of function words, diacritics and character
+   trigrams for en/de/fr/es/it/pt/nl.
+
+``detect_language`` returns ``(language, confidence)``.  Confidence is
+deliberately conservative: short or mixed inputs get low scores so callers
+fall through to the remote detector instead of guessing.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Dict, FrozenSet, Tuple
+
+_WORD_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+# ---------------------------------------------------------------------------
+# Stage 1: script classes
+# ---------------------------------------------------------------------------
+
+# (start, end, script) — checked in order, first match wins.
+_SCRIPT_RANGES = (
+    (0x0041, 0x024F, "latin"),
+    (0x1E00, 0x1EFF, "latin"),
+    (0x0370, 0x03FF, "greek"),
+    (0x0400, 0x052F, "cyrillic"),
+    (0x0590, 0x05FF, "hebrew"),
+    (0x0600, 0x06FF, "arabic"),
+    (0x0750, 0x077F, "arabic"),
+    (0x0900, 0x097F, "devanagari"),
+    (0x0E00, 0x0E7F, "thai"),
+    (0x3040, 0x309F, "kana"),
+    (0x30A0, 0x30FF, "kana"),
+    (0x31F0, 0x31FF, "kana"),
+    (0xFF66, 0xFF9F, "kana"),
+    (0x1100, 0x11FF, "hangul"),
+    (0x3130, 0x318F, "hangul"),
+    (0xAC00, 0xD7AF, "hangul"),
+    (0x3400, 0x4DBF, "han"),
+    (0x4E00, 0x9FFF, "han"),
+    (0xF900, 0xFAFF, "han"),
+)
+
+# Scripts that map to a single language with high confidence.
+_SCRIPT_LANGUAGE = {
+    "greek": "el",
+    "hebrew": "he",
+    "thai": "th",
+    "hangul": "ko",
+    "devanagari": "hi",
+}
+
+# Cyrillic letters that do not occur in Russian.
+_UKRAINIAN_LETTERS = frozenset("іїєґ")
+
+
+def _script(ch: str) -> str:
+    cp = ord(ch)
+    for start, end, name in _SCRIPT_RANGES:
+        if start <= cp <= end:
+            return name
+    return "other"
+
+
+def script_counts(text: str) -> Dict[str, int]:
+    """Count letters per Unicode script (digits, spaces, punctuation ignored)."""
+    counts: Dict[str, int] = {}
+    for ch in text:
+        if ch.isalpha():
+            name = _script(ch)
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Stage 2: Latin-script profiles
+# ---------------------------------------------------------------------------
+
+_FUNCTION_WORDS: Dict[str, FrozenSet[str]] = {
+    "en": frozenset(
+        "the of and to in is are was were be been for on with that this these "
+        "those it its by as at from or an which what who whom whose when where "
+        "why how does do did has have had can could should would will shall "
+        "not any all there their they we you our your my me i a".split()
+    ),
+    "de": frozenset(
+        "der die das und ist sind war waren ein eine einer eines einem den dem "
+        "des nicht mit von zu im auf für wie was wer wann wo warum welche "
+        "welcher welches gibt es sich auch oder aus bei nach über unter kann "
+        "muss wird werden haben hat ich sie wir ihr".split()
+    ),
+    "fr": frozenset(
+        "le la les des du de et est sont un une au aux dans pour par sur avec "
+        "qui que quoi quel quelle quels quelles est-ce ce cette ces il elle ils "
+        "elles nous vous pas ne ou où comment pourquoi quand y a été être "
+        "avoir son sa ses leur".split()
+    ),
+    "es": frozenset(
+        "el la los las de del y es son un una en por para con que qué cuál "
+        "cuáles cómo cuándo dónde quién se su sus al lo no o hay está están "
+        "fue ser muy pero como este esta estos estas".split()
+    ),
+    "it": frozenset(
+        "il lo la gli le di del della dei delle e è sono un una uno in per con "
+        "che cosa quale quali come quando dove chi non o ci si suo sua al alla "
+        "nel nella questo questa quello sul".split()
+    ),
+    "pt": frozenset(
+        "o a os as de do da dos das e é são um uma em no na nos nas por para "
+        "com que qual quais como quando onde quem não ou se seu sua ao à foi "
+        "ser está estão este esta isso pelo pela".split()
+    ),
+    "nl": frozenset(
+        "de het een en is zijn was waren van in op voor met dat die dit deze "
+        "niet wat wie wanneer waar waarom hoe welke er te aan bij ook of naar "
+        "om door kan moet wordt worden heeft hebben".split()
+    ),
+}
+
+# Letters that are (nearly) exclusive to one language among the profiled set.
+_DIACRITICS: Dict[str, FrozenSet[str]] = {
+    "de": frozenset("äöüß"),
+    "fr": frozenset("çœæèêëîïûùÿ"),
+    "es": frozenset("ñ¿¡"),
+    "it": frozenset("ìò"),
+    "pt": frozenset("ãõ"),
+    "nl": frozenset("ĳ"),
+}
+
+# Frequent character trigrams (word-boundary padded with spaces).
+_TRIGRAMS: Dict[str, FrozenSet[str]] = {
+    "en": frozenset([" th", "the", "he ", "ing", "ng ", " an", "and", "nd ", "ion", " of", "of ", "ed ", " wh", "tio", "ent", "er "]),
+    "de": frozenset(["en ", "er ", "ch ", "sch", "ich", "ein", " de", "der", "die", "ie ", "und", " un", "ung", "cht", "gen", " ge"]),
+    "fr": frozenset([" de", "es ", "de ", "le ", " le", "ent", "ion", "tio", " la", "la ", "que", " qu", "ue ", "eur", "ait", "ons"]),
+    "es": frozenset([" de", "de ", "os ", "la ", " la", "ión", "ent", " co", "que", " qu", "el ", " el", "as ", "ado", "ien", "cia"]),
+    "it": frozenset([" di", "di ", "che", " ch", "la ", "to ", "ell", "lla", "one", "zio", " il", "il ", "re ", "del", "per", "ere"]),
+    "pt": frozenset([" de", "de ", "os ", "ão ", "ção", "ent", " co", "que", " qu", "do ", " do", "da ", "as ", "ado", "nte", "em "]),
+    "nl": frozenset([" de", "de ", "en ", "het", " he", "van", " va", "an ", "ijk", "ij ", "oor", "een", " ee", "aar", "cht", "sch"]),
+}
+
+
+def _strip_accents(word: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFD", word) if not unicodedata.combining(c))
+
+
+def _latin_scores(text: str) -> Dict[str, float]:
+    lowered = text.lower()
+    words = _WORD_RE.findall(lowered)
+    scores = {lang: 0.0 for lang in _FUNCTION_WORDS}
+    for word in words:
+        for lang, vocab in _FUNCTION_WORDS.items():
+            if word in vocab:
+                scores[lang] += 2.0
+    chars = set(lowered)
+    for lang, marks in _DIACRITICS.items():
+        scores[lang] += 1.5 * len(chars & marks)
+    for word in words:
+        padded = f" {_strip_accents(word) if len(word) > 3 else word} "
+        grams = {padded[i:i + 3] for i in range(len(padded) - 2)}
+        for lang, profile in _TRIGRAMS.items():
+            scores[lang] += 0.25 * len(grams & profile)
+    return scores
+
+
+def _latin_detect(text: str) -> Tuple[str, float]:
+    scores = _latin_scores(text)
+    ranked = sorted(scores.items(), key=lambda kv: -kv[1])
+    (best, top), (_, runner_up) = ranked[0], ranked[1]
+    if top <= 0:
+        return "unknown", 0.0
+    # Margin over the runner-up, damped for short inputs with little evidence.
+    margin = (top - runner_up) / top
+    evidence = min(1.0, top / 6.0)
+    return best, round(margin * evidence, 3)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def detect_language(text: str) -> Tuple[str, float]:
+    """Detect the language of *text* without any network call.
+
+    Returns:
+        ``(language, confidence)`` — an ISO 639-1 code (``"unknown"`` when
+        nothing can be said) and a confidence in ``[0, 1]``.
+    """
+    counts = script_counts(text or "")
+    letters = sum(counts.values())
+    if letters == 0:
+        return "unknown", 0.0
+
+    script, count = max(counts.items(), key=lambda kv: kv[1])
+    if "kana" in counts:
+        # Japanese mixes kana and kanji; any kana means Japanese, not Chinese.
+        cjk = counts.get("kana", 0) + counts.get("han", 0)
+        if cjk / letters >= 0.5:
+            return "ja", round(cjk / letters, 3)
+    share = count / letters
+
+    if script == "latin":
+        lang, conf = _latin_detect(text)
+        return lang, round(conf * share, 3)
+    if script == "han":
+        # Han without kana is usually Chinese, but short kanji-only Japanese
+        # exists — keep confidence a notch below the other scripts.
+        return "zh", round(0.9 * share, 3)
+    if script == "cyrillic":
+        if _UKRAINIAN_LETTERS & set(text.lower()):
+            return "uk", round(0.9 * share, 3)
+        # Russian vs. other Cyrillic languages is not resolvable this way.
+        return "ru", round(0.8 * share, 3)
+    if script == "arabic":
+        # Persian / Urdu share the script.
+        return "ar", round(0.8 * share, 3)
+    if script in _SCRIPT_LANGUAGE:
+        return _SCRIPT_LANGUAGE[script], round(share, 3)
+    return "unknown", 0.0
+
+
+def same_language(detected: str, target: str) -> bool:
+    """Compare language tags on their primary subtag (``zh-Hans`` ≈ ``zh``)."""
+    return detected.split("-")[0].lower() == target.split("-")[0].lower()
@@ -34,6 +34,8 @@ from neo4j_graphrag.experimental.components.kg_writer import Neo4jWriter, KGWrit
 from neo4j_graphrag.experimental.components.types import Neo4jGraph, LexicalGraphConfig
 
 from src.core.config import settings
+from src.worker.services.neo4j_pool import get_neo4j_pool
+from src.worker.services.schema_registry import get_schema_registry
 
 logger = logging.getLogger(__name__)
 
@@ -133,10 +135,7 @@ class Neo4jGraphRAGService:
                 uri = settings.NEO4J_URI or "neo4j+s://localhost:7687"
                 username = settings.NEO4J_USERNAME or "neo4j"
                 password = settings.NEO4J_PASSWORD or "password"
-                self._driver = neo4j.GraphDatabase.driver(
-                    uri,
-                    auth=(username, password),
-                )
+                self._driver = get_neo4j_pool().get_driver(uri, username, password)
         return self._driver
     
     @property
@@ -1032,13 +1031,12 @@ Output ONLY the JSON object, no explanations or markdown:"""
                 logger.error(f"Failed to create entity_fulltext index: {e}")
                 results["entity_fulltext"] = str(e)
         
+        get_schema_registry().invalidate(self.driver)
         return results
     
     def close(self):
-        """Close Neo4j driver connection."""
-        if self._driver:
-            self._driver.close()
-            self._driver = None
+        """Release the shared driver (closed by ``Neo4jPoolManager`` at shutdown)."""
+        self._driver = None
 
 
 # Singleton instance
@@ -21,6 +21,7 @@ import threading
 
 from src.worker.services.graph_service import GraphService, MultiTenantNeo4jStore
 from src.worker.services.llm_service import LLMService
+from src.worker.services.schema_registry import get_schema_registry
 from src.core.config import settings
 
 if TYPE_CHECKING:
@@ -67,66 +68,25 @@ class Neo4jHybridSearchService:
         Creates:
         1. Full-text index on Entity nodes (name, id fields)
         2. Vector index on Entity nodes (embedding field)
+        3. Vector index on Chunk/__Node__ nodes (embedding field)
+        
+        Existence is answered by the process-wide schema registry, so
+        repeated calls do not issue SHOW INDEXES or DDL round-trips.
         
         Returns:
             Dict with status of each index creation
         """
         store = self.graph_service.get_store(group_id)
-        results = {
-            "fulltext_index": False,
-            "vector_index": False,
-            "chunk_vector_index": False,
-        }
-        
-        # Create full-text index
-        try:
-            # Check if full-text index exists
-            check_ft_query = """
-            SHOW INDEXES
-            WHERE name = $index_name
-            RETURN name
-            """
-            existing = store.structured_query(
-                check_ft_query,
-                param_map={"index_name": self.fulltext_index_name}
-            )
-            
-            if not existing:
-                # Create full-text index on entity name and id
-                create_ft_query = f"""
+        registry = get_schema_registry()
+        # Note: dimensions match V1 legacy embedding model (3072 for text-embedding-3-large)
+        # V2 uses Voyage voyage-context-3 (2048 dims) with separate indexes
+        indexes = [
+            ("fulltext_index", self.fulltext_index_name, f"""
                 CREATE FULLTEXT INDEX {self.fulltext_index_name} IF NOT EXISTS
                 FOR (e:Entity)
                 ON EACH [e.name, e.id]
-                """
-                store.structured_query(create_ft_query)
-                logger.info(f"Created full-text index: {self.fulltext_index_name}")
-            else:
-                logger.info(f"Full-text index already exists: {self.fulltext_index_name}")
-            
-            results["fulltext_index"] = True
-            
-        except Exception as e:
-            logger.error(f"Failed to create full-text index: {e}")
-            results["fulltext_index"] = False
-        
-        # Create vector index
-        try:
-            # Check if vector index exists
-            check_vec_query = """
-            SHOW INDEXES
-            WHERE name = $index_name
-            RETURN name
-            """
-            existing = store.structured_query(
-                check_vec_query,
-                param_map={"index_name": self.vector_index_name}
-            )
-            
-            if not existing:
-                # Create vector index on entity embeddings
-                # Note: dimensions match V1 legacy embedding model (3072 for text-embedding-3-large)
-                # V2 uses Voyage voyage-context-3 (2048 dims) with separate indexes
-                create_vec_query = f"""
+                """),
+            ("vector_index", self.vector_index_name, f"""
                 CREATE VECTOR INDEX {self.vector_index_name} IF NOT EXISTS
                 FOR (e:Entity)
                 ON e.embedding
@@ -136,31 +96,8 @@ class Neo4jHybridSearchService:
                         `vector.similarity_function`: 'cosine'
                     }}
                 }}
-                """
-                store.structured_query(create_vec_query)
-                logger.info(f"Created vector index: {self.vector_index_name}")
-            else:
-                logger.info(f"Vector index already exists: {self.vector_index_name}")
-            
-            results["vector_index"] = True
-            
-        except Exception as e:
-            logger.error(f"Failed to create vector index: {e}")
-            results["vector_index"] = False
-        
-        # Create chunk vector index (for Chunk/__Node__ embeddings)
-        try:
-            check_chunk_query = """
-            SHOW INDEXES
-            WHERE name = $index_name
-            RETURN name
-            """
-            existing_chunk = store.structured_query(
-                check_chunk_query,
-                param_map={"index_name": self.chunk_vector_index_name}
-            )
-            if not existing_chunk:
-                create_chunk_vec_query = f"""
+                """),
+            ("chunk_vector_index", self.chunk_vector_index_name, f"""
                 CREATE VECTOR INDEX {self.chunk_vector_index_name} IF NOT EXISTS
                 FOR (c:`__Node__`)
                 ON c.embedding
@@ -170,15 +107,23 @@ class Neo4jHybridSearchService:
                         `vector.similarity_function`: 'cosine'
                     }}
                 }}
-                """
-                store.structured_query(create_chunk_vec_query)
-                logger.info(f"Created chunk vector index: {self.chunk_vector_index_name}")
-            else:
-                logger.info(f"Chunk vector index already exists: {self.chunk_vector_index_name}")
-            results["chunk_vector_index"] = True
-        except Exception as e:
-            logger.error(f"Failed to create chunk vector index: {e}")
-            results["chunk_vector_index"] = False
+                """),
+        ]
+        
+        results: Dict[str, bool] = {}
+        for result_key, index_name, create_query in indexes:
+            try:
+                created = await asyncio.to_thread(
+                    registry.ensure_index, store.driver, index_name, create_query, store.database
+                )
+                if created:
+                    logger.info(f"Created index: {index_name}")
+                else:
+                    logger.debug(f"Index already exists: {index_name}")
+                results[result_key] = True
+            except Exception as e:
+                logger.error(f"Failed to create index {index_name}: {e}")
+                results[result_key] = False
         
         return results
     
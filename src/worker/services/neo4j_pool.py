@@ -0,0 +1,294 @@
+"""
+Process-wide Neo4j connection pool manager.
+
+Every query and indexing path used to build its own driver:
+``HybridPipeline`` created an ``AsyncNeo4jService`` driver plus a private
+``ThreadPoolExecutor`` per cached group, ``Neo4jStoreV3`` and
+``DocumentSyncService`` held their own sync drivers, and the pipeline-cache
+staleness check opened (and closed) a fresh driver on every lookup.  With
+dozens of cached groups one API worker ended up holding dozens of
+connection pools and hundreds of idle sockets.
+
+``Neo4jPoolManager`` hands out one shared driver per connection target:
+
+- Sync drivers are keyed by ``(uri, username, password digest)``, so
+  rotated credentials get a new driver.  A Neo4j driver already routes to
+  any database and access mode at session level, so reads and writes share
+  one pool; use ``session(read_only=...)`` to get a retry session routed to
+  a reader or writer.
+- Async drivers are additionally held per event loop (weakly, so a dead
+  loop's entry cannot be handed to a new loop that reuses its ``id()``)
+  because an ``AsyncDriver`` is bound to the loop it was created on.  Code
+  that runs a private loop (e.g. indexing jobs) calls ``aclose_loop()``
+  before closing it.
+- One bounded ``ThreadPoolExecutor`` is shared by every pipeline for the
+  remaining sync driver calls.
+
+Drivers returned here are owned by the manager.  Callers must never
+``close()`` them — they drop their reference instead; the manager closes
+everything at application shutdown via ``close_all()`` / ``aclose_all()``.
+
+Pool sizes come from settings (``NEO4J_MAX_CONNECTION_POOL_SIZE``,
+``NEO4J_CONNECTION_ACQUISITION_TIMEOUT``, ``NEO4J_MAX_CONNECTION_LIFETIME``,
+``NEO4J_MAX_TRANSACTION_RETRY_TIME``, ``NEO4J_SYNC_EXECUTOR_WORKERS``).
+
+Usage::
+
+    from src.worker.services.neo4j_pool import get_neo4j_pool
+
+    pool = get_neo4j_pool()
+    driver = pool.get_driver()                 # shared sync driver (settings)
+    with pool.session(read_only=True) as s:    # retry session, read routing
+        s.run("MATCH (n) RETURN count(n)")
+    adriver = await pool.get_async_driver()    # shared async driver
+    pool.metrics()                             # per-driver counters for /health
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from neo4j import AsyncDriver, AsyncGraphDatabase, Driver, GraphDatabase
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _pool_config() -> Dict[str, Any]:
+    """Driver pool configuration shared by sync and async drivers."""
+    return {
+        "max_connection_pool_size": settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        "connection_acquisition_timeout": settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        "max_connection_lifetime": settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        "max_transaction_retry_time": settings.NEO4J_MAX_TRANSACTION_RETRY_TIME,
+    }
+
+
+class Neo4jPoolManager:
+    """Owns every Neo4j driver and the shared sync executor for this process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._drivers: Dict[Tuple[str, str, str], Driver] = {}
+        # loop → {(uri, username, password digest): driver}
+        self._async_drivers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str, str], AsyncDriver]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # key → {"created_at", "acquired", "sessions": {"<db>:<mode>": n}}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Connection targets
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _resolve(
+        uri: Optional[str], username: Optional[str], password: Optional[str],
+    ) -> Tuple[str, str, str]:
+        return (
+            uri or settings.NEO4J_URI or "",
+            username or settings.NEO4J_USERNAME or "neo4j",
+            password if password is not None else (settings.NEO4J_PASSWORD or ""),
+        )
+
+    @staticmethod
+    def _driver_key(uri: str, username: str, password: str) -> Tuple[str, str, str]:
+        # A digest keeps the secret itself out of the key
+        return uri, username, hashlib.sha256(password.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _stats_key(mode: str, uri: str, username: str) -> str:
+        return f"{mode}:{username}@{uri}"
+
+    def _record_acquire(self, stats_key: str) -> None:
+        entry = self._stats.setdefault(
+            stats_key, {"created_at": time.time(), "acquired": 0, "sessions": {}},
+        )
+        entry["acquired"] += 1
+
+    # ------------------------------------------------------------------
+    # Sync driver
+    # ------------------------------------------------------------------
+
+    def get_driver(
+        self,
+        uri: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Driver:
+        """Return the shared sync driver for *uri* (defaults to settings).
+
+        The driver is created and connectivity-checked on first use.
+        """
+        uri, username, password = self._resolve(uri, username, password)
+        if not uri:
+            raise ValueError("NEO4J_URI is not configured")
+        key = self._driver_key(uri, username, password)
+        driver = self._drivers.get(key)
+        if driver is None:
+            with self._lock:
+                driver = self._drivers.get(key)
+                if driver is None:
+                    driver = GraphDatabase.driver(uri, auth=(username, password), **_pool_config())
+                    try:
+                        driver.verify_connectivity()
+                    except Exception:
+                        driver.close()
+                        raise
+                    self._drivers[key] = driver
+                    logger.info("neo4j_pool_driver_created", extra={"uri": uri, "mode": "sync"})
+        self._record_acquire(self._stats_key("sync", uri, username))
+        return driver
+
+    def session(
+        self,
+        read_only: bool = False,
+        database: Optional[str] = None,
+        uri: Optional[str] = None,
+    ):
+        """Retry-enabled session on the shared driver, routed by access mode.
+
+        ``read_only=True`` routes to read replicas (``execute_read``);
+        otherwise the session targets the writer.
+        """
+        from src.worker.hybrid_v2.services.neo4j_retry import retry_session
+
+        database = database or settings.NEO4J_DATABASE or "neo4j"
+        driver = self.get_driver(uri=uri)
+        resolved_uri, username, _ = self._resolve(uri, None, None)
+        sessions = self._stats[self._stats_key("sync", resolved_uri, username)]["sessions"]
+        mode_key = f"{database}:{'read' if read_only else 'write'}"
+        sessions[mode_key] = sessions.get(mode_key, 0) + 1
+        return retry_session(driver, database=database, read_only=read_only)
+
+    # ------------------------------------------------------------------
+    # Async driver
+    # ------------------------------------------------------------------
+
+    async def get_async_driver(
+        self,
+        uri: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> AsyncDriver:
+        """Return the shared async driver for *uri* on the running event loop."""
+        uri, username, password = self._resolve(uri, username, password)
+        if not uri:
+            raise ValueError("NEO4J_URI is not configured")
+        drivers = self._async_drivers.setdefault(asyncio.get_running_loop(), {})
+        key = self._driver_key(uri, username, password)
+        driver = drivers.get(key)
+        if driver is None:
+            driver = AsyncGraphDatabase.driver(uri, auth=(username, password), **_pool_config())
+            try:
+                await driver.verify_connectivity()
+            except Exception:
+                await driver.close()
+                raise
+            existing = drivers.setdefault(key, driver)
+            if existing is not driver:
+                # Lost a race with another coroutine on this loop
+                await driver.close()
+                driver = existing
+            else:
+                logger.info("neo4j_pool_driver_created", extra={"uri": uri, "mode": "async"})
+        self._record_acquire(self._stats_key("async", uri, username))
+        return driver
+
+    # ------------------------------------------------------------------
+    # Shared executor for sync driver calls
+    # ------------------------------------------------------------------
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Return the process-wide executor for blocking Neo4j calls."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=settings.NEO4J_SYNC_EXECUTOR_WORKERS,
+                        thread_name_prefix="neo4j-sync",
+                    )
+        return self._executor
+
+    # ------------------------------------------------------------------
+    # Health + lifecycle
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-driver counters plus the shared pool configuration."""
+        return {
+            "sync_drivers": len(self._drivers),
+            "async_drivers": sum(len(d) for d in list(self._async_drivers.values())),
+            "executor_workers": settings.NEO4J_SYNC_EXECUTOR_WORKERS if self._executor else 0,
+            "pool_config": _pool_config(),
+            "drivers": {k: dict(v, sessions=dict(v["sessions"])) for k, v in self._stats.items()},
+        }
+
+    def health_check(self) -> Dict[str, Any]:
+        """Verify connectivity of every sync driver (blocking; run off-loop)."""
+        results: Dict[str, Any] = {}
+        for (uri, username, _), driver in list(self._drivers.items()):
+            t0 = time.perf_counter()
+            try:
+                driver.verify_connectivity()
+                results[f"{username}@{uri}"] = {
+                    "status": "healthy",
+                    "latency_ms": int((time.perf_counter() - t0) * 1000),
+                }
+            except Exception as e:
+                results[f"{username}@{uri}"] = {"status": "unhealthy", "error": str(e)}
+        return results
+
+    def close_all(self) -> None:
+        """Close all sync drivers and the shared executor."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, {}
+            executor, self._executor = self._executor, None
+        for driver in drivers.values():
+            try:
+                driver.close()
+            except Exception as e:
+                logger.warning("neo4j_pool_close_failed", extra={"error": str(e)})
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def aclose_loop(self) -> None:
+        """Close the async drivers bound to the running loop.
+
+        Call before closing a private event loop; its connection pools are
+        otherwise never released.
+        """
+        drivers = self._async_drivers.pop(asyncio.get_running_loop(), {})
+        for driver in drivers.values():
+            try:
+                await driver.close()
+            except Exception as e:
+                logger.warning("neo4j_pool_close_failed", extra={"error": str(e)})
+
+    async def aclose_all(self) -> None:
+        """Close every driver (async ones on the current loop) and the executor."""
+        await self.aclose_loop()
+        self.close_all()
+
+
+# Singleton instance
+_neo4j_pool: Optional[Neo4jPoolManager] = None
+_neo4j_pool_lock = threading.Lock()
+
+
+def get_neo4j_pool() -> Neo4jPoolManager:
+    """Get or create the process-wide Neo4jPoolManager."""
+    global _neo4j_pool
+    if _neo4j_pool is not None:
+        return _neo4j_pool
+    with _neo4j_pool_lock:
+        if _neo4j_pool is None:
+            _neo4j_pool = Neo4jPoolManager()
+    return _neo4j_pool
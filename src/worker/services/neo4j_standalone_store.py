@@ -16,7 +16,6 @@ Replaces: MultiTenantNeo4jStore (which inherited from Neo4jPropertyGraphStore)
 
 from typing import List, Optional, Dict, Any, Tuple
 import logging
-from neo4j import GraphDatabase
 
 # Still use llama-index-core types for API compatibility (doesn't conflict with driver v6)
 from llama_index.core.graph_stores.types import LabelledNode, Relation, EntityNode, ChunkNode
@@ -28,6 +27,7 @@ from llama_index.core.vector_stores.types import (
 )
 
 from src.core.config import settings
+from src.worker.services.neo4j_pool import get_neo4j_pool
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +63,8 @@ class StandaloneNeo4jStore:
     ):
         self.group_id = group_id
         self.database = database
-        self._driver = GraphDatabase.driver(url, auth=(username, password))
+        # Shared process-wide driver — one per (url, username), not per group
+        self._driver = get_neo4j_pool().get_driver(url, username, password)
         
         # Check driver version for Vector support
         try:
@@ -80,9 +81,8 @@ class StandaloneNeo4jStore:
         )
     
     def close(self):
-        """Close the driver connection."""
-        if self._driver:
-            self._driver.close()
+        """Release the shared driver (the pool manager owns its lifecycle)."""
+        self._driver = None
     
     def __enter__(self):
         return self
@@ -0,0 +1,176 @@
+"""
+CPU-bound clustering for RAPTOR levels.
+
+Kept free of LLM / llama-index imports so it can run in a worker process
+(``RaptorService._cluster_nodes`` submits ``cluster_embeddings`` to a
+process pool) without blocking the indexing event loop.
+
+Pipeline for an ``(n, d)`` embedding matrix:
+
+1. **Dimensionality reduction** — randomized PCA (or a Gaussian random
+   projection) down to ``reduce_dim`` components.  A GMM on 2048-d
+   embeddings is both slow and badly conditioned; RAPTOR itself reduces
+   with UMAP before clustering.
+2. **Clustering** — ``GaussianMixture`` with a configurable covariance type
+   (``diag`` by default; ``full`` costs O(k·d²) memory and O(k·d³) per EM
+   step), or K-Means.
+3. **Silhouette** — exact when ``n <= silhouette_sample``; otherwise the
+   average is computed on a random sample and per-node scores are
+   estimated against that sample, O(n·s) instead of O(n²).
+
+Environment knobs (read by ``ClusteringConfig.from_env``):
+    RAPTOR_REDUCTION           pca | random | none        (default: pca)
+    RAPTOR_REDUCE_DIM          target dimensions          (default: 64)
+    RAPTOR_GMM_COVARIANCE      diag | tied | spherical | full (default: diag)
+    RAPTOR_SILHOUETTE_SAMPLE   sample size for silhouette (default: 2000)
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ClusteringConfig:
+    """Tuning for ``cluster_embeddings``."""
+
+    reduction: str = "pca"
+    reduce_dim: int = 64
+    covariance_type: str = "diag"
+    silhouette_sample: int = 2000
+    random_state: int = 42
+
+    @classmethod
+    def from_env(cls) -> "ClusteringConfig":
+        return cls(
+            reduction=os.getenv("RAPTOR_REDUCTION", "pca").strip().lower(),
+            reduce_dim=int(os.getenv("RAPTOR_REDUCE_DIM", "64")),
+            covariance_type=os.getenv("RAPTOR_GMM_COVARIANCE", "diag").strip().lower(),
+            silhouette_sample=int(os.getenv("RAPTOR_SILHOUETTE_SAMPLE", "2000")),
+        )
+
+
+def reduced_dim(n: int, d: int, config: ClusteringConfig) -> int:
+    """Width of the matrix ``reduce_dimensions`` returns for ``(n, d)`` input."""
+    if config.reduction == "none":
+        return d
+    return min(config.reduce_dim, d, max(n - 1, 1))
+
+
+def reduce_dimensions(embeddings: np.ndarray, config: ClusteringConfig) -> np.ndarray:
+    """Project *embeddings* to at most ``config.reduce_dim`` dimensions."""
+    n, d = embeddings.shape
+    target = reduced_dim(n, d, config)
+    if target >= d:
+        return embeddings
+    if config.reduction == "random":
+        from sklearn.random_projection import GaussianRandomProjection
+
+        projector = GaussianRandomProjection(n_components=target, random_state=config.random_state)
+        return projector.fit_transform(embeddings).astype(np.float32, copy=False)
+
+    from sklearn.decomposition import PCA
+
+    pca = PCA(n_components=target, svd_solver="randomized", random_state=config.random_state)
+    return pca.fit_transform(embeddings).astype(np.float32, copy=False)
+
+
+def sampled_silhouette(
+    features: np.ndarray,
+    labels: np.ndarray,
+    sample_size: int,
+    random_state: int = 42,
+    chunk_size: int = 4096,
+) -> Tuple[float, np.ndarray]:
+    """Silhouette average and per-sample scores.
+
+    Exact (``sklearn.metrics``) when ``n <= sample_size``.  Otherwise every
+    point's intra-/nearest-cluster mean distances are measured against a
+    random reference sample of ``sample_size`` points, and the average is the
+    mean of those estimates.
+
+    Returns:
+        ``(silhouette_avg, per_sample)``; per-sample scores are 0.0 for
+        points in singleton clusters, as in scikit-learn.
+    """
+    n = len(labels)
+    if n <= sample_size:
+        from sklearn.metrics import silhouette_samples
+
+        per_sample = silhouette_samples(features, labels)
+        return float(per_sample.mean()), per_sample
+
+    from scipy.spatial.distance import cdist
+
+    rng = np.random.RandomState(random_state)
+    ref_idx = np.sort(rng.choice(n, size=sample_size, replace=False))
+    ref = features[ref_idx]
+    uniq, label_ids = np.unique(labels, return_inverse=True)
+    k = len(uniq)
+    ref_ids = label_ids[ref_idx]
+    onehot = np.zeros((sample_size, k), dtype=np.float64)
+    onehot[np.arange(sample_size), ref_ids] = 1.0
+    ref_counts = onehot.sum(axis=0)
+    in_ref = np.zeros(n, dtype=bool)
+    in_ref[ref_idx] = True
+
+    per_sample = np.zeros(n, dtype=np.float64)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        sums = cdist(features[start:stop], ref) @ onehot  # (chunk, k)
+        own = label_ids[start:stop]
+        rows = np.arange(stop - start)
+        own_count = ref_counts[own] - in_ref[start:stop]
+        a = np.divide(sums[rows, own], own_count, out=np.zeros(stop - start), where=own_count > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / ref_counts
+        means[:, ref_counts == 0] = np.inf
+        means[rows, own] = np.inf
+        b = means.min(axis=1)
+        denom = np.maximum(a, b)
+        valid = (own_count > 0) & np.isfinite(b) & (denom > 0)
+        per_sample[start:stop] = np.where(valid, (b - a) / np.where(valid, denom, 1.0), 0.0)
+
+    return float(per_sample[ref_idx].mean()), per_sample
+
+
+def cluster_embeddings(
+    embeddings: np.ndarray,
+    n_clusters: int,
+    method: str = "gmm",
+    config: Optional[ClusteringConfig] = None,
+) -> Tuple[np.ndarray, Optional[float], Optional[np.ndarray]]:
+    """Reduce, cluster and score *embeddings*.
+
+    Returns:
+        ``(labels, silhouette_avg, per_sample_silhouette)``; the silhouette
+        values are ``None`` when they cannot be computed (e.g. one cluster).
+    """
+    config = config or ClusteringConfig()
+    features = reduce_dimensions(np.asarray(embeddings, dtype=np.float32), config)
+
+    if method == "gmm":
+        from sklearn.mixture import GaussianMixture
+
+        gmm = GaussianMixture(
+            n_components=n_clusters,
+            covariance_type=config.covariance_type,
+            random_state=config.random_state,
+        )
+        labels = gmm.fit_predict(features)
+    else:
+        from sklearn.cluster import KMeans
+
+        kmeans = KMeans(n_clusters=n_clusters, random_state=config.random_state, n_init=10)
+        labels = kmeans.fit_predict(features)
+
+    if len(np.unique(labels)) < 2:
+        return labels, None, None
+    silhouette_avg, per_sample = sampled_silhouette(
+        features, labels, config.silhouette_sample, config.random_state
+    )
+    return labels, silhouette_avg, per_sample
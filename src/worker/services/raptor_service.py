@@ -15,8 +15,13 @@ from __future__ import annotations
 from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 import asyncio
 import logging
+import multiprocessing
+import os
+import threading
 import numpy as np
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from llama_index.core import Document, VectorStoreIndex
 from llama_index.core.node_parser import SentenceSplitter
@@ -40,11 +45,51 @@ except ImportError:
     SKLEARN_AVAILABLE = False
 
 from src.worker.services.llm_service import LLMService
+from src.worker.services.raptor_clustering import ClusteringConfig, cluster_embeddings, reduced_dim
 from src.worker.services.vector_service import VectorStoreService
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Clustering runs in a worker process (RAPTOR_CLUSTER_PROCESS=0 → thread).
+_cluster_pool: Optional[ProcessPoolExecutor] = None
+_cluster_pool_lock = threading.Lock()
+
+
+def _get_cluster_pool() -> ProcessPoolExecutor:
+    global _cluster_pool
+    if _cluster_pool is None:
+        with _cluster_pool_lock:
+            if _cluster_pool is None:
+                # spawn: forking a process that holds driver/event-loop threads
+                # is not safe; the child only imports raptor_clustering's deps.
+                _cluster_pool = ProcessPoolExecutor(
+                    max_workers=int(os.getenv("RAPTOR_CLUSTER_WORKERS", "1")),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _cluster_pool
+
+
+async def _run_clustering(
+    embeddings: np.ndarray,
+    n_clusters: int,
+    method: str,
+    config: ClusteringConfig,
+) -> Tuple[np.ndarray, Optional[float], Optional[np.ndarray]]:
+    """Run ``cluster_embeddings`` off the event loop."""
+    global _cluster_pool
+    if os.getenv("RAPTOR_CLUSTER_PROCESS", "1").strip().lower() in {"1", "true", "yes"}:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                _get_cluster_pool(), cluster_embeddings, embeddings, n_clusters, method, config
+            )
+        except BrokenProcessPool as e:
+            logger.warning(f"RAPTOR clustering worker died ({e}); retrying in a thread")
+            with _cluster_pool_lock:
+                _cluster_pool = None
+    return await asyncio.to_thread(cluster_embeddings, embeddings, n_clusters, method, config)
+
 
 class RaptorService:
     """
@@ -271,6 +316,10 @@ class RaptorService:
         """
         Cluster nodes based on their embeddings.
         
+        Missing embeddings are generated in one async batch; the CPU-bound
+        reduction + clustering + silhouette work (see ``raptor_clustering``)
+        runs in a worker process so large documents don't stall the loop.
+        
         Args:
             nodes: Nodes to cluster
             method: 'gmm' for Gaussian Mixture Model, 'kmeans' for K-Means
@@ -281,23 +330,21 @@ class RaptorService:
             - quality_metrics: Dict with silhouette scores and cluster quality info
         """
         if len(nodes) < self.min_cluster_size:
-            return {0: nodes}
+            return {0: nodes}, {"silhouette_avg": 0.0, "n_clusters": 1, "method": method}
         
         if self.llm_service.embed_model is None:
             raise RuntimeError("Embed model must be initialized for clustering")
         
-        # Get embeddings for all nodes
-        embeddings = []
-        for node in nodes:
-            if node.embedding is not None:
-                embeddings.append(node.embedding)
-            else:
-                # Generate embedding if not present
-                emb = self.llm_service.embed_model.get_text_embedding(node.text)
+        # Embed nodes that don't have an embedding yet, in one batched call
+        missing = [node for node in nodes if node.embedding is None]
+        if missing:
+            new_embeddings = await self.llm_service.embed_model.aget_text_embedding_batch(
+                [node.text for node in missing]
+            )
+            for node, emb in zip(missing, new_embeddings):
                 node.embedding = emb
-                embeddings.append(emb)
         
-        embeddings_array = np.array(embeddings)
+        embeddings_array = np.asarray([node.embedding for node in nodes], dtype=np.float32)
         
         # Determine number of clusters
         n_clusters = min(
@@ -305,35 +352,24 @@ class RaptorService:
             max(2, len(nodes) // 3)  # Roughly 3 nodes per cluster
         )
         
+        config = ClusteringConfig.from_env()
         try:
-            if method == "gmm":
-                # Gaussian Mixture Model (soft clustering, better for hierarchical)
-                gmm = GaussianMixture(
-                    n_components=n_clusters,
-                    covariance_type='full',
-                    random_state=42
-                )
-                cluster_labels = gmm.fit_predict(embeddings_array)
-            else:
-                # K-Means (hard clustering)
-                kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-                cluster_labels = kmeans.fit_predict(embeddings_array)
+            cluster_labels, silhouette_avg, silhouette_per_sample = await _run_clustering(
+                embeddings_array, n_clusters, method, config
+            )
         except Exception as e:
             logger.warning(f"Clustering failed: {e}, returning single cluster")
-            return {0: nodes}
+            return {0: nodes}, {"silhouette_avg": 0.0, "n_clusters": 1, "method": method}
         
         # Group nodes by cluster
         clusters = defaultdict(list)
         for i, label in enumerate(cluster_labels):
             clusters[int(label)].append(nodes[i])
         
-        # Calculate cluster quality metrics
-        from sklearn.metrics import silhouette_score, silhouette_samples
-        
-        try:
-            silhouette_avg = silhouette_score(embeddings_array, cluster_labels)
-            silhouette_per_sample = silhouette_samples(embeddings_array, cluster_labels)
-            
+        if silhouette_avg is None:
+            logger.warning("Failed to calculate silhouette scores: fewer than 2 clusters")
+            quality_metrics = {"silhouette_avg": 0.0, "n_clusters": n_clusters, "method": method}
+        else:
             # Store quality metrics in each node
             for i, node in enumerate(nodes):
                 node.metadata['silhouette_score'] = float(silhouette_per_sample[i])
@@ -345,10 +381,9 @@ class RaptorService:
                 "silhouette_avg": float(silhouette_avg),
                 "n_clusters": n_clusters,
                 "method": method,
+                "covariance_type": config.covariance_type,
+                "reduced_dim": reduced_dim(*embeddings_array.shape, config),
             }
-        except Exception as e:
-            logger.warning(f"Failed to calculate silhouette scores: {e}")
-            quality_metrics = {"silhouette_avg": 0.0, "n_clusters": n_clusters, "method": method}
         
         return dict(clusters), quality_metrics
     
@@ -457,7 +492,7 @@ Summary:"""
             )
             
             # Generate embedding for the summary
-            summary_node.embedding = self.llm_service.embed_model.get_text_embedding(summary_text)
+            summary_node.embedding = await self.llm_service.embed_model.aget_text_embedding(summary_text)
             
             return summary_node
             
@@ -75,13 +75,10 @@ class RetrievalService:
         self._native_embedder = None
 
     def _get_neo4j_driver(self):
-        """Get or create Neo4j driver for native retrievers."""
+        """Get the shared pool driver for native retrievers."""
         if self._neo4j_driver is None:
-            import neo4j
-            self._neo4j_driver = neo4j.GraphDatabase.driver(
-                settings.NEO4J_URI,
-                auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
-            )
+            from src.worker.services.neo4j_pool import get_neo4j_pool
+            self._neo4j_driver = get_neo4j_pool().get_driver()
         return self._neo4j_driver
     
     def _get_native_embedder(self):
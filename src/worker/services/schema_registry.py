@@ -0,0 +1,182 @@
+"""
+Process-wide Neo4j schema registry.
+
+Query paths used to "ensure" their indexes with a schema round-trip:
+``BaseRouteHandler._ensure_textchunk_fulltext_index`` ran
+``CREATE FULLTEXT INDEX ... IF NOT EXISTS`` once per ``HybridPipeline``
+instance and ``Neo4jHybridSearchService.ensure_indexes_exist`` issued a
+``SHOW INDEXES`` per index on every call.  The hybrid router's pipeline
+cache evicts and rebuilds pipelines per group, so those commands ran again
+constantly — and on Aura even an ``IF NOT EXISTS`` create takes a schema
+lock that contends with indexing writes.
+
+``SchemaRegistry`` loads ``SHOW INDEXES`` once per connection target and
+answers existence checks from memory:
+
+- Snapshots are keyed by ``(driver, database)``.  Drivers come from
+  ``Neo4jPoolManager`` and live for the whole process, so every pipeline
+  on the same target shares one snapshot.
+- A snapshot is reloaded after ``NEO4J_SCHEMA_REGISTRY_TTL_SECONDS``
+  (default 300), which is how indexes created by other processes show up.
+- ``ensure_index`` only issues DDL when the index is still missing after a
+  fresh ``SHOW INDEXES``, then records it.
+- Paths that create or drop indexes (``Neo4jStoreV3.initialize_schema``,
+  the admin index endpoints) call ``invalidate`` so the next check reloads.
+
+Usage::
+
+    from src.worker.services.schema_registry import get_schema_registry
+
+    registry = get_schema_registry()
+    registry.has_index(driver, "sentence_embedding")
+    registry.ensure_index(
+        driver,
+        "sentence_fulltext",
+        "CREATE FULLTEXT INDEX sentence_fulltext IF NOT EXISTS FOR (s:Sentence) ON EACH [s.text]",
+    )
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SHOW_INDEXES_QUERY = "SHOW INDEXES YIELD name, type, state, labelsOrTypes, properties"
+
+
+@dataclass(frozen=True)
+class IndexInfo:
+    """One row of ``SHOW INDEXES``."""
+
+    name: str
+    type: Optional[str] = None
+    state: Optional[str] = None
+    labels: Tuple[str, ...] = ()
+    properties: Tuple[str, ...] = ()
+
+
+@dataclass
+class _Snapshot:
+    driver: Any  # keeps id(driver) from being reused while the entry exists
+    indexes: Dict[str, IndexInfo]
+    loaded_at: float
+
+
+class SchemaRegistry:
+    """Index names per Neo4j target, loaded from ``SHOW INDEXES`` and refreshed on TTL."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None) -> None:
+        self._ttl = (
+            ttl_seconds if ttl_seconds is not None
+            else float(os.getenv("NEO4J_SCHEMA_REGISTRY_TTL_SECONDS", "300"))
+        )
+        self._snapshots: Dict[Tuple[int, Optional[str]], _Snapshot] = {}
+        self._locks: Dict[Tuple[int, Optional[str]], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.loads = 0
+        self.creates = 0
+
+    def _lock_for(self, key: Tuple[int, Optional[str]]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _fresh(self, snapshot: Optional[_Snapshot]) -> bool:
+        return snapshot is not None and time.monotonic() - snapshot.loaded_at < self._ttl
+
+    def indexes(self, driver: Any, database: Optional[str] = None, refresh: bool = False) -> Dict[str, IndexInfo]:
+        """Known indexes on *driver*/*database*, loading ``SHOW INDEXES`` when stale (sync)."""
+        key = (id(driver), database)
+        snapshot = self._snapshots.get(key)
+        if not refresh and self._fresh(snapshot):
+            return snapshot.indexes
+
+        with self._lock_for(key):
+            current = self._snapshots.get(key)
+            # Another thread reloaded while we waited for the lock
+            if self._fresh(current) and (not refresh or current is not snapshot):
+                return current.indexes
+            indexes = self._load(driver, database)
+            self._snapshots[key] = _Snapshot(driver, indexes, time.monotonic())
+            return indexes
+
+    def has_index(self, driver: Any, name: str, database: Optional[str] = None) -> bool:
+        """Whether index *name* exists (answered from the cached snapshot)."""
+        return name in self.indexes(driver, database)
+
+    def ensure_index(self, driver: Any, name: str, create_query: str, database: Optional[str] = None) -> bool:
+        """Run *create_query* unless index *name* already exists.
+
+        A miss is confirmed against a fresh ``SHOW INDEXES`` first, so an
+        index created by another process since the last load costs a read
+        rather than a schema command.  Returns True when the DDL ran.
+        """
+        if self.has_index(driver, name, database):
+            return False
+        if name in self.indexes(driver, database, refresh=True):
+            return False
+        # DDL needs an auto-commit transaction, not a managed one
+        with driver.session(database=database) as session:
+            session.run(create_query)
+        self.creates += 1
+        self.record_created(driver, name, database=database)
+        logger.info("schema_registry_index_created", extra={"index": name, "database": database})
+        return True
+
+    def record_created(self, driver: Any, *names: str, database: Optional[str] = None) -> None:
+        """Add indexes created by this process to the cached snapshot (if any)."""
+        snapshot = self._snapshots.get((id(driver), database))
+        if snapshot is None:
+            return
+        indexes = dict(snapshot.indexes)
+        for name in names:
+            indexes.setdefault(name, IndexInfo(name=name))
+        snapshot.indexes = indexes
+
+    def invalidate(self, driver: Any = None) -> None:
+        """Drop cached snapshots (all, or every database of *driver*) so the next check reloads."""
+        for key in list(self._snapshots):
+            if driver is None or key[0] == id(driver):
+                self._snapshots.pop(key, None)
+
+    def _load(self, driver: Any, database: Optional[str]) -> Dict[str, IndexInfo]:
+        t0 = time.perf_counter()
+        with driver.session(database=database) as session:
+            records: List[Any] = list(session.run(SHOW_INDEXES_QUERY))
+        self.loads += 1
+        indexes = {
+            r["name"]: IndexInfo(
+                name=r["name"],
+                type=r.get("type"),
+                state=r.get("state"),
+                labels=tuple(r.get("labelsOrTypes") or ()),
+                properties=tuple(r.get("properties") or ()),
+            )
+            for r in records
+        }
+        logger.info(
+            "schema_registry_loaded",
+            extra={
+                "database": database,
+                "indexes": len(indexes),
+                "elapsed_ms": int((time.perf_counter() - t0) * 1000),
+            },
+        )
+        return indexes
+
+
+_registry: Optional[SchemaRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Get or create the process-wide schema registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SchemaRegistry()
+    return _registry
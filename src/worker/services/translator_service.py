@@ -5,24 +5,57 @@ A single call to /translate auto-detects the source language and translates to
 the target language. If the detected language already matches the target, the
 original text is returned untranslated.
 
+Before any remote call:
+
+- a local script / n-gram detector (``language_detection``) short-circuits
+  text that is confidently already in the target language
+  (``TRANSLATOR_LOCAL_DETECT_MIN_CONFIDENCE``, default 0.6; ``0`` disables);
+- results are cached by ``(sha256(text), target_lang)`` in an in-process LRU
+  (``TRANSLATION_CACHE_SIZE``, ``TRANSLATION_CACHE_TTL_SECONDS``) and, with
+  ``TRANSLATION_CACHE_REDIS=1``, in Redis so replicas share translations.
+
+``translate_batch`` sends every remaining text of a request in one call.
+
 See: https://learn.microsoft.com/en-us/azure/ai-services/translator/text-translation/reference/rest-api-guide
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import aiohttp
 import structlog
 from azure.identity.aio import DefaultAzureCredential
 
 from src.core.config import settings
+from src.worker.services.language_detection import detect_language, same_language
 
 logger = structlog.get_logger(__name__)
 
 _TRANSLATOR_SCOPE = "https://cognitiveservices.azure.com/.default"
 _API_VERSION = "3.0"
+# Azure Translator request limits: 1000 array elements, 50,000 characters.
+_MAX_BATCH_ITEMS = 1000
+_MAX_BATCH_CHARS = 50_000
+_REDIS_PREFIX = "translation"
+
+
+def _local_detect_min_confidence() -> float:
+    return float(os.getenv("TRANSLATOR_LOCAL_DETECT_MIN_CONFIDENCE", "0.6"))
+
+
+def _redis_cache_enabled() -> bool:
+    return os.getenv("TRANSLATION_CACHE_REDIS", "0").strip().lower() in {"1", "true", "yes"}
+
+
+def _cache_key(text: str, target_lang: str) -> Tuple[str, str]:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest(), target_lang.lower()
 
 
 @dataclass
@@ -36,6 +69,48 @@ class TranslationResult:
     characters: int
 
 
+def _untranslated(text: str, target_lang: str, detected_lang: str = "unknown") -> TranslationResult:
+    return TranslationResult(
+        original_text=text,
+        translated_text=text,
+        detected_language=detected_lang,
+        target_language=target_lang,
+        was_translated=False,
+        characters=0,
+    )
+
+
+class TranslationCache:
+    """LRU of ``(text hash, target_lang) → TranslationResult`` with a TTL."""
+
+    def __init__(self, max_size: int = 2048, ttl_seconds: float = 86400.0) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, TranslationResult]]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str]) -> Optional[TranslationResult]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Tuple[str, str], result: TranslationResult) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class TranslatorService:
     """Azure AI Translator with Managed Identity authentication.
 
@@ -46,17 +121,24 @@ class TranslatorService:
         # result.translated_text == "What is the contract period?"
         # result.detected_language == "ja"
         # result.was_translated == True
+
+        results = await svc.translate_batch(["契約期間は？", "支払条件は？"], target_lang="en")
     """
 
     def __init__(
         self,
         endpoint: Optional[str] = None,
         region: Optional[str] = None,
+        cache: Optional[TranslationCache] = None,
     ) -> None:
         self.endpoint = (endpoint or settings.AZURE_TRANSLATOR_ENDPOINT or "").rstrip("/")
         self.region = region or settings.AZURE_TRANSLATOR_REGION or "swedencentral"
         self._credential: Optional[DefaultAzureCredential] = None
         self._session: Optional[aiohttp.ClientSession] = None
+        self.cache = cache or TranslationCache(
+            max_size=int(os.getenv("TRANSLATION_CACHE_SIZE", "2048")),
+            ttl_seconds=float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "86400")),
+        )
         if not self.endpoint:
             logger.warning("translator_service_disabled: AZURE_TRANSLATOR_ENDPOINT not set")
 
@@ -86,16 +168,88 @@ class TranslatorService:
         If the detected language prefix matches target_lang, returns the
         original text with was_translated=False.
         """
+        return (await self.translate_batch([text], target_lang=target_lang))[0]
+
+    async def translate_batch(
+        self,
+        texts: Sequence[str],
+        target_lang: str = "en",
+    ) -> List[TranslationResult]:
+        """Detect and translate several texts, one result per input (same order).
+
+        Texts resolved by the local detector or the cache never reach Azure;
+        the rest go out in as few ``/translate`` calls as the API limits allow.
+        """
         if not self.endpoint:
-            return TranslationResult(
-                original_text=text,
-                translated_text=text,
-                detected_language="unknown",
-                target_language=target_lang,
-                was_translated=False,
-                characters=0,
+            return [_untranslated(text, target_lang) for text in texts]
+
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        pending: Dict[Tuple[str, str], List[int]] = {}
+        min_confidence = _local_detect_min_confidence()
+
+        for i, text in enumerate(texts):
+            if min_confidence > 0:
+                lang, confidence = detect_language(text)
+                if confidence >= min_confidence and same_language(lang, target_lang):
+                    results[i] = _untranslated(text, target_lang, lang)
+                    continue
+            key = _cache_key(text, target_lang)
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+
+        if pending and _redis_cache_enabled():
+            for key, cached in (await self._redis_get(list(pending))).items():
+                self.cache.put(key, cached)
+                for i in pending.pop(key):
+                    results[i] = cached
+
+        local_hits = len(texts) - sum(len(idx) for idx in pending.values())
+        if pending:
+            keys = list(pending)
+            fresh = await self._translate_remote(
+                [texts[pending[key][0]] for key in keys], target_lang
             )
-
+            cacheable: Dict[Tuple[str, str], TranslationResult] = {}
+            for key, result in zip(keys, fresh):
+                if result.detected_language != "unknown":
+                    self.cache.put(key, result)
+                    cacheable[key] = result
+                for i in pending[key]:
+                    results[i] = result
+            if cacheable and _redis_cache_enabled():
+                await self._redis_put(cacheable)
+
+        if local_hits:
+            logger.debug("translator_remote_skipped", texts=len(texts), resolved_locally=local_hits)
+        return results  # type: ignore[return-value]
+
+    async def _translate_remote(
+        self,
+        texts: List[str],
+        target_lang: str,
+    ) -> List[TranslationResult]:
+        """Call ``/translate`` for *texts*, split to respect the API limits."""
+        results: List[TranslationResult] = []
+        batch: List[str] = []
+        batch_chars = 0
+        for text in texts:
+            if batch and (len(batch) >= _MAX_BATCH_ITEMS or batch_chars + len(text) > _MAX_BATCH_CHARS):
+                results.extend(await self._post_translate(batch, target_lang))
+                batch, batch_chars = [], 0
+            batch.append(text)
+            batch_chars += len(text)
+        if batch:
+            results.extend(await self._post_translate(batch, target_lang))
+        return results
+
+    async def _post_translate(
+        self,
+        texts: List[str],
+        target_lang: str,
+    ) -> List[TranslationResult]:
         url = f"{self.endpoint}/translate"
         params = {"api-version": _API_VERSION, "to": target_lang}
         token = await self._get_token()
@@ -104,7 +258,7 @@ class TranslatorService:
             "Ocp-Apim-Subscription-Region": self.region,
             "Content-Type": "application/json",
         }
-        body = [{"Text": text}]
+        body = [{"Text": text} for text in texts]
 
         session = await self._get_session()
         async with session.post(url, params=params, headers=headers, json=body) as resp:
@@ -115,49 +269,74 @@ class TranslatorService:
                     status=resp.status,
                     body=error_body[:500],
                 )
-                return TranslationResult(
-                    original_text=text,
-                    translated_text=text,
-                    detected_language="unknown",
-                    target_language=target_lang,
-                    was_translated=False,
-                    characters=0,
-                )
+                return [_untranslated(text, target_lang) for text in texts]
 
             data = await resp.json()
 
-        result = data[0]
-        detected = result.get("detectedLanguage", {})
-        detected_lang = detected.get("language", "unknown")
-        translations = result.get("translations", [])
-        translated_text = translations[0]["text"] if translations else text
-
-        # Check if translation was actually needed
-        target_prefix = target_lang.split("-")[0].lower()
-        detected_prefix = detected_lang.split("-")[0].lower()
-        same_language = detected_prefix == target_prefix
-
-        if same_language:
-            translated_text = text
-
-        char_count = len(text)
+        results = []
+        for text, result in zip(texts, data):
+            detected = result.get("detectedLanguage", {})
+            detected_lang = detected.get("language", "unknown")
+            translations = result.get("translations", [])
+            translated_text = translations[0]["text"] if translations else text
+
+            # Check if translation was actually needed
+            same = same_language(detected_lang, target_lang)
+            char_count = len(text)
+
+            logger.info(
+                "translator_result",
+                detected=detected_lang,
+                target=target_lang,
+                was_translated=not same,
+                chars=char_count,
+            )
 
-        logger.info(
-            "translator_result",
-            detected=detected_lang,
-            target=target_lang,
-            was_translated=not same_language,
-            chars=char_count,
-        )
+            results.append(TranslationResult(
+                original_text=text,
+                translated_text=translated_text if not same else text,
+                detected_language=detected_lang,
+                target_language=target_lang,
+                was_translated=not same,
+                characters=char_count if not same else 0,
+            ))
+        return results
+
+    # ── Shared Redis cache (optional) ────────────────────────────────────
+
+    @staticmethod
+    def _redis_key(key: Tuple[str, str]) -> str:
+        return f"{_REDIS_PREFIX}:{key[1]}:{key[0]}"
+
+    async def _redis_get(
+        self, keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], TranslationResult]:
+        try:
+            from src.core.services.redis_service import get_redis_service
+
+            redis = (await get_redis_service())._redis
+            values = await redis.mget([self._redis_key(k) for k in keys])
+        except Exception as e:
+            logger.warning("translation_cache_redis_read_failed", error=str(e))
+            return {}
+        return {
+            key: TranslationResult(**json.loads(raw))
+            for key, raw in zip(keys, values)
+            if raw
+        }
 
-        return TranslationResult(
-            original_text=text,
-            translated_text=translated_text if not same_language else text,
-            detected_language=detected_lang,
-            target_language=target_lang,
-            was_translated=not same_language,
-            characters=char_count if not same_language else 0,
-        )
+    async def _redis_put(self, entries: Dict[Tuple[str, str], TranslationResult]) -> None:
+        ttl = int(self.cache.ttl_seconds)
+        try:
+            from src.core.services.redis_service import get_redis_service
+
+            redis = (await get_redis_service())._redis
+            pipe = redis.pipeline(transaction=False)
+            for key, result in entries.items():
+                pipe.set(self._redis_key(key), json.dumps(asdict(result)), ex=ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("translation_cache_redis_write_failed", error=str(e))
 
     async def close(self) -> None:
         """Clean up resources."""
@@ -0,0 +1,243 @@
+"""
+Unit Tests: Redis-backed answer cache (services/answer_cache.py)
+
+Exact and semantic tiers run against an in-memory Redis stand-in; the
+orchestrator test checks that a hit bypasses the route handler.
+
+Run: pytest tests/unit/test_answer_cache.py -v
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.worker.hybrid_v2.services.answer_cache import AnswerCache, AnswerCacheKey, normalize_query
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def set(self, key, value, ex=None):
+        self._ops.append(("set", key, value, ex))
+
+    def lpush(self, key, value):
+        self._ops.append(("lpush", key, value))
+
+    def ltrim(self, key, start, end):
+        self._ops.append(("ltrim", key, start, end))
+
+    def expire(self, key, seconds):
+        self._ops.append(("expire", key, seconds))
+
+    async def execute(self):
+        for op, key, *args in self._ops:
+            if op == "set":
+                await self._redis.set(key, args[0], ex=args[1])
+            elif op == "lpush":
+                self._redis.lists.setdefault(key, []).insert(0, args[0])
+            elif op == "ltrim":
+                start, end = args
+                self._redis.lists[key] = self._redis.lists.get(key, [])[start:end + 1]
+            elif op == "expire":
+                self._redis.ttls[key] = args[0]
+        self._ops = []
+
+
+class _FakeRedis:
+    """The subset of ``redis.asyncio.Redis`` (decode_responses=True) the cache uses."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+def _key(query, version="g|v1", **overrides):
+    params = dict(group_id="g", folder_id=None, version=version, route="hipporag2_search",
+                  response_type="summary", prompt_variant=None)
+    params.update(overrides)
+    return AnswerCacheKey.build(query=query, **params)
+
+
+RESULT = {
+    "response": "Net 30 days.",
+    "route_used": "route_7_hipporag2",
+    "citations": [{"chunk_id": "s1", "document_id": "d1"}],
+    "evidence_path": [],
+    "metadata": {"num_chunks": 3, "pipeline_timings_ms": {"total_ms": 900}},
+    "usage": {"total_tokens": 1234},
+}
+
+
+class TestAnswerCache:
+
+    def test_normalize_query(self):
+        assert normalize_query("  What are the   PAYMENT terms?? ") == "what are the payment terms"
+        assert normalize_query("Ｗhat is ﬁnal") == "what is final"
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_after_put(self):
+        redis = _FakeRedis()
+        cache = AnswerCache(redis, ttl_seconds=60)
+        assert await cache.get(_key("What are the payment terms?")) is None
+
+        await cache.put(_key("What are the payment terms?"), RESULT)
+        hit = await cache.get(_key("what are the payment terms"))
+
+        assert hit.tier == "exact"
+        assert hit.result["citations"] == RESULT["citations"]
+        assert "usage" not in hit.result
+        assert "pipeline_timings_ms" not in hit.result["metadata"]
+        assert set(redis.ttls.values()) == {60}
+
+    @pytest.mark.asyncio
+    async def test_key_changes_miss(self):
+        cache = AnswerCache(_FakeRedis())
+        await cache.put(_key("payment terms"), RESULT)
+
+        assert await cache.get(_key("payment terms", version="g|v2")) is None
+        assert await cache.get(_key("payment terms", folder_id="f1")) is None
+        assert await cache.get(_key("payment terms", response_type="detailed_report")) is None
+        assert await cache.get(_key("payment terms", prompt_variant="v1_concise")) is None
+        assert await cache.get(_key("payment terms", language="de")) is None
+        assert await cache.get(_key("payment terms", group_id="other")) is None
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_threshold(self):
+        redis = _FakeRedis()
+        cache = AnswerCache(redis, semantic_threshold=0.97, semantic_max_entries=2)
+        await cache.put(_key("what are the payment terms"), RESULT, embedding=[1.0, 0.0, 0.0])
+
+        close = await cache.get(_key("what are the terms of payment"), [0.99, 0.1, 0.0])
+        far = await cache.get(_key("who is the landlord"), [0.8, 0.6, 0.0])
+
+        assert close.tier == "semantic"
+        assert close.similarity >= 0.97
+        assert close.result["response"] == RESULT["response"]
+        assert far is None
+
+        await cache.put(_key("q2"), RESULT, embedding=[0.0, 1.0, 0.0])
+        await cache.put(_key("q3"), RESULT, embedding=[0.0, 0.0, 1.0])
+        assert len(redis.lists[_key("q3").semantic_key]) == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.pipeline.side_effect = ConnectionError("down")
+        cache = AnswerCache(redis)
+
+        assert await cache.get(_key("payment terms")) is None
+        await cache.put(_key("payment terms"), RESULT)
+
+
+def _make_pipeline():
+    from src.worker.hybrid_v2.orchestrator import HybridPipeline
+    from src.worker.hybrid_v2.routes.base import RouteResult
+    from src.worker.hybrid_v2.router.main import QueryRoute
+
+    pipeline = HybridPipeline.__new__(HybridPipeline)
+    pipeline.llm = None
+    pipeline.group_id = "test-group"
+    pipeline.group_ids = ["test-group"]
+    pipeline.folder_id = None
+    pipeline.neo4j_driver = object()
+    pipeline._maybe_translate_query = AsyncMock(side_effect=lambda q, accumulator=None: (q, "en", False))
+    pipeline.router = MagicMock()
+    pipeline.router.route_with_profile = AsyncMock(return_value=(QueryRoute.LOCAL_SEARCH, None))
+
+    handler = MagicMock(spec=["execute"])
+    handler.execute = AsyncMock(side_effect=lambda *a, **k: RouteResult(
+        response="Net 30 days.", route_used="route_7_hipporag2", metadata={"num_chunks": 3},
+    ))
+    pipeline._route_handlers = {QueryRoute.HIPPORAG2_SEARCH: handler}
+    return pipeline, handler
+
+
+class TestOrchestratorAnswerCache:
+
+    @pytest.mark.asyncio
+    async def test_hit_bypasses_handler(self):
+        from src.worker.hybrid_v2 import orchestrator
+
+        pipeline, handler = _make_pipeline()
+        cache = AnswerCache(_FakeRedis())
+        env = {"ANSWER_CACHE": "1", "ANSWER_CACHE_SEMANTIC": "0", "HYBRID_SPECULATIVE_PREFETCH": "0"}
+        with patch.dict(os.environ, env), \
+                patch.object(orchestrator, "get_answer_cache", return_value=cache), \
+                patch.object(orchestrator, "read_group_version", return_value="test-group|v1"):
+            first = await pipeline.query("What are the payment terms?", "summary")
+            second = await pipeline.query("what are the payment terms", "summary")
+
+        assert handler.execute.await_count == 1
+        assert first["metadata"]["answer_cache"] == {"hit": False}
+        assert second["response"] == first["response"]
+        assert second["metadata"]["answer_cache"]["hit"] is True
+        assert second["metadata"]["answer_cache"]["tier"] == "exact"
+        assert "answer_cache_ms" in second["metadata"]["pipeline_timings_ms"]
+        assert second["usage"]["answer_cache_hit"] is True
+        assert second["usage"]["total_tokens"] == 0
+        assert second["usage"]["llm_calls"] == 0
+
+    @pytest.mark.asyncio
+    async def test_version_change_reruns_handler(self):
+        from src.worker.hybrid_v2 import orchestrator
+
+        pipeline, handler = _make_pipeline()
+        cache = AnswerCache(_FakeRedis())
+        versions = iter(["test-group|v1", "test-group|v2"])
+        with patch.dict(os.environ, {"ANSWER_CACHE": "1", "HYBRID_SPECULATIVE_PREFETCH": "0"}), \
+                patch.object(orchestrator, "get_answer_cache", return_value=cache), \
+                patch.object(orchestrator, "read_group_version", side_effect=lambda *a: next(versions)):
+            await pipeline.query("What are the payment terms?", "summary")
+            second = await pipeline.query("What are the payment terms?", "summary")
+
+        assert handler.execute.await_count == 2
+        assert second["metadata"]["answer_cache"] == {"hit": False}
+
+    @pytest.mark.asyncio
+    async def test_not_cached_while_group_is_indexing(self):
+        from src.worker.hybrid_v2 import orchestrator
+
+        pipeline, handler = _make_pipeline()
+        cache = AnswerCache(_FakeRedis())
+        with patch.dict(os.environ, {"ANSWER_CACHE": "1", "HYBRID_SPECULATIVE_PREFETCH": "0"}), \
+                patch.object(orchestrator, "get_answer_cache", return_value=cache), \
+                patch.object(orchestrator, "read_group_version", return_value="test-group|t1|indexing||"):
+            result = await pipeline.query("What are the payment terms?", "summary")
+            await pipeline.query("What are the payment terms?", "summary")
+
+        assert handler.execute.await_count == 2
+        assert "answer_cache" not in result["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        from src.worker.hybrid_v2 import orchestrator
+
+        pipeline, handler = _make_pipeline()
+        version = MagicMock()
+        with patch.dict(os.environ, {"ANSWER_CACHE": "0", "HYBRID_SPECULATIVE_PREFETCH": "0"}), \
+                patch.object(orchestrator, "read_group_version", version):
+            result = await pipeline.query("What are the payment terms?", "summary")
+            await pipeline.query("What are the payment terms?", "summary")
+
+        version.assert_not_called()
+        assert handler.execute.await_count == 2
+        assert "answer_cache" not in result["metadata"]
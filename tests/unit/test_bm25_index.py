@@ -0,0 +1,199 @@
+"""Tests for the in-process BM25 keyword index (retrievers/bm25_index.py)."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.worker.hybrid_v2.retrievers.bm25_index import (
+    BM25Index,
+    KeywordIndexCache,
+    group_version_in_progress,
+    tokenize,
+)
+
+DOCS = [
+    ("s1", "The termination fee is payable within 30 days."),
+    ("s2", "Either party may terminate with written notice."),
+    ("s3", "Notice of termination must be in writing; the termination fee applies."),
+    ("s4", "Payment terms: net 30."),
+]
+
+
+class TestBM25Index:
+
+    def test_tokenize_lowercases_and_splits_punctuation(self):
+        assert tokenize("Net-30, Termination FEE") == ["net", "30", "termination", "fee"]
+        assert tokenize(None) == []
+
+    def test_tokenize_keeps_non_ascii_words(self):
+        assert tokenize("Kündigungsfrist für Café") == ["kündigungsfrist", "für", "café"]
+        assert tokenize("契約解除の通知") == ["契約解除の通知"]
+
+    def test_ranks_by_match_count_then_score(self):
+        index = BM25Index.build(DOCS)
+        hits = index.search(["termination", "notice"])
+        # s3 matches both keywords; s2 outranks s1 on length normalisation.
+        assert [key for key, _, _ in hits] == ["s3", "s2", "s1"]
+        assert [count for _, _, count in hits] == [2, 1, 1]
+        assert all(score > 0 for _, score, _ in hits)
+
+    def test_phrase_keyword_requires_all_tokens(self):
+        index = BM25Index.build(DOCS)
+        keys = [key for key, _, _ in index.search(["termination fee"])]
+        assert sorted(keys) == ["s1", "s3"]
+
+    def test_min_matches_and_unknown_terms(self):
+        index = BM25Index.build(DOCS)
+        assert [k for k, _, _ in index.search(["termination", "notice"], min_matches=2)] == ["s3"]
+        assert index.search(["arbitration"]) == []
+        assert BM25Index.build([]).search(["anything"]) == []
+
+    def test_top_k_limits_results(self):
+        index = BM25Index.build(DOCS)
+        assert len(index.search(["30", "termination", "notice"], top_k=2)) == 2
+
+    def test_save_load_round_trip(self, tmp_path):
+        index = BM25Index.build(DOCS)
+        path = tmp_path / "idx.npz"
+        index.save(path)
+        loaded = BM25Index.load(path)
+        assert len(loaded) == len(index)
+        assert loaded.search(["termination", "notice"]) == index.search(["termination", "notice"])
+
+
+class _FakeSession:
+    def __init__(self, state):
+        self._state = state
+
+    def run(self, query, **params):
+        result = MagicMock()
+        result.single.return_value = {"parts": [self._state["version"]]}
+        return result
+
+    def stream(self, query, *, key, **params):
+        assert "$after" in query
+        self._state["builds"] += 1
+        self._state.setdefault("reads", []).append("paged")
+        return iter({"key": k, "text": t} for k, t in self._state["docs"])
+
+    def read_all(self, query, consume, **params):
+        assert "$after" not in query
+        self._state["builds"] += 1
+        self._state.setdefault("reads", []).append("single")
+        return consume(iter({"key": k, "text": t} for k, t in self._state["docs"]))
+
+
+class TestKeywordIndexCache:
+
+    def _patched(self, state):
+        @contextmanager
+        def _retry_session(driver, database=None, read_only=False):
+            yield _FakeSession(state)
+
+        return patch("src.worker.hybrid_v2.retrievers.bm25_index.retry_session", _retry_session)
+
+    def test_reuses_index_until_group_version_changes(self):
+        state = {"version": "g|v1", "docs": DOCS, "builds": 0}
+        cache = KeywordIndexCache(cache_dir="", check_interval=0)
+        with self._patched(state):
+            first = cache.get(object(), "sentence", ["g"])
+            assert cache.get(object(), "sentence", ["g"]) is first
+            assert state["builds"] == 1
+
+            state["version"] = "g|v2"
+            state["docs"] = DOCS[:2]
+            refreshed = cache.get(object(), "sentence", ["g"])
+        assert refreshed is not first
+        assert len(refreshed) == 2
+        assert state["builds"] == 2
+
+    def test_loads_persisted_index_instead_of_rebuilding(self, tmp_path):
+        state = {"version": "g|v1", "docs": DOCS, "builds": 0}
+        with self._patched(state):
+            KeywordIndexCache(cache_dir=str(tmp_path), check_interval=0).get(object(), "chunk", ["g"])
+            index = KeywordIndexCache(cache_dir=str(tmp_path), check_interval=0).get(object(), "chunk", ["g"])
+        assert state["builds"] == 1
+        assert len(index) == len(DOCS)
+        assert list(tmp_path.glob("bm25_chunk_*.npz"))
+
+    def test_chunks_read_in_one_pass_sentences_paged(self):
+        state = {"version": "g|v1", "docs": DOCS, "builds": 0}
+        cache = KeywordIndexCache(cache_dir="", check_interval=0)
+        with self._patched(state):
+            cache.get(object(), "sentence", ["g"])
+            cache.get(object(), "chunk", ["g"])
+        assert state["reads"] == ["paged", "single"]
+
+    def test_index_built_during_indexing_is_not_persisted(self, tmp_path):
+        state = {"version": "g|t1|indexing|||", "docs": DOCS, "builds": 0}
+        with self._patched(state):
+            KeywordIndexCache(cache_dir=str(tmp_path), check_interval=0).get(object(), "chunk", ["g"])
+        assert not list(tmp_path.glob("*.npz"))
+
+    def test_group_version_in_progress(self):
+        assert group_version_in_progress("a|t1|||;b|t2|indexing|||")
+        assert not group_version_in_progress("a|t1|||;b|t2|||")
+
+    def test_unknown_kind_rejected(self):
+        with pytest.raises(ValueError):
+            KeywordIndexCache(cache_dir="").get(object(), "entity", ["g"])
+
+
+class TestTextStoreKeywordPath:
+
+    def _store(self):
+        from src.worker.hybrid_v2.indexing.text_store import Neo4jTextUnitStore
+
+        store = Neo4jTextUnitStore.__new__(Neo4jTextUnitStore)
+        store._driver = MagicMock()
+        store._group_id = "g"
+        return store
+
+    def test_falls_back_to_contains_scan_when_index_fails(self, monkeypatch):
+        store = self._store()
+        store._get_chunks_for_query_indexed = MagicMock(side_effect=RuntimeError("no index"))
+        session = store._driver.session.return_value.__enter__.return_value
+        session.run.return_value = []
+
+        assert store._get_chunks_for_query_sync(["termination"], 5) == []
+        store._get_chunks_for_query_indexed.assert_called_once()
+        session.run.assert_called_once()
+
+    def test_no_index_hits_fall_back_to_contains_scan(self):
+        store = self._store()
+        store._get_chunks_for_query_indexed = MagicMock(return_value=[])
+        session = store._driver.session.return_value.__enter__.return_value
+        session.run.return_value = []
+
+        store._get_chunks_for_query_sync(["解除"], 5)
+        session.run.assert_called_once()
+
+    def test_index_disabled_skips_index(self, monkeypatch):
+        monkeypatch.setenv("KEYWORD_BM25_INDEX", "0")
+        store = self._store()
+        store._get_chunks_for_query_indexed = MagicMock()
+        session = store._driver.session.return_value.__enter__.return_value
+        session.run.return_value = []
+
+        store._get_chunks_for_query_sync(["termination"], 5)
+        store._get_chunks_for_query_indexed.assert_not_called()
+
+    def test_indexed_winners_are_fetched_within_the_group(self):
+        store = self._store()
+        index = BM25Index.build([("4:abc:1", "termination fee")])
+        session = MagicMock()
+        session.run.return_value = []
+
+        @contextmanager
+        def _retry_session(driver, database=None, read_only=False):
+            yield session
+
+        with patch("src.worker.hybrid_v2.retrievers.bm25_index.get_keyword_index_cache") as cache, \
+                patch("src.worker.hybrid_v2.indexing.text_store.retry_session", _retry_session):
+            cache.return_value.get.return_value = index
+            assert store._get_chunks_for_query_indexed(["termination"], 5) == []
+
+        query = session.run.call_args.args[0]
+        assert "c.group_id = $group_id" in query
+        assert session.run.call_args.kwargs == {"keys": ["4:abc:1"], "group_id": "g"}
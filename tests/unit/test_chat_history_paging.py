@@ -0,0 +1,186 @@
+"""Chat history router against an in-memory stand-in for the Cosmos container."""
+
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api_gateway.middleware.auth import get_user_id
+from src.api_gateway.routers import chat_history
+
+
+class _AsyncPage:
+    def __init__(self, items):
+        self._items = items
+
+    def __aiter__(self):
+        async def gen():
+            for item in self._items:
+                yield item
+        return gen()
+
+
+class _Pager:
+    """Mimics AsyncItemPaged.by_page(): async iterator of pages with continuation_token."""
+
+    def __init__(self, container, spec, start_after):
+        self._container = container
+        self._spec = spec
+        self._after = start_after
+        self._done = False
+        self.continuation_token = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+        # Re-evaluated per page, keyed on the last returned item (like Cosmos
+        # rid-based tokens), so deletes between pages do not skip items.
+        rows = self._container._evaluate(self._spec)
+        if self._after is not None:
+            keys = [key for key, _ in rows]
+            if self._after in keys:
+                rows = rows[keys.index(self._after) + 1:]
+            else:  # last item was deleted; unordered queries are sorted by key
+                rows = [row for row in rows if row[0] > self._after]
+        page = rows[:self._spec["max_item_count"]]
+        if len(rows) > len(page) and page:
+            self._after = page[-1][0]
+            self.continuation_token = f"after:{self._after}"
+        else:
+            self.continuation_token = None
+            self._done = True
+        return _AsyncPage([item for _, item in page])
+
+
+class _QueryResult:
+    def __init__(self, container, spec):
+        self._container = container
+        self._spec = spec
+
+    def by_page(self, continuation_token=None):
+        after = continuation_token.split(":", 1)[1] if continuation_token else None
+        return _Pager(self._container, self._spec, after)
+
+
+class InMemoryHistoryContainer:
+    """Just enough of the Cosmos async container API for the chat history router."""
+
+    def __init__(self):
+        self.items = {}  # (tuple(partition_key), id) -> item
+        self.batches = []
+
+    def query_items(self, query, parameters, partition_key, max_item_count=None):
+        fields = re.match(r"SELECT (.+?) FROM c", query).group(1)
+        return _QueryResult(self, {
+            "fields": None if fields == "*" else [f.strip()[2:] for f in fields.split(",")],
+            "params": {p["name"][1:]: p["value"] for p in parameters},
+            "partition": tuple(partition_key),
+            "order_desc": "ORDER BY c.timestamp DESC" in query,
+            "max_item_count": max_item_count or 1000,
+        })
+
+    def _evaluate(self, spec):
+        rows = []
+        for (pk, item_id), item in sorted(self.items.items()):
+            if pk[:len(spec["partition"])] != spec["partition"]:
+                continue
+            if any(item.get(k) != v for k, v in spec["params"].items()):
+                continue
+            projected = item if spec["fields"] is None else {f: item.get(f) for f in spec["fields"]}
+            rows.append((f"{'/'.join(pk)}/{item_id}", projected, item))
+        if spec["order_desc"]:
+            rows.sort(key=lambda r: r[2].get("timestamp", 0), reverse=True)
+        return [(key, projected) for key, projected, _ in rows]
+
+    async def execute_item_batch(self, batch_operations, partition_key):
+        assert 0 < len(batch_operations) <= chat_history.BATCH_OPERATION_LIMIT
+        self.batches.append(batch_operations)
+        pk = tuple(partition_key)
+        for op, args in batch_operations:
+            if op == "upsert":
+                self.items[(pk, args[0]["id"])] = dict(args[0])
+            elif op == "delete":
+                del self.items[(pk, args[0])]
+
+
+@pytest.fixture
+def client_and_container():
+    app = FastAPI()
+    app.include_router(chat_history.router)
+    container = InMemoryHistoryContainer()
+    app.state.cosmos_history_container = container
+    app.dependency_overrides[get_user_id] = lambda: "user-1"
+    return TestClient(app), container
+
+
+def _save(client, session_id, pairs, question="question"):
+    answers = [[f"{question} {i}", f"answer {i}"] for i in range(pairs)]
+    assert client.post("/chat_history", json={"id": session_id, "answers": answers}).status_code == 201
+
+
+class TestChatHistoryPaging:
+
+    def test_session_pages_follow_continuation_tokens(self, client_and_container, monkeypatch):
+        client, _ = client_and_container
+        clock = iter(range(1, 100))
+        monkeypatch.setattr(chat_history.time, "time", lambda: next(clock))
+        for i in range(7):
+            _save(client, f"s{i}", 1)
+
+        seen, token, pages = [], None, 0
+        while True:
+            params = {"count": 3, **({"continuationToken": token} if token else {})}
+            body = client.get("/chat_history/sessions", params=params).json()
+            pages += 1
+            assert len(body["sessions"]) <= 3
+            seen += [s["id"] for s in body["sessions"]]
+            token = body["continuation_token"]
+            if not token:
+                break
+
+        assert pages == 3
+        assert seen == [f"s{i}" for i in reversed(range(7))]
+        assert set(body["sessions"][0]) == {"id", "entra_oid", "title", "timestamp"}
+
+    def test_page_size_is_capped(self, client_and_container):
+        client, container = client_and_container
+        for i in range(chat_history.MAX_PAGE_SIZE + 5):
+            container.items[(("user-1", f"s{i}"), f"s{i}")] = {
+                "id": f"s{i}", "entra_oid": "user-1", "type": "session", "title": "t", "timestamp": i,
+            }
+        body = client.get("/chat_history/sessions", params={"count": 10_000}).json()
+        assert len(body["sessions"]) == chat_history.MAX_PAGE_SIZE
+        assert body["continuation_token"]
+
+    def test_session_messages_paged(self, client_and_container):
+        client, _ = client_and_container
+        _save(client, "long", 5)
+
+        full = client.get("/chat_history/sessions/long").json()
+        assert len(full["answers"]) == 5 and full["continuation_token"] is None
+
+        first = client.get("/chat_history/sessions/long", params={"count": 2}).json()
+        second = client.get(
+            "/chat_history/sessions/long",
+            params={"count": 2, "continuationToken": first["continuation_token"]},
+        ).json()
+        assert len(first["answers"]) == 2 and len(second["answers"]) == 2
+        assert first["answers"] + second["answers"] == full["answers"][:4]
+
+    def test_large_session_saved_and_deleted_in_bounded_batches(self, client_and_container):
+        client, container = client_and_container
+        _save(client, "big", 250)
+        _save(client, "other", 2)
+        assert len(container.items) == 251 + 3
+        assert [len(b) for b in container.batches[:3]] == [100, 100, 51]
+        assert container.batches[2][-1][1][0]["type"] == "session"
+
+        container.batches.clear()
+        assert client.delete("/chat_history/sessions/big").status_code == 204
+        assert [len(b) for b in container.batches] == [100, 100, 51]
+        assert container.batches[-1][-1] == ("delete", ("big",))
+        assert {pk for pk, _ in container.items} == {("user-1", "other")}
@@ -0,0 +1,122 @@
+"""Tests for compact sentence geometry and async citation enrichment."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.worker.hybrid_v2.routes.base import BaseRouteHandler, Citation
+from src.worker.hybrid_v2.utils.geometry import (
+    compact_sentence_geometry,
+    expand_sentence_geometry,
+)
+
+
+def _metadata(page=3, pages=12):
+    return {
+        "sentences": [{
+            "text": "The fee is due on receipt.",
+            "polygons": [[0.1, 0.2, 0.5, 0.2, 0.5, 0.25, 0.1, 0.25]],
+            "page": page,
+            "confidence": 0.98,
+        }],
+        "page_dimensions": [
+            {"page": p, "width": 8.5, "height": 11, "unit": "inch"} for p in range(1, pages + 1)
+        ],
+    }
+
+
+class TestCompactGeometry:
+
+    def test_keeps_only_cited_page_dimensions(self):
+        meta = _metadata()
+        compact = compact_sentence_geometry(meta)
+        assert len(compact) < len(json.dumps(meta)) / 3
+        geometry = expand_sentence_geometry(compact, text="The fee is due on receipt.")
+        assert geometry["page_dimensions"] == [{"page": 3, "width": 8.5, "height": 11, "unit": "inch"}]
+        assert geometry["sentences"] == meta["sentences"]
+
+    def test_empty_when_no_polygons(self):
+        assert compact_sentence_geometry({}) == ""
+        assert compact_sentence_geometry({"page_dimensions": _metadata()["page_dimensions"]}) == ""
+        assert expand_sentence_geometry("") == {}
+        assert expand_sentence_geometry("not json") == {}
+
+
+class _FakeReads:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    async def fetch(self, query, ids, group_ids):
+        self.calls.append(list(ids))
+        await asyncio.sleep(0)
+        return [self.rows[i] for i in ids if i in self.rows]
+
+
+def _handler(rows):
+    handler = BaseRouteHandler.__new__(BaseRouteHandler)
+    handler.neo4j_driver = MagicMock()
+    handler.group_ids = ["g"]
+    handler._graph_reads = _FakeReads(rows)
+    return handler
+
+
+def _row(sid, geometry=None, metadata=None, text="sentence"):
+    return {"id": sid, "text": text, "geometry": geometry, "metadata": metadata}
+
+
+def _citation(sid, index=1):
+    return Citation(index=index, sentence_id=sid, document_id="d", document_title="D",
+                    score=1.0, text_preview="")
+
+
+class TestAsyncEnrichment:
+
+    @pytest.mark.asyncio
+    async def test_prefetch_then_fetch_missing(self):
+        rows = {
+            "s1": _row("s1", geometry=compact_sentence_geometry(_metadata(page=1))),
+            "s2": _row("s2", geometry=compact_sentence_geometry(_metadata(page=2))),
+            # Indexed before the geometry property existed
+            "s3": _row("s3", metadata=json.dumps({**_metadata(page=5), "page_number": 5})),
+        }
+        handler = _handler(rows)
+        prefetch = handler._start_geometry_prefetch(["s1", "s2", "community_7", ""])
+        citations = [_citation("s1"), _citation("community_7", 2), _citation("s3", 3)]
+
+        await handler._enrich_citations_with_geometry_async(citations, prefetch=prefetch)
+
+        assert handler._graph_reads.calls == [["s1", "s2"], ["s3"]]
+        assert citations[0].sentences[0]["page"] == 1
+        assert citations[0].sentences[0]["text"] == "sentence"
+        assert citations[0].page_dimensions == [{"page": 1, "width": 8.5, "height": 11, "unit": "inch"}]
+        assert citations[1].sentences is None
+        assert citations[2].page_number == 5 and len(citations[2].page_dimensions) == 12
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_leaves_citations_untouched(self):
+        handler = _handler({})
+
+        async def boom(*args, **kwargs):
+            raise RuntimeError("neo4j down")
+
+        handler._graph_reads.fetch = boom
+        citations = [_citation("s1")]
+        await handler._enrich_citations_with_geometry_async(
+            citations, prefetch=handler._start_geometry_prefetch(["s1"]),
+        )
+        assert citations[0].sentences is None and citations[0].page_dimensions is None
+
+    @pytest.mark.asyncio
+    async def test_existing_fields_not_overwritten(self):
+        rows = {"s1": _row("s1", geometry=compact_sentence_geometry({**_metadata(), "page_number": 3}))}
+        handler = _handler(rows)
+        citation = _citation("s1")
+        citation.page_number = 9
+        citation.sentences = [{"text": "kept"}]
+        await handler._enrich_citations_with_geometry_async([citation])
+        assert citation.page_number == 9
+        assert citation.sentences == [{"text": "kept"}]
+        assert citation.page_dimensions
@@ -190,6 +190,10 @@ class TestCommunityMatcherLoading:
         matcher._summary_hashes = {}
         matcher._loaded = False
         matcher._load_lock = asyncio.Lock()
+        matcher._loaded_version = None
+        matcher._version_checked_at = 0.0
+        matcher._matrix_cache = None
+        matcher._embeddings_rev = 0
         return matcher
 
     def _mock_neo4j_records(self, records_data: List[Dict]):
@@ -436,6 +440,9 @@ class TestSemanticMatch:
         matcher._community_embeddings = embeddings
         matcher._summary_hashes = summary_hashes or {}
         matcher._loaded = True
+        matcher._loaded_version = None
+        matcher._matrix_cache = None
+        matcher._embeddings_rev = 0
         return matcher
 
     @pytest.mark.asyncio
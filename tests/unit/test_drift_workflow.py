@@ -0,0 +1,199 @@
+"""Tests for the adaptive DRIFT workflow (workflows/drift_workflow.py)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from llama_index.core.workflow import StartEvent
+
+from src.worker.hybrid_v2.workflows.drift_workflow import DRIFTWorkflow, SubQuestionBudget
+
+
+class _ScriptedPipeline:
+    """Fake pipeline: scripted decompositions, per-question NER/latency, fixed confidence."""
+
+    def __init__(self, decompositions, entities, latencies, original_entities=(), confidence=0.9):
+        self._decompositions = list(decompositions)
+        self.entities = entities
+        self.latencies = latencies
+        self.original_entities = list(original_entities)
+        self.confidence = confidence
+        self.enhanced_retriever = None
+        self.decompose_calls = []
+        self.completed = []
+        self.cancelled = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.synthesis = None
+        self.disambiguator = SimpleNamespace(disambiguate=self._disambiguate)
+        self.tracer = SimpleNamespace(trace=self._trace)
+        self.synthesizer = SimpleNamespace(synthesize=self._synthesize)
+
+    async def _drift_decompose(self, prompt):
+        self.decompose_calls.append(prompt)
+        return self._decompositions.pop(0)
+
+    async def _disambiguate(self, text):
+        if text not in self.latencies:
+            return self.original_entities
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies[text])
+        except asyncio.CancelledError:
+            self.cancelled.append(text)
+            raise
+        finally:
+            self.in_flight -= 1
+        self.completed.append(text)
+        return self.entities.get(text, [])
+
+    async def _trace(self, query, seed_entities, top_k):
+        return [(e, 1.0) for e in seed_entities][:top_k] * 2
+
+    def _compute_subgraph_confidence(self, sub_questions, intermediate_results, complete_evidence):
+        return {
+            "score": self.confidence,
+            "satisfied_ratio": self.confidence,
+            "entity_diversity": 1.0,
+            "thin_questions": [r["question"] for r in intermediate_results][:1],
+            "concentrated_entities": [],
+        }
+
+    async def _synthesize(self, query, evidence_nodes, response_type, sub_questions, intermediate_context,
+                          coverage_chunks=None):
+        self.synthesis = {"sub_questions": sub_questions, "intermediate_context": intermediate_context}
+        return {"response": "ok", "citations": [], "evidence_path": []}
+
+
+async def _run(pipeline, **kwargs):
+    workflow = DRIFTWorkflow(pipeline=pipeline, timeout=10, **kwargs)
+    return await workflow.run(start_event=StartEvent(query="original question", response_type="summary"))
+
+
+@pytest.mark.asyncio
+async def test_results_keep_question_order_within_shared_budget(monkeypatch):
+    monkeypatch.setenv("ROUTE4_EARLY_EXIT", "0")
+    questions = [f"q{i}" for i in range(6)]
+    pipeline = _ScriptedPipeline(
+        decompositions=[questions],
+        entities={q: [f"E{q}"] for q in questions},
+        latencies={q: 0.06 - 0.01 * i for i, q in enumerate(questions)},  # later questions finish first
+    )
+
+    result = await _run(pipeline, sub_question_budget=SubQuestionBudget(2))
+
+    assert pipeline.max_in_flight == 2
+    assert pipeline.completed != questions
+    assert [r["question"] for r in pipeline.synthesis["intermediate_context"]] == questions
+    assert pipeline.synthesis["sub_questions"] == questions
+    assert result["metadata"]["cancelled_sub_questions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_is_shared_across_concurrent_workflows(monkeypatch):
+    monkeypatch.setenv("ROUTE4_EARLY_EXIT", "0")
+    budget = SubQuestionBudget(3)
+    pipelines = [
+        _ScriptedPipeline(
+            decompositions=[[f"{w}-q{i}" for i in range(4)]],
+            entities={},
+            latencies={f"{w}-q{i}": 0.03 for i in range(4)},
+        )
+        for w in "ab"
+    ]
+    peak = 0
+
+    async def probe():
+        nonlocal peak
+        while True:
+            peak = max(peak, budget.in_flight)
+            await asyncio.sleep(0.002)
+
+    watcher = asyncio.create_task(probe())
+    await asyncio.gather(*(_run(p, sub_question_budget=budget) for p in pipelines))
+    watcher.cancel()
+
+    assert peak == 3
+    assert all(len(p.completed) == 4 for p in pipelines)
+
+
+@pytest.mark.asyncio
+async def test_outstanding_sub_questions_cancelled_once_entities_covered(monkeypatch):
+    monkeypatch.setenv("ROUTE4_EARLY_EXIT", "1")
+    questions = ["fast contoso", "fast fabrikam", "slow 1", "slow 2", "queued"]
+    pipeline = _ScriptedPipeline(
+        decompositions=[questions],
+        entities={"fast contoso": ["Contoso"], "fast fabrikam": ["fabrikam "], "slow 1": ["X"], "slow 2": ["Y"]},
+        latencies={"fast contoso": 0.01, "fast fabrikam": 0.02, "slow 1": 5, "slow 2": 5, "queued": 5},
+        original_entities=["Contoso", "Fabrikam"],
+    )
+
+    result = await asyncio.wait_for(_run(pipeline, sub_question_budget=SubQuestionBudget(2)), timeout=3)
+
+    assert pipeline.completed == ["fast contoso", "fast fabrikam"]
+    assert sorted(pipeline.cancelled) == ["slow 1", "slow 2"]  # "queued" never started
+    assert result["metadata"]["cancelled_sub_questions"] == 3
+    assert pipeline.synthesis["sub_questions"] == ["fast contoso", "fast fabrikam"]
+    assert [r["question"] for r in pipeline.synthesis["intermediate_context"]] == ["fast contoso", "fast fabrikam"]
+
+
+@pytest.mark.asyncio
+async def test_single_answer_covering_entities_does_not_cancel_other_facets(monkeypatch):
+    monkeypatch.setenv("ROUTE4_EARLY_EXIT", "1")
+    questions = ["termination terms", "payment terms", "renewal terms"]
+    pipeline = _ScriptedPipeline(
+        decompositions=[questions],
+        entities={q: ["Contoso MSA"] for q in questions},
+        latencies={"termination terms": 0.01, "payment terms": 0.05, "renewal terms": 5},
+        original_entities=["Contoso MSA"],
+    )
+
+    result = await asyncio.wait_for(_run(pipeline, sub_question_budget=SubQuestionBudget(3)), timeout=3)
+
+    # The first answer alone covers the only entity; the second facet still runs
+    assert pipeline.completed == ["termination terms", "payment terms"]
+    assert pipeline.cancelled == ["renewal terms"]
+    assert result["metadata"]["cancelled_sub_questions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_early_exit_off_by_default(monkeypatch):
+    monkeypatch.delenv("ROUTE4_EARLY_EXIT", raising=False)
+    questions = ["termination terms", "payment terms", "renewal terms"]
+    pipeline = _ScriptedPipeline(
+        decompositions=[questions],
+        entities={q: ["Contoso MSA"] for q in questions},
+        latencies={"termination terms": 0.01, "payment terms": 0.02, "renewal terms": 0.03},
+        original_entities=["Contoso MSA"],
+    )
+
+    result = await _run(pipeline, sub_question_budget=SubQuestionBudget(3))
+
+    assert sorted(pipeline.completed) == sorted(questions)
+    assert result["metadata"]["cancelled_sub_questions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_latency_budget_gates_redecompose(monkeypatch):
+    monkeypatch.setenv("ROUTE4_EARLY_EXIT", "0")
+
+    def pipeline():
+        return _ScriptedPipeline(
+            decompositions=[["q0", "q1"], ["r0"]],
+            entities={"q0": ["A"], "q1": ["B"], "r0": ["C"]},
+            latencies={"q0": 0.02, "q1": 0.02, "r0": 0.0},
+            confidence=0.2,
+        )
+
+    generous = pipeline()
+    result = await _run(generous, latency_budget_ms=10_000)
+    assert len(generous.decompose_calls) == 2
+    assert result["metadata"]["redecompose_attempts"] == 1
+    assert result["metadata"]["redecompose_skipped"] is None
+
+    tight = pipeline()
+    result = await _run(tight, latency_budget_ms=30)
+    assert len(tight.decompose_calls) == 1
+    assert result["metadata"]["redecompose_attempts"] == 0
+    assert result["metadata"]["redecompose_skipped"] == "latency_budget"
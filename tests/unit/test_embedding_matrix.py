@@ -0,0 +1,133 @@
+"""Tests for compact embedding storage (retrievers/embedding_matrix.py, TripleEmbeddingStore)."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.worker.hybrid_v2.retrievers.embedding_matrix import EmbeddingMatrix
+
+
+def _fixture(n=3000, dim=512, topics=40, queries=60, seed=3):
+    """Clustered unit vectors plus queries drawn near random corpus rows."""
+    rng = np.random.RandomState(seed)
+    centers = rng.normal(size=(topics, dim))
+    corpus = centers[rng.randint(0, topics, size=n)] + 0.9 * rng.normal(size=(n, dim))
+    corpus = (corpus / np.linalg.norm(corpus, axis=1, keepdims=True)).astype(np.float32)
+    picks = rng.randint(0, n, size=queries)
+    qs = corpus[picks] + 0.5 * rng.normal(size=(queries, dim)).astype(np.float32) / np.sqrt(dim)
+    return corpus, qs.astype(np.float32)
+
+
+def _recall_at_k(matrix, reference, queries, k):
+    hits = 0
+    for q in queries:
+        truth = set(reference.top_k(q, k)[0].tolist())
+        hits += len(truth & set(matrix.top_k(q, k)[0].tolist()))
+    return hits / (k * len(queries))
+
+
+class TestEmbeddingMatrix:
+
+    @pytest.mark.parametrize("dtype,min_recall", [("float16", 0.99), ("int8", 0.95)])
+    def test_recall_matches_float32(self, dtype, min_recall):
+        corpus, queries = _fixture()
+        reference = EmbeddingMatrix.from_array(corpus, "float32")
+        compact = EmbeddingMatrix.from_array(corpus, dtype)
+        assert _recall_at_k(compact, reference, queries, k=10) >= min_recall
+        q = queries[0]
+        assert np.abs(compact.scores(q) - reference.scores(q)).max() < 0.02
+
+    def test_storage_size(self):
+        corpus, _ = _fixture(n=1000, dim=256)
+        f32 = EmbeddingMatrix.from_array(corpus, "float32").nbytes
+        assert EmbeddingMatrix.from_array(corpus, "float16").nbytes == f32 // 2
+        assert EmbeddingMatrix.from_array(corpus, "int8").nbytes == f32 // 4 + 1000 * 4
+
+    def test_rows_are_normalised_and_zero_rows_stay_zero(self):
+        raw = np.array([[3.0, 4.0], [0.0, 0.0], [-1.0, 1.0]], dtype=np.float32)
+        for dtype in ("float32", "float16", "int8"):
+            matrix = EmbeddingMatrix.from_array(raw, dtype)
+            assert np.linalg.norm(matrix.row(0)) == pytest.approx(1.0, abs=1e-2)
+            assert not matrix.row(1).any()
+            assert matrix.scores(np.array([0.6, 0.8]))[0] == pytest.approx(1.0, abs=1e-2)
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_save_and_memory_map(self, tmp_path, dtype):
+        corpus, queries = _fixture(n=500, dim=64)
+        matrix = EmbeddingMatrix.from_array(corpus, dtype)
+        path = tmp_path / "m.npy"
+        matrix.save(path)
+
+        mapped = EmbeddingMatrix.load(path)
+        assert mapped.mapped
+        report = mapped.memory_report()
+        assert report["heap_mb"] == 0.0 and report["mapped_mb"] > 0
+        assert report["dtype"] == dtype
+        np.testing.assert_array_equal(mapped.scores(queries[0]), matrix.scores(queries[0]))
+
+
+class TestTripleStoreStorage:
+
+    def _triples(self, module, n):
+        return [
+            module.Triple(subject_id=f"s{i}", subject_name=f"S{i}", predicate="p",
+                          object_id=f"o{i}", object_name=f"O{i}", triple_text=f"S{i} p O{i}")
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_second_load_memory_maps_saved_matrix(self, tmp_path, monkeypatch):
+        from src.worker.hybrid_v2.retrievers import triple_store as module
+
+        monkeypatch.setenv("EMBEDDING_MMAP_DIR", str(tmp_path))
+        monkeypatch.setenv("EMBEDDING_STORAGE_DTYPE", "float16")
+        corpus, queries = _fixture(n=20, dim=32)
+        calls = []
+
+        def _fetch(self, driver, group_ids, with_embeddings=True):
+            calls.append(with_embeddings)
+            triples = self._triples_for_test
+            if with_embeddings:
+                for t, row in zip(triples, corpus):
+                    t.embedding = row
+            return triples, corpus
+
+        monkeypatch.setattr(module.TripleEmbeddingStore, "_fetch_triples_sync", _fetch)
+
+        first = module.TripleEmbeddingStore()
+        first._triples_for_test = self._triples(module, 20)
+        await first.load(MagicMock(), "g", MagicMock(), group_ids=["g"], version="g|v1")
+        second = module.TripleEmbeddingStore()
+        second._triples_for_test = self._triples(module, 20)
+        await second.load(MagicMock(), "g", MagicMock(), group_ids=["g"], version="g|v1")
+
+        assert calls == [True, False]
+        assert first.memory_report()["mapped"] and second.memory_report()["mapped"]
+        assert len(list(tmp_path.glob("triples_*_float16.npy"))) == 1
+        assert first.memory_report()["dtype"] == "float16"
+        assert [t.triple_text for t, _ in second.search(queries[0].tolist(), 3)] == \
+            [t.triple_text for t, _ in first.search(queries[0].tolist(), 3)]
+        assert second._triples[0].embedding is not None
+
+    @pytest.mark.asyncio
+    async def test_shared_store_reused_per_group_version(self, monkeypatch):
+        from src.worker.hybrid_v2.retrievers import bm25_index, triple_store as module
+
+        monkeypatch.delenv("EMBEDDING_MMAP_DIR", raising=False)
+        versions = iter(["g|v1", "g|v1", "g|v2"])
+        monkeypatch.setattr(bm25_index, "read_group_version", lambda driver, group_ids: next(versions))
+        monkeypatch.setattr(module, "_shared_stores", {})
+        loads = []
+
+        async def _load(self, driver, group_id, voyage, group_ids=None, version=None):
+            loads.append(version)
+            self._loaded = True
+
+        monkeypatch.setattr(module.TripleEmbeddingStore, "load", _load)
+
+        a = await module.get_shared_triple_store(MagicMock(), "g", MagicMock(), group_ids=["g"])
+        b = await module.get_shared_triple_store(MagicMock(), "g", MagicMock(), group_ids=["g"])
+        c = await module.get_shared_triple_store(MagicMock(), "g", MagicMock(), group_ids=["g"])
+        assert a is b and c is not a
+        assert loads == ["g|v1", "g|v2"]
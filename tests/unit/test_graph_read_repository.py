@@ -0,0 +1,126 @@
+"""
+Unit Tests: GraphReadRepository (native async reads for hybrid_v2)
+
+Route handlers, EnhancedGraphRetriever and Neo4jTextUnitStore read through
+``GraphReadRepository``: the native async driver once AsyncNeo4jService is
+connected, the sync driver on a worker thread otherwise.
+
+Run: pytest tests/unit/test_graph_read_repository.py -v
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.worker.hybrid_v2.services import graph_read_repository as repo_mod
+from src.worker.hybrid_v2.services.graph_read_repository import GraphReadRepository
+
+
+def _async_service(records):
+    """AsyncNeo4jService stand-in whose read session returns *records*."""
+    session = MagicMock()
+    session.run = AsyncMock(return_value=records)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    service = MagicMock()
+    service.is_connected = True
+    service._get_session = MagicMock(return_value=session)
+    return service, session
+
+
+def _sync_driver(records):
+    """Sync driver stand-in for the retry_session fallback."""
+    session = MagicMock()
+    session.run.return_value = records
+    session.__enter__ = MagicMock(return_value=session)
+    session.__exit__ = MagicMock(return_value=False)
+    return session
+
+
+class TestFetch:
+
+    @pytest.mark.asyncio
+    async def test_uses_async_driver_when_connected(self):
+        service, session = _async_service([{"id": "e1"}])
+        driver = MagicMock()
+        repo = GraphReadRepository(driver=driver, async_neo4j=service)
+
+        with patch.dict(os.environ, {"NEO4J_ASYNC_READS": "1"}):
+            records = await repo.fetch("MATCH (n) RETURN n", group_ids=["g"])
+
+        assert records == [{"id": "e1"}]
+        service._get_session.assert_called_once_with(read_only=True)
+        session.run.assert_awaited_once_with("MATCH (n) RETURN n", group_ids=["g"])
+        driver.session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_thread_when_not_connected(self):
+        service, _ = _async_service([])
+        service.is_connected = False
+        sync_session = _sync_driver([{"id": "e2"}])
+        repo = GraphReadRepository(driver=MagicMock(), async_neo4j=service, database="neo4j")
+
+        with patch.object(repo_mod, "retry_session", return_value=sync_session) as rs:
+            records = await repo.fetch("MATCH (n) RETURN n", group_ids=["g"])
+
+        assert records == [{"id": "e2"}]
+        assert rs.call_args.kwargs == {"database": "neo4j", "read_only": True}
+        service._get_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flag_forces_thread_offload(self):
+        service, _ = _async_service([])
+        sync_session = _sync_driver([{"id": "e3"}])
+        repo = GraphReadRepository(driver=MagicMock(), async_neo4j=service)
+
+        with patch.dict(os.environ, {"NEO4J_ASYNC_READS": "0"}), \
+             patch.object(repo_mod, "retry_session", return_value=sync_session):
+            assert not repo.uses_async
+            records = await repo.fetch("RETURN 1")
+
+        assert records == [{"id": "e3"}]
+        service._get_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_driver_raises(self):
+        with pytest.raises(RuntimeError):
+            await GraphReadRepository().fetch("RETURN 1")
+
+    @pytest.mark.asyncio
+    async def test_fetch_dicts_and_fetch_one(self):
+        service, _ = _async_service([{"a": 1}, {"a": 2}])
+        repo = GraphReadRepository(async_neo4j=service)
+
+        with patch.dict(os.environ, {"NEO4J_ASYNC_READS": "1"}):
+            assert await repo.fetch_dicts("RETURN 1") == [{"a": 1}, {"a": 2}]
+            assert await repo.fetch_one("RETURN 1") == {"a": 1}
+
+        service, _ = _async_service([])
+        repo = GraphReadRepository(async_neo4j=service)
+        assert await repo.fetch_one("RETURN 1") is None
+
+
+class TestConsumers:
+
+    def test_route_handler_builds_repository_from_pipeline(self):
+        from src.worker.hybrid_v2.routes.base import BaseRouteHandler
+
+        handler = BaseRouteHandler.__new__(BaseRouteHandler)
+        handler.neo4j_driver = MagicMock()
+        handler._async_neo4j = MagicMock()
+
+        repo = handler.graph_reads
+        assert repo is handler.graph_reads
+        assert repo.driver is handler.neo4j_driver
+        assert repo.async_neo4j is handler._async_neo4j
+
+    @pytest.mark.asyncio
+    async def test_text_store_attaches_async_service(self):
+        from src.worker.hybrid_v2.indexing.text_store import Neo4jTextUnitStore
+
+        store = Neo4jTextUnitStore(MagicMock(), group_id="g")
+        assert store._repo.async_neo4j is None
+        service, _ = _async_service([])
+        store.attach_async_neo4j(service)
+        assert store._repo.async_neo4j is service
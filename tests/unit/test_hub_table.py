@@ -0,0 +1,126 @@
+"""Tests for the in-process hub / degree table (retrievers/hub_table.py)."""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.worker.hybrid_v2.retrievers.hub_table import HubTable, HubTableCache
+
+ROWS = [
+    {"key": "4", "name": "Contoso", "id": "e1", "community": None,
+     "community_id": 1, "degree": 9},
+    {"key": "2", "name": "Fabrikam", "id": "e2", "community": None,
+     "community_id": 1, "degree": 5},
+    {"key": "3", "name": "Termination Fee", "id": "e3", "community": "7",
+     "community_id": None, "degree": 5},
+    {"key": "1", "name": None, "id": "e4", "community": None,
+     "community_id": 1, "degree": 2},
+    {"key": "5", "name": "Orphan", "id": "e5", "community": None,
+     "community_id": 1, "degree": 0},
+]
+
+
+class TestHubTable:
+
+    def test_top_orders_by_degree_then_name(self):
+        table = HubTable(ROWS)
+        assert table.top(10) == [("Contoso", 9), ("Fabrikam", 5), ("Termination Fee", 5), ("e4", 2)]
+        assert table.top(2) == [("Contoso", 9), ("Fabrikam", 5)]
+
+    def test_community_hubs_match_either_property(self):
+        table = HubTable(ROWS)
+        assert table.community_hubs(1, 5) == ["Contoso", "Fabrikam", "e4"]
+        assert table.community_hubs("1", 2) == ["Contoso", "Fabrikam"]
+        assert table.community_hubs(7, 5) == ["Termination Fee"]
+        assert table.community_hubs("missing", 5) == []
+
+    def test_keyword_hubs_substring_match_in_degree_order(self):
+        table = HubTable(ROWS)
+        assert table.keyword_hubs(["fee", "fab"], 5) == ["Fabrikam", "Termination Fee"]
+        assert table.keyword_hubs(["orphan"], 5) == []
+        assert table.keyword_hubs([], 5) == []
+
+
+class _FakeSession:
+    def __init__(self, state):
+        self._state = state
+
+    def run(self, query, **params):
+        result = MagicMock()
+        if "collect(g.group_id)" in query:
+            result.single.return_value = {"fresh": self._state["fresh"]}
+        else:
+            result.single.return_value = {"parts": [self._state["version"]]}
+        return result
+
+    def read_all(self, query, consume, **params):
+        assert "$after" not in query
+        self._state["builds"] += 1
+        self._state["fresh_param"] = params["fresh_groups"]
+        return consume(iter(dict(r) for r in self._state["rows"]))
+
+
+class TestHubTableCache:
+
+    def _patched(self, state):
+        @contextmanager
+        def _retry_session(driver, database=None, read_only=False):
+            yield _FakeSession(state)
+
+        return (
+            patch("src.worker.hybrid_v2.retrievers.bm25_index.retry_session", _retry_session),
+            patch("src.worker.hybrid_v2.retrievers.hub_table.retry_session", _retry_session),
+        )
+
+    def test_reuses_table_until_group_version_changes(self):
+        state = {"version": "g|v1", "rows": ROWS, "builds": 0, "fresh": ["g"]}
+        cache = HubTableCache(check_interval=0)
+        p1, p2 = self._patched(state)
+        with p1, p2:
+            first = cache.get(object(), ["g"])
+            assert cache.get(object(), ["g"]) is first
+            assert state["builds"] == 1
+            assert state["fresh_param"] == ["g"]
+
+            state["version"] = "g|v2"
+            state["rows"] = ROWS[:2]
+            refreshed = cache.get(object(), ["g"])
+        assert refreshed is not first
+        assert len(refreshed) == 2
+        assert state["builds"] == 2
+
+
+class TestHubConsumers:
+
+    @pytest.mark.asyncio
+    async def test_hub_extractor_reads_table(self, monkeypatch):
+        from src.worker.hybrid_v2.pipeline import hub_extractor as module
+
+        monkeypatch.setenv("HUB_TABLE", "1")
+        cache = MagicMock()
+        cache.get.return_value = HubTable(ROWS)
+        monkeypatch.setattr(module, "get_hub_table_cache", lambda: cache)
+        extractor = module.HubExtractor(neo4j_driver=MagicMock(), group_id="g", group_ids=["g"])
+
+        assert await extractor.get_high_degree_entities(top_k=2) == [("Contoso", 9), ("Fabrikam", 5)]
+        assert await extractor._query_neo4j_hubs("1", 1) == ["Contoso"]
+        assert await extractor._query_neo4j_hubs_by_keywords(["FEE"], 3) == ["Termination Fee"]
+        extractor.neo4j_driver.session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retriever_falls_back_to_cypher_when_table_fails(self, monkeypatch):
+        from src.worker.hybrid_v2.pipeline import enhanced_graph_retriever as module
+
+        monkeypatch.setenv("HUB_TABLE", "1")
+        cache = MagicMock()
+        cache.get.side_effect = RuntimeError("neo4j unavailable")
+        monkeypatch.setattr(module, "get_hub_table_cache", lambda: cache)
+        retriever = module.EnhancedGraphRetriever(neo4j_driver=MagicMock(), group_id="g")
+        retriever._repo = MagicMock()
+
+        async def _fetch(query, **params):
+            return [{"name": "Contoso", "degree": 9}]
+
+        retriever._repo.fetch = _fetch
+        assert await retriever.get_top_entities_by_degree(top_k=1) == [("Contoso", 9)]
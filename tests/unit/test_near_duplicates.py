@@ -0,0 +1,108 @@
+"""Tests for MinHash/LSH near-duplicate detection (utils/near_duplicates.py)."""
+
+import random
+
+import pytest
+
+from src.worker.hybrid_v2.utils.near_duplicates import (
+    NearDuplicateDetector,
+    dedup_indices,
+    jaccard,
+    lsh_params,
+    word_set,
+)
+
+
+def _legacy_kept(texts, threshold, order):
+    """The greedy word-set Jaccard loop previously inlined in synthesis."""
+    sets = [word_set(t) for t in texts]
+    kept = []
+    for idx in order:
+        if not sets[idx]:
+            kept.append(idx)
+            continue
+        if any(
+            sets[k] and jaccard(sets[idx], sets[k]) >= threshold
+            for k in kept
+        ):
+            continue
+        kept.append(idx)
+    return kept
+
+
+def _corpus(n, seed=3, dup_rate=0.3):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(3000)]
+    texts = []
+    for _ in range(n):
+        if texts and rng.random() < dup_rate:
+            words = rng.choice(texts).split()
+            # Small edits: drop / swap a word or two (OCR-style noise).
+            for _ in range(rng.randint(0, 2)):
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+            texts.append(" ".join(words))
+        else:
+            texts.append(" ".join(rng.sample(vocab, rng.randint(20, 60))))
+    return texts
+
+
+class TestNearDuplicateDetector:
+
+    def test_word_set_normalises_case_and_punctuation(self):
+        assert word_set("Net-30, NET 30.") == frozenset({"net", "30"})
+
+    @pytest.mark.parametrize("threshold", [0.7, 0.85, 0.92])
+    def test_matches_brute_force_decisions(self, threshold):
+        texts = _corpus(400)
+        order = list(range(len(texts)))
+        random.Random(1).shuffle(order)
+        assert dedup_indices(texts, threshold, order=order) == _legacy_kept(texts, threshold, order)
+
+    def test_empty_texts_always_kept(self):
+        assert dedup_indices(["", "  ", "a b c", "a b c"], 0.9) == [0, 1, 2]
+
+    def test_scopes_are_isolated(self):
+        detector = NearDuplicateDetector(threshold=0.9)
+        assert detector.add("the supplier shall deliver within ten days", scope="doc-a")
+        assert detector.add("the supplier shall deliver within ten days", scope="doc-b")
+        assert not detector.add("The supplier shall deliver within ten days.", scope="doc-a")
+
+    def test_insert_and_is_duplicate_do_not_mutate_on_check(self):
+        detector = NearDuplicateDetector(threshold=0.9)
+        detector.insert("alpha beta gamma delta")
+        assert detector.is_duplicate("Alpha, beta, gamma, delta")
+        assert not detector.is_duplicate("epsilon zeta")
+        assert len(detector) == 1
+
+    def test_lsh_keeps_comparisons_sublinear_for_distinct_texts(self):
+        texts = _corpus(1000, dup_rate=0.0)
+        detector = NearDuplicateDetector(threshold=0.92)
+        for t in texts:
+            detector.add(t)
+        assert detector.comparisons < len(texts)
+
+    def test_lsh_params_bound_false_negatives(self):
+        for threshold in (0.5, 0.8, 0.92):
+            bands, rows = lsh_params(threshold, 128)
+            assert bands * rows <= 128
+            assert (1 - threshold ** rows) ** bands <= 1e-4
+
+
+class TestDenoiseSentenceDedup:
+
+    EVIDENCE = [
+        {"text": "The supplier shall deliver the goods within ten days.", "document_id": "d1"},
+        {"text": "The supplier shall deliver the goods within ten days!", "document_id": "d1"},
+    ]
+
+    def test_off_by_default(self, monkeypatch):
+        from src.worker.hybrid_v2.routes.route_3_global import GlobalSearchHandler
+
+        monkeypatch.delenv("DENOISE_SENTENCE_DEDUP", raising=False)
+        assert len(GlobalSearchHandler._denoise_sentences(self.EVIDENCE)) == 2
+
+    def test_opt_in_drops_same_document_copy(self, monkeypatch):
+        from src.worker.hybrid_v2.routes.route_3_global import GlobalSearchHandler
+
+        monkeypatch.setenv("DENOISE_SENTENCE_DEDUP", "1")
+        assert GlobalSearchHandler._denoise_sentences(self.EVIDENCE) == self.EVIDENCE[:1]
@@ -0,0 +1,203 @@
+"""
+Unit Tests: process-wide Neo4j pool manager
+
+Every pipeline, store and service obtains its driver (and the sync
+executor) from ``Neo4jPoolManager`` instead of building its own pool.
+
+Run: pytest tests/unit/test_neo4j_pool.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.worker.services import neo4j_pool as pool_mod
+
+
+@pytest.fixture
+def pool():
+    return pool_mod.Neo4jPoolManager()
+
+
+class TestSyncDrivers:
+
+    def test_same_target_shares_one_driver(self, pool):
+        with patch.object(pool_mod, "GraphDatabase") as gd:
+            gd.driver.side_effect = lambda *a, **kw: MagicMock()
+            d1 = pool.get_driver("neo4j://a", "neo4j", "pw")
+            d2 = pool.get_driver("neo4j://a", "neo4j", "pw")
+            d3 = pool.get_driver("neo4j://b", "neo4j", "pw")
+
+        assert d1 is d2
+        assert d1 is not d3
+        assert gd.driver.call_count == 2
+        d1.verify_connectivity.assert_called_once()
+
+    def test_rotated_password_gets_a_new_driver(self, pool):
+        with patch.object(pool_mod, "GraphDatabase") as gd:
+            gd.driver.side_effect = lambda *a, **kw: MagicMock()
+            old = pool.get_driver("neo4j://a", "neo4j", "pw1")
+            new = pool.get_driver("neo4j://a", "neo4j", "pw2")
+        assert old is not new
+        assert gd.driver.call_args.kwargs["auth"] == ("neo4j", "pw2")
+
+    def test_driver_created_with_pool_config(self, pool):
+        with patch.object(pool_mod, "GraphDatabase") as gd:
+            pool.get_driver("neo4j://a", "neo4j", "pw")
+        kwargs = gd.driver.call_args.kwargs
+        assert kwargs["auth"] == ("neo4j", "pw")
+        assert kwargs["max_connection_pool_size"] == pool_mod.settings.NEO4J_MAX_CONNECTION_POOL_SIZE
+        assert "connection_acquisition_timeout" in kwargs
+
+    def test_failed_connectivity_is_not_cached(self, pool):
+        with patch.object(pool_mod, "GraphDatabase") as gd:
+            bad = MagicMock()
+            bad.verify_connectivity.side_effect = RuntimeError("down")
+            gd.driver.return_value = bad
+            with pytest.raises(RuntimeError):
+                pool.get_driver("neo4j://a", "neo4j", "pw")
+        bad.close.assert_called_once()
+        assert pool.metrics()["sync_drivers"] == 0
+
+    def test_session_counts_per_access_mode(self, pool):
+        with patch.object(pool_mod, "GraphDatabase"), \
+             patch("src.worker.hybrid_v2.services.neo4j_retry.retry_session") as rs:
+            pool.session(read_only=True, database="neo4j", uri="neo4j://a")
+            pool.session(read_only=True, database="neo4j", uri="neo4j://a")
+            pool.session(read_only=False, database="neo4j", uri="neo4j://a")
+
+        assert rs.call_args.kwargs == {"database": "neo4j", "read_only": False}
+        drivers = pool.metrics()["drivers"]
+        (entry,) = drivers.values()
+        assert entry["sessions"] == {"neo4j:read": 2, "neo4j:write": 1}
+
+
+class TestAsyncDrivers:
+
+    @pytest.mark.asyncio
+    async def test_async_driver_shared_on_loop(self, pool):
+        with patch.object(pool_mod, "AsyncGraphDatabase") as agd:
+            drv = MagicMock()
+            drv.verify_connectivity = AsyncMock()
+            agd.driver.return_value = drv
+            d1 = await pool.get_async_driver("neo4j://a", "neo4j", "pw")
+            d2 = await pool.get_async_driver("neo4j://a", "neo4j", "pw")
+        assert d1 is d2
+        assert agd.driver.call_count == 1
+
+    def test_private_loop_drivers_closed_and_not_reused(self, pool):
+        import asyncio
+        import gc
+
+        created = []
+
+        def _driver(*a, **kw):
+            drv = MagicMock()
+            drv.verify_connectivity = AsyncMock()
+            drv.close = AsyncMock()
+            created.append(drv)
+            return drv
+
+        with patch.object(pool_mod, "AsyncGraphDatabase") as agd:
+            agd.driver.side_effect = _driver
+            for _ in range(3):  # one indexing job per fresh loop
+                loop = asyncio.new_event_loop()
+                try:
+                    loop.run_until_complete(pool.get_async_driver("neo4j://a", "neo4j", "pw"))
+                    assert pool.metrics()["async_drivers"] == 1
+                    loop.run_until_complete(pool.aclose_loop())
+                finally:
+                    loop.close()
+                del loop
+                gc.collect()
+
+        assert len(created) == 3
+        assert all(d.close.await_count == 1 for d in created)
+        assert pool.metrics()["async_drivers"] == 0
+
+    def test_dead_loop_entry_is_dropped(self, pool):
+        import asyncio
+        import gc
+
+        with patch.object(pool_mod, "AsyncGraphDatabase") as agd:
+            drv = MagicMock()
+            drv.verify_connectivity = AsyncMock()
+            agd.driver.return_value = drv
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(pool.get_async_driver("neo4j://a", "neo4j", "pw"))
+            loop.close()
+        del loop
+        gc.collect()
+        assert pool.metrics()["async_drivers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_all_closes_everything(self, pool):
+        with patch.object(pool_mod, "AsyncGraphDatabase") as agd, \
+             patch.object(pool_mod, "GraphDatabase") as gd:
+            adrv = MagicMock()
+            adrv.verify_connectivity = AsyncMock()
+            adrv.close = AsyncMock()
+            agd.driver.return_value = adrv
+            await pool.get_async_driver("neo4j://a", "neo4j", "pw")
+            sdrv = pool.get_driver("neo4j://a", "neo4j", "pw")
+            executor = pool.get_executor()
+
+            await pool.aclose_all()
+
+        adrv.close.assert_awaited_once()
+        sdrv.close.assert_called_once()
+        assert executor._shutdown
+        assert pool.metrics()["sync_drivers"] == 0
+        assert pool.metrics()["async_drivers"] == 0
+
+
+class TestSharedExecutor:
+
+    def test_executor_is_shared(self, pool):
+        assert pool.get_executor() is pool.get_executor()
+        pool.close_all()
+
+    def test_singleton(self):
+        assert pool_mod.get_neo4j_pool() is pool_mod.get_neo4j_pool()
+
+
+class TestConsumers:
+
+    def test_store_close_does_not_close_shared_driver(self):
+        from src.worker.hybrid_v2.services.neo4j_store import Neo4jStoreV3
+
+        shared = MagicMock()
+        fake_pool = MagicMock()
+        fake_pool.get_driver.return_value = shared
+        with patch("src.worker.hybrid_v2.services.neo4j_store.get_neo4j_pool", return_value=fake_pool):
+            store = Neo4jStoreV3("neo4j://a", "neo4j", "pw")
+            assert store.driver is shared
+            store.close()
+        shared.close.assert_not_called()
+
+    def test_graph_service_close_leaves_pool_open(self):
+        from src.worker.services.graph_service import GraphService
+
+        shared = MagicMock()
+        fake_pool = MagicMock()
+        svc = object.__new__(GraphService)
+        svc._driver = shared
+        with patch.object(pool_mod, "get_neo4j_pool", return_value=fake_pool):
+            svc.close()
+        assert svc.driver is None
+        shared.close.assert_not_called()
+        fake_pool.close_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_service_uses_pool(self):
+        from src.worker.services.async_neo4j_service import AsyncNeo4jService
+
+        shared = MagicMock()
+        fake_pool = MagicMock()
+        fake_pool.get_async_driver = AsyncMock(return_value=shared)
+        with patch.object(pool_mod, "get_neo4j_pool", return_value=fake_pool):
+            svc = AsyncNeo4jService("neo4j://a", "neo4j", "pw")
+            await svc.connect()
+            await svc.close()
+        fake_pool.get_async_driver.assert_awaited_once_with("neo4j://a", "neo4j", "pw")
+        shared.close.assert_not_called()
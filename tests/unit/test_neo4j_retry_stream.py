@@ -0,0 +1,149 @@
+"""
+Unit Tests: bulk reads on RetrySession (stream / read_all / read_embeddings)
+
+Bulk graph loads read keyset pages — one managed transaction per page — or,
+without an indexed cursor, one streamed transaction, and copy embeddings
+straight into a preallocated float32 matrix.
+
+Run: pytest tests/unit/test_neo4j_retry_stream.py -v
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from src.worker.hybrid_v2.services.neo4j_retry import RetrySession
+
+
+class _FakeResult:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def keys(self):
+        return list(self._rows[0]) if self._rows else []
+
+    def consume(self):
+        return None
+
+
+class _PagedSession:
+    """Raw session whose transactions serve ``rows`` by ``$after`` / ``$limit``.
+
+    Queries run without those parameters get every row.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], fail_first: bool = False):
+        self.rows = sorted(rows, key=lambda r: r["id"])
+        self.transactions: List[Dict[str, Any]] = []
+        self._fail_first = fail_first
+
+    def execute_read(self, fn):
+        if self._fail_first:
+            # A transient failure of one page is retried by the driver
+            self._fail_first = False
+            fn(self)
+        return fn(self)
+
+    def run(self, query, params):
+        self.transactions.append(dict(params))
+        after, limit = params.get("after"), params.get("limit")
+        page = [r for r in self.rows if after is None or r["id"] > after]
+        return _FakeResult(page[:limit])
+
+
+def _rows(n: int, dim: int = 4) -> List[Dict[str, Any]]:
+    return [
+        {"id": f"s{i:04d}", "doc": f"d{i % 3}", "embedding": [float(i)] * dim}
+        for i in range(n)
+    ]
+
+
+class TestStream:
+
+    def test_yields_all_records_across_pages(self):
+        raw = _PagedSession(_rows(7))
+        session = RetrySession(raw, read_only=True)
+
+        ids = [r["id"] for r in session.stream("Q", page_size=3, group_id="g")]
+
+        assert ids == [f"s{i:04d}" for i in range(7)]
+        assert [t["after"] for t in raw.transactions] == [None, "s0002", "s0005"]
+        assert all(t["group_id"] == "g" and t["limit"] == 3 for t in raw.transactions)
+
+    def test_exact_multiple_ends_with_empty_page(self):
+        raw = _PagedSession(_rows(4))
+        ids = [r["id"] for r in RetrySession(raw, read_only=True).stream("Q", page_size=2)]
+        assert len(ids) == 4
+        assert len(raw.transactions) == 3
+
+    def test_retried_page_does_not_duplicate(self):
+        raw = _PagedSession(_rows(5), fail_first=True)
+        ids = [r["id"] for r in RetrySession(raw, read_only=True).stream("Q", page_size=2)]
+        assert ids == sorted(set(ids)) and len(ids) == 5
+
+
+class TestReadAll:
+
+    def test_single_transaction_without_cursor(self):
+        raw = _PagedSession(_rows(7))
+        ids = RetrySession(raw, read_only=True).read_all(
+            "Q", lambda records: [r["id"] for r in records], group_id="g",
+        )
+        assert ids == [f"s{i:04d}" for i in range(7)]
+        assert raw.transactions == [{"group_id": "g"}]
+
+    def test_retry_reruns_consumer_from_scratch(self):
+        raw = _PagedSession(_rows(5), fail_first=True)
+        ids = RetrySession(raw, read_only=True).read_all("Q", lambda records: [r["id"] for r in records])
+        assert len(ids) == 5
+        assert len(raw.transactions) == 2
+
+
+class TestReadEmbeddings:
+
+    def test_fills_preallocated_matrix(self):
+        raw = _PagedSession(_rows(5))
+        rows, matrix, present = RetrySession(raw, read_only=True).read_embeddings(
+            "Q", expected_rows=5, page_size=2,
+        )
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (5, 4)
+        assert present.all()
+        assert rows[3] == {"id": "s0003", "doc": "d0"}
+        assert matrix[3].tolist() == [3.0] * 4
+
+    def test_grows_when_count_underestimates(self):
+        raw = _PagedSession(_rows(40))
+        rows, matrix, present = RetrySession(raw, read_only=True).read_embeddings(
+            "Q", expected_rows=3, page_size=7,
+        )
+        assert len(rows) == matrix.shape[0] == present.shape[0] == 40
+        assert matrix[39, 0] == 39.0
+
+    def test_missing_and_mismatched_embeddings_masked(self):
+        data = _rows(4)
+        data[1]["embedding"] = None
+        data[2]["embedding"] = [1.0, 2.0]
+        raw = _PagedSession(data)
+        rows, matrix, present = RetrySession(raw, read_only=True).read_embeddings("Q", expected_rows=4)
+
+        assert present.tolist() == [True, False, False, True]
+        assert not matrix[1].any() and not matrix[2].any()
+        assert len(rows) == 4
+
+    def test_empty_result(self):
+        rows, matrix, present = RetrySession(_PagedSession([]), read_only=True).read_embeddings("Q")
+        assert rows == [] and matrix.shape[0] == 0 and present.shape == (0,)
+
+    def test_single_pass_without_key(self):
+        raw = _PagedSession(_rows(40), fail_first=True)
+        rows, matrix, present = RetrySession(raw, read_only=True).read_embeddings(
+            "Q", key=None, expected_rows=3, page_size=7,
+        )
+        assert len(rows) == matrix.shape[0] == 40 and present.all()
+        assert matrix[39, 0] == 39.0
+        assert all("after" not in t and "limit" not in t for t in raw.transactions)
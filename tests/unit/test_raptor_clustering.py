@@ -0,0 +1,130 @@
+"""Tests for RAPTOR clustering (services/raptor_clustering.py, RaptorService._cluster_nodes)."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.worker.services.raptor_clustering import (
+    ClusteringConfig,
+    cluster_embeddings,
+    reduce_dimensions,
+    reduced_dim,
+    sampled_silhouette,
+)
+
+
+def _blobs(n, k=4, dim=256, seed=0, spread=0.05):
+    rng = np.random.RandomState(seed)
+    centers = rng.normal(size=(k, dim))
+    labels = rng.randint(0, k, size=n)
+    points = centers[labels] + spread * rng.normal(size=(n, dim))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    return points.astype(np.float32), labels
+
+
+class TestRaptorClustering:
+
+    @pytest.mark.parametrize("reduction", ["pca", "random"])
+    def test_reduce_dimensions(self, reduction):
+        points, _ = _blobs(200)
+        reduced = reduce_dimensions(points, ClusteringConfig(reduction=reduction, reduce_dim=16))
+        assert reduced.shape == (200, 16)
+
+    def test_reduction_skipped_when_already_small(self):
+        points, _ = _blobs(50, dim=8)
+        assert reduce_dimensions(points, ClusteringConfig(reduce_dim=64)) is points
+
+    @pytest.mark.parametrize("n, reduction, expected", [(200, "pca", 16), (6, "pca", 5), (200, "none", 32)])
+    def test_reduced_dim_matches_reduced_matrix(self, n, reduction, expected):
+        points, _ = _blobs(n, dim=32)
+        config = ClusteringConfig(reduction=reduction, reduce_dim=16)
+        assert reduced_dim(n, 32, config) == reduce_dimensions(points, config).shape[1] == expected
+
+    @pytest.mark.parametrize("covariance_type", ["diag", "tied", "full"])
+    def test_recovers_separated_clusters(self, covariance_type):
+        points, truth = _blobs(400)
+        labels, avg, per_sample = cluster_embeddings(
+            points, 4, "gmm", ClusteringConfig(reduce_dim=16, covariance_type=covariance_type)
+        )
+        # Each true blob maps to exactly one predicted cluster.
+        assert all(len(set(labels[truth == t])) == 1 for t in range(4))
+        assert avg > 0.5
+        assert per_sample.shape == (400,)
+
+    def test_sampled_silhouette_tracks_exact(self):
+        from sklearn.metrics import silhouette_samples
+
+        points, truth = _blobs(1500, spread=0.6)
+        exact = silhouette_samples(points, truth)
+        avg, approx = sampled_silhouette(points, truth, sample_size=300)
+        assert abs(avg - exact.mean()) < 0.03
+        assert np.abs(approx - exact).mean() < 0.05
+
+    def test_sampled_silhouette_is_exact_below_sample_size(self):
+        from sklearn.metrics import silhouette_score
+
+        points, truth = _blobs(120)
+        avg, _ = sampled_silhouette(points, truth, sample_size=500)
+        assert avg == pytest.approx(silhouette_score(points, truth))
+
+
+class TestClusterNodes:
+
+    def _service(self, monkeypatch):
+        from src.worker.services.raptor_service import RaptorService
+
+        monkeypatch.setenv("RAPTOR_CLUSTER_PROCESS", "0")
+        monkeypatch.setenv("RAPTOR_REDUCE_DIM", "8")
+        svc = RaptorService.__new__(RaptorService)
+        svc.llm_service = MagicMock()
+        svc.min_cluster_size = 2
+        svc.max_clusters_per_level = 4
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_embeds_missing_nodes_in_one_batch(self, monkeypatch):
+        from llama_index.core.schema import TextNode
+
+        points, _ = _blobs(12, k=2, dim=32)
+        svc = self._service(monkeypatch)
+        nodes = [TextNode(text=f"chunk {i}") for i in range(12)]
+        for node, emb in zip(nodes[:4], points[:4]):
+            node.embedding = emb.tolist()
+        svc.llm_service.embed_model.aget_text_embedding_batch = AsyncMock(
+            return_value=[p.tolist() for p in points[4:]]
+        )
+
+        clusters, quality = await svc._cluster_nodes(nodes)
+
+        svc.llm_service.embed_model.aget_text_embedding_batch.assert_awaited_once()
+        assert svc.llm_service.embed_model.aget_text_embedding_batch.await_args.args[0] == [
+            f"chunk {i}" for i in range(4, 12)
+        ]
+        assert sum(len(c) for c in clusters.values()) == 12
+        assert quality["covariance_type"] == "diag"
+        assert quality["reduced_dim"] == 8
+        assert all("silhouette_score" in n.metadata for n in nodes)
+
+    @pytest.mark.asyncio
+    async def test_reduced_dim_reports_unreduced_width(self, monkeypatch):
+        from llama_index.core.schema import TextNode
+
+        points, _ = _blobs(12, k=2, dim=32)
+        svc = self._service(monkeypatch)
+        monkeypatch.setenv("RAPTOR_REDUCTION", "none")
+        nodes = [TextNode(text=f"chunk {i}", embedding=p.tolist()) for i, p in enumerate(points)]
+
+        _, quality = await svc._cluster_nodes(nodes)
+
+        assert quality["reduced_dim"] == 32
+
+    @pytest.mark.asyncio
+    async def test_too_few_nodes_returns_single_cluster_tuple(self, monkeypatch):
+        from llama_index.core.schema import TextNode
+
+        svc = self._service(monkeypatch)
+        node = TextNode(text="only")
+        clusters, quality = await svc._cluster_nodes([node])
+        assert clusters == {0: [node]}
+        assert quality["n_clusters"] == 1
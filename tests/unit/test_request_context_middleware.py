@@ -0,0 +1,145 @@
+"""Tests for the JWT claims cache and the combined RequestContextMiddleware."""
+
+import time
+
+import jwt as pyjwt
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.api_gateway.middleware import auth as auth_module
+from src.api_gateway.middleware.request_context import RequestContextMiddleware
+
+
+def _token(**claims):
+    payload = {"oid": "user-1", "groups": ["group-a"], "roles": ["User"], **claims}
+    return pyjwt.encode(payload, "test-signing-key-0123456789abcdef", algorithm="HS256")
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache(monkeypatch):
+    monkeypatch.setattr(auth_module.settings, "GROUP_ID_OVERRIDE", None)
+    auth_module.clear_claims_cache()
+    yield
+    auth_module.clear_claims_cache()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls = []
+    real_decode = pyjwt.decode
+
+    def _decode(token, *args, **kwargs):
+        calls.append(token)
+        return real_decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(auth_module.pyjwt, "decode", _decode)
+    return calls
+
+
+class TestClaimsCache:
+
+    def test_decodes_each_token_once(self, decode_calls):
+        authenticator = auth_module.JWTAuthenticator()
+        token = _token(exp=int(time.time()) + 600)
+        first = authenticator._decode_token(token)
+        first["groups"].append("mutated")
+        assert authenticator._decode_token(token)["oid"] == "user-1"
+        assert authenticator._decode_token(token, skip_exp=True)["oid"] == "user-1"
+        assert decode_calls == [token, token]
+
+    def test_entry_expires_with_token(self, decode_calls, monkeypatch):
+        authenticator = auth_module.JWTAuthenticator()
+        token = _token(exp=int(time.time()) + 30)
+        authenticator._decode_token(token)
+        now = time.monotonic()
+        monkeypatch.setattr(auth_module.time, "monotonic", lambda: now + 60)
+        authenticator._decode_token(token, skip_exp=False)
+        assert len(decode_calls) == 2
+
+    def test_expired_token_is_rejected_and_not_cached(self, decode_calls):
+        authenticator = auth_module.JWTAuthenticator()
+        token = _token(exp=int(time.time()) - 10)
+        for _ in range(2):
+            with pytest.raises(Exception):
+                authenticator._decode_token(token)
+        assert len(decode_calls) == 2
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(auth_module.settings, "JWT_CLAIMS_CACHE_SIZE", 3)
+        authenticator = auth_module.JWTAuthenticator()
+        for i in range(5):
+            authenticator._decode_token(_token(sub=f"s{i}"))
+        assert len(auth_module._claims_cache) == 3
+
+
+def _app(require_auth=True):
+    app = FastAPI()
+
+    @app.get("/api/whoami")
+    async def whoami(request: Request):
+        return {
+            "group_id": request.state.group_id,
+            "user_id": request.state.user_id,
+            "correlation_id": request.state.correlation_id,
+            "algorithm_version": request.state.algorithm_version,
+        }
+
+    @app.get("/groups/{group_id}/items")
+    async def items(group_id: str):
+        return {"group_id": group_id}
+
+    @app.get("/api/stream")
+    async def stream():
+        async def events():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    app.add_middleware(RequestContextMiddleware, auth_type="B2B", require_auth=require_auth)
+    return app
+
+
+class TestRequestContextMiddleware:
+
+    def test_authenticated_request_populates_state_and_headers(self):
+        client = TestClient(_app())
+        resp = client.get(
+            "/api/whoami",
+            headers={"Authorization": f"Bearer {_token()}", "X-Correlation-ID": "corr-1"},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["group_id"] == "group-a" and body["user_id"] == "user-1"
+        assert body["correlation_id"] == "corr-1"
+        assert resp.headers["X-Correlation-ID"] == "corr-1"
+        assert resp.headers["X-API-Version-Used"] == body["algorithm_version"]
+        assert resp.headers["X-Algorithm-Version-Used"].startswith(body["algorithm_version"])
+
+    def test_missing_token_rejected_with_correlation_header(self):
+        resp = TestClient(_app()).get("/api/whoami")
+        assert resp.status_code == 401
+        assert resp.headers["WWW-Authenticate"] == "Bearer"
+        assert resp.headers["X-Correlation-ID"]
+
+    def test_path_group_must_match_token(self):
+        client = TestClient(_app())
+        headers = {"Authorization": f"Bearer {_token()}"}
+        assert client.get("/groups/group-a/items", headers=headers).status_code == 200
+        assert client.get("/groups/group-b/items", headers=headers).status_code == 403
+
+    def test_exempt_paths_skip_auth(self):
+        assert TestClient(_app()).get("/health").status_code == 200
+
+    def test_streaming_body_passes_through(self):
+        client = TestClient(_app())
+        with client.stream("GET", "/api/stream", headers={"Authorization": f"Bearer {_token()}"}) as resp:
+            chunks = list(resp.iter_text())
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            assert "X-Correlation-ID" in resp.headers
+        assert "".join(chunks) == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
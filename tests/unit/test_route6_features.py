@@ -281,15 +281,12 @@ class TestCommunityChildren:
              "level": 1, "rank": 0.4, "parent_id": "c1"},
         ]
 
-        # Mock the Neo4j query
-        mock_session = MagicMock()
-        mock_session.run.return_value = child_records
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
+        # Mock the Neo4j read
+        handler._graph_reads = MagicMock()
+        handler._graph_reads.fetch_dicts = AsyncMock(return_value=child_records)
 
-        with patch("src.worker.hybrid_v2.routes.route_6_concept.retry_session", return_value=mock_session):
-            with patch.dict(os.environ, {"ROUTE6_COMMUNITY_CHILDREN": "1"}):
-                children = await handler._fetch_community_children([parent])
+        with patch.dict(os.environ, {"ROUTE6_COMMUNITY_CHILDREN": "1"}):
+            children = await handler._fetch_community_children([parent])
 
         assert len(children) == 2
         assert children[0][0]["title"] == "Credit Risk"
@@ -303,13 +300,10 @@ class TestCommunityChildren:
         handler = _make_handler()
         parent = _make_community("c1", "Risk", "Summary")
 
-        mock_session = MagicMock()
-        mock_session.run.return_value = []
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
+        handler._graph_reads = MagicMock()
+        handler._graph_reads.fetch_dicts = AsyncMock(return_value=[])
 
-        with patch("src.worker.hybrid_v2.routes.route_6_concept.retry_session", return_value=mock_session):
-            children = await handler._fetch_community_children([parent])
+        children = await handler._fetch_community_children([parent])
 
         assert children == []
 
@@ -327,13 +321,10 @@ class TestCommunityChildren:
              "level": 1, "rank": 0.5, "parent_id": "c1"},
         ]
 
-        mock_session = MagicMock()
-        mock_session.run.return_value = child_records
-        mock_session.__enter__ = MagicMock(return_value=mock_session)
-        mock_session.__exit__ = MagicMock(return_value=False)
+        handler._graph_reads = MagicMock()
+        handler._graph_reads.fetch_dicts = AsyncMock(return_value=child_records)
 
-        with patch("src.worker.hybrid_v2.routes.route_6_concept.retry_session", return_value=mock_session):
-            children = await handler._fetch_community_children([parent])
+        children = await handler._fetch_community_children([parent])
 
         # Simulate dedup logic as done in execute()
         community_data = [parent, already_matched]
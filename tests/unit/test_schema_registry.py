@@ -0,0 +1,129 @@
+"""
+Unit Tests: process-wide Neo4j schema registry (services/schema_registry.py)
+
+Run: pytest tests/unit/test_schema_registry.py -v
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.worker.services.schema_registry import SHOW_INDEXES_QUERY, SchemaRegistry
+
+
+class _FakeDriver:
+    """Records SHOW INDEXES reads and DDL; CREATE ... IF NOT EXISTS adds the index."""
+
+    def __init__(self, indexes=()):
+        self.indexes = set(indexes)
+        self.shows = 0
+        self.ddl = []
+
+    def session(self, database=None):
+        driver = self
+
+        class _Session:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def run(self, query, **params):
+                if query == SHOW_INDEXES_QUERY:
+                    driver.shows += 1
+                    return [{"name": n, "type": "FULLTEXT", "state": "ONLINE",
+                             "labelsOrTypes": ["Sentence"], "properties": ["text"]} for n in sorted(driver.indexes)]
+                driver.ddl.append(query)
+                driver.indexes.add(query.split()[3])  # CREATE <KIND> INDEX <name> ...
+                return []
+
+        return _Session()
+
+
+CREATE_FT = "CREATE FULLTEXT INDEX sentence_fulltext IF NOT EXISTS FOR (s:Sentence) ON EACH [s.text]"
+
+
+class TestSchemaRegistry:
+
+    def test_existence_answered_from_one_snapshot(self):
+        driver = _FakeDriver({"sentence_embedding", "sentence_fulltext"})
+        registry = SchemaRegistry(ttl_seconds=300)
+
+        assert registry.has_index(driver, "sentence_embedding")
+        assert not registry.has_index(driver, "entity_embedding")
+        for _ in range(20):
+            assert registry.ensure_index(driver, "sentence_fulltext", CREATE_FT) is False
+
+        assert driver.shows == 1
+        assert driver.ddl == []
+        info = registry.indexes(driver)["sentence_fulltext"]
+        assert (info.type, info.state, info.labels) == ("FULLTEXT", "ONLINE", ("Sentence",))
+
+    def test_missing_index_created_once(self):
+        driver = _FakeDriver()
+        registry = SchemaRegistry(ttl_seconds=300)
+
+        assert registry.ensure_index(driver, "sentence_fulltext", CREATE_FT) is True
+        assert registry.ensure_index(driver, "sentence_fulltext", CREATE_FT) is False
+
+        assert driver.ddl == [CREATE_FT]
+        assert driver.shows == 2  # initial load + confirm before DDL
+        assert registry.has_index(driver, "sentence_fulltext")
+
+    def test_index_created_elsewhere_costs_a_read_not_ddl(self):
+        driver = _FakeDriver()
+        registry = SchemaRegistry(ttl_seconds=300)
+        assert not registry.has_index(driver, "sentence_fulltext")
+
+        driver.indexes.add("sentence_fulltext")  # another process created it
+        assert registry.ensure_index(driver, "sentence_fulltext", CREATE_FT) is False
+        assert driver.ddl == []
+
+    def test_ttl_and_invalidate_reload(self):
+        driver = _FakeDriver({"a"})
+        registry = SchemaRegistry(ttl_seconds=60)
+        registry.has_index(driver, "a")
+
+        driver.indexes.add("b")
+        assert not registry.has_index(driver, "b")
+        registry.invalidate(driver)
+        assert registry.has_index(driver, "b")
+        assert driver.shows == 2
+
+        driver.indexes.add("c")
+        with patch("src.worker.services.schema_registry.time.monotonic", return_value=time.monotonic() + 61):
+            assert registry.has_index(driver, "c")
+        assert driver.shows == 3
+
+    def test_snapshots_are_per_driver_and_database(self):
+        first, second = _FakeDriver({"a"}), _FakeDriver({"b"})
+        registry = SchemaRegistry(ttl_seconds=300)
+
+        assert registry.has_index(first, "a") and not registry.has_index(second, "a")
+        assert registry.has_index(first, "a", database="other")
+        assert (first.shows, second.shows) == (2, 1)
+
+
+class TestRouteHandlerFulltextIndex:
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_pipelines_share_registry(self):
+        from src.worker.hybrid_v2.routes import base as base_module
+        from src.worker.hybrid_v2.routes.base import BaseRouteHandler
+
+        driver = _FakeDriver({"sentence_fulltext"})
+        registry = SchemaRegistry(ttl_seconds=300)
+
+        with patch.object(base_module, "get_schema_registry", return_value=registry):
+            for _ in range(5):  # pipeline cache evicts and rebuilds
+                handler = BaseRouteHandler.__new__(BaseRouteHandler)
+                handler.pipeline = SimpleNamespace(_textchunk_fulltext_index_checked=False)
+                handler.neo4j_driver = driver
+                handler._executor = None
+                await handler._ensure_textchunk_fulltext_index()
+
+        assert driver.shows == 1
+        assert driver.ddl == []
@@ -0,0 +1,202 @@
+"""Tests for the Route 2 sentence adjacency cache (retrievers/sentence_graph.py)."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.worker.hybrid_v2.retrievers.sentence_graph import SentenceGraph, SentenceGraphCache
+
+# Two sections of document d1 (a1..a5, b1..b3) and one of d2 (c1..c3).
+# NEXT_IN_SECTION chains within each section; RELATED_TO links across them.
+SECTIONS = {"a": "d1/intro", "b": "d1/terms", "c": "d2/terms"}
+CHAINS = [["a1", "a2", "a3", "a4", "a5"], ["b1", "b2", "b3"], ["c1", "c2", "c3"]]
+RELATED = [("a2", "b2", 0.9), ("a2", "c1", 0.88), ("b2", "c3", 0.95), ("a4", "a1", 0.87), ("c2", "b3", 0.91)]
+
+
+def _rows():
+    rows = []
+    for chain in CHAINS:
+        for i, sid in enumerate(chain):
+            rows.append({
+                "id": sid,
+                "section_path": SECTIONS[sid[0]],
+                "next_ids": chain[i + 1:i + 2],
+                "related": [[o, w] for s, o, w in RELATED if s == sid] + [[s, w] for s, o, w in RELATED if o == sid],
+            })
+    return rows
+
+
+def _cypher_reference(seeds):
+    """Straight transcription of the Strategy B Cypher traversal over the fixture."""
+    section = {sid: SECTIONS[sid[0]] for chain in CHAINS for sid in chain}
+    nxt = {c[i]: c[i + 1] for c in CHAINS for i in range(len(c) - 1)}
+    prv = {v: k for k, v in nxt.items()}
+
+    anchor_entries = [(sid, score, "seed") for sid, score in seeds]
+    for sid, score in seeds:
+        for s, o, w in RELATED:
+            for a, b in ((s, o), (o, s)):
+                if a == sid:
+                    decay = 0.85 if section[b] == section[sid] else 0.6
+                    anchor_entries.append((b, score * w * decay, "related_to"))
+    anchors = {}
+    for sid, score, via in anchor_entries:
+        best, first_via = anchors.get(sid, (score, via))
+        anchors[sid] = (max(best, score), first_via)
+
+    entries = [(sid, score, via) for sid, (score, via) in anchors.items()]
+    for direction, step in (("next", nxt), ("prev", prv)):
+        for sid, (score, _) in anchors.items():
+            cur = sid
+            for _ in range(2):
+                cur = step.get(cur)
+                if cur is None:
+                    break
+                entries.append((cur, score * 0.9, direction))
+    final = {}
+    for sid, score, via in entries:
+        best, vias = final.get(sid, (score, []))
+        if via not in vias:
+            vias.append(via)
+        final[sid] = (max(best, score), vias)
+    return final
+
+
+class TestSentenceGraph:
+
+    def test_csr_adjacency(self):
+        graph = SentenceGraph(_rows())
+        i = graph.index["a2"]
+        assert [graph.ids[j] for j in graph.next_targets[graph.next_offsets[i]:graph.next_offsets[i + 1]]] == ["a3"]
+        assert [graph.ids[j] for j in graph.prev_targets[graph.prev_offsets[i]:graph.prev_offsets[i + 1]]] == ["a1"]
+        assert sorted((graph.ids[j], w) for j, w in graph._related(graph.index["b2"])) == [("a2", 0.9), ("c3", 0.95)]
+        assert graph.edge_count == 8 + 2 * len(RELATED)
+
+    @pytest.mark.parametrize("seeds", [
+        [("a2", 0.8)],
+        [("a2", 0.8), ("b2", 0.7)],
+        [("c2", 0.6), ("a4", 0.75), ("b1", 0.5)],
+        [("a1", 0.9), ("a2", 0.85), ("a3", 0.5), ("c3", 0.65)],
+    ])
+    def test_expand_matches_cypher_traversal(self, seeds):
+        expected = _cypher_reference(seeds)
+        expanded = SentenceGraph(_rows()).expand(seeds)
+
+        assert {e.sentence_id for e in expanded} == set(expected)
+        for e in expanded:
+            score, sources = expected[e.sentence_id]
+            assert e.score == pytest.approx(score)
+            assert e.sources == sources
+        assert [e.score for e in expanded] == sorted((e.score for e in expanded), reverse=True)
+
+    def test_unknown_seed_is_kept_without_expansion(self):
+        expanded = SentenceGraph(_rows()).expand([("global-1", 0.7)])
+        assert [(e.sentence_id, e.score, e.sources) for e in expanded] == [("global-1", 0.7, ["seed"])]
+
+
+class _FakeSession:
+    def __init__(self, state):
+        self._state = state
+
+    def run(self, query, **params):
+        result = MagicMock()
+        result.single.return_value = {"parts": [self._state["version"]]}
+        return result
+
+    def stream(self, query, *, key, **params):
+        self._state["builds"] += 1
+        return iter(self._state["rows"])
+
+
+class TestSentenceGraphCache:
+
+    def test_reuses_graph_until_group_version_changes(self):
+        state = {"version": "g|v1", "rows": _rows(), "builds": 0}
+
+        @contextmanager
+        def _retry_session(driver, database=None, read_only=False):
+            yield _FakeSession(state)
+
+        cache = SentenceGraphCache(check_interval=0)
+        with patch("src.worker.hybrid_v2.retrievers.bm25_index.retry_session", _retry_session), \
+                patch("src.worker.hybrid_v2.retrievers.sentence_graph.retry_session", _retry_session):
+            first = cache.get(object(), ["g"])
+            assert cache.get(object(), ["g"]) is first
+            assert state["builds"] == 1
+
+            state["version"] = "g|v2"
+            state["rows"] = _rows()[:5]
+            refreshed = cache.get(object(), ["g"])
+        assert refreshed is not first
+        assert len(refreshed) == 5
+        assert state["builds"] == 2
+
+
+class TestRoute2LocalTraversal:
+
+    def _handler(self, fetch_dicts):
+        from src.worker.hybrid_v2.routes.route_2_local import LocalSearchHandler
+
+        handler = LocalSearchHandler.__new__(LocalSearchHandler)
+        handler.neo4j_driver = object()
+        handler.group_id = "g"
+        handler.group_ids = ["g", "global"]
+        handler.folder_id = None
+        handler._graph_reads = SimpleNamespace(fetch_dicts=fetch_dicts)
+        handler._get_query_embedding = AsyncMock(return_value=[0.1, 0.2])
+        handler._filter_skeleton_by_document = lambda chunks: chunks
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_expands_locally_and_hydrates_ids(self, monkeypatch):
+        from src.worker.hybrid_v2.routes import route_2_local as module
+
+        cache = MagicMock()
+        cache.get.return_value = SentenceGraph(_rows())
+        monkeypatch.setattr(module, "get_sentence_graph_cache", lambda: cache)
+        monkeypatch.setenv("SKELETON_SENTENCE_GRAPH", "1")
+
+        calls = []
+
+        async def fetch_dicts(cypher, **params):
+            calls.append(cypher)
+            if "rows" not in params:
+                return [{"sentence_id": "b2", "score": 0.8}]
+            return [
+                {"sentence_id": r["id"], "text": f"text {r['id']}", "score": r["score"], "sources": r["sources"],
+                 "document_id": "d1", "section_key": "terms", "parent_passage": ""}
+                for r in params["rows"]
+            ]
+
+        chunks = await self._handler(fetch_dicts)._retrieve_skeleton_graph_traversal("payment terms?")
+
+        assert len(calls) == 2
+        assert all("NEXT_IN_SECTION" not in c for c in calls)
+        ids = [c["metadata"]["skeleton_sentence_id"] for c in chunks]
+        assert ids[0] == "b2"
+        assert set(ids) == set(_cypher_reference([("b2", 0.8)]))
+        assert chunks[0]["metadata"]["source"] == "skeleton_b_paragraph"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_cypher_traversal_when_graph_fails(self, monkeypatch):
+        from src.worker.hybrid_v2.routes import route_2_local as module
+
+        cache = MagicMock()
+        cache.get.side_effect = RuntimeError("neo4j unavailable")
+        monkeypatch.setattr(module, "get_sentence_graph_cache", lambda: cache)
+        monkeypatch.setenv("SKELETON_SENTENCE_GRAPH", "1")
+
+        calls = []
+
+        async def fetch_dicts(cypher, **params):
+            calls.append(cypher)
+            if "NEXT_IN_SECTION" in cypher:
+                return [{"sentence_id": "a1", "text": "text a1", "score": 0.7, "sources": ["seed"]}]
+            return [{"sentence_id": "a1", "score": 0.7}]
+
+        chunks = await self._handler(fetch_dicts)._retrieve_skeleton_graph_traversal("payment terms?")
+
+        assert "NEXT_IN_SECTION" in calls[-1]
+        assert [c["metadata"]["skeleton_sentence_id"] for c in chunks] == ["a1"]
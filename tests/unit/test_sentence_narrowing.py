@@ -0,0 +1,107 @@
+"""Indexed claim-to-sentence narrowing matches the original full-map scan."""
+
+import random
+import re
+
+import pytest
+
+from src.worker.hybrid_v2.pipeline.sentence_index import SentenceIndex
+from src.worker.hybrid_v2.routes.base import BaseRouteHandler, Citation
+
+
+def _legacy_match(chunk_index, response, sentence_map):
+    """The pre-index matcher: regex-scan and re-tokenise every map entry."""
+    marker = f"[{chunk_index}]"
+    pos = response.find(marker)
+    if pos < 0:
+        return None
+    claim_text = response[max(0, pos - 100):min(len(response), pos + len(marker) + 50)]
+    claim_words = set(re.findall(r"[a-z0-9]+", claim_text.lower()))
+    if not claim_words:
+        return None
+    best_match, best_score = None, 0.0
+    for key, entry in sentence_map.items():
+        m = re.match(r"^\[(\d+)[a-z]\]$", key)
+        if not m or int(m.group(1)) != chunk_index:
+            continue
+        sent_words = set(re.findall(r"[a-z0-9]+", entry.get("sentence_text", "").lower()))
+        if not sent_words:
+            continue
+        score = len(claim_words & sent_words) / len(claim_words | sent_words)
+        if score > best_score:
+            best_score, best_match = score, entry
+    return best_match if best_score >= 0.15 else None
+
+
+_VOCAB = (
+    "the tenant shall pay rent monthly invoice due within thirty days of receipt "
+    "warranty covers defects for one year landlord may terminate agreement notice "
+    "fee 250 usd 2024 contract party"
+).split()
+
+
+def _fixture(seed, chunks=12, per_chunk=30):
+    rng = random.Random(seed)
+    sentence_map = {}
+    for n in range(1, chunks + 1):
+        for s_idx in range(per_chunk):
+            # Indices >= 26 produce non-letter suffixes that never match [Na]
+            suffix = chr(ord("a") + s_idx) if s_idx < 26 else str(s_idx)
+            text = " ".join(rng.choice(_VOCAB) for _ in range(rng.randint(0, 12)))
+            sentence_map[f"[{n}{suffix}]"] = {
+                "sentence_text": text.capitalize() + ".", "sentence_offset": s_idx * 40,
+                "sentence_length": len(text), "chunk_id": f"c{n}",
+            }
+    sentence_map["[3a]"]["sentence_text"] = ""
+    response = " ".join(
+        " ".join(rng.choice(_VOCAB) for _ in range(rng.randint(5, 20))) + f" [{rng.randint(1, chunks + 2)}]."
+        for _ in range(20)
+    )
+    return sentence_map, response
+
+
+class TestSentenceIndex:
+
+    def test_identical_to_full_map_scan(self):
+        for seed in range(25):
+            sentence_map, response = _fixture(seed)
+            index = SentenceIndex.from_map(sentence_map)
+            for n in range(0, 16):
+                expected = _legacy_match(n, response, sentence_map)
+                assert BaseRouteHandler._match_sentence_to_claim(n, response, index) is expected
+                assert BaseRouteHandler._match_sentence_to_claim(n, response, sentence_map) is expected
+
+    def test_ties_keep_earliest_sentence(self):
+        sentence_map = {
+            "[1a]": {"sentence_text": "Rent is due monthly."},
+            "[1b]": {"sentence_text": "Rent is due monthly."},
+            "[2a]": {"sentence_text": "Rent is due monthly."},
+        }
+        index = SentenceIndex.from_map(sentence_map)
+        assert len(index) == 3
+        assert index.best_match(1, frozenset({"rent", "due"})) is sentence_map["[1a]"]
+        assert index.best_match(1, frozenset({"warranty"})) is None
+        assert index.sentences(9) == []
+
+    def test_narrowing_reuses_prebuilt_index(self, monkeypatch):
+        sentence_map = {
+            "[1a]": {"sentence_text": "The warranty covers defects for one year.",
+                     "sentence_offset": 0, "sentence_length": 41},
+            "[1b]": {"sentence_text": "Invoices are due within thirty days.",
+                     "sentence_offset": 42, "sentence_length": 36},
+        }
+        index = SentenceIndex.from_map(sentence_map)
+        monkeypatch.setattr(SentenceIndex, "from_map", classmethod(lambda cls, m: pytest.fail("sentence map was re-indexed")))
+
+        handler = BaseRouteHandler.__new__(BaseRouteHandler)
+        citations = [
+            Citation(index=1, sentence_id="c1", document_id="d", document_title="D", score=1.0, text_preview=""),
+            Citation(index=2, sentence_id="c2", document_id="d", document_title="D", score=1.0, text_preview="",
+                     sentence_text="kept"),
+        ]
+        handler._narrow_citations_to_sentences(
+            citations, "Payment is due within thirty days [1].", sentence_map, sentence_index=index,
+        )
+        assert citations[0].sentence_text == "Invoices are due within thirty days."
+        assert (citations[0].sentence_offset, citations[0].sentence_length) == (42, 36)
+        assert citations[1].sentence_text == "kept"
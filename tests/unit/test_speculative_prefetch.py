@@ -0,0 +1,147 @@
+"""
+Unit Tests: Speculative Route 7 pre-retrieval in HybridPipeline.query
+
+With HYBRID_SPECULATIVE_PREFETCH=1 the orchestrator starts Route 7's
+route-independent work (query embedding, triple linking, DPR) while
+translation and routing are still running, then hands the in-flight tasks
+to the selected handler — or cancels them.
+
+Run: pytest tests/unit/test_speculative_prefetch.py -v
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _make_pipeline(route, translated=None):
+    """Build a HybridPipeline shell with a fake router, translator and handlers."""
+    from src.worker.hybrid_v2.orchestrator import HybridPipeline
+    from src.worker.hybrid_v2.routes.base import RouteResult
+    from src.worker.hybrid_v2.routes.route_7_hipporag2 import Route7Prefetch
+
+    pipeline = HybridPipeline.__new__(HybridPipeline)
+    pipeline.llm = None
+    pipeline.group_id = "test-group"
+
+    async def _translate(query, accumulator=None):
+        await asyncio.sleep(0.01)
+        if translated:
+            return translated, "de", True
+        return query, "en", False
+
+    pipeline._maybe_translate_query = _translate
+    pipeline.router = MagicMock()
+    pipeline.router.route_with_profile = AsyncMock(return_value=(route, None))
+
+    started = []
+
+    def _start_prefetch(query):
+        async def _never_finishes():
+            await asyncio.sleep(3600)
+
+        prefetch = Route7Prefetch(query=query)
+        prefetch.embed_task = asyncio.create_task(_never_finishes())
+        started.append(prefetch)
+        return prefetch
+
+    route7 = MagicMock()
+    route7.start_prefetch = _start_prefetch
+    route7.execute = AsyncMock(return_value=RouteResult(response="ok", route_used="route_7_hipporag2"))
+    other = MagicMock(spec=["execute"])
+    other.execute = AsyncMock(return_value=RouteResult(response="ok", route_used="route_3_global"))
+
+    from src.worker.hybrid_v2.router.main import QueryRoute
+    pipeline._route_handlers = {
+        QueryRoute.HIPPORAG2_SEARCH: route7,
+        QueryRoute.GLOBAL_SEARCH: other,
+    }
+    return pipeline, route7, other, started
+
+
+class TestOrchestratorSpeculation:
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        from src.worker.hybrid_v2.router.main import QueryRoute
+        pipeline, route7, _, started = _make_pipeline(QueryRoute.LOCAL_SEARCH)
+        with patch.dict(os.environ, {"HYBRID_SPECULATIVE_PREFETCH": "0"}):
+            result = await pipeline.query("What is the fee?")
+        assert started == []
+        assert "prefetch" not in route7.execute.call_args.kwargs
+        assert "pipeline_timings_ms" in result["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_handed_to_route7(self):
+        from src.worker.hybrid_v2.router.main import QueryRoute
+        pipeline, route7, _, started = _make_pipeline(QueryRoute.LOCAL_SEARCH)
+        with patch.dict(os.environ, {"HYBRID_SPECULATIVE_PREFETCH": "1"}):
+            result = await pipeline.query("What is the fee?")
+        assert len(started) == 1
+        assert route7.execute.call_args.kwargs["prefetch"] is started[0]
+        timings = result["metadata"]["pipeline_timings_ms"]
+        assert {"translate_ms", "route_ms", "handler_ms", "prefetch_head_start_ms"} <= set(timings)
+        started[0].cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_when_translation_changes_query(self):
+        from src.worker.hybrid_v2.router.main import QueryRoute
+        pipeline, route7, _, started = _make_pipeline(
+            QueryRoute.LOCAL_SEARCH, translated="What is the fee?",
+        )
+        with patch.dict(os.environ, {"HYBRID_SPECULATIVE_PREFETCH": "1"}):
+            await pipeline.query("Wie hoch ist die Gebühr?")
+        await asyncio.sleep(0)
+        assert started[0].embed_task.cancelled()
+        assert "prefetch" not in route7.execute.call_args.kwargs
+        assert route7.execute.call_args.args[0] == "What is the fee?"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_when_other_route_selected(self):
+        from src.worker.hybrid_v2.router.main import QueryRoute
+        pipeline, route7, other, started = _make_pipeline(QueryRoute.GLOBAL_SEARCH)
+        with patch.dict(os.environ, {"HYBRID_SPECULATIVE_PREFETCH": "1"}):
+            await pipeline.query("Summarize termination rules across agreements")
+        await asyncio.sleep(0)
+        assert started[0].embed_task.cancelled()
+        route7.execute.assert_not_called()
+        other.execute.assert_awaited_once()
+
+
+class TestRoute7Prefetch:
+
+    @pytest.mark.asyncio
+    async def test_prefetch_launches_triple_and_dpr_with_embedding(self):
+        from src.worker.hybrid_v2.routes import route_7_hipporag2 as r7
+
+        handler = r7.HippoRAG2Handler.__new__(r7.HippoRAG2Handler)
+        handler._ensure_initialized = AsyncMock()
+        handler._query_to_triple_linking = AsyncMock(return_value=["triple"])
+        handler._dpr_passage_search = AsyncMock(return_value=[("s1", 0.9)])
+        voyage = MagicMock()
+        voyage.embed_query = MagicMock(return_value=[0.5, 0.5])
+
+        with patch.object(r7, "_get_voyage_service", return_value=voyage):
+            prefetch = handler.start_prefetch("What is the fee?")
+            embedding = await prefetch.embed_task
+            triples, dpr = await asyncio.gather(prefetch.triple_task, prefetch.dpr_task)
+
+        assert embedding == [0.5, 0.5]
+        assert triples == ["triple"]
+        assert dpr == [("s1", 0.9)]
+        handler._query_to_triple_linking.assert_awaited_once_with(
+            "What is the fee?", [0.5, 0.5], handler._seed_search_config()[0],
+        )
+        assert "embed_ms" in prefetch.timings_ms
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_unfinished_tasks(self):
+        from src.worker.hybrid_v2.routes.route_7_hipporag2 import Route7Prefetch
+
+        prefetch = Route7Prefetch(query="q")
+        prefetch.embed_task = asyncio.create_task(asyncio.sleep(3600))
+        prefetch.cancel()
+        await asyncio.sleep(0)
+        assert prefetch.embed_task.cancelled()
@@ -6,6 +6,8 @@ Tests:
 - credit_schedule.compute_translation_credits
 - TokenAccumulator translation tracking
 - Orchestrator _maybe_translate_query (mock translator + Neo4j)
+- Local language detection (multilingual fixtures, skip precision)
+- TranslatorService fast path, cache and batching
 """
 
 import pytest
@@ -379,3 +381,202 @@ class TestOrchestratorTranslation:
         lang2 = await pipeline._get_document_language()
         assert lang2 == "en"
         assert pipeline._async_neo4j.run_query.call_count == 1  # Still 1, cached
+
+
+# ============================================================================
+# 6. Local language detection
+# ============================================================================
+
+# Multilingual query fixtures: (text, language).
+LANGUAGE_FIXTURES = [
+    ("What is the contract period?", "en"),
+    ("Who is responsible for maintenance of the property?", "en"),
+    ("List all payment terms in the agreement", "en"),
+    ("termination fee", "en"),
+    ("How many days notice are required to terminate?", "en"),
+    ("Summarize the warranty obligations of the supplier.", "en"),
+    ("Which invoices exceed the purchase order amount?", "en"),
+    ("What are the key differences between the two leases?", "en"),
+    ("Wie lange ist die Vertragslaufzeit?", "de"),
+    ("Welche Zahlungsbedingungen gelten für die Rechnung?", "de"),
+    ("Wer ist für die Instandhaltung der Immobilie verantwortlich?", "de"),
+    ("Fassen Sie die Garantiepflichten des Lieferanten zusammen.", "de"),
+    ("Quelle est la durée du contrat ?", "fr"),
+    ("Qui est responsable de l'entretien du bien ?", "fr"),
+    ("Quelles sont les conditions de paiement de la facture ?", "fr"),
+    ("Résumez les obligations de garantie du fournisseur.", "fr"),
+    ("¿Cuál es la duración del contrato?", "es"),
+    ("¿Quién es responsable del mantenimiento de la propiedad?", "es"),
+    ("Resuma las obligaciones de garantía del proveedor.", "es"),
+    ("¿Cuáles son las condiciones de pago de la factura?", "es"),
+    ("Qual è la durata del contratto?", "it"),
+    ("Chi è responsabile della manutenzione dell'immobile?", "it"),
+    ("Quali sono le condizioni di pagamento della fattura?", "it"),
+    ("Qual é a duração do contrato?", "pt"),
+    ("Quem é responsável pela manutenção do imóvel?", "pt"),
+    ("Quais são as condições de pagamento da fatura?", "pt"),
+    ("Wat is de looptijd van het contract?", "nl"),
+    ("Wie is verantwoordelijk voor het onderhoud van het pand?", "nl"),
+    ("Welke betalingsvoorwaarden gelden voor de factuur?", "nl"),
+    ("契約期間はどのくらいですか？", "ja"),
+    ("物件の維持管理は誰の責任ですか？", "ja"),
+    ("支払条件を教えてください", "ja"),
+    ("合同期限是多久？", "zh"),
+    ("谁负责物业的维护？", "zh"),
+    ("계약 기간은 얼마입니까?", "ko"),
+    ("누가 유지 보수를 책임집니까?", "ko"),
+    ("Какой срок действия договора?", "ru"),
+    ("Кто отвечает за обслуживание имущества?", "ru"),
+    ("Який термін дії договору?", "uk"),
+    ("Ποια είναι η διάρκεια της σύμβασης;", "el"),
+    ("מהי תקופת החוזה?", "he"),
+    ("ما هي مدة العقد؟", "ar"),
+    ("สัญญามีระยะเวลาเท่าไร", "th"),
+    ("अनुबंध की अवधि क्या है?", "hi"),
+]
+
+
+class TestLocalLanguageDetection:
+    def test_fixture_accuracy(self):
+        from src.worker.services.language_detection import detect_language
+        wrong = [(t, l, detect_language(t)) for t, l in LANGUAGE_FIXTURES if detect_language(t)[0] != l]
+        assert wrong == []
+
+    @pytest.mark.parametrize("target", ["en", "de", "fr", "ja", "zh", "ru"])
+    def test_skip_decisions_are_precise(self, target):
+        """Every text the fast path would skip really is in the target language."""
+        from src.worker.services.language_detection import detect_language, same_language
+        skipped = []
+        for text, lang in LANGUAGE_FIXTURES:
+            detected, confidence = detect_language(text)
+            if confidence >= 0.6 and same_language(detected, target):
+                skipped.append(lang)
+        assert all(lang == target for lang in skipped)
+
+    def test_most_english_queries_skip_remote(self):
+        from src.worker.services.language_detection import detect_language
+        english = [t for t, l in LANGUAGE_FIXTURES if l == "en"]
+        confident = [t for t in english if detect_language(t)[1] >= 0.6]
+        assert len(confident) >= 0.75 * len(english)
+
+    def test_ambiguous_or_empty_text_has_low_confidence(self):
+        from src.worker.services.language_detection import detect_language
+        assert detect_language("") == ("unknown", 0.0)
+        assert detect_language("12345 !!") == ("unknown", 0.0)
+        assert detect_language("termination fee")[1] < 0.6
+
+    def test_same_language_compares_primary_subtag(self):
+        from src.worker.services.language_detection import same_language
+        assert same_language("zh-Hans", "zh")
+        assert not same_language("pt", "es")
+
+
+# ============================================================================
+# 7. TranslatorService fast path, cache and batching
+# ============================================================================
+
+
+def _mock_session(payload):
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.json = AsyncMock(return_value=payload)
+    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_response.__aexit__ = AsyncMock(return_value=False)
+    mock_session = AsyncMock()
+    mock_session.post = MagicMock(return_value=mock_response)
+    return mock_session
+
+
+class TestTranslatorFastPathAndCache:
+    def _svc(self):
+        from src.worker.services.translator_service import TranslatorService
+        return TranslatorService(endpoint="https://translator.example.com", region="swedencentral")
+
+    @pytest.mark.asyncio
+    async def test_confident_target_language_skips_remote_call(self):
+        svc = self._svc()
+        session = _mock_session([])
+        with patch.object(svc, "_get_token", return_value="fake-token"), \
+             patch.object(svc, "_get_session", return_value=session):
+            result = await svc.detect_and_translate(
+                "What are the key differences between the two leases?", target_lang="en"
+            )
+        session.post.assert_not_called()
+        assert result.detected_language == "en"
+        assert result.was_translated is False
+        assert result.characters == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self):
+        svc = self._svc()
+        session = _mock_session([{
+            "detectedLanguage": {"language": "ja", "score": 1.0},
+            "translations": [{"text": "What is the contract period?", "to": "en"}],
+        }])
+        with patch.object(svc, "_get_token", return_value="fake-token"), \
+             patch.object(svc, "_get_session", return_value=session):
+            first = await svc.detect_and_translate("契約期間は？", target_lang="en")
+            second = await svc.detect_and_translate("契約期間は？", target_lang="en")
+        assert session.post.call_count == 1
+        assert second == first
+        assert second.was_translated is True
+
+    @pytest.mark.asyncio
+    async def test_api_errors_are_not_cached(self):
+        svc = self._svc()
+        mock_response = AsyncMock()
+        mock_response.status = 503
+        mock_response.text = AsyncMock(return_value="busy")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+        session = AsyncMock()
+        session.post = MagicMock(return_value=mock_response)
+        with patch.object(svc, "_get_token", return_value="fake-token"), \
+             patch.object(svc, "_get_session", return_value=session):
+            await svc.detect_and_translate("テスト", target_lang="en")
+            await svc.detect_and_translate("テスト", target_lang="en")
+        assert session.post.call_count == 2
+        assert len(svc.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_one_request_for_remaining_texts(self):
+        svc = self._svc()
+        session = _mock_session([
+            {"detectedLanguage": {"language": "ja"}, "translations": [{"text": "Contract period?"}]},
+            {"detectedLanguage": {"language": "de"}, "translations": [{"text": "Payment terms?"}]},
+        ])
+        texts = [
+            "契約期間は？",
+            "Which invoices exceed the purchase order amount?",
+            "Welche Zahlungsbedingungen gelten für die Rechnung?",
+            "契約期間は？",
+        ]
+        with patch.object(svc, "_get_token", return_value="fake-token"), \
+             patch.object(svc, "_get_session", return_value=session):
+            results = await svc.translate_batch(texts, target_lang="en")
+
+        assert session.post.call_count == 1
+        body = session.post.call_args.kwargs["json"]
+        assert body == [{"Text": "契約期間は？"}, {"Text": "Welche Zahlungsbedingungen gelten für die Rechnung?"}]
+        assert [r.translated_text for r in results] == [
+            "Contract period?",
+            "Which invoices exceed the purchase order amount?",
+            "Payment terms?",
+            "Contract period?",
+        ]
+
+    def test_lru_evicts_oldest_and_honours_ttl(self):
+        from src.worker.services.translator_service import TranslationCache, TranslationResult
+        cache = TranslationCache(max_size=2, ttl_seconds=60)
+        r = TranslationResult("a", "a", "en", "en", False, 0)
+        cache.put(("a", "en"), r)
+        cache.put(("b", "en"), r)
+        cache.get(("a", "en"))
+        cache.put(("c", "en"), r)
+        assert cache.get(("b", "en")) is None
+        assert cache.get(("a", "en")) is r
+
+        expired = TranslationCache(max_size=2, ttl_seconds=0)
+        expired.put(("a", "en"), r)
+        with patch("src.worker.services.translator_service.time.monotonic", return_value=1e12):
+            assert expired.get(("a", "en")) is None
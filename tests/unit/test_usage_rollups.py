@@ -0,0 +1,304 @@
+"""
+Tests for write-time usage rollups and batched usage writes.
+
+Covers the Redis rollup counters (``usage_rollups.py``), the UsageTracker
+queue that flushes through ``write_usage_batch``, and the per-partition
+transactional batches in ``CosmosDBClient.write_usage_batch``.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.models.usage import UsageRecord
+
+
+def _llm(user="user-1", route="route_2", model="gpt-5.1", tokens=100, **kwargs):
+    return UsageRecord(
+        partition_id=user,
+        user_id=user,
+        usage_type="llm_completion",
+        route=route,
+        model=model,
+        total_tokens=tokens,
+        timestamp=datetime(2026, 3, 4, 10, 30),
+        **kwargs,
+    )
+
+
+class _FakePipeline:
+    """Records pipelined calls; ``execute`` returns canned results."""
+
+    def __init__(self, results=None):
+        self.calls = []
+        self._results = results or []
+
+    def __getattr__(self, name):
+        def _call(*args, **kwargs):
+            self.calls.append((name, args))
+            return self
+        return _call
+
+    async def execute(self):
+        return self._results
+
+
+def _rollups(*pipelines):
+    from src.core.services.usage_rollups import UsageRollups
+
+    rollups = UsageRollups.__new__(UsageRollups)
+    rollups._redis = MagicMock()
+    rollups._redis.pipeline = MagicMock(side_effect=list(pipelines))
+    rollups._redis.hmget = AsyncMock(return_value=[b"2026-03-04T10:30:00"])
+    return rollups
+
+
+class TestRollupCounters:
+
+    def test_llm_record_counts_query_route_model_and_tenant(self):
+        from src.core.services.usage_rollups import UsageRollups
+
+        counters = UsageRollups._counters(_llm(was_translated=True, credits_used=7))
+        assert counters["queries"] == 1
+        assert counters["tokens"] == 100
+        assert counters["credits"] == 7
+        assert counters["translated"] == 1
+        assert "speech" not in counters
+        assert counters["route:route_2"] == 1
+        assert counters["model:gpt-5.1"] == 1
+        assert counters["tenant:user-1:queries"] == 1
+        assert counters["tenant:user-1:route:route_2"] == 1
+
+    def test_doc_intel_record_counts_pages_only(self):
+        from src.core.services.usage_rollups import UsageRollups
+
+        record = UsageRecord(
+            partition_id="user-1", usage_type="doc_intel",
+            document_id="a.pdf", pages_analyzed=12,
+        )
+        assert UsageRollups._counters(record) == {
+            "doc_pages": 12, "tenant:user-1:doc_pages": 12,
+        }
+
+    @pytest.mark.asyncio
+    async def test_record_batch_uses_one_pipeline(self):
+        pipe = _FakePipeline()
+        rollups = _rollups(pipe)
+
+        await rollups.record_batch([_llm(), _llm(user="user-2")])
+
+        rollups._redis.pipeline.assert_called_once()
+        assert ("hincrby", ("usage_rollup:hour:2026030410", "queries", 1)) in pipe.calls
+        assert ("hincrby", ("usage_rollup:day:20260304", "route:route_2", 1)) in pipe.calls
+        assert ("zincrby", ("usage_rollup:users:month:202603", 1, "user-2")) in pipe.calls
+        assert ("expire", ("usage_rollup:day:20260304", 40 * 86400)) in pipe.calls
+
+    @pytest.mark.asyncio
+    async def test_doc_intel_record_adds_document_to_sets(self):
+        pipe = _FakePipeline()
+        rollups = _rollups(pipe)
+        record = UsageRecord(
+            partition_id="user-1", usage_type="doc_intel",
+            document_id="a.pdf", pages_analyzed=12,
+        )
+
+        await rollups.record_batch([record])
+
+        assert ("sadd", ("usage_rollup:documents:user-1", "a.pdf")) in pipe.calls
+        assert ("sadd", ("usage_rollup:documents:all", "a.pdf")) in pipe.calls
+        assert ("hset", ("usage_rollup:document_owner", "a.pdf", "user-1")) in pipe.calls
+
+    @pytest.mark.asyncio
+    async def test_forget_documents_removes_from_owner_and_total(self):
+        pipe = _FakePipeline()
+        rollups = _rollups(pipe)
+        rollups._redis.hmget = AsyncMock(return_value=[b"user-1", None])
+
+        await rollups.forget_documents(["a.pdf", "b.pdf"])
+
+        assert pipe.calls == [
+            ("srem", ("usage_rollup:documents:all", "a.pdf")),
+            ("srem", ("usage_rollup:documents:user-1", "a.pdf")),
+            ("srem", ("usage_rollup:documents:all", "b.pdf")),
+            ("hdel", ("usage_rollup:document_owner", "a.pdf", "b.pdf")),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_record_batch_empty_is_noop(self):
+        pipe = _FakePipeline()
+        rollups = _rollups(pipe)
+        await rollups.record_batch([])
+        assert pipe.calls == []
+
+    @pytest.mark.asyncio
+    async def test_admin_summary_parses_pipeline_results(self):
+        hours = [b"0"] * 10 + [b"4"]
+        pipe = _FakePipeline(results=[
+            {b"queries": b"4", b"route:route_2": b"3", b"tenant:u1:route:route_2": b"3"},
+            {b"queries": b"40", b"route:route_2": b"30", b"model:gpt-5.1": b"40"},
+            1,
+            2,
+            [(b"u1", 25.0)],
+            5,
+            b"120",
+            *hours,
+            3,
+        ])
+        rollups = _rollups(pipe)
+
+        summary = await rollups.admin_summary(now=datetime(2026, 3, 4, 10, 30))
+
+        assert summary["queries_today"] == 4
+        assert summary["queries_month"] == 40
+        assert summary["active_users_month"] == 2
+        assert summary["total_documents"] == 5
+        assert summary["doc_pages"] == 120
+        assert summary["queries_by_route"] == {"route_2": 30}
+        assert summary["queries_by_model"] == {"gpt-5.1": 40}
+        assert len(summary["queries_per_hour"]) == 11
+        assert summary["queries_per_hour"][0] == {"hour": "2026-03-04T00", "count": 0}
+        assert summary["queries_per_hour"][-1] == {"hour": "2026-03-04T10", "count": 4}
+        assert summary["top_users"] == [
+            {"user_id": "u1", "queries": 25, "last_active": "2026-03-04T10:30:00"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_admin_summary_is_none_until_totals_exist(self):
+        # Month counters exist, but the all-time document / page keys don't
+        pipe = _FakePipeline(results=[{}, {b"queries": b"3"}, 0, 1, [], 0, None, *[None] * 11, 1])
+        rollups = _rollups(pipe)
+
+        assert await rollups.admin_summary(now=datetime(2026, 3, 4, 10, 30)) is None
+
+    @pytest.mark.asyncio
+    async def test_list_users_and_tenant_summary_are_none_when_empty(self):
+        rollups = _rollups(
+            _FakePipeline(results=[0, []]),
+            _FakePipeline(results=[[None] * 5, 0, None, 0]),
+        )
+
+        assert await rollups.list_users() is None
+        assert await rollups.tenant_summary("user-1") is None
+
+    def test_reads_default_off(self, monkeypatch):
+        from src.core.services.usage_rollups import rollups_read_enabled
+
+        monkeypatch.delenv("USAGE_ROLLUPS_READ", raising=False)
+        assert rollups_read_enabled() is False
+        monkeypatch.setenv("USAGE_ROLLUPS_READ", "1")
+        assert rollups_read_enabled() is True
+
+    @pytest.mark.asyncio
+    async def test_record_usage_rollups_never_raises(self):
+        from src.core.services import usage_rollups
+
+        with patch.object(usage_rollups, "get_usage_rollups",
+                          AsyncMock(side_effect=ConnectionError("redis down"))):
+            await usage_rollups.record_usage_rollups([_llm()])
+
+    def test_get_usage_rollups_works_from_several_loops(self):
+        from src.core.services import usage_rollups
+
+        redis_svc = MagicMock()
+        with patch.object(usage_rollups, "_rollups", None), \
+             patch.object(usage_rollups, "get_redis_service", AsyncMock(return_value=redis_svc)):
+            first = asyncio.run(usage_rollups.get_usage_rollups())
+            second = asyncio.run(usage_rollups.get_usage_rollups())
+        assert first is second
+        assert first._redis is redis_svc.client
+
+
+class TestUsageTrackerBatching:
+
+    def _tracker(self, batch_size=3):
+        from src.core.services.usage_tracker import UsageTracker
+
+        tracker = UsageTracker.__new__(UsageTracker)
+        tracker._cosmos_client = MagicMock()
+        tracker._cosmos_client.write_usage_batch = AsyncMock()
+        tracker._cosmos_client.write_usage_record = AsyncMock()
+        tracker._batch_queue = []
+        tracker._queue_lock = threading.Lock()
+        tracker._loop = None
+        tracker._batch_size = batch_size
+        tracker._batch_interval = 60
+        tracker._last_flush = datetime.utcnow()
+        tracker._flush_timer = None
+        return tracker
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_queued_records_in_one_batch(self):
+        tracker = self._tracker(batch_size=10)
+        with patch("src.core.services.usage_tracker.record_usage_rollups", AsyncMock()) as rollups:
+            for _ in range(4):
+                await tracker.track_record(_llm())
+            tracker._cosmos_client.write_usage_batch.assert_not_called()
+            await tracker.flush()
+
+        tracker._cosmos_client.write_usage_batch.assert_awaited_once()
+        assert len(tracker._cosmos_client.write_usage_batch.call_args[0][0]) == 4
+        rollups.assert_awaited_once()
+        tracker._cosmos_client.write_usage_record.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_flushes_without_waiting_for_timer(self):
+        tracker = self._tracker(batch_size=3)
+        with patch("src.core.services.usage_tracker.record_usage_rollups", AsyncMock()):
+            for _ in range(3):
+                await tracker.track_record(_llm())
+            for _ in range(3):
+                await asyncio.sleep(0)
+        tracker._flush_timer.cancel()
+
+        tracker._cosmos_client.write_usage_batch.assert_awaited_once()
+        assert tracker._batch_queue == []
+
+    @pytest.mark.asyncio
+    async def test_records_from_a_closed_job_loop_flush_on_bound_loop(self):
+        tracker = self._tracker(batch_size=10)
+        tracker._batch_interval = 0.01
+        tracker.bind_loop()
+        with patch("src.core.services.usage_tracker.record_usage_rollups", AsyncMock()):
+            # An indexing job runs on its own loop, which closes right after
+            job = threading.Thread(target=lambda: asyncio.run(tracker.track_record(_llm())))
+            job.start()
+            job.join()
+            await asyncio.sleep(0.1)
+
+        tracker._cosmos_client.write_usage_batch.assert_awaited_once()
+        assert tracker._flush_timer.get_loop() is asyncio.get_running_loop()
+
+
+class TestCosmosUsageBatch:
+
+    def _client(self):
+        from src.core.services.cosmos_client import CosmosDBClient
+
+        client = CosmosDBClient.__new__(CosmosDBClient)
+        client.endpoint = "https://fake.documents.azure.com:443/"
+        client._usage_container = MagicMock()
+        client._usage_container.execute_item_batch = AsyncMock()
+        client._usage_container.upsert_item = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_groups_records_by_partition(self):
+        client = self._client()
+        await client.write_usage_batch([_llm("a"), _llm("b"), _llm("a")])
+
+        calls = client._usage_container.execute_item_batch.call_args_list
+        by_pk = {c.kwargs["partition_key"]: len(c.kwargs["batch_operations"]) for c in calls}
+        assert by_pk == {"a": 2, "b": 1}
+        client._usage_container.upsert_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_upserts(self):
+        client = self._client()
+        client._usage_container.execute_item_batch.side_effect = RuntimeError("batch rejected")
+
+        await client.write_usage_batch([_llm("a"), _llm("a")])
+
+        assert client._usage_container.upsert_item.await_count == 2
@@ -0,0 +1,223 @@
+"""Tests for the NumPy cosine helpers (utils/vectors.py) and their callers."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.worker.hybrid_v2.utils.vectors import (
+    cosine_similarity,
+    top_k_indices,
+    unit_rows,
+    unit_vector,
+)
+
+
+def _python_cosine(vec1, vec2):
+    """The pure-Python loop the helpers replace."""
+    dot = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = sum(a * a for a in vec1) ** 0.5
+    norm2 = sum(b * b for b in vec2) ** 0.5
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return dot / (norm1 * norm2)
+
+
+def _vectors(n, dim=64, seed=0):
+    rng = np.random.RandomState(seed)
+    return rng.normal(size=(n, dim)).tolist()
+
+
+class TestVectorHelpers:
+
+    def test_cosine_matches_python_loop(self):
+        a, b = _vectors(2)
+        assert cosine_similarity(a, b) == pytest.approx(_python_cosine(a, b), abs=1e-12)
+        assert cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+
+    def test_unit_rows_scores_match_pairwise(self):
+        vecs = _vectors(20)
+        vecs[3] = [0.0] * 64
+        query = _vectors(1, seed=1)[0]
+        scores = unit_rows(vecs) @ unit_vector(query)
+        expected = [_python_cosine(v, query) for v in vecs]
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+        assert scores[3] == 0.0
+
+    def test_top_k_is_stable_descending(self):
+        scores = np.array([0.2, 0.9, 0.5, 0.9, 0.1, 0.5], dtype=np.float32)
+        assert top_k_indices(scores, 3).tolist() == [1, 3, 2]
+        assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 5, 0, 4]
+        assert top_k_indices(scores, 0).tolist() == []
+
+
+class TestCommunityMatcherMatrix:
+
+    def _matcher(self, communities, embeddings):
+        from src.worker.hybrid_v2.pipeline.community_matcher import CommunityMatcher
+
+        matcher = CommunityMatcher.__new__(CommunityMatcher)
+        matcher.neo4j_service = None
+        matcher.group_id = "g"
+        matcher.folder_id = None
+        matcher._communities = communities
+        matcher._community_embeddings = embeddings
+        matcher._summary_hashes = {}
+        matcher._loaded = True
+        matcher._loaded_version = None
+        matcher._matrix_cache = None
+        matcher._embeddings_rev = 0
+        return matcher
+
+    @pytest.mark.asyncio
+    async def test_ranking_matches_pairwise_loop(self):
+        vecs = _vectors(30, seed=2)
+        communities = [{"id": f"c{i}", "title": f"C{i}"} for i in range(30)]
+        matcher = self._matcher(communities, {f"c{i}": v for i, v in enumerate(vecs)})
+        query = _vectors(1, seed=3)[0]
+        matcher._get_embedding = AsyncMock(return_value=query)
+
+        results = await matcher._semantic_match("q", top_k=4)
+
+        expected = sorted(
+            ((c, _python_cosine(v, query)) for c, v in zip(communities, vecs)),
+            key=lambda x: x[1], reverse=True,
+        )
+        expected = [(c, s) for c, s in expected if s >= 0.05][:4]
+        assert [c["id"] for c, _ in results] == [c["id"] for c, _ in expected]
+        assert [s for _, s in results] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_matrix_rebuilt_after_embeddings_refresh(self):
+        communities = [{"id": "c1", "title": "A"}, {"id": "c2", "title": "B"}]
+        matcher = self._matcher(communities, {"c1": [1.0, 0.0], "c2": [0.0, 1.0]})
+        matcher._get_embedding = AsyncMock(return_value=[1.0, 0.1])
+        first = await matcher._semantic_match("q", top_k=1)
+        assert first[0][0]["id"] == "c1"
+        assert matcher._embedding_matrix()[0] is matcher._embedding_matrix()[0]
+
+        matcher.embedding_client = MagicMock(embed_dim=2)
+        matcher._summary_hashes = {"c1": "stale", "c2": matcher._compute_text_hash(communities[1])}
+        matcher._get_embeddings_batch = AsyncMock(return_value=[[0.0, -1.0]])
+        await matcher._ensure_embeddings()
+
+        second = await matcher._semantic_match("q", top_k=1)
+        assert second[0][0]["id"] == "c2"
+
+    @pytest.mark.asyncio
+    async def test_matrix_rebuilt_after_same_size_reload(self, tmp_path):
+        matcher = self._matcher([{"id": "c1", "title": "A"}], {"c1": [1.0, 0.0]})
+        before = matcher._embedding_matrix()[0]
+        path = tmp_path / "communities.json"
+        path.write_text(json.dumps({
+            "communities": [{"id": "c1", "title": "A"}],
+            "embeddings": {"c1": [0.0, 1.0]},
+        }))
+        matcher.communities_path = path
+        matcher._loaded = False
+        matcher._load_lock = asyncio.Lock()
+        matcher._ensure_embeddings = AsyncMock()
+
+        await matcher.load_communities()
+
+        after = matcher._embedding_matrix()[0]
+        assert after is not before
+        assert after.tolist() == [[0.0, 1.0]]
+
+    @pytest.mark.asyncio
+    async def test_reload_when_group_version_changes(self, monkeypatch):
+        monkeypatch.setenv("COMMUNITY_VERSION_CHECK_SECONDS", "0")
+        matcher = self._matcher([{"id": "c1", "title": "A"}], {"c1": [1.0, 0.0]})
+        matcher._loaded_version = "g|v1"
+        matcher._version_checked_at = 0.0
+        matcher._load_lock = asyncio.Lock()
+        matcher.neo4j_service = MagicMock()
+        session = MagicMock()
+        ctx = AsyncMock()
+        ctx.__aenter__ = AsyncMock(return_value=session)
+        matcher.neo4j_service._get_session = MagicMock(return_value=ctx)
+
+        matcher._read_group_version = AsyncMock(return_value="g|v1")
+        await matcher._reload_if_group_changed()
+        assert matcher._loaded is True
+
+        matcher._read_group_version = AsyncMock(return_value="g|v2")
+        await matcher._reload_if_group_changed()
+        assert matcher._loaded is False
+
+
+class TestEntityDedupMatrix:
+
+    def test_matrix_path_merges_same_pairs_as_pairwise(self, monkeypatch):
+        from src.worker.hybrid_v2.services import entity_deduplication as module
+
+        rng = np.random.RandomState(4)
+        base = rng.normal(size=(8, 32))
+        entities = []
+        for i in range(8):
+            entities.append({"name": f"Entity {i}", "embedding": base[i].tolist()})
+            entities.append({"name": f"Entity {i} Variant", "embedding": (base[i] + 0.05 * rng.normal(size=32)).tolist()})
+        entities.append({"name": "No Embedding"})
+        entities.append({"name": "Odd Dim", "embedding": [1.0, 0.0]})
+
+        service = module.EntityDeduplicationService(similarity_threshold=0.95, min_entities_for_dedup=2)
+        vectorised = service.deduplicate_entities(entities, group_id="g")
+        monkeypatch.setattr(module, "_unit_embedding_matrix", lambda data: (None, None))
+        pairwise = service.deduplicate_entities(entities, group_id="g")
+
+        assert vectorised.merge_map == pairwise.merge_map
+        assert vectorised.embedding_merges == pairwise.embedding_merges == 8
+
+
+class TestMMRMatrix:
+
+    def _legacy_mmr_order(self, emb_matrix, norm_scores, lambda_param, max_facts):
+        selected, remaining = [], set(range(len(norm_scores)))
+        for _ in range(min(max_facts, len(norm_scores))):
+            best_idx, best_mmr = -1, -float("inf")
+            for idx in remaining:
+                max_sim = float(np.max(emb_matrix[idx] @ emb_matrix[selected].T)) if selected else 0.0
+                mmr = lambda_param * norm_scores[idx] - (1 - lambda_param) * max_sim
+                if mmr > best_mmr:
+                    best_mmr, best_idx = mmr, idx
+            selected.append(best_idx)
+            remaining.discard(best_idx)
+        return selected
+
+    def test_selection_matches_pairwise_loop(self, monkeypatch):
+        from src.worker.hybrid_v2.retrievers.triple_store import Triple, mmr_diversity_filter
+
+        monkeypatch.setenv("ROUTE7_MMR_DEDUP", "0")
+        vecs = _vectors(25, dim=16, seed=5)
+        scores = np.linspace(1.0, 0.2, 25).tolist()
+        candidates = [
+            (Triple(subject_id=str(i), subject_name=f"S{i}", predicate="p", object_id=str(i),
+                    object_name=f"O{i}", triple_text=f"S{i} p O{i}", embedding=v), s)
+            for i, (v, s) in enumerate(zip(vecs, scores))
+        ]
+        picked = mmr_diversity_filter(candidates, max_facts=7, lambda_param=0.6)
+
+        norm_scores = (np.array(scores, dtype=np.float32) - 0.2) / 0.8
+        expected = self._legacy_mmr_order(unit_rows(vecs), norm_scores, 0.6, 7)
+        assert [t.subject_id for t, _ in picked] == [str(i) for i in expected]
+
+    def test_negative_similarities_are_not_clamped(self, monkeypatch):
+        from src.worker.hybrid_v2.retrievers.triple_store import Triple, mmr_diversity_filter
+
+        monkeypatch.setenv("ROUTE7_MMR_DEDUP", "0")
+        # Both later candidates point away from the first pick; the opposite one is more diverse
+        vecs = [[1.0, 0.0], [-0.1, float(np.sqrt(0.99))], [-1.0, 0.0]]
+        scores = [1.0, 0.6, 0.4]
+        candidates = [
+            (Triple(subject_id=str(i), subject_name=f"S{i}", predicate="p", object_id=str(i),
+                    object_name=f"O{i}", triple_text=f"S{i} p O{i}", embedding=v), s)
+            for i, (v, s) in enumerate(zip(vecs, scores))
+        ]
+        picked = mmr_diversity_filter(candidates, max_facts=2, lambda_param=0.5)
+
+        norm_scores = (np.array(scores, dtype=np.float32) - 0.4) / 0.6
+        expected = self._legacy_mmr_order(unit_rows(vecs), norm_scores, 0.5, 2)
+        assert expected == [0, 2]
+        assert [t.subject_id for t, _ in picked] == ["0", "2"]